@@ -6,8 +6,6 @@ Processes historical matches in parallel using multiprocessing.
 """
 
 import argparse
-import gzip
-import json
 import logging
 import os
 import sys
@@ -22,8 +20,9 @@ from psycopg.rows import dict_row
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from pewstats_collectors.core.telemetry_artifact import TelemetryArtifactCache
 from pewstats_collectors.processors.fight_tracking_processor import FightTrackingProcessor
-
+from pewstats_collectors.workers.telemetry_processing_worker import TelemetryProcessingWorker
 
 # Global logger setup
 logging.basicConfig(
@@ -35,6 +34,9 @@ logger = logging.getLogger(__name__)
 # Database connection parameters (will be set by main)
 DB_PARAMS = {}
 
+# Shares artifacts with the telemetry processing worker
+ARTIFACT_CACHE = TelemetryArtifactCache(TelemetryProcessingWorker.TELEMETRY_EVENT_TYPES)
+
 
 def get_db_connection():
     """Get a database connection."""
@@ -44,23 +46,9 @@ def get_db_connection():
 
 
 def read_telemetry_file(file_path: str) -> Optional[List[Dict]]:
-    """Read and parse telemetry JSON file."""
+    """Read fight events from the match's extracted-event artifact or raw telemetry."""
     try:
-        with gzip.open(file_path, "rb") as f:
-            first_bytes = f.read(2)
-            f.seek(0)
-
-            if first_bytes == b"\x1f\x8b":
-                # Double gzipped
-                with gzip.open(f, "rt", encoding="utf-8") as f2:
-                    events = json.load(f2)
-            else:
-                # Single gzipped
-                f.seek(0)
-                content = f.read().decode("utf-8")
-                events = json.loads(content)
-
-        return events
+        return ARTIFACT_CACHE.read(file_path, FightTrackingProcessor.EVENT_TYPES)
     except FileNotFoundError:
         logger.warning(f"Telemetry file not found: {file_path}")
         return None
@@ -15,6 +15,7 @@ from concurrent.futures import ProcessPoolExecutor, as_completed
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from pewstats_collectors.core.database_manager import DatabaseManager
+from pewstats_collectors.metrics import MULTIPROCESS_DIR, start_metrics_server
 from pewstats_collectors.workers.telemetry_processing_worker import TelemetryProcessingWorker
 
 logging.basicConfig(
@@ -72,7 +73,7 @@ def process_single_match(match_data: dict, worker_id: int) -> tuple:
         database_manager=db_manager,
         worker_id=f"parallel-worker-{worker_id}",
         logger=logging.getLogger(f"worker-{worker_id}"),
-        metrics_port=9095 + worker_id,  # Different port for each worker
+        metrics_port=None,  # Served by the main process with PROMETHEUS_MULTIPROC_DIR set
     )
 
     # Construct telemetry file path
@@ -137,6 +138,10 @@ def main():
             logger.info(f"  ... and {len(matches) - 20} more")
         return
 
+    # One metrics server for all worker processes (multiprocess mode)
+    if MULTIPROCESS_DIR:
+        start_metrics_server(port=9095, worker_name="backfill-finishing-metrics")
+
     logger.info(f"Starting parallel backfill with {args.workers} workers...")
     logger.info(f"Processing {len(matches)} matches")
 
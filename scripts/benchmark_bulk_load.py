@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark Bulk Load
+
+Compares executemany with binary COPY (DatabaseManager use_copy) for writing
+player_damage_events. Each run inserts synthetic events under a throwaway
+match ID and deletes them again afterwards.
+
+Usage:
+    python3 scripts/benchmark_bulk_load.py --rows 20000 --runs 3
+"""
+
+import logging
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+import click
+from dotenv import load_dotenv
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from pewstats_collectors.core.database_manager import DatabaseManager
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def build_damage_events(match_id: str, count: int) -> List[Dict[str, Any]]:
+    """Build synthetic damage events shaped like the extractor's output."""
+    start = datetime(2024, 1, 1, 12, 0, 0)
+    events = []
+    for i in range(count):
+        events.append(
+            {
+                "match_id": match_id,
+                "attacker_name": f"attacker_{i % 64}",
+                "attacker_team_id": i % 16,
+                "attacker_health": random.uniform(1, 100),
+                "attacker_location_x": random.uniform(0, 816000),
+                "attacker_location_y": random.uniform(0, 816000),
+                "attacker_location_z": random.uniform(0, 5000),
+                "victim_name": f"victim_{i % 64}",
+                "victim_team_id": (i + 1) % 16,
+                "victim_health": random.uniform(1, 100),
+                "victim_location_x": random.uniform(0, 816000),
+                "victim_location_y": random.uniform(0, 816000),
+                "victim_location_z": random.uniform(0, 5000),
+                "damage_type_category": "Damage_Gun",
+                "damage_reason": "TorsoShot",
+                "damage": random.uniform(1, 50),
+                "weapon_id": "WeapHK416_C",
+                "event_timestamp": (start + timedelta(milliseconds=i)).isoformat() + "Z",
+            }
+        )
+    return events
+
+
+def run_once(database: DatabaseManager, match_id: str, events: List[Dict[str, Any]]) -> float:
+    """Insert the events once and remove them again, returning the insert time."""
+    started = time.perf_counter()
+    database.insert_damage_events(events)
+    elapsed = time.perf_counter() - started
+    database.execute_query(
+        "DELETE FROM player_damage_events WHERE match_id = %s", (match_id,), fetch=False
+    )
+    return elapsed
+
+
+@click.command()
+@click.option("--rows", default=20000, help="Damage events per run")
+@click.option("--runs", default=3, help="Runs per method")
+@click.option(
+    "--env-file",
+    default=".env",
+    help="Path to .env file",
+)
+def main(rows: int, runs: int, env_file: str):
+    """Benchmark executemany against binary COPY for damage events."""
+    load_dotenv(env_file)
+
+    database = DatabaseManager(
+        host=os.getenv("POSTGRES_HOST"),
+        port=int(os.getenv("POSTGRES_PORT", "5432")),
+        dbname=os.getenv("POSTGRES_DB"),
+        user=os.getenv("POSTGRES_USER"),
+        password=os.getenv("POSTGRES_PASSWORD"),
+    )
+
+    match_id = f"benchmark-bulk-load-{int(time.time())}"
+    events = build_damage_events(match_id, rows)
+
+    try:
+        for method, use_copy in (("executemany", False), ("copy", True)):
+            database.use_copy = use_copy
+            timings = [run_once(database, match_id, events) for _ in range(runs)]
+            best = min(timings)
+            logger.info(
+                f"{method:>11}: best {best:.3f}s of {runs} runs ({rows / best:,.0f} rows/s)"
+            )
+    finally:
+        database.execute_query(
+            "DELETE FROM player_damage_events WHERE match_id = %s", (match_id,), fetch=False
+        )
+        database.disconnect()
+
+
+if __name__ == "__main__":
+    main()
@@ -78,6 +78,7 @@ def republish_matches(
         Dictionary with success/failure counts
     """
     stats = {"total": len(matches), "published": 0, "failed": 0}
+    messages = []
 
     for i, match in enumerate(matches, 1):
         match_id = match["match_id"]
@@ -98,25 +99,23 @@ def republish_matches(
             logger.info(f"[DRY RUN] Would publish match {i}/{len(matches)}: {match_id}")
             stats["published"] += 1
         else:
-            try:
-                success = publisher.publish_message("match", "discovered", message)
-
-                if success:
-                    logger.info(f"Published match {i}/{len(matches)}: {match_id}")
-                    stats["published"] += 1
-                else:
-                    logger.error(f"Failed to publish match {i}/{len(matches)}: {match_id}")
-                    stats["failed"] += 1
-
-            except Exception as e:
-                logger.error(
-                    f"Error publishing match {i}/{len(matches)} {match_id}: {e}", exc_info=True
-                )
+            messages.append(message)
+
+    # Publish under publisher confirms, 100 matches at a time
+    for start in range(0, len(messages), 100):
+        chunk = messages[start : start + 100]
+        results = publisher.publish_many("match", "discovered", chunk)
+
+        for i, (message, success) in enumerate(zip(chunk, results), start + 1):
+            if success:
+                logger.info(f"Published match {i}/{len(matches)}: {message['match_id']}")
+                stats["published"] += 1
+            else:
+                logger.error(f"Failed to publish match {i}/{len(matches)}: {message['match_id']}")
                 stats["failed"] += 1
 
-        # Progress update every 100 matches
-        if i % 100 == 0:
-            logger.info(f"Progress: {i}/{len(matches)} matches processed")
+        # Progress update after every chunk
+        logger.info(f"Progress: {start + len(chunk)}/{len(matches)} matches processed")
 
     return stats
 
@@ -105,6 +105,7 @@ def republish_matches(
         "skipped_no_file": 0,
         "failed": 0,
     }
+    messages = []
 
     for i, match in enumerate(matches, 1):
         match_id = match["match_id"]
@@ -145,13 +146,19 @@ def republish_matches(
             logger.info(f"  [DRY RUN] Would publish: {message}")
             stats["published"] += 1
         else:
-            try:
-                publisher.publish_message("match", "processing", message)
-                logger.info("  ✅ Published to match.processing queue")
+            messages.append(message)
+
+    if messages:
+        # Publish in confirm windows under publisher confirms
+        results = publisher.publish_many("match", "processing", messages)
+
+        for message, success in zip(messages, results):
+            if success:
                 stats["published"] += 1
-            except Exception as e:
-                logger.error(f"  ❌ Failed to publish: {e}")
+            else:
+                logger.error(f"  ❌ Failed to publish {message['match_id']}")
                 stats["failed"] += 1
+        logger.info(f"  ✅ Published {stats['published']} matches to match.processing queue")
 
     return stats
 
@@ -69,6 +69,7 @@ def republish_telemetry_messages(
     logger.info(f"Found {len(matches)} matches with telemetry info")
 
     stats = {"total": len(matches), "published": 0, "failed": 0}
+    messages = []
 
     for match in matches:
         match_id = match["match_id"]
@@ -94,17 +95,18 @@ def republish_telemetry_messages(
             logger.info(f"[DRY RUN] Would publish telemetry for match: {match_id}")
             stats["published"] += 1
         else:
-            try:
-                success = publisher.publish_message("match", "telemetry", message)
-
-                if success:
-                    logger.info(f"✅ Published telemetry for match: {match_id}")
-                    stats["published"] += 1
-                else:
-                    logger.error(f"❌ Failed to publish telemetry for match: {match_id}")
-                    stats["failed"] += 1
-            except Exception as e:
-                logger.error(f"Error publishing match {match_id}: {e}", exc_info=True)
+            messages.append(message)
+
+    if messages:
+        # Publish in confirm windows under publisher confirms
+        results = publisher.publish_many("match", "telemetry", messages)
+
+        for message, success in zip(messages, results):
+            if success:
+                logger.info(f"✅ Published telemetry for match: {message['match_id']}")
+                stats["published"] += 1
+            else:
+                logger.error(f"❌ Failed to publish telemetry for match: {message['match_id']}")
                 stats["failed"] += 1
 
     return stats
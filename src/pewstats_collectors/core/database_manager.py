@@ -10,15 +10,22 @@ Key features:
 - Connection pooling for performance
 - Context manager support
 - Type-safe operations with Pydantic models
+- Optional binary COPY bulk loading for high-volume telemetry tables
+- transaction() to run several operations on one connection with one commit
+- Optional pipeline mode and prepared statements to save round trips
 """
 
 import logging
-from contextlib import contextmanager
-from typing import Any, Dict, List, Optional, Set
+import threading
+from contextlib import contextmanager, nullcontext
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 import psycopg
 from psycopg import sql
 from psycopg.rows import dict_row
+from psycopg.types.json import Json, Jsonb
 
 # Try to import connection pool, fallback to single connection if not available
 try:
@@ -40,6 +47,174 @@ class DatabaseError(Exception):
     pass
 
 
+# Columns of the bulk-loaded telemetry tables, in the order rows are loaded
+# fmt: off
+LANDING_COLUMNS = (
+    "match_id", "player_id", "player_name", "team_id",
+    "x_coordinate", "y_coordinate", "z_coordinate",
+    "is_game", "map_name", "game_type", "game_mode", "match_datetime",
+)
+
+KILL_POSITION_COLUMNS = (
+    "match_id", "attack_id", "dbno_id", "victim_name", "victim_team_id",
+    "victim_x_location", "victim_y_location", "victim_z_location",
+    "victim_in_blue_zone", "victim_in_vehicle", "killed_in_zone",
+    "dbno_maker_name", "dbno_maker_team_id",
+    "dbno_maker_x_location", "dbno_maker_y_location", "dbno_maker_z_location",
+    "dbno_maker_zone", "dbno_damage_reason", "dbno_damage_category",
+    "dbno_damage_causer_name", "dbno_damage_causer_distance",
+    "finisher_name", "finisher_team_id",
+    "finisher_x_location", "finisher_y_location", "finisher_z_location",
+    "finisher_zone", "finisher_damage_reason", "finisher_damage_category",
+    "finisher_damage_causer_name", "finisher_damage_causer_distance",
+    "is_game", "map_name", "game_type", "game_mode", "match_datetime",
+)
+
+DAMAGE_EVENT_COLUMNS = (
+    "match_id", "attacker_name", "attacker_team_id", "attacker_health",
+    "attacker_location_x", "attacker_location_y", "attacker_location_z",
+    "victim_name", "victim_team_id", "victim_health",
+    "victim_location_x", "victim_location_y", "victim_location_z",
+    "damage_type_category", "damage_reason", "damage", "weapon_id", "event_timestamp",
+)
+
+KNOCK_EVENT_COLUMNS = (
+    "match_id", "dbno_id", "attack_id",
+    "attacker_name", "attacker_team_id", "attacker_account_id",
+    "attacker_location_x", "attacker_location_y", "attacker_location_z", "attacker_health",
+    "victim_name", "victim_team_id", "victim_account_id",
+    "victim_location_x", "victim_location_y", "victim_location_z",
+    "damage_reason", "damage_type_category",
+    "knock_weapon", "knock_weapon_attachments",
+    "victim_weapon", "victim_weapon_attachments",
+    "knock_distance",
+    "is_attacker_in_vehicle", "is_through_penetrable_wall",
+    "is_blue_zone", "is_red_zone", "zone_name",
+    "nearest_teammate_distance", "avg_teammate_distance",
+    "teammates_within_50m", "teammates_within_100m", "teammates_within_200m",
+    "team_spread_variance", "total_teammates_alive", "teammate_positions",
+    "victim_nearest_teammate_distance", "victim_avg_teammate_distance",
+    "victim_teammates_within_50m", "victim_teammates_within_100m", "victim_teammates_within_200m",
+    "victim_team_spread_variance", "victim_total_teammates_alive", "victim_teammate_positions",
+    "outcome", "finisher_name", "finisher_is_self", "finisher_is_teammate", "time_to_finish",
+    "map_name", "game_mode", "game_type", "match_datetime", "event_timestamp",
+)
+
+CIRCLE_POSITION_COLUMNS = (
+    "match_id", "player_name", "elapsed_time",
+    "player_x", "player_y",
+    "safe_zone_center_x", "safe_zone_center_y", "safe_zone_radius",
+    "distance_from_center", "distance_from_edge", "is_in_safe_zone",
+)
+
+WEAPON_DISTRIBUTION_COLUMNS = (
+    "match_id", "player_name", "weapon_category",
+    "total_damage", "total_kills", "knock_downs",
+)
+
+FIGHT_COLUMNS = (
+    "match_id", "fight_start_time", "fight_end_time", "duration_seconds",
+    "team_ids", "primary_team_1", "primary_team_2", "third_party_teams",
+    "total_knocks", "total_kills", "total_damage", "total_damage_events", "total_attack_events",
+    "outcome", "winning_team_id", "loser_team_id", "team_outcomes", "fight_reason",
+    "fight_center_x", "fight_center_y", "fight_spread_radius",
+    "map_name", "game_mode", "game_type", "match_datetime",
+)
+
+FIGHT_PARTICIPANT_COLUMNS = (
+    "fight_id", "match_id", "player_name", "player_account_id", "team_id",
+    "knocks_dealt", "kills_dealt", "damage_dealt", "damage_taken", "attacks_made",
+    "position_center_x", "position_center_y",
+    "was_knocked", "was_killed", "survived",
+    "knocked_at", "killed_at", "match_datetime",
+)
+# fmt: on
+
+# match_summaries columns set by update_match_summaries_enhanced_stats (migration 008),
+# with the types their VALUES are cast to
+ENHANCED_STATS_COLUMNS = (
+    ("heals_used", "integer"),
+    ("boosts_used", "integer"),
+    ("throwables_used", "integer"),
+    ("smokes_thrown", "integer"),
+    ("killsteals", "integer"),
+    ("throwable_damage", "numeric"),
+    ("damage_received", "numeric"),
+    ("avg_distance_from_center", "numeric"),
+    ("avg_distance_from_edge", "numeric"),
+    ("max_distance_from_center", "numeric"),
+    ("min_distance_from_edge", "numeric"),
+    ("time_outside_zone_seconds", "integer"),
+)
+
+# PostgreSQL accepts at most this many bind parameters in one statement
+MAX_BIND_PARAMETERS = 65535
+
+
+def rows_from_dicts(records: Iterable[Dict[str, Any]], columns: Sequence[str]) -> List[tuple]:
+    """Convert record dicts to row tuples in column order (for copy_rows).
+
+    Args:
+        records: Record dictionaries
+        columns: Column names
+
+    Returns:
+        One tuple per record
+    """
+    return [tuple(record[column] for column in columns) for record in records]
+
+
+def _parse_timestamp(value: Any, with_timezone: bool) -> Any:
+    # Binary COPY sends timestamps as such, so ISO strings are parsed client-side.
+    # For a timestamp without time zone the value is converted to UTC before the
+    # offset is dropped (the server's text cast would drop it and keep local time)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime) and value.tzinfo is not None and not with_timezone:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _text(value: Any) -> str:
+    # Booleans cast to text as "true"/"false", like the server's
+    return str(value).lower() if isinstance(value, bool) else str(value)
+
+
+def _copy_converter(type_name: str) -> Optional[Callable[[Any], Any]]:
+    """Get the conversion binary COPY needs for values of a column type.
+
+    Binary COPY checks values against the column type instead of casting
+    them, so values that executemany leaves to the server to cast (ISO
+    strings for timestamps, floats for numeric, JSON text for jsonb) are
+    converted client-side.
+
+    Args:
+        type_name: PostgreSQL type name (pg_type.typname)
+
+    Returns:
+        Conversion function, or None if values are passed as they are
+    """
+    if type_name in ("timestamp", "timestamptz"):
+        with_timezone = type_name == "timestamptz"
+        return lambda value: _parse_timestamp(value, with_timezone)
+    if type_name == "date":
+        return lambda value: date.fromisoformat(value) if isinstance(value, str) else value
+    if type_name == "numeric":
+        return lambda value: Decimal(repr(value)) if isinstance(value, float) else value
+    if type_name in ("int2", "int4", "int8"):
+        # The server rounds floats half to even when assigning them to integers
+        return lambda value: round(value) if isinstance(value, (float, bool)) else value
+    if type_name == "bool":
+        return lambda value: bool(value) if isinstance(value, int) else value
+    if type_name in ("text", "varchar", "bpchar"):
+        return lambda value: value if isinstance(value, str) else _text(value)
+    if type_name in ("json", "jsonb"):
+        wrapper = Jsonb if type_name == "jsonb" else Json
+        # Strings already hold JSON text, anything else is serialized
+        return lambda value: wrapper(value, dumps=str) if isinstance(value, str) else wrapper(value)
+    return None
+
+
 class DatabaseManager:
     """Database manager for PUBG match collection system.
 
@@ -62,6 +237,8 @@ class DatabaseManager:
         min_pool_size: int = 1,
         max_pool_size: int = 3,
         sslmode: str = "disable",
+        use_copy: bool = False,
+        use_pipeline: bool = False,
     ):
         """Initialize database manager with connection pooling.
 
@@ -74,6 +251,11 @@ class DatabaseManager:
             min_pool_size: Minimum pool size (default: 2)
             max_pool_size: Maximum pool size (default: 10)
             sslmode: SSL mode (default: "disable" for R compatibility)
+            use_copy: Bulk-load high-volume telemetry tables with binary COPY
+                instead of executemany (default: False)
+            use_pipeline: Send execute_pipeline() statements in psycopg pipeline
+                mode and prepare hot statements on each connection on first use
+                (default: False). Needs session pooling if behind PgBouncer.
 
         Raises:
             DatabaseError: If connection fails
@@ -82,6 +264,18 @@ class DatabaseManager:
         self.dbname = dbname
         self.user = user
         self.port = port
+        self.use_copy = use_copy
+        self.use_pipeline = use_pipeline
+
+        # prepare= argument for hot statements: prepare on first use, or leave it
+        # to psycopg's prepare_threshold
+        self.prepare: Optional[bool] = True if use_pipeline else None
+
+        # Column types of tables loaded with copy_rows, by table name
+        self._copy_types: Dict[str, Dict[str, Any]] = {}
+
+        # Connection of the open transaction() of each thread
+        self._local = threading.local()
 
         # Build connection string
         conninfo = (
@@ -126,6 +320,15 @@ class DatabaseManager:
         Raises:
             DatabaseError: If connection fails
         """
+        shared = getattr(self._local, "conn", None)
+        if shared is not None:
+            # Inside transaction(): its connection is committed or rolled back there
+            try:
+                yield shared
+            except psycopg.Error as e:
+                raise DatabaseError(f"Database connection error: {e}")
+            return
+
         conn = None
         try:
             if HAS_POOL and self._pool:
@@ -157,6 +360,50 @@ class DatabaseManager:
                 finally:
                     self._pool.putconn(conn)
 
+    def _commit(self, conn) -> None:
+        """Commit conn, unless it belongs to this thread's open transaction()."""
+        if conn is not getattr(self._local, "conn", None):
+            conn.commit()
+
+    @contextmanager
+    def transaction(self):
+        """Run this thread's operations in one transaction (context manager).
+
+        Every DatabaseManager call made by the current thread inside the block
+        uses the same connection and skips its own commit. The block commits
+        once when it exits and rolls everything back if it raises, so a failed
+        unit of work leaves nothing behind and can simply be retried. Nested
+        blocks join the outer transaction.
+
+        Yields:
+            This DatabaseManager
+
+        Raises:
+            DatabaseError: If the connection or the commit fails
+
+        Example:
+            >>> with db.transaction():
+            ...     db.insert_landings(landings)
+            ...     db.update_match_processing_flags(match_id, landings_processed=True)
+        """
+        if getattr(self._local, "conn", None) is not None:
+            yield self
+            return
+
+        with self._get_connection() as conn:
+            self._local.conn = conn
+            try:
+                yield self
+                conn.commit()
+            except BaseException:
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass  # Connection broken, nothing to keep
+                raise
+            finally:
+                self._local.conn = None
+
     def disconnect(self) -> None:
         """Close all connections in pool or single connection."""
         if hasattr(self, "_pool") and self._pool:
@@ -208,14 +455,213 @@ class DatabaseManager:
                     if fetch:
                         return cur.fetchall()
                     else:
-                        conn.commit()
+                        self._commit(conn)
                         return None
         except psycopg.Error as e:
             raise DatabaseError(f"Query execution failed: {e}")
 
+    def execute_pipeline(
+        self, statements: Sequence[Tuple[Any, Optional[Sequence[Any]]]]
+    ) -> List[int]:
+        """Execute independent statements on one connection and commit once.
+
+        With use_pipeline, the statements are sent in psycopg pipeline mode, so
+        they cost one round trip instead of one each, and every statement is
+        prepared on the connection the first time it runs there. Otherwise they
+        run one after another. Either way they share one transaction: if any
+        fails, none of them is committed.
+
+        Args:
+            statements: (query, params) pairs; no statement may depend on the
+                result of another
+
+        Returns:
+            Number of rows affected by each statement
+
+        Raises:
+            DatabaseError: If a statement fails
+        """
+        if not statements:
+            return []
+
+        pipelined = self.use_pipeline and psycopg.Pipeline.is_supported()
+        try:
+            with self._get_connection() as conn:
+                cursors = [conn.cursor() for _ in statements]
+                try:
+                    with conn.pipeline() if pipelined else nullcontext():
+                        for cur, (query, params) in zip(cursors, statements):
+                            cur.execute(query, params, prepare=self.prepare)
+                    # Results are only all received once the pipeline has synced
+                    rowcounts = [cur.rowcount for cur in cursors]
+                finally:
+                    for cur in cursors:
+                        cur.close()
+                self._commit(conn)
+                return rowcounts
+
+        except psycopg.Error as e:
+            raise DatabaseError(f"Pipeline execution failed: {e}")
+
     # Alias for compatibility
     close = disconnect
 
+    def copy_rows(
+        self,
+        table: str,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        on_conflict: Optional[str] = None,
+    ) -> int:
+        """Bulk-load rows with COPY ... FROM STDIN in binary format.
+
+        Without on_conflict the rows are copied straight into the table. With
+        it, they are copied into a temporary staging table and merged with
+        INSERT ... SELECT and the given ON CONFLICT clause, which COPY itself
+        does not support.
+
+        Args:
+            table: Target table
+            columns: Columns to load, in row order
+            rows: Row tuples in column order (see rows_from_dicts)
+            on_conflict: ON CONFLICT clause of the merge, e.g.
+                "ON CONFLICT DO NOTHING" (default: copy directly)
+
+        Returns:
+            Number of rows loaded (excludes conflicts skipped by the merge)
+
+        Raises:
+            DatabaseError: If loading fails
+        """
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cur:
+                    count = self._copy_rows(cur, table, columns, rows, on_conflict)
+                    self._commit(conn)
+                    return count
+
+        except psycopg.Error as e:
+            raise DatabaseError(f"Failed to copy rows into {table}: {e}")
+
+    def _copy_rows(
+        self,
+        cur: psycopg.Cursor,
+        table: str,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        on_conflict: Optional[str],
+    ) -> int:
+        """Load rows on a cursor without committing (see copy_rows)."""
+        column_types = self._get_copy_types(cur, table)
+        types = [column_types[column][0] for column in columns]
+        converters = [
+            (index, column_types[column][1])
+            for index, column in enumerate(columns)
+            if column_types[column][1] is not None
+        ]
+
+        column_list = sql.SQL(", ").join(map(sql.Identifier, columns))
+        target = sql.Identifier(table)
+        if on_conflict:
+            staging = sql.Identifier(f"_staging_{table}")
+            cur.execute(
+                sql.SQL(
+                    "CREATE TEMP TABLE {} (LIKE {} INCLUDING DEFAULTS) ON COMMIT DROP"
+                ).format(staging, target)
+            )
+            copy_target = staging
+        else:
+            copy_target = target
+
+        with cur.copy(
+            sql.SQL("COPY {} ({}) FROM STDIN (FORMAT BINARY)").format(copy_target, column_list)
+        ) as copy:
+            copy.set_types(types)
+            for row in rows:
+                if converters:
+                    row = list(row)
+                    for index, convert in converters:
+                        if row[index] is not None:
+                            row[index] = convert(row[index])
+                copy.write_row(row)
+        count = cur.rowcount
+
+        if on_conflict:
+            cur.execute(
+                sql.SQL("INSERT INTO {} ({}) SELECT {} FROM {} {}").format(
+                    target, column_list, column_list, staging, sql.SQL(on_conflict)
+                )
+            )
+            count = cur.rowcount
+            # Dropped now so the table can be loaded again in the same transaction
+            cur.execute(sql.SQL("DROP TABLE {}").format(staging))
+
+        return count
+
+    def _get_copy_types(self, cur: psycopg.Cursor, table: str) -> Dict[str, Any]:
+        """Get (type OID, converter) of a table's columns, cached per table."""
+        column_types = self._copy_types.get(table)
+        if column_types is None:
+            cur.execute(
+                """
+                SELECT a.attname, a.atttypid, t.typname
+                FROM pg_attribute a
+                JOIN pg_type t ON t.oid = a.atttypid
+                WHERE a.attrelid = %s::regclass AND a.attnum > 0 AND NOT a.attisdropped
+                """,
+                (table,),
+            )
+            column_types = {
+                row["attname"]: (row["atttypid"], _copy_converter(row["typname"]))
+                for row in cur.fetchall()
+            }
+            self._copy_types[table] = column_types
+        return column_types
+
+    def _insert_values(
+        self,
+        cur: psycopg.Cursor,
+        table: str,
+        columns: Sequence[str],
+        rows: Sequence[Sequence[Any]],
+        suffix: str = "",
+        returning: bool = False,
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """Insert rows with multi-row INSERT ... VALUES statements, without committing.
+
+        Rows are sent in as few statements as the bind parameter limit allows.
+
+        Args:
+            cur: Cursor to execute on
+            table: Target table
+            columns: Columns to insert, in row order
+            rows: Row tuples in column order
+            suffix: Clauses after VALUES, e.g. "ON CONFLICT DO NOTHING RETURNING id"
+            returning: Whether suffix has a RETURNING clause to fetch
+
+        Returns:
+            Tuple of (rows inserted, rows returned)
+        """
+        column_list = sql.SQL(", ").join(map(sql.Identifier, columns))
+        row_values = sql.SQL("({})").format(sql.SQL(", ").join([sql.Placeholder()] * len(columns)))
+        chunk_size = MAX_BIND_PARAMETERS // len(columns)
+
+        count = 0
+        returned: List[Dict[str, Any]] = []
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start : start + chunk_size]
+            query = sql.SQL("INSERT INTO {} ({}) VALUES {} {}").format(
+                sql.Identifier(table),
+                column_list,
+                sql.SQL(", ").join([row_values] * len(chunk)),
+                sql.SQL(suffix),
+            )
+            cur.execute(query, [value for row in chunk for value in row])
+            count += cur.rowcount
+            if returning:
+                returned.extend(cur.fetchall())
+        return count, returned
+
     # ========================================================================
     # Player Management
     # ========================================================================
@@ -277,7 +723,7 @@ class DatabaseManager:
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
                     cur.execute(query, (player_name, player_id, platform))
-                    conn.commit()
+                    self._commit(conn)
                     return True
 
         except psycopg.Error as e:
@@ -332,7 +778,7 @@ class DatabaseManager:
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
                     cur.execute(query, (player_name, player_id))
-                    conn.commit()
+                    self._commit(conn)
                     return cur.rowcount > 0
 
         except psycopg.Error as e:
@@ -420,8 +866,9 @@ class DatabaseManager:
                             status,
                             game_type,
                         ),
+                        prepare=self.prepare,
                     )
-                    conn.commit()
+                    self._commit(conn)
                     # Return True only if row was actually inserted
                     return cur.rowcount > 0
 
@@ -466,8 +913,8 @@ class DatabaseManager:
 
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute(query, params)
-                    conn.commit()
+                    cur.execute(query, params, prepare=self.prepare)
+                    self._commit(conn)
                     return cur.rowcount > 0
 
         except psycopg.Error as e:
@@ -549,7 +996,7 @@ class DatabaseManager:
 
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute(query, (match_id,))
+                    cur.execute(query, (match_id,), prepare=self.prepare)
                     result = cur.fetchone()
                     return result["count"] > 0
 
@@ -592,7 +1039,7 @@ class DatabaseManager:
                     # Execute batch insert using executemany for performance
                     data = [[summary[col] for col in columns] for summary in summaries]
                     cur.executemany(query, data)
-                    conn.commit()
+                    self._commit(conn)
                     # Return actual number of rows inserted (excludes conflicts)
                     return cur.rowcount
 
@@ -657,7 +1104,7 @@ class DatabaseManager:
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
                     cur.execute(query)
-                    conn.commit()
+                    self._commit(conn)
                     logger.debug("Match summaries table created/verified")
 
         except psycopg.Error as e:
@@ -682,6 +1129,11 @@ class DatabaseManager:
         if not landings:
             return 0
 
+        if self.use_copy:
+            return self.copy_rows(
+                "landings", LANDING_COLUMNS, rows_from_dicts(landings, LANDING_COLUMNS)
+            )
+
         try:
             query = sql.SQL("""
                 INSERT INTO landings (
@@ -698,7 +1150,7 @@ class DatabaseManager:
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
                     cur.executemany(query, landings)
-                    conn.commit()
+                    self._commit(conn)
                     return cur.rowcount
 
         except psycopg.Error as e:
@@ -719,6 +1171,13 @@ class DatabaseManager:
         if not kills:
             return 0
 
+        if self.use_copy:
+            return self.copy_rows(
+                "kill_positions",
+                KILL_POSITION_COLUMNS,
+                rows_from_dicts(kills, KILL_POSITION_COLUMNS),
+            )
+
         try:
             query = sql.SQL("""
                 INSERT INTO kill_positions (
@@ -753,7 +1212,7 @@ class DatabaseManager:
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
                     cur.executemany(query, kills)
-                    conn.commit()
+                    self._commit(conn)
                     return cur.rowcount
 
         except psycopg.Error as e:
@@ -800,7 +1259,7 @@ class DatabaseManager:
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
                     cur.executemany(query, weapon_kills)
-                    conn.commit()
+                    self._commit(conn)
                     return cur.rowcount
 
         except psycopg.Error as e:
@@ -821,6 +1280,13 @@ class DatabaseManager:
         if not damage_events:
             return 0
 
+        if self.use_copy:
+            return self.copy_rows(
+                "player_damage_events",
+                DAMAGE_EVENT_COLUMNS,
+                rows_from_dicts(damage_events, DAMAGE_EVENT_COLUMNS),
+            )
+
         try:
             query = sql.SQL("""
                 INSERT INTO player_damage_events (
@@ -841,7 +1307,7 @@ class DatabaseManager:
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
                     cur.executemany(query, damage_events)
-                    conn.commit()
+                    self._commit(conn)
                     return cur.rowcount
 
         except psycopg.Error as e:
@@ -922,8 +1388,8 @@ class DatabaseManager:
 
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute(query, params)
-                    conn.commit()
+                    cur.execute(query, params, prepare=self.prepare)
+                    self._commit(conn)
                     return cur.rowcount > 0
 
         except psycopg.Error as e:
@@ -948,6 +1414,13 @@ class DatabaseManager:
         if not knock_events:
             return 0
 
+        if self.use_copy:
+            return self.copy_rows(
+                "player_knock_events",
+                KNOCK_EVENT_COLUMNS,
+                rows_from_dicts(knock_events, KNOCK_EVENT_COLUMNS),
+            )
+
         try:
             query = sql.SQL("""
                 INSERT INTO player_knock_events (
@@ -996,7 +1469,7 @@ class DatabaseManager:
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
                     cur.executemany(query, knock_events)
-                    conn.commit()
+                    self._commit(conn)
                     return cur.rowcount
 
         except psycopg.Error as e:
@@ -1078,7 +1551,7 @@ class DatabaseManager:
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
                     cur.executemany(query, summaries)
-                    conn.commit()
+                    self._commit(conn)
                     return cur.rowcount
 
         except psycopg.Error as e:
@@ -1122,7 +1595,7 @@ class DatabaseManager:
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
                     cur.executemany(query, fights)
-                    conn.commit()
+                    self._commit(conn)
                     return cur.rowcount
 
         except psycopg.Error as e:
@@ -1165,7 +1638,7 @@ class DatabaseManager:
                 with conn.cursor() as cur:
                     cur.execute(query, fight)
                     result = cur.fetchone()
-                    conn.commit()
+                    self._commit(conn)
 
                     if result:
                         return result["id"]
@@ -1223,12 +1696,124 @@ class DatabaseManager:
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
                     cur.executemany(query, participants)
-                    conn.commit()
+                    self._commit(conn)
                     return cur.rowcount
 
         except psycopg.Error as e:
             raise DatabaseError(f"Failed to insert fight participants: {e}")
 
+    def insert_fights_with_participants(self, fights: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """Insert the team fights of a match together with their participants.
+
+        All fights go in with one multi-row INSERT ... RETURNING, and their
+        participants (the "participants" list of each fight) are linked to the
+        returned fight IDs client-side and inserted with one more statement.
+        Fights that already exist are skipped, and their IDs are looked up
+        with a single query so their participants are still linked.
+
+        Args:
+            fights: Fight dictionaries, each with a "participants" list
+
+        Returns:
+            Tuple of (fights inserted, participants inserted)
+
+        Raises:
+            DatabaseError: If insert fails
+        """
+        if not fights:
+            return 0, 0
+
+        # Fights are linked by (match, start, end). Times are sent time zone aware,
+        # so the server converts them to its TimeZone like the participants' times,
+        # and read back as timestamptz, so keys compare as instants client-side.
+        keys = [
+            (
+                fight["match_id"],
+                _parse_timestamp(fight["fight_start_time"], with_timezone=True),
+                _parse_timestamp(fight["fight_end_time"], with_timezone=True),
+            )
+            for fight in fights
+        ]
+        start_index = FIGHT_COLUMNS.index("fight_start_time")
+        end_index = FIGHT_COLUMNS.index("fight_end_time")
+        fight_rows = []
+        for row, (_, start_time, end_time) in zip(rows_from_dicts(fights, FIGHT_COLUMNS), keys):
+            row = list(row)
+            row[start_index] = start_time
+            row[end_index] = end_time
+            fight_rows.append(row)
+
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cur:
+                    fight_count, returned = self._insert_values(
+                        cur,
+                        "team_fights",
+                        FIGHT_COLUMNS,
+                        fight_rows,
+                        "ON CONFLICT DO NOTHING RETURNING id, match_id, "
+                        "fight_start_time::timestamptz AS fight_start_time, "
+                        "fight_end_time::timestamptz AS fight_end_time",
+                        returning=True,
+                    )
+
+                    if fight_count < len(fights):
+                        # Some fights existed already - fetch the IDs of the match's fights
+                        cur.execute(
+                            """
+                            SELECT
+                                id,
+                                match_id,
+                                fight_start_time::timestamptz AS fight_start_time,
+                                fight_end_time::timestamptz AS fight_end_time
+                            FROM team_fights
+                            WHERE match_id = ANY(%s)
+                            ORDER BY id
+                            """,
+                            (list({key[0] for key in keys}),),
+                        )
+                        returned.extend(cur.fetchall())
+
+                    fight_ids: Dict[tuple, List[int]] = {}
+                    for row in returned:
+                        key = (row["match_id"], row["fight_start_time"], row["fight_end_time"])
+                        ids = fight_ids.setdefault(key, [])
+                        if row["id"] not in ids:
+                            ids.append(row["id"])
+
+                    participant_rows = []
+                    for fight, key in zip(fights, keys):
+                        ids = fight_ids.get(key)
+                        if not ids:
+                            raise DatabaseError(
+                                f"Failed to retrieve fight ID for fight starting {key[1]}"
+                            )
+                        # Fights sharing start and end times take their IDs in order
+                        fight_id = ids.pop(0) if len(ids) > 1 else ids[0]
+                        for participant in fight.get("participants", []):
+                            participant_rows.append(
+                                tuple(
+                                    fight_id if column == "fight_id" else participant[column]
+                                    for column in FIGHT_PARTICIPANT_COLUMNS
+                                )
+                            )
+
+                    participant_count = 0
+                    if participant_rows:
+                        participant_count, _ = self._insert_values(
+                            cur,
+                            "fight_participants",
+                            FIGHT_PARTICIPANT_COLUMNS,
+                            participant_rows,
+                            "ON CONFLICT DO NOTHING",
+                        )
+
+                    self._commit(conn)
+                    return fight_count, participant_count
+
+        except psycopg.Error as e:
+            raise DatabaseError(f"Failed to insert fights with participants: {e}")
+
     # ========================================================================
     # Enhanced Tournament Stats (New Processors)
     # ========================================================================
@@ -1244,6 +1829,9 @@ class DatabaseManager:
         - avg_distance_from_center, avg_distance_from_edge
         - max_distance_from_center, min_distance_from_edge, time_outside_zone_seconds
 
+        All players are updated with one UPDATE ... FROM (VALUES ...) statement.
+        Stats that are missing or None keep their current value.
+
         Args:
             match_id: Match ID
             player_stats: Dictionary mapping player_name -> stats dict
@@ -1257,53 +1845,49 @@ class DatabaseManager:
         if not player_stats:
             return 0
 
-        try:
-            # Build UPDATE query for each player
-            query = sql.SQL("""
-                UPDATE match_summaries
-                SET
-                    heals_used = COALESCE(%(heals_used)s, heals_used),
-                    boosts_used = COALESCE(%(boosts_used)s, boosts_used),
-                    throwables_used = COALESCE(%(throwables_used)s, throwables_used),
-                    smokes_thrown = COALESCE(%(smokes_thrown)s, smokes_thrown),
-                    killsteals = COALESCE(%(killsteals)s, killsteals),
-                    throwable_damage = COALESCE(%(throwable_damage)s, throwable_damage),
-                    damage_received = COALESCE(%(damage_received)s, damage_received),
-                    avg_distance_from_center = COALESCE(%(avg_distance_from_center)s, avg_distance_from_center),
-                    avg_distance_from_edge = COALESCE(%(avg_distance_from_edge)s, avg_distance_from_edge),
-                    max_distance_from_center = COALESCE(%(max_distance_from_center)s, max_distance_from_center),
-                    min_distance_from_edge = COALESCE(%(min_distance_from_edge)s, min_distance_from_edge),
-                    time_outside_zone_seconds = COALESCE(%(time_outside_zone_seconds)s, time_outside_zone_seconds),
-                    updated_at = NOW()
-                WHERE match_id = %(match_id)s
-                  AND player_name = %(player_name)s
-            """)
+        columns = [column for column, _ in ENHANCED_STATS_COLUMNS]
+        row_values = sql.SQL("({})").format(
+            sql.SQL(", ").join(
+                [sql.Placeholder()]
+                + [
+                    sql.SQL("{}::{}").format(sql.Placeholder(), sql.SQL(column_type))
+                    for _, column_type in ENHANCED_STATS_COLUMNS
+                ]
+            )
+        )
+        assignments = sql.SQL(", ").join(
+            sql.SQL("{0} = COALESCE(v.{0}, ms.{0})").format(sql.Identifier(column))
+            for column in columns
+        )
+        value_columns = sql.SQL(", ").join(map(sql.Identifier, ["player_name"] + columns))
 
+        rows = [
+            [player_name] + [stats.get(column) for column in columns]
+            for player_name, stats in player_stats.items()
+        ]
+        chunk_size = (MAX_BIND_PARAMETERS - 1) // (len(columns) + 1)
+
+        try:
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
-                    # Execute update for each player
                     update_count = 0
-                    for player_name, stats in player_stats.items():
-                        params = {
-                            "match_id": match_id,
-                            "player_name": player_name,
-                            "heals_used": stats.get("heals_used"),
-                            "boosts_used": stats.get("boosts_used"),
-                            "throwables_used": stats.get("throwables_used"),
-                            "smokes_thrown": stats.get("smokes_thrown"),
-                            "killsteals": stats.get("killsteals"),
-                            "throwable_damage": stats.get("throwable_damage"),
-                            "damage_received": stats.get("damage_received"),
-                            "avg_distance_from_center": stats.get("avg_distance_from_center"),
-                            "avg_distance_from_edge": stats.get("avg_distance_from_edge"),
-                            "max_distance_from_center": stats.get("max_distance_from_center"),
-                            "min_distance_from_edge": stats.get("min_distance_from_edge"),
-                            "time_outside_zone_seconds": stats.get("time_outside_zone_seconds"),
-                        }
-                        cur.execute(query, params)
+                    for start in range(0, len(rows), chunk_size):
+                        chunk = rows[start : start + chunk_size]
+                        query = sql.SQL("""
+                            UPDATE match_summaries AS ms
+                            SET {}, updated_at = NOW()
+                            FROM (VALUES {}) AS v ({})
+                            WHERE ms.match_id = %s
+                              AND ms.player_name = v.player_name
+                        """).format(
+                            assignments,
+                            sql.SQL(", ").join([row_values] * len(chunk)),
+                            value_columns,
+                        )
+                        cur.execute(query, [value for row in chunk for value in row] + [match_id])
                         update_count += cur.rowcount
 
-                    conn.commit()
+                    self._commit(conn)
                     return update_count
 
         except psycopg.Error as e:
@@ -1330,6 +1914,14 @@ class DatabaseManager:
         if not positions:
             return 0
 
+        if self.use_copy:
+            return self.copy_rows(
+                "player_circle_positions",
+                CIRCLE_POSITION_COLUMNS,
+                rows_from_dicts(positions, CIRCLE_POSITION_COLUMNS),
+                on_conflict="ON CONFLICT DO NOTHING",
+            )
+
         try:
             query = sql.SQL("""
                 INSERT INTO player_circle_positions (
@@ -1349,7 +1941,7 @@ class DatabaseManager:
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
                     cur.executemany(query, positions)
-                    conn.commit()
+                    self._commit(conn)
                     return cur.rowcount
 
         except psycopg.Error as e:
@@ -1375,6 +1967,19 @@ class DatabaseManager:
         if not distributions:
             return 0
 
+        if self.use_copy:
+            return self.copy_rows(
+                "player_match_weapon_distribution",
+                WEAPON_DISTRIBUTION_COLUMNS,
+                rows_from_dicts(distributions, WEAPON_DISTRIBUTION_COLUMNS),
+                on_conflict=(
+                    "ON CONFLICT (match_id, player_name, weapon_category) DO UPDATE SET "
+                    "total_damage = EXCLUDED.total_damage, "
+                    "total_kills = EXCLUDED.total_kills, "
+                    "knock_downs = EXCLUDED.knock_downs"
+                ),
+            )
+
         try:
             query = sql.SQL("""
                 INSERT INTO player_match_weapon_distribution (
@@ -1393,7 +1998,7 @@ class DatabaseManager:
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
                     cur.executemany(query, distributions)
-                    conn.commit()
+                    self._commit(conn)
                     return cur.rowcount
 
         except psycopg.Error as e:
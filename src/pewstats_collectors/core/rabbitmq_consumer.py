@@ -8,6 +8,9 @@ Key features:
 - Callback pattern matching R BaseWorker
 - Manual acknowledgment mode (messages only removed on successful processing)
 - Batch processing support
+- Deferred acknowledgment for messages processed off the consumer thread
+- Threaded mode running callbacks on a thread pool so heartbeats keep flowing
+- Batched mode handing several messages to one callback for bulk writes
 - Prefetch control for concurrency
 - Graceful shutdown
 """
@@ -15,7 +18,8 @@ Key features:
 import json
 import logging
 import time
-from typing import Any, Callable, Dict, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
 
 import pika
 from pika.exceptions import AMQPConnectionError
@@ -188,22 +192,7 @@ class RabbitMQConsumer:
         try:
             self._ensure_connection()
 
-            queue_name = self._build_queue_name(type, step)
-            exchange_name = self._build_exchange_name(type)
-
-            # Declare exchange
-            self._channel.exchange_declare(
-                exchange=exchange_name, exchange_type="topic", durable=True
-            )
-
-            # Declare queue
-            self._channel.queue_declare(queue=queue_name, durable=True)
-
-            # Bind queue to exchange
-            routing_key = f"{type}.{step}"
-            self._channel.queue_bind(
-                exchange=exchange_name, queue=queue_name, routing_key=routing_key
-            )
+            queue_name = self._declare_queue(type, step)
 
             logger.info(f"Starting consumption from queue: {queue_name}")
 
@@ -229,6 +218,228 @@ class RabbitMQConsumer:
             logger.error(f"Error during consumption: {e}")
             raise RabbitMQConsumerError(f"Consumption failed: {e}")
 
+    def consume_messages_deferred(
+        self,
+        type: str,
+        step: str,
+        submit: Callable[[Dict[str, Any], Callable[[Dict[str, Any]], None]], None],
+    ) -> None:
+        """Start consuming messages that finish processing later (daemon mode).
+
+        For each message, submit(data, done) is called on the consumer thread and
+        must hand the message off without processing it. Once the message is
+        processed, done(result) is called from any thread with the usual callback
+        result; the message is then acked or nacked on the consumer thread through
+        connection.add_callback_threadsafe. Blocks indefinitely.
+
+        Up to prefetch_count messages are in flight at once, so set it to the
+        number of messages submit can accept without blocking.
+
+        Args:
+            type: Message type (match, stats, telemetry)
+            step: Processing step (discovered, processing, completed, failed)
+            submit: Function handing each message off for processing
+
+        Raises:
+            RabbitMQConsumerError: If consumption fails
+        """
+        try:
+            self._ensure_connection()
+
+            queue_name = self._declare_queue(type, step)
+            connection = self._connection
+
+            logger.info(f"Starting deferred consumption from queue: {queue_name}")
+
+            def on_message(channel, method, properties, body):
+                delivery_tag = method.delivery_tag
+                try:
+                    message_data = json.loads(body.decode("utf-8"))
+                except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                    logger.error(f"Failed to parse message JSON: {e}")
+                    channel.basic_nack(delivery_tag, requeue=False)
+                    return
+
+                def done(result: Dict[str, Any]) -> None:
+                    connection.add_callback_threadsafe(
+                        lambda: self._settle(channel, delivery_tag, message_data, result)
+                    )
+
+                try:
+                    submit(message_data, done)
+                except Exception as e:
+                    logger.error(f"Exception submitting message: {e}")
+                    channel.basic_nack(delivery_tag, requeue=False)
+
+            self._channel.basic_consume(
+                queue=queue_name, on_message_callback=on_message, auto_ack=False
+            )
+
+            self._consuming = True
+
+            logger.info(f"Waiting for messages from {queue_name}. Press Ctrl+C to exit.")
+            self._channel.start_consuming()
+
+        except KeyboardInterrupt:
+            logger.info("Consumption interrupted by user")
+            self.stop_consuming()
+        except Exception as e:
+            logger.error(f"Error during consumption: {e}")
+            raise RabbitMQConsumerError(f"Consumption failed: {e}")
+
+    def consume_messages_threaded(
+        self,
+        type: str,
+        step: str,
+        callback: Callable[[Dict[str, Any]], Dict[str, Any]],
+        workers: int = 1,
+    ) -> None:
+        """Start consuming messages on a pool of worker threads (daemon mode).
+
+        Same callback contract as consume_messages, but callbacks run on a pool of
+        worker threads while the consumer thread keeps servicing the connection,
+        so long-running callbacks no longer miss heartbeats. Messages are acked or
+        nacked through consume_messages_deferred. Prefetch is set to the number of
+        workers, so every worker has a message and none wait in the pool's queue.
+        Blocks indefinitely.
+
+        Args:
+            type: Message type (match, stats, telemetry)
+            step: Processing step (discovered, processing, completed, failed)
+            callback: Function to process each message; must be thread-safe if
+                workers > 1
+            workers: Number of worker threads (default: 1)
+
+        Raises:
+            RabbitMQConsumerError: If consumption fails
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+
+        self._set_prefetch(workers)
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"{type}.{step}")
+
+        def submit(data: Dict[str, Any], done: Callable[[Dict[str, Any]], None]) -> None:
+            future = executor.submit(self._run_callback, data, callback)
+            future.add_done_callback(lambda f: self._complete(f, done))
+
+        logger.info(f"Processing messages on {workers} worker thread(s)")
+        try:
+            self.consume_messages_deferred(type, step, submit)
+        finally:
+            # Unfinished messages are redelivered once the connection closes
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def consume_messages_batched(
+        self,
+        type: str,
+        step: str,
+        callback: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+        batch_size: int = 10,
+        max_wait: float = 5.0,
+    ) -> None:
+        """Start consuming messages in batches (daemon mode).
+
+        Gathers up to batch_size messages, or whatever arrived within max_wait
+        seconds of the first one, and passes them to callback at once, e.g. to
+        write all of them in one transaction. The callback runs on a worker
+        thread, like in consume_messages_threaded, so the consumer thread keeps
+        servicing heartbeats while a batch is processed. Blocks indefinitely.
+
+        Callback contract:
+            Input: List of parsed message dicts
+            Output: One result per message, in order:
+                {"success": True/False, "error": optional error message}
+
+        Each message is acked or nacked on its own result; messages without a
+        result, or all of them if the callback raises, are nacked. Prefetch is set
+        to batch_size so a full batch can be delivered.
+
+        Args:
+            type: Message type (match, stats, telemetry)
+            step: Processing step (discovered, processing, completed, failed)
+            callback: Function to process each batch
+            batch_size: Maximum number of messages per batch (default: 10)
+            max_wait: Seconds to wait for a batch to fill (default: 5.0)
+
+        Raises:
+            RabbitMQConsumerError: If consumption fails
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+        self._set_prefetch(batch_size)
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{type}.{step}")
+        try:
+            self._ensure_connection()
+
+            queue_name = self._declare_queue(type, step)
+            connection = self._connection
+            batch = []
+            timer = None
+
+            logger.info(
+                f"Starting batched consumption from queue: {queue_name} "
+                f"(batch_size={batch_size}, max_wait={max_wait}s)"
+            )
+
+            def flush():
+                nonlocal timer
+                if timer is not None:
+                    connection.remove_timeout(timer)
+                    timer = None
+                deliveries = batch[:]
+                batch.clear()
+                messages = [message_data for _, _, message_data in deliveries]
+
+                def done(results: List[Dict[str, Any]]) -> None:
+                    connection.add_callback_threadsafe(
+                        lambda: self._settle_batch(deliveries, results)
+                    )
+
+                future = executor.submit(self._run_batch, messages, callback)
+                future.add_done_callback(lambda f: self._complete(f, done))
+
+            def on_timeout():
+                nonlocal timer
+                timer = None
+                if batch:
+                    flush()
+
+            def on_message(channel, method, properties, body):
+                nonlocal timer
+                try:
+                    message_data = json.loads(body.decode("utf-8"))
+                except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                    logger.error(f"Failed to parse message JSON: {e}")
+                    channel.basic_nack(method.delivery_tag, requeue=False)
+                    return
+
+                batch.append((channel, method.delivery_tag, message_data))
+                if len(batch) >= batch_size:
+                    flush()
+                elif timer is None:
+                    timer = connection.call_later(max_wait, on_timeout)
+
+            self._channel.basic_consume(
+                queue=queue_name, on_message_callback=on_message, auto_ack=False
+            )
+
+            self._consuming = True
+
+            logger.info(f"Waiting for messages from {queue_name}. Press Ctrl+C to exit.")
+            self._channel.start_consuming()
+
+        except KeyboardInterrupt:
+            logger.info("Consumption interrupted by user")
+            self.stop_consuming()
+        except Exception as e:
+            logger.error(f"Error during consumption: {e}")
+            raise RabbitMQConsumerError(f"Consumption failed: {e}")
+        finally:
+            # Unfinished messages are redelivered once the connection closes
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def consume_batch(
         self,
         type: str,
@@ -301,6 +512,155 @@ class RabbitMQConsumer:
             logger.error(f"Error during batch consumption: {e}")
             raise RabbitMQConsumerError(f"Batch consumption failed: {e}")
 
+    def _declare_queue(self, type: str, step: str) -> str:
+        """Declare a step's queue and bind it to its type's exchange.
+
+        Args:
+            type: Message type (match, stats, telemetry)
+            step: Processing step (discovered, processing, completed, failed)
+
+        Returns:
+            Queue name
+        """
+        queue_name = self._build_queue_name(type, step)
+        exchange_name = self._build_exchange_name(type)
+
+        # Declare exchange
+        self._channel.exchange_declare(exchange=exchange_name, exchange_type="topic", durable=True)
+
+        # Declare queue
+        self._channel.queue_declare(queue=queue_name, durable=True)
+
+        # Bind queue to exchange
+        routing_key = f"{type}.{step}"
+        self._channel.queue_bind(exchange=exchange_name, queue=queue_name, routing_key=routing_key)
+
+        return queue_name
+
+    def _set_prefetch(self, prefetch_count: int) -> None:
+        """Set the prefetch count, applying it to the open channel.
+
+        Args:
+            prefetch_count: Number of unacknowledged messages to allow
+        """
+        self.prefetch_count = prefetch_count
+        if self._channel is not None and not self._channel.is_closed:
+            self._channel.basic_qos(prefetch_count=prefetch_count)
+
+    def _run_callback(
+        self, message_data: Dict[str, Any], callback: Callable[[Dict[str, Any]], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Run a callback on a worker thread, turning exceptions into failures.
+
+        Args:
+            message_data: Parsed message
+            callback: User callback function
+
+        Returns:
+            Callback result, or a failure result if it raised
+        """
+        match_id = message_data.get("match_id", "unknown")
+        logger.debug(f"Processing message for match: {match_id}")
+        try:
+            return callback(message_data)
+        except Exception as e:
+            error_msg = f"Exception during message processing: {e}"
+            logger.error(error_msg)
+            return {"success": False, "error": error_msg}
+
+    def _complete(self, future: Future, done: Callable[[Dict[str, Any]], None]) -> None:
+        """Report a worker thread's result, unless the message was cancelled.
+
+        Args:
+            future: Future of the callback run
+            done: Completion callback from consume_messages_deferred
+        """
+        if not future.cancelled():
+            done(future.result())
+
+    def _run_batch(
+        self,
+        messages: List[Dict[str, Any]],
+        callback: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """Run a batch callback on a worker thread, returning one result per message.
+
+        Args:
+            messages: Parsed messages of the batch
+            callback: User batch callback function
+
+        Returns:
+            Callback results; failures for every message if it raised and for
+            messages it returned no result for
+        """
+        start_time = time.time()
+
+        try:
+            results = list(callback(messages))
+        except Exception as e:
+            error_msg = f"Exception during batch processing: {e}"
+            logger.error(error_msg)
+            results = [{"success": False, "error": error_msg}] * len(messages)
+
+        if len(results) != len(messages):
+            logger.warning(
+                f"Batch callback returned {len(results)} results for {len(messages)} "
+                "messages, treating missing results as failures"
+            )
+            missing = {"success": False, "error": "No result for message"}
+            results = results[: len(messages)] + [missing] * (len(messages) - len(results))
+
+        logger.debug(
+            f"Processed batch of {len(messages)} messages in {time.time() - start_time:.2f}s"
+        )
+        return results
+
+    def _settle_batch(self, deliveries: List[tuple], results: List[Dict[str, Any]]) -> None:
+        """Ack or nack each message of a batch. Runs on the consumer thread.
+
+        Args:
+            deliveries: (channel, delivery_tag, message_data) of each message
+            results: Result of each message, from _run_batch
+        """
+        for (channel, delivery_tag, message_data), result in zip(deliveries, results):
+            self._settle(channel, delivery_tag, message_data, result)
+
+    def _settle(
+        self,
+        channel: pika.channel.Channel,
+        delivery_tag: int,
+        message_data: Dict[str, Any],
+        result: Any,
+    ) -> None:
+        """Ack or nack a deferred message once its result is known.
+
+        Runs on the consumer thread.
+
+        Args:
+            channel: Channel the message was delivered on
+            delivery_tag: Delivery tag of the message
+            message_data: Parsed message
+            result: Result passed to done()
+        """
+        match_id = message_data.get("match_id", "unknown")
+
+        if not isinstance(result, dict) or "success" not in result:
+            logger.warning(f"Callback returned invalid format, treating as failure: {result}")
+            result = {"success": False, "error": "Invalid callback return format"}
+
+        try:
+            if result["success"]:
+                self._processed_count += 1
+                logger.info(f"Successfully processed match: {match_id}")
+                channel.basic_ack(delivery_tag)
+            else:
+                logger.error(
+                    f"Failed to process match {match_id}: {result.get('error', 'Unknown error')}"
+                )
+                channel.basic_nack(delivery_tag, requeue=False)
+        except Exception as e:
+            logger.error(f"Failed to acknowledge message for match {match_id}: {e}")
+
     def _on_message_callback(
         self,
         channel: pika.channel.Channel,
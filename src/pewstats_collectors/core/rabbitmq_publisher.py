@@ -8,6 +8,8 @@ Key features:
 - AMQP protocol (via pika) for better performance
 - Connection management with auto-reconnect
 - Message persistence and durability
+- Queue declarations cached per connection
+- Batch publishing under publisher confirms
 - Full R business logic parity
 """
 
@@ -15,7 +17,7 @@ import json
 import logging
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Set
 
 import pika
 from pika.exceptions import AMQPConnectionError
@@ -30,6 +32,141 @@ class RabbitMQError(Exception):
     pass
 
 
+class _ConfirmedBatch:
+    """One publish_many batch, sent on its own SelectConnection.
+
+    Messages are published confirm_window at a time; the broker's acks and
+    nacks for a window are matched to messages by delivery tag before the next
+    window is sent. The batch stops if a window is not confirmed within
+    confirm_timeout or the channel closes; unsent and unconfirmed messages
+    keep a False result.
+    """
+
+    def __init__(
+        self,
+        parameters: pika.ConnectionParameters,
+        routing_key: str,
+        bodies: List[str],
+        properties: pika.BasicProperties,
+        confirm_window: int,
+        confirm_timeout: float,
+    ):
+        self.parameters = parameters
+        self.routing_key = routing_key
+        self.bodies = bodies
+        self.properties = properties
+        self.confirm_window = confirm_window
+        self.confirm_timeout = confirm_timeout
+
+        self.results = [False] * len(bodies)
+        self.error: Optional[BaseException] = None
+        self._connection: Optional[pika.SelectConnection] = None
+        self._channel = None
+        self._sent = 0
+        self._delivery_tag = 0
+        self._pending: Dict[int, int] = {}  # delivery tag -> message index
+        self._timeout = None
+
+    def run(self) -> List[bool]:
+        """Publish the batch, returning one result per message."""
+        self._connection = pika.SelectConnection(
+            self.parameters,
+            on_open_callback=self._on_connection_open,
+            on_open_error_callback=self._on_connection_error,
+            on_close_callback=self._on_connection_closed,
+        )
+        try:
+            self._connection.ioloop.start()
+        except Exception as e:
+            self.error = e
+            if not self._connection.is_closed:
+                self._close()
+                self._connection.ioloop.start()
+        return self.results
+
+    def _on_connection_open(self, connection) -> None:
+        connection.channel(on_open_callback=self._on_channel_open)
+
+    def _on_connection_error(self, connection, error: BaseException) -> None:
+        self.error = error
+        connection.ioloop.stop()
+
+    def _on_connection_closed(self, connection, reason: BaseException) -> None:
+        connection.ioloop.stop()
+
+    def _on_channel_open(self, channel) -> None:
+        self._channel = channel
+        channel.add_on_close_callback(self._on_channel_closed)
+        channel.queue_declare(
+            queue=self.routing_key, durable=True, callback=self._on_queue_declared
+        )
+
+    def _on_queue_declared(self, frame) -> None:
+        self._channel.confirm_delivery(
+            ack_nack_callback=self._on_confirm, callback=lambda frame: self._publish_window()
+        )
+
+    def _on_channel_closed(self, channel, reason: BaseException) -> None:
+        if self._pending or self._sent < len(self.bodies):
+            self.error = reason
+        self._pending.clear()
+        self._close()
+
+    def _publish_window(self) -> None:
+        """Send the next window of messages, or finish once all are confirmed."""
+        if self._sent >= len(self.bodies):
+            self._close()
+            return
+
+        end = min(self._sent + self.confirm_window, len(self.bodies))
+        for index in range(self._sent, end):
+            self._channel.basic_publish(
+                exchange="",
+                routing_key=self.routing_key,
+                body=self.bodies[index],
+                properties=self.properties,
+            )
+            self._delivery_tag += 1
+            self._pending[self._delivery_tag] = index
+        self._sent = end
+        self._timeout = self._connection.ioloop.call_later(
+            self.confirm_timeout, self._on_confirm_timeout
+        )
+
+    def _on_confirm(self, frame) -> None:
+        """Record the broker's ack or nack of one or more delivery tags."""
+        method = frame.method
+        if method.multiple:
+            tags = [tag for tag in self._pending if tag <= method.delivery_tag]
+        else:
+            tags = [method.delivery_tag]
+
+        confirmed = isinstance(method, pika.spec.Basic.Ack)
+        for tag in tags:
+            index = self._pending.pop(tag, None)
+            if index is not None:
+                self.results[index] = confirmed
+
+        if not self._pending:
+            self._connection.ioloop.remove_timeout(self._timeout)
+            self._publish_window()
+
+    def _on_confirm_timeout(self) -> None:
+        logger.warning(
+            f"{len(self._pending)} messages to {self.routing_key} not confirmed within "
+            f"{self.confirm_timeout}s"
+        )
+        self._pending.clear()
+        self._sent = len(self.bodies)
+        self._close()
+
+    def _close(self) -> None:
+        if self._connection.is_open:
+            self._connection.close()
+        elif self._connection.is_closed:
+            self._connection.ioloop.stop()
+
+
 class RabbitMQPublisher:
     """RabbitMQ publisher for PUBG match collection system.
 
@@ -59,6 +196,7 @@ class RabbitMQPublisher:
         environment: Optional[str] = None,
         connection_timeout: int = 10,
         heartbeat: int = 600,
+        confirm_timeout: int = 30,
     ):
         """Initialize RabbitMQ publisher.
 
@@ -71,6 +209,8 @@ class RabbitMQPublisher:
             environment: Environment (prod, dev, etc.) (auto-detects if None)
             connection_timeout: Connection timeout in seconds
             heartbeat: Heartbeat interval in seconds
+            confirm_timeout: Seconds publish_many waits for the broker to confirm
+                a window of messages
 
         Raises:
             RabbitMQError: If connection fails
@@ -86,11 +226,15 @@ class RabbitMQPublisher:
         self.environment = config["environment"]
         self.connection_timeout = connection_timeout
         self.heartbeat = heartbeat
+        self.confirm_timeout = confirm_timeout
 
         # Connection and channel (lazy initialization)
         self._connection: Optional[pika.BlockingConnection] = None
         self._channel: Optional[pika.channel.Channel] = None
 
+        # Queues declared on the current connection
+        self._declared_queues: Set[str] = set()
+
         logger.info(
             f"RabbitMQ publisher initialized: {self.host}:{self.port} (vhost={self.vhost}, env={self.environment})"
         )
@@ -211,26 +355,28 @@ class RabbitMQPublisher:
         """
         if self._connection is None or self._connection.is_closed:
             try:
-                credentials = pika.PlainCredentials(self.username, self.password)
-                parameters = pika.ConnectionParameters(
-                    host=self.host,
-                    port=self.port,
-                    virtual_host=self.vhost,
-                    credentials=credentials,
-                    connection_attempts=3,
-                    retry_delay=2,
-                    socket_timeout=self.connection_timeout,
-                    heartbeat=self.heartbeat,
-                )
-
-                self._connection = pika.BlockingConnection(parameters)
+                self._connection = pika.BlockingConnection(self._connection_parameters())
                 self._channel = self._connection.channel()
+                self._declared_queues = set()
 
                 logger.debug(f"Connected to RabbitMQ: {self.host}:{self.port}")
 
             except AMQPConnectionError as e:
                 raise RabbitMQError(f"Failed to connect to RabbitMQ: {e}")
 
+    def _connection_parameters(self) -> pika.ConnectionParameters:
+        """Build the connection parameters of this publisher."""
+        return pika.ConnectionParameters(
+            host=self.host,
+            port=self.port,
+            virtual_host=self.vhost,
+            credentials=pika.PlainCredentials(self.username, self.password),
+            connection_attempts=3,
+            retry_delay=2,
+            socket_timeout=self.connection_timeout,
+            heartbeat=self.heartbeat,
+        )
+
     def publish_message(
         self,
         type: str,
@@ -261,25 +407,12 @@ class RabbitMQPublisher:
             # Build queue name (routing key)
             routing_key = self._build_queue_name(type, step)
 
-            # Declare queue (idempotent - safe to call multiple times)
+            # Declare queue once per connection
             # This ensures the queue exists before publishing
-            self._channel.queue_declare(queue=routing_key, durable=True)
-
-            # Add metadata to message (R compatibility)
-            message_with_metadata = message.copy()
-            message_with_metadata["environment"] = self.environment
-            message_with_metadata["queue_target"] = routing_key
-
-            # Serialize message to JSON
-            payload = json.dumps(message_with_metadata)
-
-            # Build AMQP properties
-            amqp_properties = pika.BasicProperties(
-                delivery_mode=2,  # Persistent message
-                content_type=properties.get("content_type", "application/json")
-                if properties
-                else "application/json",
-            )
+            self._declare_queue(routing_key)
+
+            payload = self._build_payload(message, routing_key)
+            amqp_properties = self._build_properties(properties)
 
             # Publish to default exchange with routing_key = queue_name
             # This matches R's behavior of publishing directly to queue
@@ -297,6 +430,110 @@ class RabbitMQPublisher:
             logger.warning(f"Failed to publish message to {type}.{step}: {e}")
             return False
 
+    def publish_many(
+        self,
+        type: str,
+        step: str,
+        messages: List[Dict[str, Any]],
+        properties: Optional[Dict[str, Any]] = None,
+        confirm_window: int = 100,
+    ) -> List[bool]:
+        """Publish many messages to a RabbitMQ queue under publisher confirms.
+
+        The batch is sent on its own non-blocking connection. Messages go out in
+        windows of confirm_window without waiting in between, and the broker's
+        acks and nacks for a window are collected by delivery tag before the
+        next window is sent. Messages get the same metadata as publish_message.
+
+        Args:
+            type: Message type (match, stats, telemetry, dlq)
+            step: Processing step (discovered, processing, completed, failed)
+            messages: Message payloads (will be JSON serialized)
+            properties: Optional message properties (e.g., content_type)
+            confirm_window: Messages sent before waiting for their confirms
+
+        Returns:
+            One result per message, in order: True if the broker confirmed it,
+            False if it was nacked, not confirmed in time or not sent
+        """
+        if confirm_window < 1:
+            raise ValueError(f"confirm_window must be at least 1, got {confirm_window}")
+
+        results = [False] * len(messages)
+        if not messages:
+            return results
+
+        routing_key = self._build_queue_name(type, step)
+        try:
+            batch = _ConfirmedBatch(
+                self._connection_parameters(),
+                routing_key,
+                [self._build_payload(message, routing_key) for message in messages],
+                self._build_properties(properties),
+                confirm_window,
+                self.confirm_timeout,
+            )
+            results = batch.run()
+            if batch.error is not None:
+                logger.warning(f"Failed to publish messages to {type}.{step}: {batch.error}")
+
+        except Exception as e:
+            logger.warning(f"Failed to publish messages to {type}.{step}: {e}")
+
+        confirmed = sum(results)
+        if confirmed < len(messages):
+            logger.warning(
+                f"Published {confirmed}/{len(messages)} messages to "
+                f"{self._build_queue_name(type, step)}"
+            )
+        else:
+            logger.debug(
+                f"Published {confirmed} messages to queue: {self._build_queue_name(type, step)}"
+            )
+        return results
+
+    def _declare_queue(self, queue_name: str) -> None:
+        """Declare a durable queue unless it was declared on this connection.
+
+        Args:
+            queue_name: Queue to declare
+        """
+        if queue_name in self._declared_queues:
+            return
+        self._channel.queue_declare(queue=queue_name, durable=True)
+        self._declared_queues.add(queue_name)
+
+    def _build_payload(self, message: Dict[str, Any], routing_key: str) -> str:
+        """Serialize a message with its metadata (R compatibility).
+
+        Args:
+            message: Message payload
+            routing_key: Queue the message is published to
+
+        Returns:
+            JSON payload
+        """
+        message_with_metadata = message.copy()
+        message_with_metadata["environment"] = self.environment
+        message_with_metadata["queue_target"] = routing_key
+        return json.dumps(message_with_metadata)
+
+    def _build_properties(self, properties: Optional[Dict[str, Any]]) -> pika.BasicProperties:
+        """Build AMQP properties of a persistent message.
+
+        Args:
+            properties: Optional message properties (e.g., content_type)
+
+        Returns:
+            AMQP properties
+        """
+        return pika.BasicProperties(
+            delivery_mode=2,  # Persistent message
+            content_type=properties.get("content_type", "application/json")
+            if properties
+            else "application/json",
+        )
+
     def close(self) -> None:
         """Close RabbitMQ connection.
 
@@ -0,0 +1,245 @@
+"""
+Telemetry Artifact Cache - pre-extracted events stored next to raw telemetry.
+
+Parsing raw.json.gz is the most expensive part of reprocessing a match. The
+first read of a match writes an artifact (raw.events.msgpack.zz for raw.json.gz)
+in the same directory containing only the event types the extractors consume,
+so later reprocessing and backfills can load the events directly.
+
+An artifact is only used when its schema version matches
+ARTIFACT_SCHEMA_VERSION, it contains every requested event type, and the raw
+file has not changed since it was written. Otherwise it is rebuilt from the
+raw file. Bump ARTIFACT_SCHEMA_VERSION whenever extractors start reading event
+fields or types that older artifacts may not contain.
+
+An artifact is a msgpack header map, prefixed with its 4-byte big-endian
+length, followed by the zlib-compressed msgpack encoded event records (see
+telemetry_records), so staleness checks only read the header. Both are
+decoded with msgspec, which only builds plain data and records. Loaded
+records share their repeated strings like freshly read ones.
+
+Example:
+    >>> cache = TelemetryArtifactCache(event_types=TELEMETRY_EVENT_TYPES)
+    >>> events = cache.read("/data/telemetry/matchID=abc/raw.json.gz")
+"""
+
+import gc
+import logging
+import os
+import struct
+import tempfile
+import zlib
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional
+
+import msgspec
+
+from ..metrics import TELEMETRY_ARTIFACT_LOOKUPS
+from ..processors.event_dispatcher import get_event_type
+from .telemetry_reader import TelemetryReader
+from .telemetry_records import TelemetryEvent, TelemetryEventList, share_strings
+
+ARTIFACT_SCHEMA_VERSION = 3
+ARTIFACT_SUFFIX = ".events.msgpack.zz"
+
+# Artifacts favour fast loads over size
+ARTIFACT_COMPRESSLEVEL = 1
+
+_ENCODER = msgspec.msgpack.Encoder()
+_DECODER = msgspec.msgpack.Decoder(TelemetryEventList)
+_HEADER_DECODER = msgspec.msgpack.Decoder(Dict[str, Any])
+
+# Big-endian length of the encoded header
+_HEADER_LENGTH = struct.Struct(">I")
+
+
+@contextmanager
+def _gc_paused():
+    """Pause cyclic GC; decoding many small objects otherwise triggers repeated collections."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def artifact_path_for(file_path: str) -> str:
+    """Path of the artifact belonging to a raw telemetry file."""
+    base = os.path.abspath(file_path)
+    for extension in (".gz", ".json"):
+        if base.endswith(extension):
+            base = base[: -len(extension)]
+    return base + ARTIFACT_SUFFIX
+
+
+class TelemetryArtifactCache:
+    """
+    Read-through cache of extracted telemetry events per match.
+
+    Attributes:
+        event_types: Event types stored in artifacts written by this cache
+        schema_version: Artifact schema version written and accepted
+    """
+
+    def __init__(
+        self,
+        event_types: Iterable[str],
+        schema_version: int = ARTIFACT_SCHEMA_VERSION,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Initialize artifact cache.
+
+        Args:
+            event_types: Event types to store in artifacts
+            schema_version: Artifact schema version (default: ARTIFACT_SCHEMA_VERSION)
+            logger: Optional logger instance
+        """
+        self.event_types = frozenset(event_types)
+        self.schema_version = schema_version
+        self.logger = logger or logging.getLogger(__name__)
+
+    def read(self, file_path: str, event_types: Optional[Iterable[str]] = None) -> List[Any]:
+        """
+        Load events from the artifact, rebuilding it from the raw file if needed.
+
+        Args:
+            file_path: Path to raw.json.gz file
+            event_types: Event types to return (default: all cached event types)
+
+        Returns:
+            List of events in telemetry order, as records where the type has one
+
+        Raises:
+            OSError, ValueError: If the raw file has to be read and cannot be parsed
+        """
+        wanted = self.event_types if event_types is None else frozenset(event_types)
+
+        events = self.load(file_path, wanted)
+        if events is None:
+            events = TelemetryReader(
+                file_path, event_types=self.event_types | wanted, typed=True
+            ).read()
+            self.save(file_path, events)
+
+        if wanted >= self.event_types:
+            return events
+        return [event for event in events if get_event_type(event) in wanted]
+
+    def load(
+        self, file_path: str, event_types: Optional[Iterable[str]] = None
+    ) -> Optional[List[TelemetryEvent]]:
+        """
+        Load events from a valid artifact.
+
+        Args:
+            file_path: Path to raw.json.gz file
+            event_types: Event types the artifact must contain (default: cached types)
+
+        Returns:
+            Cached events, or None if there is no usable artifact
+        """
+        wanted = self.event_types if event_types is None else frozenset(event_types)
+        artifact_path = artifact_path_for(file_path)
+
+        try:
+            source = self._source_stamp(file_path)
+            with open(artifact_path, "rb") as f:
+                (header_length,) = _HEADER_LENGTH.unpack(f.read(_HEADER_LENGTH.size))
+                header = _HEADER_DECODER.decode(f.read(header_length))
+
+                if (
+                    header.get("schema_version") != self.schema_version
+                    or header.get("source") != source
+                    or not wanted <= frozenset(header.get("event_types", ()))
+                ):
+                    TELEMETRY_ARTIFACT_LOOKUPS.labels(result="stale").inc()
+                    return None
+
+                payload = zlib.decompress(f.read())
+
+            with _gc_paused():
+                events = _DECODER.decode(payload)
+                strings: Dict[str, str] = {}
+                for event in events:
+                    share_strings(event, strings)
+
+        except FileNotFoundError:
+            TELEMETRY_ARTIFACT_LOOKUPS.labels(result="miss").inc()
+            return None
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable telemetry artifact {artifact_path}: {e}")
+            TELEMETRY_ARTIFACT_LOOKUPS.labels(result="error").inc()
+            return None
+
+        TELEMETRY_ARTIFACT_LOOKUPS.labels(result="hit").inc()
+        return events
+
+    def save(self, file_path: str, events: List[Any]) -> bool:
+        """
+        Write the artifact for a raw telemetry file.
+
+        The artifact is written to a temporary file and renamed into place, so
+        concurrent readers never see a partial artifact. Failures, including
+        events the encoder rejects, are logged and only skip caching. Files with
+        cached events that do not fit their record schema are not cached and are
+        read from the raw file every time.
+
+        Args:
+            file_path: Path to raw.json.gz file
+            events: Events read from the raw file (at least self.event_types)
+
+        Returns:
+            True if the artifact was written
+        """
+        artifact_path = artifact_path_for(file_path)
+        stored = [event for event in events if get_event_type(event) in self.event_types]
+        if not all(isinstance(event, TelemetryEvent) for event in stored):
+            self.logger.warning(
+                f"Not caching telemetry artifact {artifact_path}: events do not fit their schema"
+            )
+            return False
+
+        tmp_path = None
+        try:
+            header = {
+                "schema_version": self.schema_version,
+                "event_types": sorted(self.event_types),
+                "source": self._source_stamp(file_path),
+                "event_count": len(stored),
+            }
+            # Encode first: events the encoder rejects must not leave a temp file
+            encoded_header = _ENCODER.encode(header)
+            payload = zlib.compress(_ENCODER.encode(stored), ARTIFACT_COMPRESSLEVEL)
+
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=f".{os.path.basename(artifact_path)}.", dir=os.path.dirname(artifact_path)
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER_LENGTH.pack(len(encoded_header)))
+                f.write(encoded_header)
+                f.write(payload)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, artifact_path)
+            tmp_path = None
+            return True
+
+        except Exception as e:
+            self.logger.warning(f"Failed to write telemetry artifact {artifact_path}: {e}")
+            TELEMETRY_ARTIFACT_LOOKUPS.labels(result="error").inc()
+            return False
+
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _source_stamp(file_path: str) -> Dict[str, int]:
+        """Size and modification time identifying a raw file version."""
+        stat = os.stat(file_path)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
@@ -0,0 +1,207 @@
+"""Telemetry Reader - incremental parsing of raw telemetry files.
+
+Telemetry files are a single JSON array of events, stored either gzipped once
+or gzipped twice (older downloads). Loading them with json.load materializes
+every event before extraction starts; this reader instead decodes the array
+one event at a time from the decompressed stream and drops event types that
+no extractor consumes, so only relevant events are ever held in memory.
+
+PUBG writes the "_T" event type as the last key of each event, so the end of
+an event and its type are found by scanning for the next "_T" key. Events of
+unwanted types are skipped without being decoded at all. In typed mode, events
+with a schema in telemetry_records are decoded straight into records, sharing
+one string object per distinct player name, account id and weapon id of the
+file. Events that do not follow this layout are decoded with the json module
+as before.
+
+Example:
+    >>> reader = TelemetryReader(path, event_types={"LogPlayerKillV2"}, typed=True)
+    >>> kills = list(reader)
+    >>> reader.events_read, reader.events_kept
+"""
+
+import gzip
+import io
+import json
+import re
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional, Tuple
+
+from ..processors.event_dispatcher import get_event_type
+from .telemetry_records import decode_event, record_from_dict, share_strings
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+# Characters of decompressed text decoded per read
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# "_T" key closing an event object; the first "_T" after an event's start
+_TYPE_KEY = '"_T"'
+_TYPE_TAIL = re.compile(r'"_T"[ \t\n\r]*:[ \t\n\r]*"([^"\\]*)"[ \t\n\r]*\}')
+
+# Alternative type keys; spans containing them are decoded to be safe
+_OTHER_TYPE_KEYS = ('"type"', '"event_type"')
+
+
+class TelemetryReader:
+    """Streaming reader for raw.json.gz telemetry files.
+
+    Iterating the reader yields events in file order. Counters are updated as
+    the stream is consumed.
+
+    Attributes:
+        events_read: Number of events read from the file (decoded or skipped)
+        events_kept: Number of events yielded (matching event_types)
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        event_types: Optional[Iterable[str]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        typed: bool = False,
+    ):
+        """Initialize telemetry reader.
+
+        Args:
+            file_path: Path to raw.json.gz file (single or double gzipped)
+            event_types: Event types to keep (default: None keeps all events)
+            chunk_size: Number of characters decoded per read
+            typed: Yield records for event types with a schema (default: dicts)
+        """
+        self.file_path = file_path
+        self.event_types = frozenset(event_types) if event_types is not None else None
+        self.chunk_size = chunk_size
+        self.typed = typed
+
+        self.events_read = 0
+        self.events_kept = 0
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        with gzip.open(self.file_path, "rb") as outer:
+            # Double gzipped files start with a second gzip header
+            if outer.read(2) == GZIP_MAGIC:
+                outer.seek(0)
+                with gzip.GzipFile(fileobj=outer, mode="rb") as inner:
+                    yield from self._iter_events(inner)
+            else:
+                outer.seek(0)
+                yield from self._iter_events(outer)
+
+    def read(self) -> list:
+        """Read all matching events into a list."""
+        return list(self)
+
+    def _iter_events(self, stream: BinaryIO) -> Iterator[Dict[str, Any]]:
+        """Decode the top-level JSON array element by element."""
+        text = io.TextIOWrapper(stream, encoding="utf-8")
+        decoder = json.JSONDecoder()
+        event_types = self.event_types
+        typed = self.typed
+        scan = typed or event_types is not None
+        strings: Dict[str, str] = {}  # Shared strings of this file's records
+
+        buffer = text.read(self.chunk_size)
+        eof = not buffer
+        pos = _WHITESPACE.match(buffer, 0).end()
+
+        if buffer[pos : pos + 1] != "[":
+            # Not an event array - decode it fully for a useful error message
+            content = json.loads(buffer + text.read())
+            raise ValueError(f"Expected list of events, got {type(content)}")
+        pos += 1
+        expect_separator = False
+
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+
+            # Refill when the buffer is exhausted
+            if pos >= len(buffer):
+                if eof:
+                    raise ValueError("Unexpected end of telemetry file")
+                buffer, pos, eof = self._refill(text, buffer, pos)
+                continue
+
+            char = buffer[pos]
+            if char == "]":
+                return
+
+            if expect_separator:
+                if char != ",":
+                    raise ValueError(f"Expected ',' between events at offset {pos}")
+                pos += 1
+                expect_separator = False
+                continue
+
+            if scan:
+                span = self._typed_span(buffer, pos)
+                if span is not None:
+                    event_type, end = span
+
+                    if event_types is not None and event_type not in event_types:
+                        pos = end
+                        expect_separator = True
+                        self.events_read += 1
+                        continue
+
+                    record = decode_event(event_type, buffer[pos:end]) if typed else None
+                    if record is not None:
+                        pos = end
+                        expect_separator = True
+                        self.events_read += 1
+                        self.events_kept += 1
+                        share_strings(record, strings)
+                        yield record
+                        continue
+
+            try:
+                event, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                buffer, pos, eof = self._refill(text, buffer, pos)
+                continue
+
+            # A value ending exactly at the buffer edge may be truncated
+            if end >= len(buffer) and not eof:
+                buffer, pos, eof = self._refill(text, buffer, pos)
+                continue
+
+            pos = end
+            expect_separator = True
+            self.events_read += 1
+
+            if event_types is None or get_event_type(event) in event_types:
+                self.events_kept += 1
+                if typed:
+                    event = record_from_dict(event)
+                    share_strings(event, strings)
+                yield event
+
+    @staticmethod
+    def _typed_span(buffer: str, pos: int) -> Optional[Tuple[str, int]]:
+        """Find the event type and end of the event starting at pos.
+
+        Returns:
+            Tuple of (event_type, end), or None if the event has to be decoded
+            to tell (no closing "_T" key in the buffer, or other type keys)
+        """
+        if buffer[pos] != "{":
+            return None
+        key = buffer.find(_TYPE_KEY, pos)
+        if key < 0:
+            return None
+        tail = _TYPE_TAIL.match(buffer, key)
+        if tail is None:
+            return None
+        end = tail.end()
+        for type_key in _OTHER_TYPE_KEYS:
+            if buffer.find(type_key, pos, end) >= 0:
+                return None
+        return tail.group(1), end
+
+    def _refill(self, text: io.TextIOWrapper, buffer: str, pos: int):
+        """Drop consumed text and append the next chunk."""
+        chunk = text.read(self.chunk_size)
+        return buffer[pos:] + chunk, 0, not chunk
@@ -0,0 +1,317 @@
+"""
+Telemetry Records - typed schemas for the telemetry events extractors consume.
+
+Raw telemetry events decode to generic nested dicts holding every field PUBG
+sends. The event types the extractors read are instead decoded straight into
+msgspec structs declaring only the fields the extractors use; unknown fields
+are dropped while decoding and nested objects (characters, locations, damage
+info) become records too.
+
+Records keep the read-only mapping interface the extractors already use on
+dicts: record.get(key, default), record[key], key in record, and falsiness
+when no field is set. A field missing from the raw event stays UNSET and reads
+as absent. Add a field to a schema before an extractor starts reading it, and
+bump ARTIFACT_SCHEMA_VERSION in telemetry_artifact so cached records are
+rebuilt.
+
+Player names, account ids and weapon ids repeat across thousands of events of
+a match; share_strings makes equal values share one string object per match,
+so records and the output rows built from them hold a single copy each.
+
+Example:
+    >>> event = decode_event("LogPlayerKillV2", raw_json)
+    >>> event["_T"], event.get("finisher", {}).get("name")
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type, Union, get_args
+
+import msgspec
+from msgspec import UNSET, UnsetType
+
+
+class TelemetryRecord(msgspec.Struct, omit_defaults=True, gc=False):
+    """Base record with dict-style field access."""
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = getattr(self, key, UNSET)
+        return default if value is UNSET else value
+
+    def __getitem__(self, key: str) -> Any:
+        value = getattr(self, key, UNSET)
+        if value is UNSET:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return getattr(self, key, UNSET) is not UNSET
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self.__struct_fields__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __bool__(self) -> bool:
+        return any(getattr(self, field) is not UNSET for field in self.__struct_fields__)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to plain nested dicts, omitting unset fields."""
+        return msgspec.to_builtins(self)
+
+
+class Location(TelemetryRecord):
+    x: Any = UNSET
+    y: Any = UNSET
+    z: Any = UNSET
+
+
+class Character(TelemetryRecord):
+    name: Any = UNSET
+    teamId: Any = UNSET
+    health: Any = UNSET
+    location: Union[Location, None, UnsetType] = UNSET
+    accountId: Any = UNSET
+    isInBlueZone: Any = UNSET
+    isInRedZone: Any = UNSET
+    isInVehicle: Any = UNSET
+    zone: Any = UNSET
+
+
+class Common(TelemetryRecord):
+    isGame: Any = UNSET
+    is_game: Any = UNSET
+
+
+class DamageInfo(TelemetryRecord):
+    damageReason: Any = UNSET
+    damageTypeCategory: Any = UNSET
+    damageCauserName: Any = UNSET
+    distance: Any = UNSET
+
+
+class Item(TelemetryRecord):
+    itemId: Any = UNSET
+    subCategory: Any = UNSET
+
+
+class GameState(TelemetryRecord):
+    elapsedTime: Any = UNSET
+    safetyZonePosition: Union[Location, None, UnsetType] = UNSET
+    safetyZoneRadius: Any = UNSET
+
+
+class TelemetryEvent(TelemetryRecord, tag_field="_T"):
+    """
+    Base of typed telemetry events.
+
+    The event type is the struct tag, readable as event["_T"] like on dicts.
+    """
+
+    _D: Any = UNSET
+    common: Union[Common, None, UnsetType] = UNSET
+    # Epoch milliseconds of _D, set by TelemetryEventDispatcher
+    _ms: Any = UNSET
+
+    @property
+    def _T(self) -> str:
+        return self.__struct_config__.tag
+
+
+class ParachuteLanding(TelemetryEvent, tag="LogParachuteLanding"):
+    character: Union[Character, None, UnsetType] = UNSET
+
+
+class LandParachute(ParachuteLanding, tag="LandParachute"):
+    pass
+
+
+class PlayerPosition(TelemetryEvent, tag="LogPlayerPosition"):
+    character: Union[Character, None, UnsetType] = UNSET
+    elapsedTime: Any = UNSET
+
+
+class GameStatePeriodic(TelemetryEvent, tag="LogGameStatePeriodic"):
+    gameState: Union[GameState, None, UnsetType] = UNSET
+
+
+class PlayerTakeDamage(TelemetryEvent, tag="LogPlayerTakeDamage"):
+    attackId: Any = UNSET
+    attacker: Union[Character, None, UnsetType] = UNSET
+    victim: Union[Character, None, UnsetType] = UNSET
+    damageTypeCategory: Any = UNSET
+    damageReason: Any = UNSET
+    damage: Any = UNSET
+    damageCauserName: Any = UNSET
+    isThroughPenetrableWall: Any = UNSET
+
+
+class PlayerMakeGroggy(TelemetryEvent, tag="LogPlayerMakeGroggy"):
+    attackId: Any = UNSET
+    attacker: Union[Character, None, UnsetType] = UNSET
+    victim: Union[Character, None, UnsetType] = UNSET
+    damageReason: Any = UNSET
+    damageTypeCategory: Any = UNSET
+    damageCauserName: Any = UNSET
+    damageCauserAdditionalInfo: Any = UNSET
+    victimWeapon: Any = UNSET
+    victimWeaponAdditionalInfo: Any = UNSET
+    distance: Any = UNSET
+    isAttackerInVehicle: Any = UNSET
+    dBNOId: Any = UNSET
+    isThroughPenetrableWall: Any = UNSET
+    damage: Any = UNSET
+
+
+class PlayerKillV2(TelemetryEvent, tag="LogPlayerKillV2"):
+    attackId: Any = UNSET
+    dBNOId: Any = UNSET
+    dbnoId: Any = UNSET
+    victim: Union[Character, None, UnsetType] = UNSET
+    finisher: Union[Character, None, UnsetType] = UNSET
+    killer: Union[Character, None, UnsetType] = UNSET
+    dbnoMaker: Union[Character, None, UnsetType] = UNSET
+    finisherDamageInfo: Union[DamageInfo, None, UnsetType] = UNSET
+    dbnoMakerDamageInfo: Union[DamageInfo, None, UnsetType] = UNSET
+    damageCauserName: Any = UNSET
+    damageReason: Any = UNSET
+    damageTypeCategory: Any = UNSET
+    distance: Any = UNSET
+    killedInZone: Any = UNSET
+    finisherZone: Any = UNSET
+    dbnoMakerZone: Any = UNSET
+    isThroughPenetrableWall: Any = UNSET
+
+
+class PlayerRevive(TelemetryEvent, tag="LogPlayerRevive"):
+    reviver: Union[Character, None, UnsetType] = UNSET
+    victim: Union[Character, None, UnsetType] = UNSET
+    dBNOId: Any = UNSET
+
+
+class ItemUse(TelemetryEvent, tag="LogItemUse"):
+    character: Union[Character, None, UnsetType] = UNSET
+    item: Union[Item, None, UnsetType] = UNSET
+
+
+class PlayerAttack(TelemetryEvent, tag="LogPlayerAttack"):
+    attackId: Any = UNSET
+    attacker: Union[Character, None, UnsetType] = UNSET
+    weapon: Union[Item, None, UnsetType] = UNSET
+
+
+# Typed event classes by event type
+EVENT_RECORDS: Dict[str, Type[TelemetryEvent]] = {
+    cls.__struct_config__.tag: cls
+    for cls in (
+        ParachuteLanding,
+        LandParachute,
+        PlayerPosition,
+        GameStatePeriodic,
+        PlayerTakeDamage,
+        PlayerMakeGroggy,
+        PlayerKillV2,
+        PlayerRevive,
+        ItemUse,
+        PlayerAttack,
+    )
+}
+
+TelemetryEventList = List[Union[tuple(EVENT_RECORDS.values())]]
+
+
+def _fields_of(cls: Type[TelemetryEvent], record_type: Type[TelemetryRecord]) -> Tuple[str, ...]:
+    return tuple(
+        field.name for field in msgspec.structs.fields(cls) if record_type in get_args(field.type)
+    )
+
+
+# Fields of each event class holding player names, account ids and weapon ids:
+# (Character fields, DamageInfo fields, has damageCauserName)
+_SHARED_STRING_FIELDS = {
+    cls: (
+        _fields_of(cls, Character),
+        _fields_of(cls, DamageInfo),
+        "damageCauserName" in cls.__struct_fields__,
+    )
+    for cls in EVENT_RECORDS.values()
+}
+
+
+def share_strings(event: Any, strings: Dict[str, str]) -> None:
+    """
+    Replace an event's player names, account ids and weapon ids by shared strings.
+
+    Args:
+        event: Event record (other events are left unchanged)
+        strings: Per-match table mapping each string to its shared object, updated
+            with the event's new strings
+    """
+    fields = _SHARED_STRING_FIELDS.get(event.__class__)
+    if fields is None:
+        return
+
+    share = strings.setdefault
+    characters, damage_infos, has_weapon = fields
+    for field in characters:
+        character = getattr(event, field)
+        if character.__class__ is Character:
+            name = character.name
+            if name.__class__ is str:
+                character.name = share(name, name)
+            account_id = character.accountId
+            if account_id.__class__ is str:
+                character.accountId = share(account_id, account_id)
+
+    for field in damage_infos:
+        damage_info = getattr(event, field)
+        if damage_info.__class__ is DamageInfo:
+            weapon = damage_info.damageCauserName
+            if weapon.__class__ is str:
+                damage_info.damageCauserName = share(weapon, weapon)
+
+    if has_weapon:
+        weapon = event.damageCauserName
+        if weapon.__class__ is str:
+            event.damageCauserName = share(weapon, weapon)
+
+
+@lru_cache(maxsize=None)
+def _json_decoder(event_type: str) -> msgspec.json.Decoder:
+    return msgspec.json.Decoder(EVENT_RECORDS[event_type])
+
+
+def decode_event(event_type: str, data: Union[str, bytes]) -> Optional[TelemetryEvent]:
+    """
+    Decode a single JSON event of a known type into its record.
+
+    Args:
+        event_type: Event type of the JSON object (its _T value)
+        data: JSON text of exactly one event object
+
+    Returns:
+        Event record, or None if the type has no record or the JSON does not
+        fit the schema
+    """
+    if event_type not in EVENT_RECORDS:
+        return None
+    try:
+        return _json_decoder(event_type).decode(data)
+    except msgspec.DecodeError:
+        return None
+
+
+def record_from_dict(event: Dict[str, Any]) -> Union[TelemetryEvent, Dict[str, Any]]:
+    """
+    Convert a decoded event dict into its record.
+
+    Returns:
+        Event record, or the dict itself if its type has no record or it does
+        not fit the schema
+    """
+    record_type = EVENT_RECORDS.get(event.get("_T"))
+    if record_type is None:
+        return event
+    try:
+        return msgspec.convert(event, record_type)
+    except msgspec.ValidationError:
+        return event
@@ -1,12 +1,38 @@
 """
 Prometheus metrics for collectors workers
+
+Workers that record metrics from several processes (ParallelTelemetryProcessingWorker
+and its pool processes) run in prometheus_client multiprocess mode: set
+PROMETHEUS_MULTIPROC_DIR before starting the worker. Every process then writes its
+samples to that directory, and the metrics server of the main process serves them
+aggregated. Counters and histograms are summed over processes; per-process gauges
+keep a pid label. The main process removes the files of earlier runs by calling
+reset_multiprocess_dir() when it starts.
 """
 
-from prometheus_client import Counter, Histogram, Gauge, Info, start_http_server
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    Gauge,
+    Info,
+    multiprocess,
+    start_http_server,
+)
 import logging
+import os
+import resource
 
 logger = logging.getLogger(__name__)
 
+# Directory shared by all processes of a worker in multiprocess mode, or None
+MULTIPROCESS_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
+
+# The metrics below create their sample files in it as they are defined
+if MULTIPROCESS_DIR:
+    os.makedirs(MULTIPROCESS_DIR, exist_ok=True)
+
 # Match discovery metrics
 MATCH_DISCOVERY_REQUESTS = Counter(
     "match_discovery_requests_total",
@@ -97,6 +123,53 @@ TELEMETRY_FILE_READ_DURATION = Histogram(
     buckets=[0.1, 0.5, 1, 5, 10, 30, 60],
 )
 
+TELEMETRY_MATCH_RSS = Histogram(
+    "telemetry_match_rss_bytes",
+    "Resident set size of the worker process after parsing and extracting a match",
+    buckets=[
+        100_000_000,
+        200_000_000,
+        300_000_000,
+        500_000_000,
+        750_000_000,
+        1_000_000_000,
+        2_000_000_000,
+    ],
+)
+
+TELEMETRY_PEAK_RSS = Gauge(
+    "telemetry_process_peak_rss_bytes",
+    "Peak resident set size of the telemetry processing process",
+    multiprocess_mode="liveall",  # One series per live process
+)
+
+TELEMETRY_ARTIFACT_LOOKUPS = Counter(
+    "telemetry_artifact_lookups_total",
+    "Extracted telemetry artifact cache lookups",
+    ["result"],  # hit, miss, stale, error
+)
+
+TELEMETRY_PIPELINE_QUEUE_DEPTH = Gauge(
+    "telemetry_pipeline_queue_depth",
+    "Matches waiting for a telemetry pipeline stage",
+    ["stage"],  # read, extract, store
+    multiprocess_mode="livesum",
+)
+
+TELEMETRY_PIPELINE_QUEUE_WAIT = Histogram(
+    "telemetry_pipeline_queue_wait_seconds",
+    "Time a match waits for a telemetry pipeline stage",
+    ["stage"],
+    buckets=[0.01, 0.1, 0.5, 1, 5, 10, 30, 60, 120],
+)
+
+TELEMETRY_PIPELINE_STAGE_DURATION = Histogram(
+    "telemetry_pipeline_stage_duration_seconds",
+    "Time a telemetry pipeline stage spends on a match",
+    ["stage"],
+    buckets=[0.1, 0.5, 1, 5, 10, 30, 60, 120, 300],
+)
+
 # Queue metrics
 QUEUE_MESSAGES_PROCESSED = Counter(
     "queue_messages_processed_total",
@@ -135,7 +208,10 @@ DATABASE_OPERATION_DURATION = Histogram(
 )
 
 DATABASE_CONNECTION_POOL_SIZE = Gauge(
-    "database_connection_pool_size", "Current number of connections in pool", ["pool_name"]
+    "database_connection_pool_size",
+    "Current number of connections in pool",
+    ["pool_name"],
+    multiprocess_mode="livesum",
 )
 
 # API rate limiting
@@ -155,17 +231,76 @@ TELEMETRY_FILES_IN_DATABASE = Gauge(
 )
 
 
+def get_rss_bytes() -> int:
+    """
+    Get the current resident set size of this process in bytes.
+
+    Reads /proc/self/statm on Linux and falls back to the peak RSS elsewhere.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return get_peak_rss_bytes()
+
+
+def get_peak_rss_bytes() -> int:
+    """Get the peak resident set size of this process in bytes."""
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def mark_process_dead(pid: int) -> None:
+    """
+    Drop the live gauges of an exited process in multiprocess mode.
+
+    Args:
+        pid: Process ID of the exited process
+    """
+    if MULTIPROCESS_DIR:
+        multiprocess.mark_process_dead(pid, MULTIPROCESS_DIR)
+
+
+def reset_multiprocess_dir() -> None:
+    """
+    Remove the sample files of earlier runs from the multiprocess directory.
+
+    Call from the main process of a worker before it starts other processes.
+    The calling process keeps its own files, which its metrics opened on import.
+    """
+    if not MULTIPROCESS_DIR:
+        return
+
+    own_suffix = f"_{os.getpid()}.db"
+    for name in os.listdir(MULTIPROCESS_DIR):
+        if name.endswith(".db") and not name.endswith(own_suffix):
+            try:
+                os.remove(os.path.join(MULTIPROCESS_DIR, name))
+            except FileNotFoundError:
+                pass
+
+
 def start_metrics_server(port: int = 9090, worker_name: str = "unknown"):
     """
     Start the Prometheus metrics HTTP server
 
+    In multiprocess mode the server aggregates the samples of every process
+    writing to PROMETHEUS_MULTIPROC_DIR.
+
     Args:
         port: Port to expose metrics on
         worker_name: Name/type of the worker for logging and info metric
     """
     try:
         WORKER_INFO.info({"worker_name": worker_name, "metrics_port": str(port)})
-        start_http_server(port)
+        if MULTIPROCESS_DIR:
+            # Serve the samples of all processes instead of this process's registry
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+            registry.register(WORKER_INFO)  # Info is not shared between processes
+            start_http_server(port, registry=registry)
+        else:
+            start_http_server(port)
         logger.info(f"Metrics server started on port {port} for worker: {worker_name}")
     except OSError as e:
         if e.errno == 98:  # Address already in use
@@ -2,6 +2,22 @@
 Telemetry processors for extracting specific metrics from raw telemetry data.
 """
 
+from .circle_timeline import CircleDistanceStats, CircleTimeline
+from .event_dispatcher import TelemetryEventDispatcher
+from .extractor_registry import ExtractorRegistry, TelemetryExtractor
 from .fight_tracking_processor import FightTrackingProcessor
+from .knock_index import KnockIndex
+from .match_columns import MatchColumns
+from .position_index import PositionIndex
 
-__all__ = ["FightTrackingProcessor"]
+__all__ = [
+    "CircleDistanceStats",
+    "CircleTimeline",
+    "ExtractorRegistry",
+    "FightTrackingProcessor",
+    "KnockIndex",
+    "MatchColumns",
+    "PositionIndex",
+    "TelemetryEventDispatcher",
+    "TelemetryExtractor",
+]
@@ -0,0 +1,171 @@
+"""
+Circle Timeline
+
+Safe zone states from LogGameStatePeriodic events, sorted by elapsed time, with
+binary-search lookups and vectorized player-to-zone distance calculations.
+"""
+
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+import numpy as np
+
+from .match_columns import MatchColumns, fill_nan
+
+
+class CircleTimeline:
+    """
+    Safe zone state timeline for a match.
+
+    The state for an elapsed time is the first state at or after that time, or
+    the last state for times after the final update.
+
+    Example:
+        >>> timeline = CircleTimeline(events)
+        >>> state = timeline.state_at(elapsed_time)
+        >>> center, edge = timeline.distances(xs, ys, elapsed_times)
+    """
+
+    def __init__(self, events: Union[MatchColumns, Iterable[Dict[str, Any]]]):
+        """
+        Collect safe zone states.
+
+        Args:
+            events: Telemetry events (only LogGameStatePeriodic is used) or
+                the match's MatchColumns
+        """
+        game_states = MatchColumns.of(events).game_states
+
+        # Sort by elapsed time for binary search; missing values count as 0
+        elapsed = fill_nan(game_states["elapsed"])
+        order = np.argsort(elapsed, kind="stable")
+
+        self._elapsed = elapsed[order]
+        self.elapsed_times: List[float] = self._elapsed.tolist()
+        self.center_x = fill_nan(game_states["center_x"][order])
+        self.center_y = fill_nan(game_states["center_y"][order])
+        self.radius = fill_nan(game_states["radius"][order])
+
+    def __len__(self) -> int:
+        return len(self.elapsed_times)
+
+    def state_index(self, elapsed_time: float) -> int:
+        """Index of the circle state in effect at elapsed_time."""
+        return min(bisect_left(self.elapsed_times, elapsed_time), len(self.elapsed_times) - 1)
+
+    def state_at(self, elapsed_time: float) -> Dict[str, float]:
+        """
+        Get the circle state in effect at elapsed_time.
+
+        Returns:
+            Dict with elapsed_time, center_x, center_y and radius
+        """
+        index = self.state_index(elapsed_time)
+        return {
+            "elapsed_time": self.elapsed_times[index],
+            "center_x": float(self.center_x[index]),
+            "center_y": float(self.center_y[index]),
+            "radius": float(self.radius[index]),
+        }
+
+    def state_indices(self, elapsed_times: np.ndarray) -> np.ndarray:
+        """Vectorized state_index for an array of elapsed times."""
+        indices = np.searchsorted(self._elapsed, elapsed_times, side="left")
+        return np.minimum(indices, len(self.elapsed_times) - 1)
+
+    def distances(
+        self, xs: np.ndarray, ys: np.ndarray, elapsed_times: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculate 2D distances of player positions to the safe zone.
+
+        Args:
+            xs: Player x coordinates (centimeters)
+            ys: Player y coordinates (centimeters)
+            elapsed_times: Elapsed match time of each position
+
+        Returns:
+            Tuple of (state_indices, distance_from_center, distance_from_edge) in
+            meters; distance_from_edge is negative outside the safe zone
+        """
+        indices = self.state_indices(elapsed_times)
+        distance_from_center = (
+            np.sqrt((xs - self.center_x[indices]) ** 2 + (ys - self.center_y[indices]) ** 2) / 100
+        )
+        distance_from_edge = (self.radius[indices] - distance_from_center * 100) / 100
+        return indices, distance_from_center, distance_from_edge
+
+
+class CircleDistanceStats:
+    """
+    Running per-player aggregates of distances to the safe zone.
+
+    Samples are added in batches; sums are accumulated in sample order so the
+    averages match summing each player's samples one by one.
+    """
+
+    def __init__(self):
+        self.player_index: Dict[str, int] = {}
+        self.samples = np.zeros(0, dtype=np.int64)
+        self.sum_center = np.zeros(0, dtype=np.float64)
+        self.sum_edge = np.zeros(0, dtype=np.float64)
+        self.max_center = np.zeros(0, dtype=np.float64)
+        self.min_edge = np.zeros(0, dtype=np.float64)
+
+    def index_for(self, player_name: str) -> int:
+        """Get (or assign) the accumulator index of a player."""
+        index = self.player_index.get(player_name)
+        if index is None:
+            index = self.player_index[player_name] = len(self.player_index)
+        return index
+
+    def _grow(self) -> None:
+        missing = len(self.player_index) - len(self.samples)
+        if missing <= 0:
+            return
+        self.samples = np.concatenate([self.samples, np.zeros(missing, dtype=np.int64)])
+        self.sum_center = np.concatenate([self.sum_center, np.zeros(missing)])
+        self.sum_edge = np.concatenate([self.sum_edge, np.zeros(missing)])
+        self.max_center = np.concatenate([self.max_center, np.full(missing, -np.inf)])
+        self.min_edge = np.concatenate([self.min_edge, np.full(missing, np.inf)])
+
+    def add(
+        self, indices: np.ndarray, distance_from_center: np.ndarray, distance_from_edge: np.ndarray
+    ) -> None:
+        """
+        Add a batch of samples.
+
+        Args:
+            indices: Accumulator index of each sample's player (from index_for)
+            distance_from_center: Distance from circle center of each sample
+            distance_from_edge: Distance from circle edge of each sample
+        """
+        self._grow()
+        # ufunc.at applies unbuffered, in sample order
+        np.add.at(self.samples, indices, 1)
+        np.add.at(self.sum_center, indices, distance_from_center)
+        np.add.at(self.sum_edge, indices, distance_from_edge)
+        np.maximum.at(self.max_center, indices, distance_from_center)
+        np.minimum.at(self.min_edge, indices, distance_from_edge)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get aggregates per player, in the order players were first seen.
+
+        Returns:
+            Dict[player_name, stats] with avg_distance_from_center,
+            avg_distance_from_edge, max_distance_from_center and min_distance_from_edge
+        """
+        self._grow()
+        summary = {}
+        for player_name, index in self.player_index.items():
+            samples = int(self.samples[index])
+            if samples == 0:
+                continue
+            summary[player_name] = {
+                "avg_distance_from_center": float(self.sum_center[index]) / samples,
+                "avg_distance_from_edge": float(self.sum_edge[index]) / samples,
+                "max_distance_from_center": float(self.max_center[index]),
+                "min_distance_from_edge": float(self.min_edge[index]),
+            }
+        return summary
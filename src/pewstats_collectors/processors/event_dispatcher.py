@@ -0,0 +1,122 @@
+"""
+Telemetry Event Dispatcher
+
+Groups raw telemetry events by type in a single pass so that each extractor
+only iterates over the event types it consumes instead of the full event list.
+The same pass normalizes event timestamps to epoch milliseconds.
+"""
+
+import heapq
+from collections import defaultdict
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..utils.timestamps import EVENT_TIME_KEY, parse_timestamp_ms
+
+
+def get_event_type(event: Dict[str, Any]) -> Optional[str]:
+    """
+    Get event type from multiple possible keys.
+
+    Args:
+        event: Event dictionary
+
+    Returns:
+        Event type string or None
+    """
+    return event.get("_T") or event.get("type") or event.get("event_type")
+
+
+class TelemetryEventDispatcher:
+    """
+    Single-pass index of telemetry events by event type.
+
+    Events are grouped once on construction. Selections for several event types
+    are merged back into original telemetry order, so an extractor receiving a
+    selection sees exactly the events it would have matched while walking the
+    full list.
+
+    Each event also gets its "_D" timestamp converted to epoch milliseconds
+    under EVENT_TIME_KEY (None when missing or invalid), so extractors never
+    parse ISO strings themselves.
+
+    Example:
+        >>> dispatcher = TelemetryEventDispatcher(events)
+        >>> kills = dispatcher.select(("LogPlayerKillV2",))
+    """
+
+    def __init__(self, events: Iterable[Dict[str, Any]]):
+        """
+        Group events by type and attach epoch-millisecond times.
+
+        Args:
+            events: Telemetry events in original order
+        """
+        self._events_by_type: Dict[Optional[str], List[Dict[str, Any]]] = defaultdict(list)
+        self._positions_by_type: Dict[Optional[str], List[int]] = defaultdict(list)
+        self._selections: Dict[frozenset, List[Dict[str, Any]]] = {}
+        self.event_count = 0
+
+        # Many events share a timestamp (e.g. periodic position batches)
+        parsed_times: Dict[Any, Optional[int]] = {}
+
+        for position, event in enumerate(events):
+            timestamp = event.get("_D")
+            try:
+                time_ms = parsed_times[timestamp]
+            except KeyError:
+                time_ms = parsed_times[timestamp] = parse_timestamp_ms(timestamp)
+            except TypeError:
+                time_ms = None
+            event[EVENT_TIME_KEY] = time_ms
+
+            event_type = get_event_type(event)
+            self._events_by_type[event_type].append(event)
+            self._positions_by_type[event_type].append(position)
+            self.event_count += 1
+
+    def __len__(self) -> int:
+        return self.event_count
+
+    @property
+    def event_types(self) -> List[Optional[str]]:
+        """Event types present in the telemetry."""
+        return list(self._events_by_type.keys())
+
+    def count(self, event_type: str) -> int:
+        """Number of events of the given type."""
+        return len(self._events_by_type.get(event_type, ()))
+
+    def select(self, event_types: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Get all events of the given types in original telemetry order.
+
+        Selections are cached, so extractors that declare the same event types
+        share one list. Callers must not mutate the returned list.
+
+        Args:
+            event_types: Event types to include
+
+        Returns:
+            List of matching events
+        """
+        key = frozenset(event_types)
+        selection = self._selections.get(key)
+        if selection is not None:
+            return selection
+
+        present = [t for t in key if t in self._events_by_type]
+
+        if not present:
+            selection = []
+        elif len(present) == 1:
+            selection = self._events_by_type[present[0]]
+        else:
+            merged = heapq.merge(
+                *(zip(self._positions_by_type[t], self._events_by_type[t]) for t in present),
+                key=itemgetter(0),
+            )
+            selection = [event for _, event in merged]
+
+        self._selections[key] = selection
+        return selection
@@ -0,0 +1,188 @@
+"""
+Extractor Registry
+
+Declarative descriptions of the telemetry extractors run by
+TelemetryProcessingWorker. Each extractor declares the event types it consumes,
+the matches column flagging it as processed, and the storage arguments its
+results are written through. The worker uses the registry to read, run and
+store only the extractors that are still pending for a match, and backfills use
+it to run a subset such as circle tracking on its own.
+
+Example:
+    >>> registry = ExtractorRegistry([
+    ...     TelemetryExtractor("landings", ("LogParachuteLanding",), "extract_landings",
+    ...                        outputs=("landings",), flag_column="landings_processed"),
+    ... ])
+    >>> selected = registry.select(["landings"])
+    >>> pending = registry.pending(processing_status, selected)
+"""
+
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class TelemetryExtractor:
+    """
+    A telemetry extractor and its storage contract.
+
+    Attributes:
+        name: Unique extractor name, used to select extractors
+        event_types: Telemetry event types the extractor consumes
+        method: Name of the worker method running the extractor, called as
+            method(events, match_id, match_data)
+        outputs: Storage arguments receiving the extractor's results, one per
+            value the method returns
+        flag_column: matches column marking the extractor as processed, or None
+            if the extractor has no processed flag
+        columnar: The method takes the match's MatchColumns instead of its
+            event list
+    """
+
+    name: str
+    event_types: Tuple[str, ...]
+    method: str
+    outputs: Tuple[str, ...]
+    flag_column: Optional[str] = None
+    columnar: bool = False
+
+    def __post_init__(self):
+        """Validate extractor declaration."""
+        if not self.name:
+            raise ValueError("Extractor name cannot be empty")
+        if not self.outputs:
+            raise ValueError(f"Extractor {self.name} must declare at least one output")
+
+
+class ExtractorRegistry:
+    """
+    Ordered collection of telemetry extractors.
+
+    Extractors run in registration order.
+    """
+
+    def __init__(self, extractors: Iterable[TelemetryExtractor] = ()):
+        """
+        Initialize registry.
+
+        Args:
+            extractors: Extractors to register, in run order
+        """
+        self._extractors: Dict[str, TelemetryExtractor] = {}
+        for extractor in extractors:
+            self.register(extractor)
+
+    def register(self, extractor: TelemetryExtractor) -> None:
+        """
+        Add an extractor to the end of the run order.
+
+        Raises:
+            ValueError: If an extractor with the same name or output is registered
+        """
+        if extractor.name in self._extractors:
+            raise ValueError(f"Extractor already registered: {extractor.name}")
+
+        taken = {output for other in self for output in other.outputs}
+        duplicates = taken.intersection(extractor.outputs)
+        if duplicates:
+            raise ValueError(
+                f"Extractor {extractor.name} outputs already registered: {sorted(duplicates)}"
+            )
+
+        self._extractors[extractor.name] = extractor
+
+    def __iter__(self) -> Iterator[TelemetryExtractor]:
+        return iter(self._extractors.values())
+
+    def __len__(self) -> int:
+        return len(self._extractors)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._extractors
+
+    @property
+    def names(self) -> List[str]:
+        """Registered extractor names in run order."""
+        return list(self._extractors)
+
+    def get(self, name: str) -> TelemetryExtractor:
+        """
+        Get an extractor by name.
+
+        Raises:
+            KeyError: If no extractor has that name
+        """
+        return self._extractors[name]
+
+    def select(self, names: Optional[Iterable[str]] = None) -> List[TelemetryExtractor]:
+        """
+        Select extractors by name, keeping the registry's run order.
+
+        Args:
+            names: Extractor names (default: None selects every extractor)
+
+        Returns:
+            Selected extractors
+
+        Raises:
+            ValueError: If a name is not registered
+        """
+        if names is None:
+            return list(self)
+
+        wanted = set(names)
+        unknown = wanted - self._extractors.keys()
+        if unknown:
+            raise ValueError(f"Unknown extractors: {', '.join(sorted(unknown))}")
+
+        return [extractor for extractor in self if extractor.name in wanted]
+
+    def event_types(
+        self, extractors: Optional[Iterable[TelemetryExtractor]] = None
+    ) -> FrozenSet[str]:
+        """
+        Get every event type consumed by a set of extractors.
+
+        Args:
+            extractors: Extractors (default: None uses every extractor)
+
+        Returns:
+            Union of the extractors' event types
+        """
+        if extractors is None:
+            extractors = self
+        return frozenset(
+            event_type for extractor in extractors for event_type in extractor.event_types
+        )
+
+    def pending(
+        self,
+        processing_status: Dict[str, bool],
+        extractors: Optional[Iterable[TelemetryExtractor]] = None,
+    ) -> List[TelemetryExtractor]:
+        """
+        Get the extractors that still have to run for a match.
+
+        An extractor with a processed flag is pending until its flag is set.
+        Extractors without a flag cannot tell whether they already ran, so they
+        run along with the flagged extractors whenever any of those is pending,
+        or on their own when no selected extractor has a flag.
+
+        Args:
+            processing_status: matches processed flags by column name
+            extractors: Selected extractors (default: None uses every extractor)
+
+        Returns:
+            Pending extractors in run order
+        """
+        selected = self.select() if extractors is None else list(extractors)
+        flagged = [extractor for extractor in selected if extractor.flag_column]
+
+        if flagged and all(processing_status.get(extractor.flag_column) for extractor in flagged):
+            return []
+
+        return [
+            extractor
+            for extractor in selected
+            if not extractor.flag_column or not processing_status.get(extractor.flag_column)
+        ]
@@ -7,9 +7,16 @@ Implements v2 algorithm with NPC filtering and per-team outcomes.
 
 import json
 import math
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from operator import itemgetter
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..utils.timestamps import event_time_ms, ms_to_datetime
+from .match_columns import MISSING, MatchColumns
 
 
 class FightTrackingProcessor:
@@ -31,6 +38,9 @@ class FightTrackingProcessor:
     MAX_ENGAGEMENT_DISTANCE = 300  # Fixed radius from fight center (meters)
     MAX_FIGHT_DURATION = timedelta(seconds=240)  # Maximum total fight duration
 
+    # Telemetry event types consumed by fight detection
+    EVENT_TYPES = ("LogPlayerMakeGroggy", "LogPlayerKillV2", "LogPlayerTakeDamage")
+
     NPC_NAMES = {
         "Commander",
         "Guard",
@@ -46,37 +56,48 @@ class FightTrackingProcessor:
         self.logger = logger
 
     def process_match_fights(
-        self, events: List[Dict], match_id: str, match_data: Dict[str, Any]
+        self, events: Union[MatchColumns, List[Dict]], match_id: str, match_data: Dict[str, Any]
     ) -> List[Dict]:
         """
         Process fight tracking for a match.
 
         Args:
-            events: List of telemetry events
+            events: List of telemetry events or the match's MatchColumns
             match_id: Match ID
             match_data: Match metadata (map_name, game_mode, etc.)
 
         Returns:
             List of fight records, each containing a 'participants' key with participant data
         """
+        columns = MatchColumns.of(events)
+
         if self.logger:
-            self.logger.debug(f"Processing fights for match {match_id} with {len(events)} events")
+            self.logger.debug(
+                f"Processing fights for match {match_id} with {columns.event_count} events"
+            )
 
         # Detect combat engagements
-        engagements = self._detect_combat_engagements(events, match_id)
+        engagements = self._detect_combat_engagements(columns, match_id)
 
         if not engagements:
             return []
 
+        # Time-sorted combat events, sliced per engagement window
+        combat_timeline = self._build_combat_timeline(columns)
+
         # Filter for fights and enrich with statistics
         fights = []
 
         for engagement in engagements:
+            window_events = self._slice_combat_timeline(
+                combat_timeline, engagement["start_ms"], engagement["end_ms"]
+            )
+
             # Enrich with full statistics
-            engagement = self._enrich_engagement_with_stats(engagement, events)
+            engagement = self._enrich_engagement_with_stats(engagement, window_events)
 
             # Check if it qualifies as a fight
-            is_fight_result, reason = self._is_fight(engagement, events)
+            is_fight_result, reason = self._is_fight(engagement, window_events)
 
             if is_fight_result:
                 # Determine outcome
@@ -166,115 +187,115 @@ class FightTrackingProcessor:
 
         return fights
 
-    def _detect_combat_engagements(self, events: List[Dict], match_id: str) -> List[Dict]:
+    def _detect_combat_engagements(
+        self, events: Union[MatchColumns, List[Dict]], match_id: str
+    ) -> List[Dict]:
         """Detect all potential combat engagements between teams."""
-        engagements = []
+        columns = MatchColumns.of(events)
 
-        # Extract all inter-team combat events
+        # Extract all inter-team combat events: knocks by attacker, kills by
+        # finisher and damage (> 0) by attacker
         combat_events = []
-        for event in events:
-            event_type = event.get("_T")
-            timestamp = event.get("_D")
+        seqs, times = [], []
+        for event_type, stream, actor in (
+            ("knock", columns.knocks, "attacker"),
+            ("kill", columns.kills, "finisher"),
+            ("damage", columns.damage, "attacker"),
+        ):
+            attacker_teams = stream[f"{actor}_team"]
+            victim_teams = stream["victim_team"]
+            selected = (
+                (attacker_teams != MISSING)
+                & (victim_teams != MISSING)
+                & (attacker_teams != victim_teams)
+                & (stream["time"] != MISSING)
+            )
+            if event_type == "damage":
+                selected &= stream["damage"] > 0
+
+            rows = np.flatnonzero(selected)
+            seqs.append(stream["seq"][rows])
+            times.append(stream["time"][rows])
+            for index, event_time, attacker_team, victim_team in zip(
+                rows.tolist(),
+                stream["time"][rows].tolist(),
+                attacker_teams[rows].tolist(),
+                victim_teams[rows].tolist(),
+            ):
+                event = stream.events[index]
+                combat_event = {
+                    "type": event_type,
+                    "timestamp": event_time,
+                    "attacker_team": attacker_team,
+                    "victim_team": victim_team,
+                }
+                if event_type == "damage":
+                    combat_event["damage"] = event.get("damage", 0)
+                combat_event["attacker_loc"] = event[actor].get("location")
+                combat_event["victim_loc"] = event["victim"].get("location")
+                combat_event["event"] = event
+                combat_events.append(combat_event)
 
-            if event_type == "LogPlayerMakeGroggy":
-                attacker = event.get("attacker") or {}
-                victim = event.get("victim") or {}
-                attacker_team = attacker.get("teamId")
-                victim_team = victim.get("teamId")
+        # Time order, ties in telemetry order
+        order = np.lexsort((np.concatenate(seqs), np.concatenate(times)))
+        combat_events = [combat_events[index] for index in order.tolist()]
 
-                if (
-                    attacker_team is not None
-                    and victim_team is not None
-                    and attacker_team != victim_team
-                ):
-                    event_time = self._parse_timestamp(timestamp)
-                    if event_time:
-                        combat_events.append(
-                            {
-                                "type": "knock",
-                                "timestamp": event_time,
-                                "attacker_team": attacker_team,
-                                "victim_team": victim_team,
-                                "attacker_loc": attacker.get("location"),
-                                "victim_loc": victim.get("location"),
-                                "event": event,
-                            }
-                        )
+        return self._cluster_engagements(combat_events)
 
-            elif event_type == "LogPlayerKillV2":
-                finisher = event.get("finisher") or {}
-                victim = event.get("victim") or {}
-                finisher_team = finisher.get("teamId")
-                victim_team = victim.get("teamId")
+    def _cluster_engagements(self, combat_events: List[Dict]) -> List[Dict]:
+        """
+        Cluster time-sorted combat events into engagements in a single sweep.
+
+        Each event is offered to the open engagements involving one of its teams,
+        oldest first. The first engagement that accepts it claims it; otherwise the
+        event starts a new engagement with a FIXED center. An engagement closes
+        once an event arrives more than ENGAGEMENT_WINDOW after its last event or
+        MAX_FIGHT_DURATION after its first. This gives the same clusters as seeding
+        engagements one at a time and scanning ahead through all unclaimed events.
+        """
+        max_duration_ms = self.MAX_FIGHT_DURATION // timedelta(milliseconds=1)
+        window_ms = self.ENGAGEMENT_WINDOW // timedelta(milliseconds=1)
 
-                if (
-                    finisher_team is not None
-                    and victim_team is not None
-                    and finisher_team != victim_team
-                ):
-                    event_time = self._parse_timestamp(timestamp)
-                    if event_time:
-                        combat_events.append(
-                            {
-                                "type": "kill",
-                                "timestamp": event_time,
-                                "attacker_team": finisher_team,
-                                "victim_team": victim_team,
-                                "attacker_loc": finisher.get("location"),
-                                "victim_loc": victim.get("location"),
-                                "event": event,
-                            }
-                        )
+        clusters = []
+        # Team ID -> indexes of open clusters with that team in combat
+        open_by_team = defaultdict(set)
 
-            elif event_type == "LogPlayerTakeDamage":
-                attacker = event.get("attacker") or {}
-                victim = event.get("victim") or {}
-                attacker_team = attacker.get("teamId")
-                victim_team = victim.get("teamId")
-                damage = event.get("damage", 0)
+        for event in combat_events:
+            event_time = event["timestamp"]
+            attacker_team = event["attacker_team"]
+            victim_team = event["victim_team"]
 
+            candidates = open_by_team.get(attacker_team, set()) | open_by_team.get(
+                victim_team, set()
+            )
+
+            claimed = False
+            for index in sorted(candidates):
+                cluster = clusters[index]
+
+                # Maximum total fight duration and rolling time window
                 if (
-                    attacker_team is not None
-                    and victim_team is not None
-                    and attacker_team != victim_team
-                    and damage > 0
+                    event_time - cluster["start"] > max_duration_ms
+                    or event_time - cluster["end"] > window_ms
                 ):
-                    event_time = self._parse_timestamp(timestamp)
-                    if event_time:
-                        combat_events.append(
-                            {
-                                "type": "damage",
-                                "timestamp": event_time,
-                                "attacker_team": attacker_team,
-                                "victim_team": victim_team,
-                                "damage": damage,
-                                "attacker_loc": attacker.get("location"),
-                                "victim_loc": victim.get("location"),
-                                "event": event,
-                            }
-                        )
+                    for team in cluster["teams_in_combat"]:
+                        open_by_team[team].discard(index)
+                    continue
 
-        combat_events.sort(key=lambda x: x["timestamp"])
+                new_teams = self._accept_into_cluster(cluster, event)
+                if new_teams is None:
+                    continue
 
-        # Cluster events into engagements
-        used_events = set()
+                for team in new_teams:
+                    open_by_team[team].add(index)
+                claimed = True
+                break
 
-        for i, event in enumerate(combat_events):
-            if i in used_events:
+            if claimed:
                 continue
 
-            # Start a new engagement with FIXED center
-            engagement_events = [event]
-            engagement_teams = {event["attacker_team"], event["victim_team"]}
-            engagement_start = event["timestamp"]
-            engagement_end = event["timestamp"]
-
-            # Calculate FIXED fight center from first event
-            first_locs = []
-            for loc in [event.get("attacker_loc"), event.get("victim_loc")]:
-                if loc:
-                    first_locs.append(loc)
-
+            # Start a new engagement with FIXED center from its first event
+            first_locs = [loc for loc in (event["attacker_loc"], event["victim_loc"]) if loc]
             if first_locs:
                 fixed_center = {
                     "x": sum(loc["x"] for loc in first_locs) / len(first_locs),
@@ -284,78 +305,115 @@ class FightTrackingProcessor:
             else:
                 fixed_center = None
 
-            # Track if teams are "in combat"
-            teams_in_combat = set(engagement_teams)
+            teams = {attacker_team, victim_team}
+            index = len(clusters)
+            clusters.append(
+                {
+                    "events": [event],
+                    "teams": teams,
+                    "teams_in_combat": set(teams),
+                    "fixed_center": fixed_center,
+                    "start": event_time,
+                    "end": event_time,
+                }
+            )
+            for team in teams:
+                open_by_team[team].add(index)
+
+        return [
+            {
+                "events": cluster["events"],
+                "teams": list(cluster["teams"]),
+                "start_time": ms_to_datetime(cluster["start"]),
+                "end_time": ms_to_datetime(cluster["end"]),
+                "start_ms": cluster["start"],
+                "end_ms": cluster["end"],
+                "duration": (cluster["end"] - cluster["start"]) / 1000,
+            }
+            for cluster in clusters
+        ]
 
-            # Look ahead for related events
-            for j in range(i + 1, len(combat_events)):
-                if j in used_events:
-                    continue
+    def _accept_into_cluster(self, cluster: Dict, event: Dict) -> Optional[set]:
+        """
+        Add a combat event to an open cluster if it belongs to the engagement.
 
-                next_event = combat_events[j]
+        Returns:
+            Teams newly in combat (empty if none), or None if the event was rejected
+        """
+        teams_in_combat = cluster["teams_in_combat"]
+        next_teams = {event["attacker_team"], event["victim_team"]}
+
+        # Check if both teams are already in combat
+        if event["attacker_team"] in teams_in_combat and event["victim_team"] in teams_in_combat:
+            cluster["events"].append(event)
+            cluster["teams"].update(next_teams)
+            cluster["end"] = event["timestamp"]
+            return set()
+
+        # One team is in combat, one is new - check proximity
+        new_teams = next_teams - teams_in_combat
+        if not new_teams or not cluster["fixed_center"]:
+            return None
 
-                # Check maximum total fight duration
-                total_duration = (next_event["timestamp"] - engagement_start).total_seconds()
-                if total_duration > self.MAX_FIGHT_DURATION.total_seconds():
-                    break
+        # New team(s) entering - must be within 300m of FIXED center
+        max_dist_from_center = 0
+        for loc in (event["attacker_loc"], event["victim_loc"]):
+            if loc:
+                dist = self._calculate_distance_3d(cluster["fixed_center"], loc)
+                if dist and dist > max_dist_from_center:
+                    max_dist_from_center = dist
 
-                # Rolling time window
-                time_since_last = (next_event["timestamp"] - engagement_end).total_seconds()
-                if time_since_last > self.ENGAGEMENT_WINDOW.total_seconds():
-                    break
+        if max_dist_from_center > self.MAX_ENGAGEMENT_DISTANCE:
+            return None
 
-                next_teams = {next_event["attacker_team"], next_event["victim_team"]}
+        cluster["events"].append(event)
+        cluster["teams"].update(next_teams)
+        teams_in_combat.update(next_teams)
+        cluster["end"] = event["timestamp"]
+        return new_teams
 
-                # Check if both teams are already in combat
-                if (
-                    next_event["attacker_team"] in teams_in_combat
-                    and next_event["victim_team"] in teams_in_combat
-                ):
-                    engagement_events.append(next_event)
-                    engagement_teams.update(next_teams)
-                    engagement_end = next_event["timestamp"]
-                    used_events.add(j)
-
-                elif (
-                    next_event["attacker_team"] in teams_in_combat
-                    or next_event["victim_team"] in teams_in_combat
-                ):
-                    # One team is in combat, one is new - check proximity
-                    new_teams = next_teams - teams_in_combat
-
-                    if new_teams and fixed_center:
-                        # New team(s) entering - must be within 300m of FIXED center
-                        next_locs = [next_event.get("attacker_loc"), next_event.get("victim_loc")]
-                        max_dist_from_center = 0
-                        for loc in next_locs:
-                            if loc:
-                                dist = self._calculate_distance_3d(fixed_center, loc)
-                                if dist and dist > max_dist_from_center:
-                                    max_dist_from_center = dist
-
-                        if max_dist_from_center <= self.MAX_ENGAGEMENT_DISTANCE:
-                            engagement_events.append(next_event)
-                            engagement_teams.update(next_teams)
-                            teams_in_combat.update(next_teams)
-                            engagement_end = next_event["timestamp"]
-                            used_events.add(j)
-
-            # Create engagement record
-            if len(engagement_events) > 0:
-                used_events.add(i)
-                engagements.append(
-                    {
-                        "events": engagement_events,
-                        "teams": list(engagement_teams),
-                        "start_time": engagement_start,
-                        "end_time": engagement_end,
-                        "duration": (engagement_end - engagement_start).total_seconds(),
-                    }
-                )
+    def _build_combat_timeline(self, events: Union[MatchColumns, List[Dict]]) -> Dict[str, Any]:
+        """
+        Sort combat events by time once for windowed lookups.
+
+        Returns:
+            Dict with parallel lists "times" (epoch ms), "order" (original index)
+            and "events", plus "in_order" when the telemetry was already sorted
+        """
+        columns = MatchColumns.of(events)
+        streams = (columns.knocks, columns.kills, columns.damage)
+
+        seqs = np.concatenate([stream["seq"] for stream in streams])
+        times = np.concatenate([stream["time"] for stream in streams])
+        stream_events = [event for stream in streams for event in stream.events]
+
+        # Telemetry order first, then by time if the telemetry was not sorted
+        timed = np.flatnonzero(times != MISSING)
+        order = timed[np.argsort(seqs[timed], kind="stable")]
+        in_order = bool(np.all(np.diff(times[order]) >= 0))
+        if not in_order:
+            order = order[np.argsort(times[order], kind="stable")]
+
+        return {
+            "times": times[order].tolist(),
+            "order": seqs[order].tolist(),
+            "events": [stream_events[index] for index in order.tolist()],
+            "in_order": in_order,
+        }
 
-        return engagements
+    @staticmethod
+    def _slice_combat_timeline(timeline: Dict[str, Any], start_ms: int, end_ms: int) -> List[Dict]:
+        """Get combat events between start_ms and end_ms (inclusive) in telemetry order."""
+        lo = bisect_left(timeline["times"], start_ms)
+        hi = bisect_right(timeline["times"], end_ms)
+
+        if timeline["in_order"]:
+            return timeline["events"][lo:hi]
+
+        window = sorted(zip(timeline["order"][lo:hi], timeline["events"][lo:hi]), key=itemgetter(0))
+        return [event for _, event in window]
 
-    def _is_fight(self, engagement: Dict, all_events: List[Dict]) -> Tuple[bool, str]:
+    def _is_fight(self, engagement: Dict, window_events: List[Dict]) -> Tuple[bool, str]:
         """Determine if an engagement qualifies as a fight."""
         knocks = sum(1 for e in engagement["events"] if e["type"] == "knock")
         kills = sum(1 for e in engagement["events"] if e["type"] == "kill")
@@ -535,10 +593,15 @@ class FightTrackingProcessor:
             "team_outcomes": {team: "DRAW" for team in teams},
         }
 
-    def _enrich_engagement_with_stats(self, engagement: Dict, all_events: List[Dict]) -> Dict:
-        """Calculate detailed statistics for an engagement."""
-        fight_start = engagement["start_time"]
-        fight_end = engagement["end_time"]
+    def _enrich_engagement_with_stats(self, engagement: Dict, window_events: List[Dict]) -> Dict:
+        """
+        Calculate detailed statistics for an engagement.
+
+        window_events are the combat events of the engagement's time window (see
+        _slice_combat_timeline); events outside the window are still skipped.
+        """
+        fight_start = engagement["start_ms"]
+        fight_end = engagement["end_ms"]
         fight_teams = set(engagement["teams"])
 
         # Per-team statistics
@@ -572,14 +635,14 @@ class FightTrackingProcessor:
         )
 
         # Process all events in fight timeframe
-        for event in all_events:
+        for event in window_events:
             event_type = event.get("_T")
             timestamp_str = event.get("_D")
             if not timestamp_str:
                 continue
 
-            event_time = self._parse_timestamp(timestamp_str)
-            if not event_time or event_time < fight_start or event_time > fight_end:
+            event_time = event_time_ms(event)
+            if event_time is None or event_time < fight_start or event_time > fight_end:
                 continue
 
             # Track damage
@@ -774,14 +837,6 @@ class FightTrackingProcessor:
         except (KeyError, TypeError):
             return None
 
-    @staticmethod
-    def _parse_timestamp(ts: str) -> Optional[datetime]:
-        """Parse ISO timestamp string."""
-        try:
-            return datetime.fromisoformat(ts.replace("Z", "+00:00"))
-        except Exception:
-            return None
-
     @classmethod
     def _is_npc_or_bot(cls, player_name: str) -> bool:
         """Check if a player name belongs to an NPC or AI bot."""
@@ -0,0 +1,86 @@
+"""
+Knock Index
+
+Per-match lookup tables linking knocks (LogPlayerMakeGroggy) to their outcome,
+either a kill (LogPlayerKillV2) or a revive (LogPlayerRevive), through the shared
+dBNOId. Built in a single pass so resolving the outcome of a knock is a dict
+lookup instead of a scan over every event in the match.
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional
+
+from .event_dispatcher import get_event_type
+
+
+class KnockIndex:
+    """
+    Knock, kill and revive events keyed by dBNOId and by victim name.
+
+    For knocks and revives the last event per dBNOId is kept; for kills the first
+    one is kept, matching the order in which outcomes were previously resolved.
+    Kills without a knock phase use a missing or -1 dBNOId and are only available
+    through kill_events and kills_by_victim.
+
+    Example:
+        >>> index = KnockIndex(events)
+        >>> for dbno_id, knock in index.knocks.items():
+        ...     kill = index.kill_for(dbno_id)
+    """
+
+    def __init__(self, events: Iterable[Dict[str, Any]]):
+        """
+        Index knock, kill and revive events.
+
+        Args:
+            events: Telemetry events in original order
+        """
+        self.knocks: Dict[Any, Dict[str, Any]] = {}
+        self.kills: Dict[Any, Dict[str, Any]] = {}
+        self.revives: Dict[Any, Dict[str, Any]] = {}
+        self.kill_events: List[Dict[str, Any]] = []
+
+        self.knocks_by_victim: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.kills_by_victim: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.revives_by_victim: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+
+        for event in events:
+            event_type = get_event_type(event)
+
+            if event_type == "LogPlayerMakeGroggy":
+                dbno_id = event.get("dBNOId")
+                if dbno_id:
+                    self.knocks[dbno_id] = event
+                self._add_by_victim(self.knocks_by_victim, event)
+
+            elif event_type == "LogPlayerKillV2":
+                dbno_id = event.get("dBNOId")
+                if dbno_id and dbno_id not in self.kills:
+                    self.kills[dbno_id] = event
+                self.kill_events.append(event)
+                self._add_by_victim(self.kills_by_victim, event)
+
+            elif event_type == "LogPlayerRevive":
+                dbno_id = event.get("dBNOId")
+                if dbno_id:
+                    self.revives[dbno_id] = event
+                self._add_by_victim(self.revives_by_victim, event)
+
+    @staticmethod
+    def _add_by_victim(by_victim: Dict[str, List[Dict[str, Any]]], event: Dict[str, Any]) -> None:
+        victim_name = (event.get("victim") or {}).get("name")
+        if victim_name:
+            by_victim[victim_name].append(event)
+
+    def kill_for(self, dbno_id: Any) -> Optional[Dict[str, Any]]:
+        """Kill event that finished the given knock, if any."""
+        return self.kills.get(dbno_id)
+
+    def revive_for(self, dbno_id: Any) -> Optional[Dict[str, Any]]:
+        """Revive event for the given knock, if any."""
+        return self.revives.get(dbno_id)
+
+    def is_instant_kill(self, kill_event: Dict[str, Any]) -> bool:
+        """Whether a kill had no preceding knock in this match."""
+        dbno_id = kill_event.get("dBNOId")
+        return not dbno_id or dbno_id == -1 or dbno_id not in self.knocks
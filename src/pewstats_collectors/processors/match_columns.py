@@ -0,0 +1,318 @@
+"""
+Match Columns
+
+Struct-of-arrays view of a match's combat, position and game state telemetry.
+Each event stream stores one NumPy array per field, indexed by event, and
+players, weapons and damage types are interned into per-match tables so actors
+are small integer ids. Extractors filter and group these arrays instead of
+walking nested event dicts; each stream keeps its source events for the few
+fields that are only copied into output rows.
+
+Absent names, team ids and event times are stored as MISSING (-1); absent
+numbers (locations, damage, health) are NaN. dBNO ids can legitimately be -1,
+so they keep a separate has_dbno mask instead.
+
+Example:
+    >>> columns = MatchColumns(events)
+    >>> damage = columns.damage
+    >>> blue_zone = columns.damage_types.mask(["Damage_BlueZone"])[damage["damage_type"]]
+    >>> ticks = np.bincount(damage["victim"][blue_zone & (damage["victim"] != MISSING)])
+"""
+
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..utils.timestamps import event_time_ms
+from .event_dispatcher import get_event_type
+
+MISSING = -1
+
+_NAN = float("nan")
+_EMPTY: Dict[str, Any] = {}
+
+
+def _number(value: Any) -> float:
+    return _NAN if value is None else value
+
+
+def _integer(value: Any) -> int:
+    return MISSING if value is None else value
+
+
+def _child(parent: Any, key: str) -> Any:
+    # Nested object or an empty mapping; avoids truth-testing records
+    value = parent.get(key)
+    return _EMPTY if value is None else value
+
+
+class InternTable:
+    """
+    Distinct strings of a match mapped to dense ids in first-seen order.
+
+    Empty and missing values are not interned and map to MISSING.
+    """
+
+    def __init__(self):
+        self.values: List[str] = []
+        self.ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def intern(self, value: Optional[str]) -> int:
+        """Get (or assign) the id of a value."""
+        if not value:
+            return MISSING
+        index = self.ids.get(value)
+        if index is None:
+            index = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+    def decode(self, ids: Union[np.ndarray, Sequence[int]]) -> List[Optional[str]]:
+        """Map ids back to values; MISSING becomes None."""
+        values = self.values + [None]
+        return [values[index] for index in np.asarray(ids).tolist()]
+
+    def mask(self, values: Iterable[str]) -> np.ndarray:
+        """
+        Boolean lookup array of which ids are in values.
+
+        The array has one extra trailing False entry, so indexing it with an
+        id array maps MISSING (-1) to False.
+        """
+        mask = np.zeros(len(self.values) + 1, dtype=bool)
+        for value in values:
+            index = self.ids.get(value)
+            if index is not None:
+                mask[index] = True
+        return mask
+
+    def map(self, function: Callable[[str], Any]) -> List[Any]:
+        """Apply a function once per distinct value, in id order."""
+        return [function(value) for value in self.values]
+
+
+class EventColumns:
+    """
+    Column arrays of one event stream.
+
+    Every column has one entry per event. "seq" is the event's position in the
+    telemetry list the columns were built from, "time" its epoch milliseconds.
+    """
+
+    def __init__(self, events: List[Any], columns: Dict[str, np.ndarray]):
+        self.events = events
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+
+class MatchColumns:
+    """
+    Columnar combat, position and game state streams of a match.
+
+    Streams:
+        damage: LogPlayerTakeDamage - attacker, victim, weapon, damage, damage_type
+        knocks: LogPlayerMakeGroggy - attacker, victim, weapon, dbno, has_dbno
+        kills: LogPlayerKillV2 - killer, finisher, victim, weapon, dbno, has_dbno
+        positions: LogPlayerPosition - character, elapsed
+        game_states: LogGameStatePeriodic - elapsed, center_x, center_y, radius
+
+    Each actor column ("attacker", "victim", ...) holds player ids and comes
+    with "<actor>_team", "<actor>_x", "<actor>_y" and "<actor>_z" columns.
+    Combat streams also have "is_game" (common.isGame or common.is_game).
+
+    Attributes:
+        players: Interned player names
+        weapons: Interned damageCauserName values
+        damage_types: Interned damageTypeCategory values
+        event_count: Number of events the columns were built from
+    """
+
+    # Telemetry event types with a stream
+    EVENT_TYPES = (
+        "LogPlayerTakeDamage",
+        "LogPlayerMakeGroggy",
+        "LogPlayerKillV2",
+        "LogPlayerPosition",
+        "LogGameStatePeriodic",
+    )
+
+    def __init__(self, events: Iterable[Any]):
+        """
+        Build the streams.
+
+        Args:
+            events: Telemetry events in original order (other types are ignored)
+        """
+        self.players = InternTable()
+        self.weapons = InternTable()
+        self.damage_types = InternTable()
+
+        streams: Dict[str, List[Tuple[int, Any]]] = defaultdict(list)
+        event_types = frozenset(self.EVENT_TYPES)
+        self.event_count = 0
+        for seq, event in enumerate(events):
+            self.event_count += 1
+            event_type = get_event_type(event)
+            if event_type in event_types:
+                streams[event_type].append((seq, event))
+
+        self.damage = self._combat_stream(
+            streams["LogPlayerTakeDamage"], ("attacker", "victim"), damage=True
+        )
+        self.knocks = self._combat_stream(streams["LogPlayerMakeGroggy"], ("attacker", "victim"))
+        self.kills = self._combat_stream(
+            streams["LogPlayerKillV2"], ("killer", "finisher", "victim")
+        )
+        self.positions = self._position_stream(streams["LogPlayerPosition"])
+        self.game_states = self._game_state_stream(streams["LogGameStatePeriodic"])
+
+    @classmethod
+    def of(cls, events: Union["MatchColumns", Iterable[Any]]) -> "MatchColumns":
+        """Get columns for an event list, or the columns themselves."""
+        return events if isinstance(events, cls) else cls(events)
+
+    def _common_columns(self, stream: List[Tuple[int, Any]]) -> Dict[str, np.ndarray]:
+        seqs, times, is_game = [], [], []
+        for seq, event in stream:
+            seqs.append(seq)
+            times.append(_integer(event_time_ms(event)))
+            common = _child(event, "common")
+            is_game.append(_number(common.get("isGame") or common.get("is_game")))
+        return {
+            "seq": np.array(seqs, dtype=np.int64),
+            "time": np.array(times, dtype=np.int64),
+            "is_game": np.array(is_game, dtype=np.float64),
+        }
+
+    def _actor_columns(
+        self, events: List[Any], key: str, health: bool = False
+    ) -> Dict[str, np.ndarray]:
+        intern = self.players.intern
+        names, teams, xs, ys, zs, healths = [], [], [], [], [], []
+        for event in events:
+            actor = _child(event, key)
+            names.append(intern(actor.get("name")))
+            teams.append(_integer(actor.get("teamId")))
+            location = _child(actor, "location")
+            xs.append(_number(location.get("x")))
+            ys.append(_number(location.get("y")))
+            zs.append(_number(location.get("z")))
+            if health:
+                healths.append(_number(actor.get("health")))
+
+        columns = {
+            key: np.array(names, dtype=np.int64),
+            f"{key}_team": np.array(teams, dtype=np.int64),
+            f"{key}_x": np.array(xs, dtype=np.float64),
+            f"{key}_y": np.array(ys, dtype=np.float64),
+            f"{key}_z": np.array(zs, dtype=np.float64),
+        }
+        if health:
+            columns[f"{key}_health"] = np.array(healths, dtype=np.float64)
+        return columns
+
+    def _combat_stream(
+        self, stream: List[Tuple[int, Any]], actors: Tuple[str, ...], damage: bool = False
+    ) -> EventColumns:
+        events = [event for _, event in stream]
+        columns = self._common_columns(stream)
+        for actor in actors:
+            columns.update(self._actor_columns(events, actor, health=damage))
+
+        intern_weapon = self.weapons.intern
+        columns["weapon"] = np.array(
+            [intern_weapon(event.get("damageCauserName")) for event in events], dtype=np.int64
+        )
+
+        if damage:
+            intern_type = self.damage_types.intern
+            columns["damage"] = np.array(
+                [_number(event.get("damage")) for event in events], dtype=np.float64
+            )
+            columns["damage_type"] = np.array(
+                [intern_type(event.get("damageTypeCategory")) for event in events],
+                dtype=np.int64,
+            )
+        else:
+            # Zero and missing dBNO ids both mean "no knock"; any other id (-1 too) is one
+            dbno_ids = [event.get("dBNOId") or 0 for event in events]
+            columns["dbno"] = np.array(dbno_ids, dtype=np.int64)
+            columns["has_dbno"] = columns["dbno"] != 0
+
+        return EventColumns(events, columns)
+
+    def _position_stream(self, stream: List[Tuple[int, Any]]) -> EventColumns:
+        events = [event for _, event in stream]
+        columns = self._common_columns(stream)
+        columns.update(self._actor_columns(events, "character"))
+        columns["elapsed"] = np.array(
+            [_number(event.get("elapsedTime")) for event in events], dtype=np.float64
+        )
+        return EventColumns(events, columns)
+
+    def _game_state_stream(self, stream: List[Tuple[int, Any]]) -> EventColumns:
+        events = [event for _, event in stream]
+        elapsed, center_x, center_y, radius = [], [], [], []
+        for event in events:
+            game_state = _child(event, "gameState")
+            safety_zone_position = _child(game_state, "safetyZonePosition")
+            elapsed.append(_number(game_state.get("elapsedTime")))
+            center_x.append(_number(safety_zone_position.get("x")))
+            center_y.append(_number(safety_zone_position.get("y")))
+            radius.append(_number(game_state.get("safetyZoneRadius")))
+
+        return EventColumns(
+            events,
+            {
+                "seq": np.array([seq for seq, _ in stream], dtype=np.int64),
+                "elapsed": np.array(elapsed, dtype=np.float64),
+                "center_x": np.array(center_x, dtype=np.float64),
+                "center_y": np.array(center_y, dtype=np.float64),
+                "radius": np.array(radius, dtype=np.float64),
+            },
+        )
+
+
+def first_seen_order(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Distinct keys in order of first occurrence.
+
+    Args:
+        keys: Key of each row, rows in the order that defines "first seen"
+
+    Returns:
+        Tuple of (distinct keys in first-seen order, group index of each row
+        into those keys)
+    """
+    unique, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    order = np.argsort(first, kind="stable")
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    return unique[order], rank[inverse.reshape(-1)]
+
+
+def fill_nan(values: np.ndarray, fill: float = 0.0) -> np.ndarray:
+    """Replace NaN (absent numbers) in a float column."""
+    return np.where(np.isnan(values), fill, values)
+
+
+def nan_to_none(values: np.ndarray) -> List[Optional[float]]:
+    """Convert a float column to Python floats with NaN as None."""
+    return [None if value != value else value for value in values.tolist()]
+
+
+def missing_to_none(values: np.ndarray) -> List[Optional[int]]:
+    """Convert an integer column to Python ints with MISSING as None."""
+    return [None if value == MISSING else value for value in values.tolist()]
@@ -0,0 +1,177 @@
+"""
+Position Index
+
+Time-sorted player positions collected from telemetry events. Each player has
+an array of epoch-millisecond sample times, so "where was this player around
+time T" is a binary search instead of a scan over every timestamp in the match.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..utils.timestamps import event_time_ms
+from .event_dispatcher import get_event_type
+
+# Event types carrying player positions and the event keys holding the players
+POSITION_EVENT_KEYS = {
+    "LogPlayerPosition": ("character",),
+    "LogPlayerTakeDamage": ("attacker", "victim"),
+    "LogPlayerMakeGroggy": ("attacker", "finisher", "victim"),
+    "LogPlayerKillV2": ("attacker", "finisher", "victim"),
+}
+
+# (time_ms, timestamp_seq, player_seq, timestamp, data)
+_Sample = Tuple[int, int, int, str, Dict[str, Any]]
+
+
+class PositionIndex:
+    """
+    Per-player position samples sorted by epoch milliseconds.
+
+    A sample is recorded for every named player with a location and team in a
+    position-carrying event. When a player appears several times under the same
+    timestamp, the last position wins. Timestamps and players keep the order in
+    which they first appeared, which positions_near uses to break ties.
+
+    Example:
+        >>> index = PositionIndex(events)
+        >>> nearby = index.positions_near(event_time_ms(knock_event), window_seconds=5)
+        >>> sample = index.nearest("Player1", time_ms, window_ms=5000)
+    """
+
+    def __init__(self, events: Iterable[Dict[str, Any]]):
+        """
+        Collect position samples.
+
+        Args:
+            events: Telemetry events in original order
+        """
+        # Group by timestamp first so repeated samples of a player collapse to one
+        timeline: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+        timeline_ms: Dict[str, Optional[int]] = {}
+
+        for event in events:
+            player_keys = POSITION_EVENT_KEYS.get(get_event_type(event))
+            timestamp = event.get("_D")
+
+            if not player_keys or not timestamp:
+                continue
+
+            for key in player_keys:
+                pos_data = event.get(key) or {}
+                name = pos_data.get("name")
+                team_id = pos_data.get("teamId")
+                location = pos_data.get("location")
+
+                if name and location and team_id is not None:
+                    if timestamp not in timeline_ms:
+                        timeline_ms[timestamp] = event_time_ms(event)
+                    timeline[timestamp][name] = {"location": location, "teamId": team_id}
+
+        samples: Dict[str, List[_Sample]] = defaultdict(list)
+        for timestamp_seq, (timestamp, players) in enumerate(timeline.items()):
+            time_ms = timeline_ms[timestamp]
+            if time_ms is None:
+                continue
+
+            for player_seq, (name, data) in enumerate(players.items()):
+                samples[name].append((time_ms, timestamp_seq, player_seq, timestamp, data))
+
+        self._samples: Dict[str, List[_Sample]] = {}
+        self._times: Dict[str, List[int]] = {}
+        for name, player_samples in samples.items():
+            # Stable sort keeps timestamp order for samples at the same millisecond
+            player_samples.sort(key=lambda sample: sample[0])
+            self._samples[name] = player_samples
+            self._times[name] = [sample[0] for sample in player_samples]
+
+    def __len__(self) -> int:
+        return sum(len(times) for times in self._times.values())
+
+    @property
+    def players(self) -> List[str]:
+        """Players with at least one position sample."""
+        return list(self._times.keys())
+
+    def _window(self, name: str, time_ms: int, window_ms: float) -> List[_Sample]:
+        times = self._times.get(name)
+        if not times:
+            return []
+        start = bisect_left(times, time_ms - window_ms)
+        end = bisect_right(times, time_ms + window_ms)
+        return self._samples[name][start:end]
+
+    def nearest(self, name: str, time_ms: int, window_ms: float = 5000) -> Optional[Dict[str, Any]]:
+        """
+        Get a player's position sample closest to a time.
+
+        Args:
+            name: Player name
+            time_ms: Target time in epoch milliseconds
+            window_ms: Maximum distance from the target time
+
+        Returns:
+            Dict with location, teamId, timestamp and time_diff (seconds), or None
+        """
+        best = None
+        for sample in self._window(name, time_ms, window_ms):
+            time_diff = abs(sample[0] - time_ms)
+            if best is None or time_diff < best[0]:
+                best = (time_diff, sample)
+
+        if best is None:
+            return None
+
+        time_diff, sample = best
+        return {**sample[4], "time_diff": time_diff / 1000, "timestamp": sample[3]}
+
+    def positions_near(
+        self, target_ms: Optional[int], window_seconds: float = 5
+    ) -> Dict[str, Dict]:
+        """
+        Find every player's position closest to a time within a time window.
+
+        Players are returned in the order they first appear among the timestamps
+        inside the window; equally close samples resolve to the earliest seen.
+
+        Args:
+            target_ms: Target time in epoch milliseconds
+            window_seconds: Maximum distance from the target time
+
+        Returns:
+            Dict[player_name, position] with location, teamId, time_diff and timestamp
+        """
+        if target_ms is None:
+            return {}
+
+        window_ms = window_seconds * 1000
+        found = []
+
+        for name in self._times:
+            best = None
+            first_seen = None
+
+            for sample in self._window(name, target_ms, window_ms):
+                time_diff = abs(sample[0] - target_ms) / 1000
+                if time_diff > window_seconds:
+                    continue
+
+                rank = (time_diff, sample[1])
+                if best is None or rank < best[0]:
+                    best = (rank, sample)
+                if first_seen is None or sample[1:3] < first_seen:
+                    first_seen = sample[1:3]
+
+            if best is not None:
+                (time_diff, _), sample = best
+                found.append(
+                    (
+                        first_seen,
+                        name,
+                        {**sample[4], "time_diff": time_diff, "timestamp": sample[3]},
+                    )
+                )
+
+        found.sort(key=lambda item: item[0])
+        return {name: position for _, name, position in found}
@@ -66,6 +66,7 @@ class MatchDiscoveryService:
         logger: Optional[logging.Logger] = None,
         metrics_port: int = 9090,
         start_metrics: bool = True,
+        queue_batch_size: int = 50,
     ):
         """Initialize match discovery service.
 
@@ -76,11 +77,13 @@ class MatchDiscoveryService:
             logger: Optional logger (creates new one if None)
             metrics_port: Port for Prometheus metrics server (default: 9090)
             start_metrics: Whether to start metrics server (default: True)
+            queue_batch_size: Stored matches published together (default: 50)
         """
         self.database = database
         self.pubg_client = pubg_client
         self.rabbitmq_publisher = rabbitmq_publisher
         self.logger = logger or logging.getLogger(__name__)
+        self.queue_batch_size = queue_batch_size
 
         # Start metrics server (if enabled)
         if start_metrics:
@@ -214,6 +217,7 @@ class MatchDiscoveryService:
         processed_count = 0
         failed_count = 0
         queued_count = 0
+        stored_match_ids = []
 
         for match_id in match_ids:
             try:
@@ -239,17 +243,7 @@ class MatchDiscoveryService:
                         operation="insert", table="matches", status="success"
                     ).inc()
                     self.logger.info(f"Successfully stored match: {match_id}")
-
-                    # Queue for RabbitMQ processing
-                    queue_success = self._queue_match(metadata["match_id"])
-
-                    if queue_success:
-                        queued_count += 1
-                        MATCHES_QUEUED.labels(status="success").inc()
-                        self.logger.debug(f"Successfully queued match: {match_id}")
-                    else:
-                        MATCHES_QUEUED.labels(status="failed").inc()
-                        self.logger.warning(f"Failed to queue match: {match_id}")
+                    stored_match_ids.append(metadata["match_id"])
                 else:
                     MATCHES_DISCOVERED.labels(status="existing").inc()
                     self.logger.warning(f"Match already exists in database: {match_id}")
@@ -265,6 +259,15 @@ class MatchDiscoveryService:
                 # Try to record error in database (R compatibility)
                 self._record_match_error(match_id, str(e))
 
+            # Queue stored matches in batches as the loop goes, so a crash
+            # leaves at most one batch stored but not queued
+            if len(stored_match_ids) >= self.queue_batch_size:
+                queued_count += self._queue_matches(stored_match_ids)
+                stored_match_ids = []
+
+        # Queue the last batch of stored matches
+        queued_count += self._queue_matches(stored_match_ids)
+
         return {
             "total_matches": len(match_ids),
             "processed": processed_count,
@@ -273,30 +276,46 @@ class MatchDiscoveryService:
             "timestamp": datetime.now(),
         }
 
-    def _queue_match(self, match_id: str) -> bool:
-        """Queue match for worker processing.
+    def _queue_matches(self, match_ids: List[str]) -> int:
+        """Queue matches for worker processing.
 
-        Publishes to match.discovered.{env} queue.
+        Publishes to match.discovered.{env} queue under publisher confirms.
 
         Args:
-            match_id: Match ID to queue
+            match_ids: Match IDs to queue
 
         Returns:
-            True if queued successfully, False otherwise
+            Number of matches queued successfully
         """
+        if not match_ids:
+            return 0
+
+        timestamp = datetime.now().isoformat()
         try:
-            return self.rabbitmq_publisher.publish_message(
+            queue_results = self.rabbitmq_publisher.publish_many(
                 type="match",
                 step="discovered",
-                message={
-                    "match_id": match_id,
-                    "timestamp": datetime.now().isoformat(),
-                    "source": "match-discovery-pipeline",
-                },
+                messages=[
+                    {
+                        "match_id": match_id,
+                        "timestamp": timestamp,
+                        "source": "match-discovery-pipeline",
+                    }
+                    for match_id in match_ids
+                ],
             )
         except Exception as e:
-            self.logger.error(f"Failed to queue match {match_id}: {e}")
-            return False
+            self.logger.error(f"Failed to queue {len(match_ids)} matches: {e}")
+            queue_results = [False] * len(match_ids)
+
+        for match_id, queue_success in zip(match_ids, queue_results):
+            if queue_success:
+                MATCHES_QUEUED.labels(status="success").inc()
+                self.logger.debug(f"Successfully queued match: {match_id}")
+            else:
+                MATCHES_QUEUED.labels(status="failed").inc()
+                self.logger.warning(f"Failed to queue match: {match_id}")
+        return sum(queue_results)
 
     def _record_match_error(self, match_id: str, error_message: str) -> None:
         """Record match processing error in database.
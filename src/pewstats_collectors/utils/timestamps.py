@@ -0,0 +1,63 @@
+"""
+Timestamp helpers for telemetry events.
+
+Telemetry timestamps (the "_D" field) are ISO 8601 strings with millisecond
+precision, e.g. "2024-01-01T12:00:00.123Z". Converting them to integer epoch
+milliseconds once lets callers compare and bisect times without re-parsing.
+
+TelemetryEventDispatcher stores the converted value on every event under
+EVENT_TIME_KEY; event_time_ms reads it back and only parses "_D" for events
+that did not go through the dispatcher.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Event key holding the epoch-millisecond time of "_D"
+EVENT_TIME_KEY = "_ms"
+
+
+def parse_timestamp_ms(timestamp: Any) -> Optional[int]:
+    """
+    Convert a telemetry timestamp to epoch milliseconds.
+
+    Timestamps without a timezone are treated as UTC.
+
+    Args:
+        timestamp: ISO 8601 timestamp string
+
+    Returns:
+        Milliseconds since the Unix epoch, or None if the timestamp is invalid
+    """
+    try:
+        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except (ValueError, AttributeError, TypeError):
+        return None
+
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+
+    return (dt - EPOCH) // timedelta(milliseconds=1)
+
+
+def event_time_ms(event: Dict[str, Any]) -> Optional[int]:
+    """
+    Get the epoch-millisecond time of a telemetry event.
+
+    Args:
+        event: Telemetry event
+
+    Returns:
+        Milliseconds since the Unix epoch, or None if the event has no valid "_D"
+    """
+    try:
+        return event[EVENT_TIME_KEY]
+    except KeyError:
+        return parse_timestamp_ms(event.get("_D"))
+
+
+def ms_to_datetime(time_ms: int) -> datetime:
+    """Convert epoch milliseconds to a timezone-aware UTC datetime."""
+    return EPOCH + timedelta(milliseconds=time_ms)
@@ -16,14 +16,14 @@ Target matches:
 
 import logging
 import time
-import gzip
-import json
 import os
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence
 from multiprocessing import Pool
 
 from pewstats_collectors.core.database_manager import DatabaseManager
+from pewstats_collectors.processors.event_dispatcher import TelemetryEventDispatcher
 from pewstats_collectors.workers.telemetry_processing_worker import TelemetryProcessingWorker
 
 # Configure logging
@@ -33,24 +33,37 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def _process_match_parallel(match_id: str) -> Dict[str, Any]:
+def _process_match_parallel(
+    match_id: str, extractors: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
     """
     Process a single match in parallel worker.
 
     This function is defined at module level to be picklable for multiprocessing.
     Each worker creates its own database connection.
     """
-    orchestrator = MatchBackfillOrchestrator(worker_id=f"backfill-worker-{os.getpid()}")
+    orchestrator = MatchBackfillOrchestrator(
+        worker_id=f"backfill-worker-{os.getpid()}", extractors=extractors
+    )
     return orchestrator.backfill_match(match_id)
 
 
 class MatchBackfillOrchestrator:
     """Orchestrates backfilling of historical matches with enhanced telemetry stats."""
 
+    # Enhanced-stats extractors backfilled by default
+    BACKFILL_EXTRACTORS = ("item_usage", "advanced_stats", "circle_tracking", "weapon_distribution")
+
+    # Event types read by the default extractors; everything else is skipped
+    BACKFILL_EVENT_TYPES = TelemetryProcessingWorker.EXTRACTORS.event_types(
+        TelemetryProcessingWorker.EXTRACTORS.select(BACKFILL_EXTRACTORS)
+    )
+
     def __init__(
         self,
         worker_id: str = "match-backfill-orchestrator",
         batch_size: int = 50,
+        extractors: Optional[Sequence[str]] = None,
     ):
         """
         Initialize the backfill orchestrator.
@@ -58,10 +71,22 @@ class MatchBackfillOrchestrator:
         Args:
             worker_id: Unique identifier for this worker
             batch_size: Number of matches to process per batch
+            extractors: Enhanced-stats extractors to run (default: BACKFILL_EXTRACTORS)
+
+        Raises:
+            ValueError: If extractors names an unknown or non-enhanced-stats extractor
         """
         self.worker_id = worker_id
         self.batch_size = batch_size
 
+        self.extractor_names = tuple(extractors or self.BACKFILL_EXTRACTORS)
+        unsupported = set(self.extractor_names) - set(self.BACKFILL_EXTRACTORS)
+        if unsupported:
+            raise ValueError(f"Cannot backfill extractors: {', '.join(sorted(unsupported))}")
+
+        self.extractors = TelemetryProcessingWorker.EXTRACTORS.select(self.extractor_names)
+        self.event_types = TelemetryProcessingWorker.EXTRACTORS.event_types(self.extractors)
+
         # Initialize database manager from environment variables
         self.db_manager = DatabaseManager(
             host=os.getenv("POSTGRES_HOST", "localhost"),
@@ -79,6 +104,7 @@ class MatchBackfillOrchestrator:
             worker_id=f"{worker_id}-processor",
             logger=logger,
             metrics_port=None,  # No metrics for backfill
+            use_artifacts=True,  # Backfills read telemetry through the artifact cache
         )
 
         self.logger.info(
@@ -211,27 +237,16 @@ class MatchBackfillOrchestrator:
                 self.logger.warning(f"Telemetry file not found for match {match_id}")
                 return result
 
-            # Load telemetry data (files may be single or double-gzipped)
-            # Try single gzip first (newer files), fall back to double gzip (older files)
-            telemetry_data = None
+            # Load the extracted-event artifact, or stream the raw telemetry
+            # (single or double-gzipped) and write the artifact for next time.
+            # Only the event types the selected extractors consume are kept.
             try:
-                # Try single gzip first
-                with gzip.open(telemetry_path, "rt", encoding="utf-8") as f:
-                    telemetry_data = json.load(f)
-            except (gzip.BadGzipFile, UnicodeDecodeError, json.JSONDecodeError):
-                # Try double gzip (older files)
-                try:
-                    with gzip.open(telemetry_path, "rb") as f_outer:
-                        with gzip.open(f_outer, "rt", encoding="utf-8") as f_inner:
-                            telemetry_data = json.load(f_inner)
-                except Exception as e:
-                    result["error"] = f"Failed to decompress telemetry file: {str(e)}"
-                    self.logger.error(f"Failed to decompress telemetry for match {match_id}: {e}")
-                    return result
-
-            if not isinstance(telemetry_data, list):
-                result["error"] = "Invalid telemetry format"
-                self.logger.error(f"Invalid telemetry format for match {match_id}: expected list")
+                telemetry_data = self.telemetry_processor.artifact_cache.read(
+                    str(telemetry_path), self.event_types
+                )
+            except (OSError, EOFError, UnicodeDecodeError, ValueError) as e:
+                result["error"] = f"Failed to decompress telemetry file: {str(e)}"
+                self.logger.error(f"Failed to decompress telemetry for match {match_id}: {e}")
                 return result
 
             # Get match data
@@ -259,49 +274,29 @@ class MatchBackfillOrchestrator:
                 f"Extracting enhanced stats for match {match_id} ({len(telemetry_data)} events)"
             )
 
-            # 1. Item usage
-            item_stats = self.telemetry_processor.extract_item_usage(
-                telemetry_data, match_id, match_data
-            )
-
-            # 2. Advanced stats (killsteals, throwable damage)
-            advanced_stats = self.telemetry_processor.extract_advanced_stats(
-                telemetry_data, match_id, match_data
+            # Group events by type once so each extractor only walks its own events
+            dispatcher = TelemetryEventDispatcher(telemetry_data)
+            del telemetry_data
+            results = self.telemetry_processor.run_extractors(
+                dispatcher, self.extractors, match_id, match_data
             )
 
-            # 3. Circle tracking
-            circle_stats, circle_positions = self.telemetry_processor.extract_circle_tracking(
-                telemetry_data, match_id, match_data
-            )
-
-            # 4. Weapon distribution
-            weapon_stats = self.telemetry_processor.extract_weapon_distribution(
-                telemetry_data, match_id, match_data
-            )
+            circle_positions = results.get("circle_detailed_positions", [])
             weapon_distributions = []  # Not used for backfill, only storing in match_summaries
 
             # Combine all stats for each player
             all_player_stats = {}
 
-            for player, stats in item_stats.items():
-                if player not in all_player_stats:
-                    all_player_stats[player] = {}
-                all_player_stats[player].update(stats)
-
-            for player, stats in advanced_stats.items():
-                if player not in all_player_stats:
-                    all_player_stats[player] = {}
-                all_player_stats[player].update(stats)
-
-            for player, stats in circle_stats.items():
-                if player not in all_player_stats:
-                    all_player_stats[player] = {}
-                all_player_stats[player].update(stats)
-
-            for player, stats in weapon_stats.items():
-                if player not in all_player_stats:
-                    all_player_stats[player] = {}
-                all_player_stats[player].update(stats)
+            for output in (
+                "item_usage_stats",
+                "advanced_stats",
+                "circle_aggregate_stats",
+                "weapon_distribution",
+            ):
+                for player, stats in results.get(output, {}).items():
+                    if player not in all_player_stats:
+                        all_player_stats[player] = {}
+                    all_player_stats[player].update(stats)
 
             # Update match_summaries with enhanced stats
             if all_player_stats:
@@ -390,11 +385,10 @@ class MatchBackfillOrchestrator:
         if workers > 1:
             # Parallel processing using multiprocessing
             self.logger.info(f"Processing {len(matches)} matches with {workers} parallel workers")
+            process_match = partial(_process_match_parallel, extractors=self.extractor_names)
             with Pool(processes=workers) as pool:
                 results = []
-                for i, result in enumerate(
-                    pool.imap_unordered(_process_match_parallel, match_ids), 1
-                ):
+                for i, result in enumerate(pool.imap_unordered(process_match, match_ids), 1):
                     results.append(result)
 
                     if result["success"]:
@@ -506,10 +500,19 @@ def main():
         default=1,
         help="Number of parallel workers (1=sequential, 8=recommended for parallel processing)",
     )
+    parser.add_argument(
+        "--extractors",
+        nargs="+",
+        choices=MatchBackfillOrchestrator.BACKFILL_EXTRACTORS,
+        default=None,
+        help="Enhanced-stats extractors to run (default: all)",
+    )
 
     args = parser.parse_args()
 
-    orchestrator = MatchBackfillOrchestrator(batch_size=args.max_matches)
+    orchestrator = MatchBackfillOrchestrator(
+        batch_size=args.max_matches, extractors=args.extractors
+    )
 
     summary = orchestrator.run_backfill(
         since_date=args.since, max_matches=args.max_matches, workers=args.workers
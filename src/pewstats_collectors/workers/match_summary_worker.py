@@ -8,6 +8,7 @@ extracts participant statistics, stores them in the database, and forwards to te
 import gc
 import logging
 import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
@@ -39,6 +40,32 @@ MAP_NAME_TRANSLATIONS = {
 }
 
 
+@dataclass
+class SummaryJob:
+    """
+    A match discovery message moving through the worker's steps.
+
+    Attributes:
+        data: Message payload
+        match_id: Match ID from the payload
+        start_time: When processing of the message started (time.time())
+        summaries_exist: Whether the match's summaries were stored earlier
+        match_data: Match data from the PUBG API
+        telemetry_url: Telemetry URL of the match
+        summaries: Parsed participant summaries to store
+        outcome: Result for the consumer once the job is finished, None until then
+    """
+
+    data: Dict[str, Any]
+    match_id: Optional[str]
+    start_time: float
+    summaries_exist: bool = False
+    match_data: Optional[Dict[str, Any]] = None
+    telemetry_url: Optional[str] = None
+    summaries: Optional[List[Dict[str, Any]]] = None
+    outcome: Optional[Dict[str, Any]] = None
+
+
 class MatchSummaryWorker:
     """
     Worker that processes match discovery messages and stores participant summaries.
@@ -96,15 +123,56 @@ class MatchSummaryWorker:
         Returns:
             Dict with success status: {"success": bool, "error": str}
         """
-        start_time = time.time()
-        match_id = data.get("match_id")
+        return self.process_batch([data])[0]
+
+    def process_batch(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Process several match discovery messages (RabbitMQConsumer.consume_messages_batched).
+
+        Each match is fetched and parsed on its own, then the summaries of all of
+        them are inserted in one transaction before they are forwarded to the
+        telemetry queue.
+
+        Args:
+            messages: Message payloads containing match_id and metadata
+
+        Returns:
+            One result per message, in order: {"success": bool, "error": str}
+        """
+        jobs = [self.fetch_match(data) for data in messages]
+        self.store_summaries([job for job in jobs if job.outcome is None])
+        for job in jobs:
+            if job.outcome is None:
+                self.publish_match(job)
+
+        outcomes = [job.outcome for job in jobs]
+
+        # Force garbage collection to free memory
+        del jobs
+        gc.collect()
+
+        return outcomes
+
+    def fetch_match(self, data: Dict[str, Any]) -> SummaryJob:
+        """
+        Fetch a match from the PUBG API and parse its participant summaries.
+
+        Args:
+            data: Message payload containing match_id and metadata
+
+        Returns:
+            Job to store and publish, or finished with its outcome set
+        """
+        job = SummaryJob(data=data, match_id=data.get("match_id"), start_time=time.time())
+        match_id = job.match_id
 
         if not match_id:
             error_msg = "Message missing match_id field"
             self.logger.error(f"[{self.worker_id}] {error_msg}")
             self.error_count += 1
             QUEUE_MESSAGES_PROCESSED.labels(queue_name="match_summary", status="failed").inc()
-            return {"success": False, "error": error_msg}
+            job.outcome = {"success": False, "error": error_msg}
+            return job
 
         self.logger.info(f"[{self.worker_id}] Processing match discovery for match: {match_id}")
 
@@ -114,156 +182,189 @@ class MatchSummaryWorker:
             self.logger.debug(f"[{self.worker_id}] Updated match {match_id} status to 'processing'")
 
             # Check if summaries already exist (idempotency)
-            if self.match_summaries_exist(match_id):
+            job.summaries_exist = self.match_summaries_exist(match_id)
+            if job.summaries_exist:
                 self.logger.info(
                     f"[{self.worker_id}] Match summaries already exist for {match_id}, "
                     "fetching telemetry URL and forwarding"
                 )
-
-                # Still need telemetry URL to forward to next stage
-                match_data = self.pubg_client.get_match(match_id)
-                telemetry_url = self.extract_telemetry_url(match_data)
-
-                if not telemetry_url:
-                    error_msg = "Could not extract telemetry URL from match data"
-                    self.logger.error(f"[{self.worker_id}] Match {match_id}: {error_msg}")
-                    self._update_match_status(match_id, "failed", error_msg)
-                    self.error_count += 1
-                    return {"success": False, "error": error_msg}
-
-                # Create telemetry message
-                telemetry_message = self._build_telemetry_message(
-                    match_id, telemetry_url, data, match_data, summaries_processed=True
-                )
-
-                # Publish to telemetry queue
-                publish_success = self.rabbitmq_publisher.publish_message(
-                    "match", "telemetry", telemetry_message
+            else:
+                self.logger.debug(
+                    f"[{self.worker_id}] Fetching match data from PUBG API for match: {match_id}"
                 )
 
-                if publish_success:
-                    self.logger.info(
-                        f"[{self.worker_id}] Successfully published existing match {match_id} "
-                        f"to telemetry queue with URL: {telemetry_url[:80]}"
-                    )
-                    self.processed_count += 1
-                    MATCH_SUMMARIES_PROCESSED.labels(status="skipped").inc()
-                    QUEUE_MESSAGES_PROCESSED.labels(
-                        queue_name="match_summary", status="success"
-                    ).inc()
-                    QUEUE_PROCESSING_DURATION.labels(queue_name="match_summary").observe(
-                        time.time() - start_time
-                    )
-                    return {"success": True}
-                else:
-                    error_msg = "Failed to publish to telemetry queue"
-                    self.logger.error(f"[{self.worker_id}] Match {match_id}: {error_msg}")
-                    self._update_match_status(match_id, "failed", error_msg)
-                    self.error_count += 1
-                    MATCH_SUMMARIES_PROCESSED.labels(status="failed").inc()
-                    QUEUE_MESSAGES_PROCESSED.labels(
-                        queue_name="match_summary", status="failed"
-                    ).inc()
-                    WORKER_ERRORS.labels(
-                        worker_type="match_summary", error_type="PublishError"
-                    ).inc()
-                    return {"success": False, "error": error_msg}
-
-            # Fetch match data from PUBG API
-            self.logger.debug(
-                f"[{self.worker_id}] Fetching match data from PUBG API for match: {match_id}"
-            )
-            match_data = self.pubg_client.get_match(match_id)
+            # Still need telemetry URL to forward to next stage
+            job.match_data = self.pubg_client.get_match(match_id)
 
             # Extract telemetry URL FIRST (critical for next stage)
-            telemetry_url = self.extract_telemetry_url(match_data)
-            if not telemetry_url:
-                error_msg = "Could not extract telemetry URL from match data"
-                self.logger.error(f"[{self.worker_id}] Match {match_id}: {error_msg}")
-                self._update_match_status(match_id, "failed", error_msg)
-                self.error_count += 1
-                return {"success": False, "error": error_msg}
+            job.telemetry_url = self.extract_telemetry_url(job.match_data)
+            if not job.telemetry_url:
+                return self._fail(job, "Could not extract telemetry URL from match data")
+
+            if job.summaries_exist:
+                return job
 
             self.logger.debug(
                 f"[{self.worker_id}] Extracted telemetry URL for match {match_id}: "
-                f"{telemetry_url[:80]}"
+                f"{job.telemetry_url[:80]}"
             )
 
             # Parse match summaries
-            summaries = self.parse_match_summaries(match_data)
-            if not summaries:
-                error_msg = "No participant data found in match"
-                self.logger.error(f"[{self.worker_id}] Match {match_id}: {error_msg}")
-                self._update_match_status(match_id, "failed", error_msg)
-                self.error_count += 1
-                return {"success": False, "error": error_msg}
-
-            # Store summaries in database
+            job.summaries = self.parse_match_summaries(job.match_data)
+            if not job.summaries:
+                return self._fail(job, "No participant data found in match")
+
+            return job
+
+        except Exception as e:
+            return self._fail_with_exception(job, e)
+
+    def store_summaries(self, jobs: List[SummaryJob]) -> None:
+        """
+        Insert the parsed summaries of several matches in one transaction.
+
+        Matches whose summaries already exist are left alone. If the insert
+        fails, each match is inserted again on its own, so only the matches
+        that fail by themselves are failed.
+
+        Args:
+            jobs: Jobs returned by fetch_match that are not finished yet
+        """
+        jobs = [job for job in jobs if not job.summaries_exist]
+        if not jobs:
+            return
+
+        summaries = [summary for job in jobs for summary in job.summaries]
+        try:
             inserted_count = self.database_manager.insert_match_summaries(summaries)
-            self.logger.info(
-                f"[{self.worker_id}] Stored {inserted_count}/{len(summaries)} summaries for match {match_id}"
+        except Exception as e:
+            if len(jobs) == 1:
+                self._fail_with_exception(jobs[0], e)
+                return
+            # The failed insert was rolled back, so each match can be retried alone
+            self.logger.warning(
+                f"[{self.worker_id}] Failed to store summaries of {len(jobs)} matches "
+                f"together, storing them one by one: {e}"
             )
+            for job in jobs:
+                self.store_summaries([job])
+            return
+
+        self.logger.info(
+            f"[{self.worker_id}] Stored {inserted_count}/{len(summaries)} summaries for "
+            f"{len(jobs)} match(es): {', '.join(job.match_id for job in jobs)}"
+        )
+        DATABASE_OPERATIONS.labels(
+            operation="insert", table="match_summaries", status="success"
+        ).inc(inserted_count)
 
+    def publish_match(self, job: SummaryJob) -> SummaryJob:
+        """
+        Forward a stored match to the telemetry queue and finish its job.
+
+        Args:
+            job: Job whose summaries are stored
+
+        Returns:
+            The job, finished
+        """
+        match_id = job.match_id
+
+        try:
             # Build telemetry message
-            telemetry_message = self._build_telemetry_message(
-                match_id,
-                telemetry_url,
-                data,
-                match_data,
-                summaries_processed=True,
-                participant_count=len(summaries),
-            )
+            if job.summaries_exist:
+                telemetry_message = self._build_telemetry_message(
+                    match_id, job.telemetry_url, job.data, job.match_data, summaries_processed=True
+                )
+            else:
+                telemetry_message = self._build_telemetry_message(
+                    match_id,
+                    job.telemetry_url,
+                    job.data,
+                    job.match_data,
+                    summaries_processed=True,
+                    participant_count=len(job.summaries),
+                )
 
             # Publish to telemetry queue
             publish_success = self.rabbitmq_publisher.publish_message(
                 "match", "telemetry", telemetry_message
             )
+        except Exception as e:
+            return self._fail_with_exception(job, e)
 
-            if not publish_success:
-                error_msg = "Failed to publish to telemetry queue"
-                self.logger.error(f"[{self.worker_id}] Match {match_id}: {error_msg}")
-                self._update_match_status(match_id, "failed", error_msg)
-                self.error_count += 1
-                return {"success": False, "error": error_msg}
+        if not publish_success:
+            return self._fail(
+                job,
+                "Failed to publish to telemetry queue",
+                "PublishError" if job.summaries_exist else None,
+            )
 
-            # Success!
-            self.processed_count += 1
-            duration = time.time() - start_time
+        # Success!
+        self.processed_count += 1
+        duration = time.time() - job.start_time
+        if job.summaries_exist:
+            self.logger.info(
+                f"[{self.worker_id}] Successfully published existing match {match_id} "
+                f"to telemetry queue with URL: {job.telemetry_url[:80]}"
+            )
+            MATCH_SUMMARIES_PROCESSED.labels(status="skipped").inc()
+        else:
             self.logger.info(
                 f"[{self.worker_id}] ✅ Successfully processed match {match_id} "
-                f"({len(summaries)} participants) and published to telemetry queue "
-                f"with URL: {telemetry_url[:80]}"
+                f"({len(job.summaries)} participants) and published to telemetry queue "
+                f"with URL: {job.telemetry_url[:80]}"
             )
-
-            # Record metrics
             MATCH_SUMMARIES_PROCESSED.labels(status="success").inc()
             MATCH_PROCESSING_DURATION.observe(duration)
-            QUEUE_MESSAGES_PROCESSED.labels(queue_name="match_summary", status="success").inc()
-            QUEUE_PROCESSING_DURATION.labels(queue_name="match_summary").observe(duration)
-            DATABASE_OPERATIONS.labels(
-                operation="insert", table="match_summaries", status="success"
-            ).inc(inserted_count)
 
-            # Force garbage collection to free memory
-            del match_data, summaries
-            gc.collect()
+        # Record metrics
+        QUEUE_MESSAGES_PROCESSED.labels(queue_name="match_summary", status="success").inc()
+        QUEUE_PROCESSING_DURATION.labels(queue_name="match_summary").observe(duration)
 
-            return {"success": True}
+        job.outcome = {"success": True}
+        return job
 
-        except Exception as e:
-            duration = time.time() - start_time
-            error_msg = f"Match summary processing failed: {str(e)}"
-            self.logger.error(f"[{self.worker_id}] Match {match_id}: {error_msg}", exc_info=True)
-            self._update_match_status(match_id, "failed", error_msg)
-            self.error_count += 1
+    def _fail(
+        self, job: SummaryJob, error_msg: str, error_type: Optional[str] = None
+    ) -> SummaryJob:
+        """
+        Finish a failed job, marking its match failed.
+
+        Args:
+            job: Failed job
+            error_msg: Error message logged, stored and returned
+            error_type: Error type counted in the failure metrics (default: not counted)
+        """
+        self.logger.error(f"[{self.worker_id}] Match {job.match_id}: {error_msg}")
+        self._update_match_status(job.match_id, "failed", error_msg)
+        self.error_count += 1
 
-            # Record error metrics
+        if error_type:
             MATCH_SUMMARIES_PROCESSED.labels(status="failed").inc()
             QUEUE_MESSAGES_PROCESSED.labels(queue_name="match_summary", status="failed").inc()
-            QUEUE_PROCESSING_DURATION.labels(queue_name="match_summary").observe(duration)
-            WORKER_ERRORS.labels(worker_type="match_summary", error_type=type(e).__name__).inc()
+            WORKER_ERRORS.labels(worker_type="match_summary", error_type=error_type).inc()
 
-            return {"success": False, "error": str(e)}
+        job.outcome = {"success": False, "error": error_msg}
+        return job
+
+    def _fail_with_exception(self, job: SummaryJob, e: Exception) -> SummaryJob:
+        """Finish a job that raised while processing, marking its match failed."""
+        match_id = job.match_id
+        duration = time.time() - job.start_time
+        error_msg = f"Match summary processing failed: {str(e)}"
+        self.logger.error(f"[{self.worker_id}] Match {match_id}: {error_msg}", exc_info=True)
+        self._update_match_status(match_id, "failed", error_msg)
+        self.error_count += 1
+
+        # Record error metrics
+        MATCH_SUMMARIES_PROCESSED.labels(status="failed").inc()
+        QUEUE_MESSAGES_PROCESSED.labels(queue_name="match_summary", status="failed").inc()
+        QUEUE_PROCESSING_DURATION.labels(queue_name="match_summary").observe(duration)
+        WORKER_ERRORS.labels(worker_type="match_summary", error_type=type(e).__name__).inc()
+
+        job.outcome = {"success": False, "error": str(e)}
+        return job
 
     def extract_telemetry_url(self, match_data: Dict[str, Any]) -> Optional[str]:
         """
@@ -683,6 +784,20 @@ if __name__ == "__main__":
         environment=os.getenv("ENVIRONMENT", "production"),
     )
 
+    # Batches of BATCH_SIZE matches (> 1) store their summaries in one transaction,
+    # waiting up to BATCH_MAX_WAIT seconds for a batch to fill
+    batch_size = int(os.getenv("BATCH_SIZE", "1"))
+    batch_max_wait = float(os.getenv("BATCH_MAX_WAIT", "5"))
+
     # Start consuming
     print(f"Starting match summary worker: {worker.worker_id}")
-    consumer.consume_messages("match", "discovered", worker.process_message)
+    if batch_size > 1:
+        consumer.consume_messages_batched(
+            "match",
+            "discovered",
+            worker.process_batch,
+            batch_size=batch_size,
+            max_wait=batch_max_wait,
+        )
+    else:
+        consumer.consume_messages("match", "discovered", worker.process_message)
@@ -7,84 +7,114 @@ Processes multiple telemetry files concurrently using a process pool.
 Architecture:
 - Main thread: RabbitMQ consumer (single-threaded, pika isn't thread-safe)
 - Worker pool: ProcessPoolExecutor with N workers (CPU-bound tasks)
-- Each worker process has its own database connection
+- submit keeps in_flight_per_process messages (default: 2) per worker process in
+  flight; each message is acked or nacked as soon as its result arrives
+- Each worker process builds its DatabaseManager (with its connection pool) and
+  TelemetryProcessingWorker once, in the pool initializer, and reuses them for
+  every message it processes
+- Worker processes are replaced after max_tasks_per_child messages, and the pool
+  is replaced once a worker process grows past max_child_rss_bytes
+- With PROMETHEUS_MULTIPROC_DIR set, metrics recorded in worker processes are
+  served by the main process's metrics server (see metrics module)
 """
 
 import logging
+import multiprocessing
 import os
+import threading
 import time
-from concurrent.futures import ProcessPoolExecutor
-from typing import Any, Dict, Optional
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.util import Finalize
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from ..core.database_manager import DatabaseManager
 from .telemetry_processing_worker import TelemetryProcessingWorker
 from ..metrics import (
+    MULTIPROCESS_DIR,
     QUEUE_MESSAGES_PROCESSED,
     QUEUE_PROCESSING_DURATION,
+    WORKER_RESTARTS,
+    get_rss_bytes,
+    mark_process_dead,
+    reset_multiprocess_dir,
     start_metrics_server,
 )
 
 
 logger = logging.getLogger(__name__)
 
+# Telemetry processing worker of this pool process, set by _init_worker_process
+_process_worker: Optional[TelemetryProcessingWorker] = None
 
-def _process_message_worker(
-    message_data: Dict[str, Any],
-    worker_id: str,
-    db_config: Dict[str, Any],
-) -> Dict[str, Any]:
+
+def _init_worker_process(worker_id: str, db_config: Dict[str, Any]) -> None:
     """
-    Worker function for processing a single message in a separate process.
+    Pool initializer: create the process's database manager and worker.
 
-    This function is executed in a child process by ProcessPoolExecutor.
-    Each process gets its own database connection.
+    Runs once in each worker process. The database connection pool is closed
+    when the process exits.
 
     Args:
-        message_data: Message payload containing match_id and file_path
         worker_id: Worker identifier for logging
         db_config: Database configuration dict
-
-    Returns:
-        Result dict: {"success": bool, "error": Optional[str], "match_id": str}
     """
-    try:
-        # Create database manager for this process
-        db_manager = DatabaseManager(
-            host=db_config["host"],
-            port=db_config["port"],
-            dbname=db_config["dbname"],
-            user=db_config["user"],
-            password=db_config["password"],
-            min_pool_size=1,
-            max_pool_size=2,  # Small pool per worker
-        )
+    global _process_worker
+
+    db_manager = DatabaseManager(
+        host=db_config["host"],
+        port=db_config["port"],
+        dbname=db_config["dbname"],
+        user=db_config["user"],
+        password=db_config["password"],
+        min_pool_size=1,
+        max_pool_size=2,  # Small pool per worker
+        use_copy=db_config.get("use_copy", False),
+        use_pipeline=db_config.get("use_pipeline", False),
+    )
+    # Pool processes end through os._exit, which skips atexit handlers
+    Finalize(None, db_manager.disconnect, exitpriority=10)
+    Finalize(None, mark_process_dead, args=(os.getpid(),), exitpriority=10)
+
+    _process_worker = TelemetryProcessingWorker(
+        database_manager=db_manager,
+        worker_id=f"{worker_id}-pool-{os.getpid()}",
+        metrics_port=None,  # Served by the parent's metrics server in multiprocess mode
+        # TELEMETRY_ARTIFACTS=on caches extracted events next to the raw files
+        use_artifacts=os.getenv("TELEMETRY_ARTIFACTS", "off") == "on",
+    )
 
-        # Create worker instance
-        worker = TelemetryProcessingWorker(
-            database_manager=db_manager,
-            worker_id=f"{worker_id}-pool",
-            metrics_port=None,  # No metrics server in child processes
-        )
 
-        # Process message
-        result = worker.process_message(message_data)
+def _process_message_worker(message_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Worker function for processing a single message in a separate process.
 
-        # Clean up
-        db_manager.disconnect()
+    This function is executed in a child process by ProcessPoolExecutor, using
+    the worker created by _init_worker_process.
 
-        # Add match_id to result for tracking
-        result["match_id"] = message_data.get("match_id")
+    Args:
+        message_data: Message payload containing match_id and file_path
 
-        return result
+    Returns:
+        Result dict: {"success": bool, "error": Optional[str], "match_id": str,
+        "rss_bytes": int}
+    """
+    try:
+        if _process_worker is None:
+            raise RuntimeError("Worker process was not initialized")
+
+        # Process message
+        result = _process_worker.process_message(message_data)
 
     except Exception as e:
         error_msg = f"Worker process exception: {e}"
         logger.error(error_msg)
-        return {
-            "success": False,
-            "error": error_msg,
-            "match_id": message_data.get("match_id", "unknown"),
-        }
+        result = {"success": False, "error": error_msg}
+
+    # Add match_id to result for tracking, and RSS for recycling
+    result["match_id"] = message_data.get("match_id", "unknown")
+    result["rss_bytes"] = get_rss_bytes()
+    return result
 
 
 class ParallelTelemetryProcessingWorker:
@@ -97,7 +127,8 @@ class ParallelTelemetryProcessingWorker:
     Features:
     - Concurrent processing of multiple matches
     - Configurable worker pool size
-    - Automatic database connection management per worker
+    - Database connection pool and worker state kept per worker process
+    - Worker processes recycled by task count and RSS
     - Graceful shutdown with in-flight request handling
     """
 
@@ -108,6 +139,9 @@ class ParallelTelemetryProcessingWorker:
         db_config: Optional[Dict[str, Any]] = None,
         logger: Optional[logging.Logger] = None,
         metrics_port: int = 9093,
+        max_tasks_per_child: Optional[int] = None,
+        max_child_rss_bytes: Optional[int] = None,
+        in_flight_per_process: int = 2,
     ):
         """
         Initialize parallel telemetry processing worker.
@@ -118,9 +152,18 @@ class ParallelTelemetryProcessingWorker:
             db_config: Database configuration dict (if None, reads from env)
             logger: Optional logger instance
             metrics_port: Port for Prometheus metrics server
+            max_tasks_per_child: Replace a worker process after this many messages
+                (default: None, never; worker processes are then spawned, not forked)
+            max_child_rss_bytes: Replace the pool once a worker process's RSS exceeds
+                this after a message (default: None, never)
+            in_flight_per_process: Messages per worker process kept in flight by
+                submit (default: 2, so the next message is queued while one runs)
         """
         self.worker_id = worker_id
         self.pool_size = pool_size
+        self.max_tasks_per_child = max_tasks_per_child
+        self.max_child_rss_bytes = max_child_rss_bytes
+        self.in_flight_per_process = in_flight_per_process
         self.logger = logger or logging.getLogger(__name__)
 
         # Database configuration (shared with worker processes)
@@ -130,21 +173,18 @@ class ParallelTelemetryProcessingWorker:
             "dbname": os.getenv("POSTGRES_DB"),
             "user": os.getenv("POSTGRES_USER"),
             "password": os.getenv("POSTGRES_PASSWORD"),
+            "use_copy": os.getenv("DB_BULK_LOAD", "executemany") == "copy",
+            "use_pipeline": os.getenv("DB_PIPELINE", "off") == "on",
         }
 
         # Initialize process pool
-        self.executor = ProcessPoolExecutor(
-            max_workers=self.pool_size,
-            mp_context=None,  # Use default (fork on Linux, spawn on Windows)
-        )
+        self.executor = self._create_executor()
 
-        # Processing counters
+        # Processing counters (updated from the pool's result threads too)
         self.processed_count = 0
         self.error_count = 0
         self.in_flight_count = 0
-
-        # Track submitted futures
-        self.futures = {}
+        self._lock = threading.Lock()
 
         # Start metrics server
         start_metrics_server(port=metrics_port, worker_name=f"telemetry-processing-{worker_id}")
@@ -154,6 +194,11 @@ class ParallelTelemetryProcessingWorker:
             f"with {self.pool_size} worker processes"
         )
 
+    @property
+    def max_in_flight(self) -> int:
+        """Messages submit keeps in flight: in_flight_per_process per worker process."""
+        return self.pool_size * self.in_flight_per_process
+
     def process_message(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process a telemetry processing message (callback for RabbitMQConsumer).
@@ -171,65 +216,163 @@ class ParallelTelemetryProcessingWorker:
         match_id = data.get("match_id", "unknown")
 
         try:
-            # Submit to process pool
-            future = self.executor.submit(
-                _process_message_worker,
-                data,
-                self.worker_id,
-                self.db_config,
-            )
+            executor, future = self._submit(data)
+        except Exception as e:
+            return self._fail(match_id, start_time, self.executor, e)
+
+        # Wait for result (blocking to maintain RabbitMQ ack order)
+        return self._complete(match_id, start_time, executor, future)
+
+    def submit(self, data: Dict[str, Any], done: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Submit a message without waiting for it (RabbitMQConsumer.consume_messages_deferred).
+
+        Keeps every worker process busy: the consumer prefetches up to max_in_flight
+        messages, and each message is acked or nacked as soon as it finishes.
+
+        Args:
+            data: Message payload containing match_id and file_path
+            done: Called with the result once the message is processed; runs on
+                the process pool's management thread
+        """
+        start_time = time.time()
+        match_id = data.get("match_id", "unknown")
+
+        try:
+            executor, future = self._submit(data)
+        except Exception as e:
+            done(self._fail(match_id, start_time, self.executor, e))
+            return
+
+        future.add_done_callback(
+            lambda future: done(self._complete(match_id, start_time, executor, future))
+        )
 
+    def _submit(self, data: Dict[str, Any]) -> Tuple[ProcessPoolExecutor, Future]:
+        """Submit a message to the current process pool."""
+        with self._lock:
+            executor = self.executor
+            future = executor.submit(_process_message_worker, data)
             self.in_flight_count += 1
-            self.logger.debug(
-                f"[{self.worker_id}] Submitted match {match_id} to worker pool "
-                f"({self.in_flight_count} in-flight)"
-            )
 
-            # Wait for result (blocking to maintain RabbitMQ ack order)
+        self.logger.debug(
+            f"[{self.worker_id}] Submitted match {data.get('match_id', 'unknown')} to worker "
+            f"pool ({self.in_flight_count} in-flight)"
+        )
+        return executor, future
+
+    def _complete(
+        self,
+        match_id: str,
+        start_time: float,
+        executor: ProcessPoolExecutor,
+        future: Future,
+    ) -> Dict[str, Any]:
+        """
+        Record a submitted message's result.
+
+        Args:
+            match_id: Match ID of the message
+            start_time: When the message was received
+            executor: Process pool the message was submitted to
+            future: The message's future
+
+        Returns:
+            Result dict: {"success": bool, "error": Optional[str], ...}
+        """
+        try:
             result = future.result()
+        except Exception as e:
+            with self._lock:
+                self.in_flight_count -= 1
+            return self._fail(match_id, start_time, executor, e)
 
+        # Update counters
+        duration = time.time() - start_time
+        with self._lock:
             self.in_flight_count -= 1
-
-            # Update counters
             if result.get("success"):
                 self.processed_count += 1
-                duration = time.time() - start_time
-                QUEUE_MESSAGES_PROCESSED.labels(
-                    queue_name="telemetry_processing", status="success"
-                ).inc()
-                QUEUE_PROCESSING_DURATION.labels(queue_name="telemetry_processing").observe(
-                    duration
-                )
-                self.logger.info(
-                    f"[{self.worker_id}] Successfully processed match {match_id} in {duration:.2f}s"
-                )
             else:
                 self.error_count += 1
-                duration = time.time() - start_time
-                QUEUE_MESSAGES_PROCESSED.labels(
-                    queue_name="telemetry_processing", status="failed"
-                ).inc()
-                QUEUE_PROCESSING_DURATION.labels(queue_name="telemetry_processing").observe(
-                    duration
-                )
-                self.logger.error(
-                    f"[{self.worker_id}] Failed to process match {match_id}: "
-                    f"{result.get('error', 'Unknown error')}"
-                )
-
-            return result
 
-        except Exception as e:
-            self.error_count += 1
-            self.in_flight_count -= 1
-            duration = time.time() - start_time
-            error_msg = f"Exception processing match {match_id}: {e}"
-            self.logger.error(f"[{self.worker_id}] {error_msg}")
+        if result.get("success"):
+            self.logger.info(
+                f"[{self.worker_id}] Successfully processed match {match_id} in {duration:.2f}s"
+            )
+        else:
+            self.logger.error(
+                f"[{self.worker_id}] Failed to process match {match_id}: "
+                f"{result.get('error', 'Unknown error')}"
+            )
+
+        # In multiprocess mode the pool process has recorded the message itself
+        if not MULTIPROCESS_DIR:
             QUEUE_MESSAGES_PROCESSED.labels(
-                queue_name="telemetry_processing", status="failed"
+                queue_name="telemetry_processing",
+                status="success" if result.get("success") else "failed",
             ).inc()
             QUEUE_PROCESSING_DURATION.labels(queue_name="telemetry_processing").observe(duration)
-            return {"success": False, "error": error_msg}
+
+        rss_bytes = result.get("rss_bytes")
+        if self.max_child_rss_bytes and rss_bytes and rss_bytes > self.max_child_rss_bytes:
+            self.logger.info(
+                f"[{self.worker_id}] Worker process RSS {rss_bytes / 1_000_000:.0f}MB exceeds "
+                f"{self.max_child_rss_bytes / 1_000_000:.0f}MB, replacing worker pool"
+            )
+            self._replace_executor(executor, reason="rss")
+
+        return result
+
+    def _fail(
+        self,
+        match_id: str,
+        start_time: float,
+        executor: ProcessPoolExecutor,
+        e: Exception,
+    ) -> Dict[str, Any]:
+        """Record a message that could not be processed by the process pool."""
+        with self._lock:
+            self.error_count += 1
+        duration = time.time() - start_time
+        error_msg = f"Exception processing match {match_id}: {e}"
+        self.logger.error(f"[{self.worker_id}] {error_msg}")
+        if isinstance(e, BrokenProcessPool):
+            # A worker process died (e.g. OOM-killed); later messages need a new pool
+            self._replace_executor(executor, reason="broken_pool")
+        QUEUE_MESSAGES_PROCESSED.labels(queue_name="telemetry_processing", status="failed").inc()
+        QUEUE_PROCESSING_DURATION.labels(queue_name="telemetry_processing").observe(duration)
+        return {"success": False, "error": error_msg}
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        """Create the process pool; each process initializes its worker once."""
+        return ProcessPoolExecutor(
+            max_workers=self.pool_size,
+            # max_tasks_per_child requires spawn; otherwise use the default
+            # (fork on Linux, spawn on Windows)
+            mp_context=multiprocessing.get_context("spawn") if self.max_tasks_per_child else None,
+            initializer=_init_worker_process,
+            initargs=(self.worker_id, self.db_config),
+            max_tasks_per_child=self.max_tasks_per_child,
+        )
+
+    def _replace_executor(self, executor: ProcessPoolExecutor, reason: str) -> None:
+        """
+        Replace the process pool, unless it was already replaced.
+
+        In-flight messages finish in the old pool, whose processes then exit.
+
+        Args:
+            executor: Process pool to replace
+            reason: Restart reason counted in WORKER_RESTARTS (rss, broken_pool)
+        """
+        with self._lock:
+            if executor is not self.executor:
+                return
+            self.executor = self._create_executor()
+
+        executor.shutdown(wait=False)
+        WORKER_RESTARTS.labels(worker_type="telemetry_processing", reason=reason).inc()
 
     def shutdown(self, wait: bool = True) -> None:
         """
@@ -267,13 +410,26 @@ if __name__ == "__main__":
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
+    # Drop metrics samples left by an earlier run before starting worker processes
+    reset_multiprocess_dir()
+
     # Get worker pool size from environment (default: 2, should match CPU count)
     pool_size = int(os.getenv("WORKER_POOL_SIZE", "2"))
 
+    # Worker process recycling limits (0 disables a limit)
+    max_tasks_per_child = int(os.getenv("WORKER_MAX_TASKS_PER_CHILD", "500"))
+    max_child_rss_mb = int(os.getenv("WORKER_MAX_RSS_MB", "1024"))
+
+    # Messages in flight per worker process (0 processes one message at a time)
+    in_flight_per_process = int(os.getenv("WORKER_IN_FLIGHT_PER_PROCESS", "2"))
+
     # Initialize parallel worker
     worker = ParallelTelemetryProcessingWorker(
         worker_id=os.getenv("WORKER_ID", "telemetry-processing-worker-1"),
         pool_size=pool_size,
+        max_tasks_per_child=max_tasks_per_child or None,
+        max_child_rss_bytes=max_child_rss_mb * 1_000_000 or None,
+        in_flight_per_process=max(in_flight_per_process, 1),
     )
 
     # Initialize consumer
@@ -284,14 +440,19 @@ if __name__ == "__main__":
         password=os.getenv("RABBITMQ_PASSWORD", "guest"),
         vhost=os.getenv("RABBITMQ_VHOST", "/"),
         environment=os.getenv("ENVIRONMENT", "development"),
-        prefetch_count=pool_size,  # Prefetch matches pool size
+        # Prefetch bounds the messages in flight
+        prefetch_count=worker.max_in_flight if in_flight_per_process else pool_size,
     )
 
     # Start consuming
     print(f"Starting parallel telemetry processing worker: {worker.worker_id}")
     print(f"Worker pool size: {pool_size} processes")
     try:
-        consumer.consume_messages("match", "processing", worker.process_message)
+        if in_flight_per_process:
+            print(f"Messages in flight: up to {worker.max_in_flight}")
+            consumer.consume_messages_deferred("match", "processing", worker.submit)
+        else:
+            consumer.consume_messages("match", "processing", worker.process_message)
     except KeyboardInterrupt:
         print("\nShutting down...")
         worker.shutdown(wait=True)
@@ -9,7 +9,7 @@ import gc
 import logging
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..core.database_manager import DatabaseManager
 from ..metrics import (
@@ -20,6 +20,92 @@ from ..metrics import (
     start_metrics_server,
 )
 
+# Adds a match's damage events to player_damage_stats under a match type
+DAMAGE_STATS_QUERY = """
+    INSERT INTO player_damage_stats (
+        player_name,
+        weapon_id,
+        damage_reason,
+        match_type,
+        total_damage,
+        total_hits,
+        stats_updated_at
+    )
+    SELECT
+        de.attacker_name as player_name,
+        COALESCE(de.weapon_id, 'Unknown') as weapon_id,
+        COALESCE(de.damage_reason, 'Unknown') as damage_reason,
+        %s as match_type,
+        SUM(de.damage) as total_damage,
+        COUNT(*) as total_hits,
+        NOW() as stats_updated_at
+    FROM player_damage_events de
+    WHERE de.match_id = %s
+      AND de.attacker_name IS NOT NULL
+      AND de.attacker_name != ''
+      AND de.damage > 0
+    GROUP BY de.attacker_name, de.weapon_id, de.damage_reason
+    ON CONFLICT (player_name, weapon_id, damage_reason, match_type)
+    DO UPDATE SET
+        total_damage = player_damage_stats.total_damage + EXCLUDED.total_damage,
+        total_hits = player_damage_stats.total_hits + EXCLUDED.total_hits,
+        stats_updated_at = EXCLUDED.stats_updated_at
+"""
+
+# Adds a match's weapon kill events to player_weapon_stats under a match type
+WEAPON_STATS_QUERY = """
+    INSERT INTO player_weapon_stats (
+        player_name,
+        weapon_id,
+        match_type,
+        total_kills,
+        headshot_kills,
+        knock_downs,
+        total_kill_distance,
+        longest_kill,
+        close_range_kills,
+        mid_range_kills,
+        long_range_kills,
+        stats_updated_at
+    )
+    SELECT
+        wke.killer_name as player_name,
+        COALESCE(wke.weapon_id, 'Unknown') as weapon_id,
+        %s as match_type,
+        COUNT(CASE WHEN wke.is_kill THEN 1 END) as total_kills,
+        COUNT(CASE WHEN wke.is_kill AND wke.damage_type LIKE '%%HeadShot%%' THEN 1 END) as headshot_kills,
+        COUNT(CASE WHEN wke.is_knock_down THEN 1 END) as knock_downs,
+        SUM(COALESCE(wke.distance, 0)) as total_kill_distance,
+        MAX(wke.distance) as longest_kill,
+        COUNT(CASE WHEN wke.distance < 50 THEN 1 END) as close_range_kills,
+        COUNT(CASE WHEN wke.distance >= 50 AND wke.distance < 200 THEN 1 END) as mid_range_kills,
+        COUNT(CASE WHEN wke.distance >= 200 THEN 1 END) as long_range_kills,
+        NOW() as stats_updated_at
+    FROM weapon_kill_events wke
+    WHERE wke.match_id = %s
+      AND wke.killer_name IS NOT NULL
+      AND wke.killer_name != ''
+    GROUP BY wke.killer_name, wke.weapon_id
+    ON CONFLICT (player_name, weapon_id, match_type)
+    DO UPDATE SET
+        total_kills = player_weapon_stats.total_kills + EXCLUDED.total_kills,
+        headshot_kills = player_weapon_stats.headshot_kills + EXCLUDED.headshot_kills,
+        knock_downs = player_weapon_stats.knock_downs + EXCLUDED.knock_downs,
+        total_kill_distance = player_weapon_stats.total_kill_distance + EXCLUDED.total_kill_distance,
+        longest_kill = GREATEST(player_weapon_stats.longest_kill, EXCLUDED.longest_kill),
+        close_range_kills = player_weapon_stats.close_range_kills + EXCLUDED.close_range_kills,
+        mid_range_kills = player_weapon_stats.mid_range_kills + EXCLUDED.mid_range_kills,
+        long_range_kills = player_weapon_stats.long_range_kills + EXCLUDED.long_range_kills,
+        stats_updated_at = EXCLUDED.stats_updated_at
+"""
+
+MARK_AGGREGATED_QUERY = """
+    UPDATE matches
+    SET stats_aggregated = TRUE,
+        stats_aggregated_at = NOW()
+    WHERE match_id = %s
+"""
+
 
 class StatsAggregationWorker:
     """
@@ -97,14 +183,10 @@ class StatsAggregationWorker:
                     # Determine match type for aggregation
                     match_type = self._determine_match_type(game_type)
 
-                    # Aggregate damage stats
-                    damage_aggregated = self._aggregate_damage_stats(match_id, match_type)
-
-                    # Aggregate weapon stats
-                    weapon_aggregated = self._aggregate_weapon_stats(match_id, match_type)
-
-                    # Mark match as aggregated
-                    self._mark_match_aggregated(match_id)
+                    # Aggregate damage and weapon stats and mark the match as aggregated
+                    damage_aggregated, weapon_aggregated = self._aggregate_match(
+                        match_id, match_type
+                    )
 
                     processed += 1
                     self.processed_count += 1
@@ -193,264 +275,51 @@ class StatsAggregationWorker:
         else:
             return "all"
 
-    def _aggregate_damage_stats(self, match_id: str, match_type: str) -> int:
+    def _aggregate_match(self, match_id: str, match_type: str) -> Tuple[int, int]:
         """
-        Aggregate damage events for a match into player_damage_stats.
+        Aggregate a match into player_damage_stats and player_weapon_stats and mark it.
+
+        Ranked and normal matches are also added to the 'all' match type. The
+        statements are independent, so they run as one DatabaseManager pipeline:
+        one round trip in pipeline mode and a single transaction either way, so
+        a failed match is not counted twice when it is retried.
 
         Args:
             match_id: Match ID to aggregate
             match_type: Match type (ranked/normal/all)
 
         Returns:
-            Number of records inserted/updated
+            Tuple of (damage records, weapon records) inserted/updated
         """
-        db_start = time.time()
+        match_types = [match_type]
+        if match_type in ["ranked", "normal"]:
+            match_types.append("all")
 
-        try:
-            with self.database_manager._get_connection() as conn:
-                with conn.cursor() as cur:
-                    # Aggregate damage by player, weapon, and damage reason
-                    query = """
-                        INSERT INTO player_damage_stats (
-                            player_name,
-                            weapon_id,
-                            damage_reason,
-                            match_type,
-                            total_damage,
-                            total_hits,
-                            stats_updated_at
-                        )
-                        SELECT
-                            de.attacker_name as player_name,
-                            COALESCE(de.weapon_id, 'Unknown') as weapon_id,
-                            COALESCE(de.damage_reason, 'Unknown') as damage_reason,
-                            %s as match_type,
-                            SUM(de.damage) as total_damage,
-                            COUNT(*) as total_hits,
-                            NOW() as stats_updated_at
-                        FROM player_damage_events de
-                        WHERE de.match_id = %s
-                          AND de.attacker_name IS NOT NULL
-                          AND de.attacker_name != ''
-                          AND de.damage > 0
-                        GROUP BY de.attacker_name, de.weapon_id, de.damage_reason
-                        ON CONFLICT (player_name, weapon_id, damage_reason, match_type)
-                        DO UPDATE SET
-                            total_damage = player_damage_stats.total_damage + EXCLUDED.total_damage,
-                            total_hits = player_damage_stats.total_hits + EXCLUDED.total_hits,
-                            stats_updated_at = EXCLUDED.stats_updated_at
-                    """
-
-                    cur.execute(query, (match_type, match_id))
-                    rows_affected = cur.rowcount
-
-                    # Also update 'all' match type aggregate
-                    if match_type in ["ranked", "normal"]:
-                        query_all = """
-                            INSERT INTO player_damage_stats (
-                                player_name,
-                                weapon_id,
-                                damage_reason,
-                                match_type,
-                                total_damage,
-                                total_hits,
-                                stats_updated_at
-                            )
-                            SELECT
-                                de.attacker_name as player_name,
-                                COALESCE(de.weapon_id, 'Unknown') as weapon_id,
-                                COALESCE(de.damage_reason, 'Unknown') as damage_reason,
-                                'all' as match_type,
-                                SUM(de.damage) as total_damage,
-                                COUNT(*) as total_hits,
-                                NOW() as stats_updated_at
-                            FROM player_damage_events de
-                            WHERE de.match_id = %s
-                              AND de.attacker_name IS NOT NULL
-                              AND de.attacker_name != ''
-                              AND de.damage > 0
-                            GROUP BY de.attacker_name, de.weapon_id, de.damage_reason
-                            ON CONFLICT (player_name, weapon_id, damage_reason, match_type)
-                            DO UPDATE SET
-                                total_damage = player_damage_stats.total_damage + EXCLUDED.total_damage,
-                                total_hits = player_damage_stats.total_hits + EXCLUDED.total_hits,
-                                stats_updated_at = EXCLUDED.stats_updated_at
-                        """
-                        cur.execute(query_all, (match_id,))
-                        rows_affected += cur.rowcount
-
-                    conn.commit()
-
-                    db_duration = time.time() - db_start
-                    DATABASE_OPERATION_DURATION.labels(
-                        operation="aggregate_damage", table="player_damage_stats"
-                    ).observe(db_duration)
-
-                    return rows_affected
+        statements = [(DAMAGE_STATS_QUERY, (t, match_id)) for t in match_types]
+        statements += [(WEAPON_STATS_QUERY, (t, match_id)) for t in match_types]
+        statements.append((MARK_AGGREGATED_QUERY, (match_id,)))
 
-        except Exception as e:
-            self.logger.error(
-                f"[{self.worker_id}] Failed to aggregate damage stats for {match_id[:25]}: {e}"
-            )
-            raise
-
-    def _aggregate_weapon_stats(self, match_id: str, match_type: str) -> int:
-        """
-        Aggregate weapon kill events for a match into player_weapon_stats.
-
-        Args:
-            match_id: Match ID to aggregate
-            match_type: Match type (ranked/normal/all)
-
-        Returns:
-            Number of records inserted/updated
-        """
         db_start = time.time()
 
         try:
-            with self.database_manager._get_connection() as conn:
-                with conn.cursor() as cur:
-                    # Aggregate weapon kills by player and weapon
-                    query = """
-                        INSERT INTO player_weapon_stats (
-                            player_name,
-                            weapon_id,
-                            match_type,
-                            total_kills,
-                            headshot_kills,
-                            knock_downs,
-                            total_kill_distance,
-                            longest_kill,
-                            close_range_kills,
-                            mid_range_kills,
-                            long_range_kills,
-                            stats_updated_at
-                        )
-                        SELECT
-                            wke.killer_name as player_name,
-                            COALESCE(wke.weapon_id, 'Unknown') as weapon_id,
-                            %s as match_type,
-                            COUNT(CASE WHEN wke.is_kill THEN 1 END) as total_kills,
-                            COUNT(CASE WHEN wke.is_kill AND wke.damage_type LIKE '%%HeadShot%%' THEN 1 END) as headshot_kills,
-                            COUNT(CASE WHEN wke.is_knock_down THEN 1 END) as knock_downs,
-                            SUM(COALESCE(wke.distance, 0)) as total_kill_distance,
-                            MAX(wke.distance) as longest_kill,
-                            COUNT(CASE WHEN wke.distance < 50 THEN 1 END) as close_range_kills,
-                            COUNT(CASE WHEN wke.distance >= 50 AND wke.distance < 200 THEN 1 END) as mid_range_kills,
-                            COUNT(CASE WHEN wke.distance >= 200 THEN 1 END) as long_range_kills,
-                            NOW() as stats_updated_at
-                        FROM weapon_kill_events wke
-                        WHERE wke.match_id = %s
-                          AND wke.killer_name IS NOT NULL
-                          AND wke.killer_name != ''
-                        GROUP BY wke.killer_name, wke.weapon_id
-                        ON CONFLICT (player_name, weapon_id, match_type)
-                        DO UPDATE SET
-                            total_kills = player_weapon_stats.total_kills + EXCLUDED.total_kills,
-                            headshot_kills = player_weapon_stats.headshot_kills + EXCLUDED.headshot_kills,
-                            knock_downs = player_weapon_stats.knock_downs + EXCLUDED.knock_downs,
-                            total_kill_distance = player_weapon_stats.total_kill_distance + EXCLUDED.total_kill_distance,
-                            longest_kill = GREATEST(player_weapon_stats.longest_kill, EXCLUDED.longest_kill),
-                            close_range_kills = player_weapon_stats.close_range_kills + EXCLUDED.close_range_kills,
-                            mid_range_kills = player_weapon_stats.mid_range_kills + EXCLUDED.mid_range_kills,
-                            long_range_kills = player_weapon_stats.long_range_kills + EXCLUDED.long_range_kills,
-                            stats_updated_at = EXCLUDED.stats_updated_at
-                    """
-
-                    cur.execute(query, (match_type, match_id))
-                    rows_affected = cur.rowcount
-
-                    # Also update 'all' match type aggregate
-                    if match_type in ["ranked", "normal"]:
-                        query_all = """
-                            INSERT INTO player_weapon_stats (
-                                player_name,
-                                weapon_id,
-                                match_type,
-                                total_kills,
-                                headshot_kills,
-                                knock_downs,
-                                total_kill_distance,
-                                longest_kill,
-                                close_range_kills,
-                                mid_range_kills,
-                                long_range_kills,
-                                stats_updated_at
-                            )
-                            SELECT
-                                wke.killer_name as player_name,
-                                COALESCE(wke.weapon_id, 'Unknown') as weapon_id,
-                                'all' as match_type,
-                                COUNT(CASE WHEN wke.is_kill THEN 1 END) as total_kills,
-                                COUNT(CASE WHEN wke.is_kill AND wke.damage_type LIKE '%%HeadShot%%' THEN 1 END) as headshot_kills,
-                                COUNT(CASE WHEN wke.is_knock_down THEN 1 END) as knock_downs,
-                                SUM(COALESCE(wke.distance, 0)) as total_kill_distance,
-                                MAX(wke.distance) as longest_kill,
-                                COUNT(CASE WHEN wke.distance < 50 THEN 1 END) as close_range_kills,
-                                COUNT(CASE WHEN wke.distance >= 50 AND wke.distance < 200 THEN 1 END) as mid_range_kills,
-                                COUNT(CASE WHEN wke.distance >= 200 THEN 1 END) as long_range_kills,
-                                NOW() as stats_updated_at
-                            FROM weapon_kill_events wke
-                            WHERE wke.match_id = %s
-                              AND wke.killer_name IS NOT NULL
-                              AND wke.killer_name != ''
-                            GROUP BY wke.killer_name, wke.weapon_id
-                            ON CONFLICT (player_name, weapon_id, match_type)
-                            DO UPDATE SET
-                                total_kills = player_weapon_stats.total_kills + EXCLUDED.total_kills,
-                                headshot_kills = player_weapon_stats.headshot_kills + EXCLUDED.headshot_kills,
-                                knock_downs = player_weapon_stats.knock_downs + EXCLUDED.knock_downs,
-                                total_kill_distance = player_weapon_stats.total_kill_distance + EXCLUDED.total_kill_distance,
-                                longest_kill = GREATEST(player_weapon_stats.longest_kill, EXCLUDED.longest_kill),
-                                close_range_kills = player_weapon_stats.close_range_kills + EXCLUDED.close_range_kills,
-                                mid_range_kills = player_weapon_stats.mid_range_kills + EXCLUDED.mid_range_kills,
-                                long_range_kills = player_weapon_stats.long_range_kills + EXCLUDED.long_range_kills,
-                                stats_updated_at = EXCLUDED.stats_updated_at
-                        """
-                        cur.execute(query_all, (match_id,))
-                        rows_affected += cur.rowcount
-
-                    conn.commit()
-
-                    db_duration = time.time() - db_start
-                    DATABASE_OPERATION_DURATION.labels(
-                        operation="aggregate_weapons", table="player_weapon_stats"
-                    ).observe(db_duration)
-
-                    return rows_affected
-
+            rowcounts = self.database_manager.execute_pipeline(statements)
         except Exception as e:
             self.logger.error(
-                f"[{self.worker_id}] Failed to aggregate weapon stats for {match_id[:25]}: {e}"
+                f"[{self.worker_id}] Failed to aggregate stats for {match_id[:25]}: {e}"
             )
             raise
 
-    def _mark_match_aggregated(self, match_id: str) -> None:
-        """
-        Mark a match as having its stats aggregated.
-
-        Args:
-            match_id: Match ID to mark
-        """
-        try:
-            with self.database_manager._get_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute(
-                        """
-                        UPDATE matches
-                        SET stats_aggregated = TRUE,
-                            stats_aggregated_at = NOW()
-                        WHERE match_id = %s
-                        """,
-                        (match_id,),
-                    )
-                    conn.commit()
-
-        except Exception as e:
-            self.logger.warning(
-                f"[{self.worker_id}] Failed to mark match {match_id[:25]} as aggregated: {e}"
+        # The statements share one pipeline, so each table they write gets its duration
+        db_duration = time.time() - db_start
+        for table in ("player_damage_stats", "player_weapon_stats"):
+            DATABASE_OPERATION_DURATION.labels(operation="aggregate_stats", table=table).observe(
+                db_duration
             )
 
+        damage_rows = sum(rowcounts[: len(match_types)])
+        weapon_rows = sum(rowcounts[len(match_types) : 2 * len(match_types)])
+        return damage_rows, weapon_rows
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get worker statistics.
@@ -490,6 +359,8 @@ if __name__ == "__main__":
         dbname=os.getenv("POSTGRES_DB"),
         user=os.getenv("POSTGRES_USER"),
         password=os.getenv("POSTGRES_PASSWORD"),
+        # DB_PIPELINE=on sends each match's aggregation statements in one round trip
+        use_pipeline=os.getenv("DB_PIPELINE", "off") == "on",
     )
 
     # Initialize worker
@@ -0,0 +1,202 @@
+"""
+Telemetry Pipeline
+
+Pipelined processing mode for TelemetryProcessingWorker. The worker's read,
+extract and store stages each run on their own thread, connected by bounded
+queues, so one match is parsed while the previous one is extracted and the one
+before that is written to the database. Decompression and database round trips
+release the GIL, so the CPU-bound extract stage keeps running while the other
+stages wait on zlib and PostgreSQL.
+
+A match's completion callback runs once it has been stored, or as soon as a
+stage finishes it early (skipped, invalid or failed), so message acks only go
+out after the database commit.
+
+Example:
+    >>> pipeline = TelemetryPipeline(worker, queue_size=2)
+    >>> pipeline.start()
+    >>> pipeline.submit(message_data, on_done=lambda result: print(result["success"]))
+    >>> pipeline.stop()
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from ..metrics import (
+    TELEMETRY_PIPELINE_QUEUE_DEPTH,
+    TELEMETRY_PIPELINE_QUEUE_WAIT,
+    TELEMETRY_PIPELINE_STAGE_DURATION,
+)
+from .telemetry_processing_worker import MatchJob, TelemetryProcessingWorker
+
+# Queue item telling a stage thread to stop once the items before it are done
+_STOP = object()
+
+
+class TelemetryPipeline:
+    """
+    Three-stage pipeline running a TelemetryProcessingWorker's stages concurrently.
+
+    Stages, in order: read (read_match), extract (extract_match) and store
+    (store_match). Each stage has one thread and an input queue holding up to
+    queue_size matches; submit blocks while the read queue is full.
+
+    Metrics (labelled by stage):
+        telemetry_pipeline_queue_depth: Matches waiting in the stage's queue
+        telemetry_pipeline_queue_wait_seconds: Time matches wait in the queue
+        telemetry_pipeline_stage_duration_seconds: Time the stage spends per match
+    """
+
+    STAGES = ("read", "extract", "store")
+
+    def __init__(
+        self,
+        worker: TelemetryProcessingWorker,
+        queue_size: int = 2,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Initialize telemetry pipeline.
+
+        Args:
+            worker: Worker whose stages are run
+            queue_size: Matches each stage queue holds (default: 2)
+            logger: Optional logger instance
+        """
+        if queue_size < 1:
+            raise ValueError(f"queue_size must be at least 1, got {queue_size}")
+
+        self.worker = worker
+        self.queue_size = queue_size
+        self.logger = logger or worker.logger
+
+        self._queues = {stage: queue.Queue(maxsize=queue_size) for stage in self.STAGES}
+        self._threads = []
+
+    @property
+    def capacity(self) -> int:
+        """
+        Matches the pipeline holds at once: queued plus one in each stage.
+
+        Consumers should prefetch no more than this, so submit never blocks.
+        """
+        return len(self.STAGES) * (self.queue_size + 1)
+
+    def start(self) -> None:
+        """Start the stage threads."""
+        if self._threads:
+            return
+
+        stages = [
+            ("read", self.worker.read_match),
+            ("extract", self.worker.extract_match),
+            ("store", self.worker.store_match),
+        ]
+        for index, (stage, run) in enumerate(stages):
+            next_stage = stages[index + 1][0] if index + 1 < len(stages) else None
+            thread = threading.Thread(
+                target=self._run_stage,
+                args=(stage, run, next_stage),
+                name=f"{self.worker.worker_id}-{stage}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+        self.logger.info(
+            f"[{self.worker.worker_id}] Telemetry pipeline started "
+            f"(queue_size={self.queue_size}, capacity={self.capacity})"
+        )
+
+    def submit(self, data: Dict[str, Any], on_done: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Queue a telemetry processing message.
+
+        Args:
+            data: Message payload (see TelemetryProcessingWorker.process_message)
+            on_done: Called with the message's result once it is finished; runs on
+                a stage thread
+        """
+        if not self._threads:
+            raise RuntimeError("Telemetry pipeline is not running")
+        self._put("read", (data, on_done))
+
+    def stop(self, wait: bool = True) -> None:
+        """
+        Stop the pipeline after the matches already submitted.
+
+        Args:
+            wait: Wait for the stage threads to finish
+        """
+        if not self._threads:
+            return
+
+        self._queues["read"].put((_STOP, None, time.time()))
+        if wait:
+            for thread in self._threads:
+                thread.join()
+        self._threads = []
+
+        self.logger.info(f"[{self.worker.worker_id}] Telemetry pipeline stopped")
+
+    def _put(self, stage: str, item: Any) -> None:
+        stage_queue = self._queues[stage]
+        stage_queue.put((*item, time.time()))
+        TELEMETRY_PIPELINE_QUEUE_DEPTH.labels(stage=stage).set(stage_queue.qsize())
+
+    def _run_stage(
+        self,
+        stage: str,
+        run: Callable[[Any], Optional[MatchJob]],
+        next_stage: Optional[str],
+    ) -> None:
+        stage_queue = self._queues[stage]
+        while True:
+            payload, on_done, queued_at = stage_queue.get()
+            TELEMETRY_PIPELINE_QUEUE_DEPTH.labels(stage=stage).set(stage_queue.qsize())
+
+            if payload is _STOP:
+                if next_stage is not None:
+                    self._queues[next_stage].put((_STOP, None, time.time()))
+                return
+
+            started = time.time()
+            TELEMETRY_PIPELINE_QUEUE_WAIT.labels(stage=stage).observe(started - queued_at)
+            result: Optional[Dict[str, Any]] = None
+            try:
+                job = run(payload)
+            except Exception as e:
+                # Stages finish their own failures; this only guards the pipeline
+                self.logger.error(
+                    f"[{self.worker.worker_id}] Telemetry pipeline {stage} stage failed: {e}",
+                    exc_info=True,
+                )
+                job = None
+                result = {"success": False, "error": f"Pipeline {stage} stage failed: {e}"}
+            TELEMETRY_PIPELINE_STAGE_DURATION.labels(stage=stage).observe(time.time() - started)
+
+            if job is not None and job.outcome is None and next_stage is not None:
+                self._put(next_stage, (job, on_done))
+                continue
+
+            if job is not None:
+                result = job.outcome
+            if result is None:
+                # No job, or no outcome from the last stage: still settle the message
+                self.logger.error(
+                    f"[{self.worker.worker_id}] Telemetry pipeline {stage} stage returned no result"
+                )
+                result = {"success": False, "error": f"Pipeline {stage} stage returned no result"}
+            self._finish(on_done, result)
+
+    def _finish(self, on_done: Callable[[Dict[str, Any]], None], result: Dict[str, Any]) -> None:
+        try:
+            on_done(result)
+        except Exception as e:
+            self.logger.error(
+                f"[{self.worker.worker_id}] Telemetry pipeline completion callback failed: {e}",
+                exc_info=True,
+            )
@@ -5,18 +5,38 @@ Processes raw telemetry JSON files and extracts events into database tables.
 """
 
 import gc
-import gzip
 import json
 import logging
 import math
+import threading
 import time
 from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
 
 from ..core.database_manager import DatabaseManager
+from ..core.telemetry_artifact import TelemetryArtifactCache
+from ..core.telemetry_reader import TelemetryReader
+from ..core.telemetry_records import TelemetryRecord
+from ..processors.circle_timeline import CircleDistanceStats, CircleTimeline
+from ..processors.event_dispatcher import TelemetryEventDispatcher, get_event_type
+from ..processors.extractor_registry import ExtractorRegistry, TelemetryExtractor
 from ..processors.fight_tracking_processor import FightTrackingProcessor
+from ..processors.knock_index import KnockIndex
+from ..processors.match_columns import (
+    MISSING,
+    MatchColumns,
+    fill_nan,
+    first_seen_order,
+    missing_to_none,
+    nan_to_none,
+)
+from ..processors.position_index import PositionIndex
 from ..config.weapon_categories import get_weapon_category
+from ..utils.timestamps import event_time_ms
 from ..metrics import (
     QUEUE_MESSAGES_PROCESSED,
     QUEUE_PROCESSING_DURATION,
@@ -26,10 +46,38 @@ from ..metrics import (
     TELEMETRY_PROCESSING_DURATION,
     TELEMETRY_EVENTS_EXTRACTED,
     TELEMETRY_FILE_READ_DURATION,
+    TELEMETRY_MATCH_RSS,
+    TELEMETRY_PEAK_RSS,
+    get_peak_rss_bytes,
+    get_rss_bytes,
     start_metrics_server,
 )
 
 
+@dataclass
+class MatchJob:
+    """
+    A telemetry processing message moving through the worker's stages.
+
+    Attributes:
+        data: Message payload
+        match_id: Match ID from the payload
+        start_time: When processing of the message started (time.time())
+        pending: Extractors to run, set by read_match
+        dispatcher: Match events grouped by type, from read_match to extract_match
+        results: Extractor results, from extract_match to store_match
+        outcome: Result for the consumer once the job is finished, None until then
+    """
+
+    data: Dict[str, Any]
+    match_id: Optional[str]
+    start_time: float
+    pending: List[TelemetryExtractor] = field(default_factory=list)
+    dispatcher: Optional[TelemetryEventDispatcher] = None
+    results: Optional[Dict[str, Any]] = None
+    outcome: Optional[Dict[str, Any]] = None
+
+
 class TelemetryProcessingWorker:
     """
     Worker that processes telemetry JSON files and extracts events.
@@ -39,14 +87,126 @@ class TelemetryProcessingWorker:
     - Extract multiple event types (landings, kills, damage, circles)
     - Batch insert into database tables
     - Update match processing flags and status
+
+    Each message goes through three stages: read_match, extract_match and
+    store_match. process_message runs them in turn; TelemetryPipeline runs them
+    on separate threads so consecutive matches overlap.
     """
 
+    # Telemetry event types consumed by each extractor. process_message groups the
+    # events once with TelemetryEventDispatcher and hands each extractor only these.
+    LANDING_EVENT_TYPES = ("LandParachute", "LogParachuteLanding")
+    KILL_EVENT_TYPES = ("LogPlayerKillV2",)
+    DAMAGE_EVENT_TYPES = ("LogPlayerTakeDamage",)
+    FINISHING_EVENT_TYPES = (
+        "LogPlayerPosition",
+        "LogPlayerTakeDamage",
+        "LogPlayerMakeGroggy",
+        "LogPlayerKillV2",
+        "LogPlayerRevive",
+    )
+    ITEM_USAGE_EVENT_TYPES = ("LogItemUse", "LogPlayerAttack")
+    ADVANCED_STATS_EVENT_TYPES = ("LogPlayerTakeDamage", "LogPlayerMakeGroggy", "LogPlayerKillV2")
+    CIRCLE_EVENT_TYPES = ("LogGameStatePeriodic", "LogPlayerTakeDamage", "LogPlayerPosition")
+    WEAPON_DISTRIBUTION_EVENT_TYPES = (
+        "LogPlayerTakeDamage",
+        "LogPlayerKillV2",
+        "LogPlayerMakeGroggy",
+    )
+
+    # Extractors in run order. Each declares the events it consumes, the _store_events
+    # arguments its results go to and the matches flag marking it as processed.
+    # Columnar extractors share one MatchColumns per match instead of event lists.
+    EXTRACTORS = ExtractorRegistry(
+        [
+            TelemetryExtractor(
+                "landings",
+                LANDING_EVENT_TYPES,
+                "extract_landings",
+                outputs=("landings",),
+                flag_column="landings_processed",
+            ),
+            TelemetryExtractor(
+                "kills",
+                KILL_EVENT_TYPES,
+                "extract_kill_positions",
+                outputs=("kill_positions",),
+                flag_column="kills_processed",
+            ),
+            TelemetryExtractor(
+                "weapons",
+                KILL_EVENT_TYPES,
+                "extract_weapon_kill_events",
+                outputs=("weapon_kills",),
+                flag_column="weapons_processed",
+            ),
+            TelemetryExtractor(
+                "damage",
+                DAMAGE_EVENT_TYPES,
+                "extract_damage_events",
+                outputs=("damage_events",),
+                flag_column="damage_processed",
+                columnar=True,
+            ),
+            TelemetryExtractor(
+                "finishing",
+                FINISHING_EVENT_TYPES,
+                "extract_finishing_metrics",
+                outputs=("knock_events", "finishing_summaries"),
+                flag_column="finishing_processed",
+            ),
+            TelemetryExtractor(
+                "fights",
+                FightTrackingProcessor.EVENT_TYPES,
+                "extract_fights",
+                outputs=("fights",),
+                flag_column="fights_processed",
+                columnar=True,
+            ),
+            # Enhanced stats have no processed flags yet
+            TelemetryExtractor(
+                "item_usage",
+                ITEM_USAGE_EVENT_TYPES,
+                "extract_item_usage",
+                outputs=("item_usage_stats",),
+            ),
+            TelemetryExtractor(
+                "advanced_stats",
+                ADVANCED_STATS_EVENT_TYPES,
+                "extract_advanced_stats",
+                outputs=("advanced_stats",),
+                columnar=True,
+            ),
+            TelemetryExtractor(
+                "circle_tracking",
+                CIRCLE_EVENT_TYPES,
+                "extract_circle_tracking",
+                outputs=("circle_aggregate_stats", "circle_detailed_positions"),
+                columnar=True,
+            ),
+            TelemetryExtractor(
+                "weapon_distribution",
+                WEAPON_DISTRIBUTION_EVENT_TYPES,
+                "extract_weapon_distribution",
+                outputs=("weapon_distribution",),
+                columnar=True,
+            ),
+        ]
+    )
+
+    # Every event type consumed by an extractor; all other types are dropped while reading
+    TELEMETRY_EVENT_TYPES = EXTRACTORS.event_types()
+
+    # LogPlayerPosition samples evaluated per NumPy batch in extract_circle_tracking
+    CIRCLE_BATCH_SIZE = 8192
+
     def __init__(
         self,
         database_manager: DatabaseManager,
         worker_id: str,
         logger: Optional[logging.Logger] = None,
         metrics_port: Optional[int] = 9093,
+        use_artifacts: bool = False,
     ):
         """
         Initialize telemetry processing worker.
@@ -56,18 +216,28 @@ class TelemetryProcessingWorker:
             worker_id: Unique worker identifier
             logger: Optional logger instance
             metrics_port: Port for Prometheus metrics server (default: 9093, None to skip)
+            use_artifacts: Cache extracted events next to raw telemetry files; needs
+                write access to the telemetry directory (default: False)
         """
         self.database_manager = database_manager
         self.worker_id = worker_id
         self.logger = logger or logging.getLogger(__name__)
 
-        # Processing counters
+        # Processing counters (stages may finish jobs on different threads)
         self.processed_count = 0
         self.error_count = 0
+        self._counter_lock = threading.Lock()
 
         # Initialize fight tracking processor
         self.fight_processor = FightTrackingProcessor(logger=self.logger)
 
+        # Extracted-event artifacts for fast reprocessing
+        self.artifact_cache = (
+            TelemetryArtifactCache(self.TELEMETRY_EVENT_TYPES, logger=self.logger)
+            if use_artifacts
+            else None
+        )
+
         # Tracked players cache for filtering damage events
         self._tracked_players_cache = set()
         self._tracked_players_cache_time = 0
@@ -82,68 +252,66 @@ class TelemetryProcessingWorker:
         """
         Process a telemetry processing message (callback for RabbitMQConsumer).
 
+        Runs the read, extract and store stages back to back. TelemetryPipeline
+        runs the same stages concurrently on consecutive matches.
+
         Args:
-            data: Message payload containing match_id and file_path
+            data: Message payload containing match_id and file_path, and optionally
+                extractors (names of the extractors to run; default: all)
 
         Returns:
             Dict with success status: {"success": bool, "error": str}
         """
-        start_time = time.time()
-        match_id = data.get("match_id")
+        job = self.read_match(data)
+        if job.outcome is None:
+            self.extract_match(job)
+        if job.outcome is None:
+            self.store_match(job)
+        return job.outcome
+
+    def read_match(self, data: Dict[str, Any]) -> MatchJob:
+        """
+        Read stage: validate the message and read the match's telemetry.
+
+        Finishes the job early if the message is invalid, the file has no events,
+        the match is not competitive or official, or nothing is pending.
+
+        Args:
+            data: Message payload (see process_message)
+
+        Returns:
+            MatchJob holding the dispatched events, or its outcome if finished
+        """
+        job = MatchJob(data=data, match_id=data.get("match_id"), start_time=time.time())
+        match_id = job.match_id
         file_path = data.get("file_path")
 
         if not match_id:
-            error_msg = "Message missing match_id field"
-            self.logger.error(f"[{self.worker_id}] {error_msg}")
-            self.error_count += 1
-            duration = time.time() - start_time
-            TELEMETRY_PROCESSED.labels(status="failed").inc()
-            QUEUE_MESSAGES_PROCESSED.labels(
-                queue_name="telemetry_processing", status="failed"
-            ).inc()
-            QUEUE_PROCESSING_DURATION.labels(queue_name="telemetry_processing").observe(duration)
-            WORKER_ERRORS.labels(
-                worker_type="telemetry_processing", error_type="ValidationError"
-            ).inc()
-            return {"success": False, "error": error_msg}
+            return self._fail(job, "Message missing match_id field", "ValidationError")
 
         if not file_path:
-            error_msg = f"Message missing file_path field for match {match_id}"
-            self.logger.error(f"[{self.worker_id}] {error_msg}")
-            self.error_count += 1
-            duration = time.time() - start_time
-            TELEMETRY_PROCESSED.labels(status="failed").inc()
-            QUEUE_MESSAGES_PROCESSED.labels(
-                queue_name="telemetry_processing", status="failed"
-            ).inc()
-            QUEUE_PROCESSING_DURATION.labels(queue_name="telemetry_processing").observe(duration)
-            WORKER_ERRORS.labels(
-                worker_type="telemetry_processing", error_type="ValidationError"
-            ).inc()
-            return {"success": False, "error": error_msg}
+            return self._fail(
+                job, f"Message missing file_path field for match {match_id}", "ValidationError"
+            )
+
+        try:
+            extractors = self.EXTRACTORS.select(data.get("extractors"))
+        except (TypeError, ValueError) as e:
+            return self._fail(
+                job, f"Invalid extractors for match {match_id}: {e}", "ValidationError"
+            )
 
         self.logger.info(f"[{self.worker_id}] Processing telemetry for match: {match_id}")
 
         try:
-            # Read and parse telemetry file
+            # Stream telemetry file, keeping only event types the selected extractors consume
             read_start = time.time()
-            events = self._read_telemetry_file(file_path)
+            events = self._read_telemetry_file(file_path, self.EXTRACTORS.event_types(extractors))
             read_duration = time.time() - read_start
             TELEMETRY_FILE_READ_DURATION.observe(read_duration)
 
             if not events:
-                error_msg = f"No events found in telemetry file: {file_path}"
-                self.logger.error(f"[{self.worker_id}] {error_msg}")
-                self.error_count += 1
-                duration = time.time() - start_time
-                TELEMETRY_PROCESSED.labels(status="failed").inc()
-                QUEUE_MESSAGES_PROCESSED.labels(
-                    queue_name="telemetry_processing", status="failed"
-                ).inc()
-                QUEUE_PROCESSING_DURATION.labels(queue_name="telemetry_processing").observe(
-                    duration
-                )
-                return {"success": False, "error": error_msg}
+                return self._fail(job, f"No events found in telemetry file: {file_path}")
 
             self.logger.debug(
                 f"[{self.worker_id}] Parsed {len(events)} events for match {match_id}"
@@ -157,107 +325,66 @@ class TelemetryProcessingWorker:
                 self.logger.info(
                     f"[{self.worker_id}] Match {match_id} has game_type='{game_type}', skipping telemetry event processing"
                 )
-                duration = time.time() - start_time
-                TELEMETRY_PROCESSED.labels(status="skipped").inc()
-                QUEUE_MESSAGES_PROCESSED.labels(
-                    queue_name="telemetry_processing", status="success"
-                ).inc()
-                QUEUE_PROCESSING_DURATION.labels(queue_name="telemetry_processing").observe(
-                    duration
-                )
                 # Free memory even on skip
                 del events
                 gc.collect()
-                return {"success": True, "skipped": True, "reason": f"game_type={game_type}"}
+                return self._skip(job, reason=f"game_type={game_type}")
 
-            # Check which event types are already processed
+            # Check which extractors are already processed
             processing_status = self._get_processing_status(match_id)
+            job.pending = self.EXTRACTORS.pending(processing_status, extractors)
 
-            # Log what needs processing
-            to_process = []
-            if not processing_status.get("landings_processed"):
-                to_process.append("landings")
-            if not processing_status.get("kills_processed"):
-                to_process.append("kills")
-            if not processing_status.get("weapons_processed"):
-                to_process.append("weapons")
-            if not processing_status.get("damage_processed"):
-                to_process.append("damage")
-            if not processing_status.get("finishing_processed"):
-                to_process.append("finishing")
-            if not processing_status.get("fights_processed"):
-                to_process.append("fights")
-
-            if to_process:
+            if job.pending:
                 self.logger.info(
-                    f"[{self.worker_id}] Match {match_id} needs processing for: {', '.join(to_process)}"
+                    f"[{self.worker_id}] Match {match_id} needs processing for: "
+                    f"{', '.join(extractor.name for extractor in job.pending)}"
                 )
             else:
                 self.logger.info(
                     f"[{self.worker_id}] Match {match_id} already fully processed, skipping"
                 )
-                duration = time.time() - start_time
-                TELEMETRY_PROCESSED.labels(status="skipped").inc()
-                QUEUE_MESSAGES_PROCESSED.labels(
-                    queue_name="telemetry_processing", status="success"
-                ).inc()
-                QUEUE_PROCESSING_DURATION.labels(queue_name="telemetry_processing").observe(
-                    duration
-                )
                 # Free memory even on skip
                 del events
                 gc.collect()
-                return {"success": True, "skipped": True}
-
-            # Extract only unprocessed event types
-            landings = []
-            kill_positions = []
-            weapon_kills = []
-            damage_events = []
-            knock_events = []
-            finishing_summaries = []
-            fights = []
-
-            if not processing_status.get("landings_processed"):
-                landings = self.extract_landings(events, match_id, data)
+                return self._skip(job)
 
-            if not processing_status.get("kills_processed"):
-                kill_positions = self.extract_kill_positions(events, match_id, data)
+            # Group events by type once; each extractor only walks its own event types
+            job.dispatcher = TelemetryEventDispatcher(events)
+            return job
 
-            if not processing_status.get("weapons_processed"):
-                weapon_kills = self.extract_weapon_kill_events(events, match_id, data)
-
-            if not processing_status.get("damage_processed"):
-                damage_events = self.extract_damage_events(events, match_id, data)
-
-            if not processing_status.get("finishing_processed"):
-                knock_events, finishing_summaries = self.extract_finishing_metrics(
-                    events, match_id, data
-                )
-
-            if not processing_status.get("fights_processed"):
-                fights = self.fight_processor.process_match_fights(events, match_id, data)
-
-            # NEW: Extract enhanced stats (always run for now - can add flags later)
-            item_usage_stats = {}
-            advanced_stats = {}
-            circle_aggregate_stats = {}
-            circle_detailed_positions = []
-            weapon_distribution = {}
+        except Exception as e:
+            return self._fail_with_exception(job, e)
 
-            # Extract item usage (heals, boosts, throwables)
-            item_usage_stats = self.extract_item_usage(events, match_id, data)
+    def extract_match(self, job: MatchJob) -> MatchJob:
+        """
+        Extract stage: run the job's pending extractors.
 
-            # Extract advanced combat stats (killsteals, throwable damage, damage received)
-            advanced_stats = self.extract_advanced_stats(events, match_id, data)
+        Args:
+            job: MatchJob returned by read_match
 
-            # Extract circle tracking (aggregate + detailed for tracked players)
-            circle_aggregate_stats, circle_detailed_positions = self.extract_circle_tracking(
-                events, match_id, data
-            )
+        Returns:
+            The job, holding the extractor results or its outcome if it failed
+        """
+        match_id = job.match_id
 
-            # Extract weapon distribution by category
-            weapon_distribution = self.extract_weapon_distribution(events, match_id, data)
+        try:
+            # Run only pending extractors
+            results = self.run_extractors(job.dispatcher, job.pending, match_id, job.data)
+            job.dispatcher = None
+            job.results = results
+
+            landings = results.get("landings", [])
+            kill_positions = results.get("kill_positions", [])
+            weapon_kills = results.get("weapon_kills", [])
+            damage_events = results.get("damage_events", [])
+            knock_events = results.get("knock_events", [])
+            finishing_summaries = results.get("finishing_summaries", [])
+            fights = results.get("fights", [])
+            item_usage_stats = results.get("item_usage_stats", {})
+            advanced_stats = results.get("advanced_stats", {})
+            circle_aggregate_stats = results.get("circle_aggregate_stats", {})
+            circle_detailed_positions = results.get("circle_detailed_positions", [])
+            weapon_distribution = results.get("weapon_distribution", {})
 
             total_participants = sum(len(f.get("participants", [])) for f in fights)
             self.logger.debug(
@@ -273,6 +400,10 @@ class TelemetryProcessingWorker:
                 f"{len(weapon_distribution)} players with weapon distribution"
             )
 
+            # Memory high-water mark is reached once all extractors have run
+            TELEMETRY_MATCH_RSS.observe(get_rss_bytes())
+            TELEMETRY_PEAK_RSS.set(get_peak_rss_bytes())
+
             # Track extracted events
             if landings:
                 TELEMETRY_EVENTS_EXTRACTED.labels(event_type="landings").inc(len(landings))
@@ -294,23 +425,32 @@ class TelemetryProcessingWorker:
                     total_participants
                 )
 
-            # Store in database (transaction)
+            return job
+
+        except Exception as e:
+            job.dispatcher = None
+            return self._fail_with_exception(job, e)
+
+    def store_match(self, job: MatchJob) -> MatchJob:
+        """
+        Store stage: write the job's results and mark the match completed.
+
+        Args:
+            job: MatchJob returned by extract_match
+
+        Returns:
+            The job with its outcome set
+        """
+        match_id = job.match_id
+        results = job.results
+
+        try:
+            # Store in database (one transaction, so a failed match leaves nothing behind)
             db_start = time.time()
-            self._store_events(
-                match_id,
-                landings,
-                kill_positions,
-                weapon_kills,
-                damage_events,
-                knock_events,
-                finishing_summaries,
-                fights,
-                item_usage_stats,
-                advanced_stats,
-                circle_aggregate_stats,
-                circle_detailed_positions,
-                weapon_distribution,
-            )
+            with self.database_manager.transaction():
+                self._store_events(
+                    match_id, processed_flags=self._processed_flags(job.pending, results), **results
+                )
             db_duration = time.time() - db_start
             DATABASE_OPERATION_DURATION.labels(
                 operation="batch_insert", table="telemetry_events"
@@ -319,49 +459,132 @@ class TelemetryProcessingWorker:
             # Update match status
             self._update_match_completion(match_id)
 
-            # Success!
+        except Exception as e:
+            job.results = None
+            return self._fail_with_exception(job, e)
+
+        # Success!
+        with self._counter_lock:
             self.processed_count += 1
-            duration = time.time() - start_time
-
-            TELEMETRY_PROCESSED.labels(status="success").inc()
-            TELEMETRY_PROCESSING_DURATION.observe(duration)
-            QUEUE_MESSAGES_PROCESSED.labels(
-                queue_name="telemetry_processing", status="success"
-            ).inc()
-            QUEUE_PROCESSING_DURATION.labels(queue_name="telemetry_processing").observe(duration)
-
-            self.logger.info(
-                f"[{self.worker_id}] ✅ Successfully processed telemetry for match {match_id} "
-                f"({len(landings)} landings, {len(kill_positions)} kills, "
-                f"{len(weapon_kills)} weapon kills, {len(damage_events)} damage events, "
-                f"{len(knock_events)} knock events, {len(finishing_summaries)} finishing summaries, "
-                f"{len(fights)} fights, {total_participants} fight participants)"
-            )
+        duration = time.time() - job.start_time
+
+        TELEMETRY_PROCESSED.labels(status="success").inc()
+        TELEMETRY_PROCESSING_DURATION.observe(duration)
+        QUEUE_MESSAGES_PROCESSED.labels(queue_name="telemetry_processing", status="success").inc()
+        QUEUE_PROCESSING_DURATION.labels(queue_name="telemetry_processing").observe(duration)
+
+        fights = results.get("fights", [])
+        total_participants = sum(len(f.get("participants", [])) for f in fights)
+        self.logger.info(
+            f"[{self.worker_id}] ✅ Successfully processed telemetry for match {match_id} "
+            f"({len(results.get('landings', []))} landings, "
+            f"{len(results.get('kill_positions', []))} kills, "
+            f"{len(results.get('weapon_kills', []))} weapon kills, "
+            f"{len(results.get('damage_events', []))} damage events, "
+            f"{len(results.get('knock_events', []))} knock events, "
+            f"{len(results.get('finishing_summaries', []))} finishing summaries, "
+            f"{len(fights)} fights, {total_participants} fight participants)"
+        )
 
-            # Force garbage collection to free memory from large data structures
-            del events, landings, kill_positions, weapon_kills, damage_events
-            del knock_events, finishing_summaries, fights
-            gc.collect()
+        # Force garbage collection to free memory from large data structures
+        job.results = None
+        del results, fights
+        gc.collect()
 
-            return {"success": True}
+        job.outcome = {"success": True}
+        return job
 
-        except Exception as e:
-            error_msg = f"Telemetry processing failed: {str(e)}"
-            self.logger.error(f"[{self.worker_id}] Match {match_id}: {error_msg}", exc_info=True)
-            self._update_match_status(match_id, "failed", error_msg)
+    def _skip(self, job: MatchJob, reason: Optional[str] = None) -> MatchJob:
+        """Finish a job whose match needs no processing."""
+        duration = time.time() - job.start_time
+        TELEMETRY_PROCESSED.labels(status="skipped").inc()
+        QUEUE_MESSAGES_PROCESSED.labels(queue_name="telemetry_processing", status="success").inc()
+        QUEUE_PROCESSING_DURATION.labels(queue_name="telemetry_processing").observe(duration)
+
+        job.outcome = {"success": True, "skipped": True}
+        if reason:
+            job.outcome["reason"] = reason
+        return job
+
+    def _fail(self, job: MatchJob, error_msg: str, error_type: Optional[str] = None) -> MatchJob:
+        """
+        Finish a failed job.
+
+        Args:
+            job: Failed job
+            error_msg: Error message logged and returned
+            error_type: Error type counted in WORKER_ERRORS (default: not counted)
+        """
+        self.logger.error(f"[{self.worker_id}] {error_msg}")
+        with self._counter_lock:
+            self.error_count += 1
+
+        duration = time.time() - job.start_time
+        TELEMETRY_PROCESSED.labels(status="failed").inc()
+        QUEUE_MESSAGES_PROCESSED.labels(queue_name="telemetry_processing", status="failed").inc()
+        QUEUE_PROCESSING_DURATION.labels(queue_name="telemetry_processing").observe(duration)
+        if error_type:
+            WORKER_ERRORS.labels(worker_type="telemetry_processing", error_type=error_type).inc()
+
+        job.outcome = {"success": False, "error": error_msg}
+        return job
+
+    def _fail_with_exception(self, job: MatchJob, e: Exception) -> MatchJob:
+        """Finish a job that raised while processing, marking its match failed."""
+        match_id = job.match_id
+        error_msg = f"Telemetry processing failed: {str(e)}"
+        self.logger.error(f"[{self.worker_id}] Match {match_id}: {error_msg}", exc_info=True)
+        self._update_match_status(match_id, "failed", error_msg)
+        with self._counter_lock:
             self.error_count += 1
 
-            duration = time.time() - start_time
-            TELEMETRY_PROCESSED.labels(status="failed").inc()
-            QUEUE_MESSAGES_PROCESSED.labels(
-                queue_name="telemetry_processing", status="failed"
-            ).inc()
-            QUEUE_PROCESSING_DURATION.labels(queue_name="telemetry_processing").observe(duration)
-            WORKER_ERRORS.labels(
-                worker_type="telemetry_processing", error_type=type(e).__name__
-            ).inc()
+        duration = time.time() - job.start_time
+        TELEMETRY_PROCESSED.labels(status="failed").inc()
+        QUEUE_MESSAGES_PROCESSED.labels(queue_name="telemetry_processing", status="failed").inc()
+        QUEUE_PROCESSING_DURATION.labels(queue_name="telemetry_processing").observe(duration)
+        WORKER_ERRORS.labels(worker_type="telemetry_processing", error_type=type(e).__name__).inc()
+
+        job.outcome = {"success": False, "error": str(e)}
+        return job
+
+    def run_extractors(
+        self,
+        dispatcher: TelemetryEventDispatcher,
+        extractors: List[TelemetryExtractor],
+        match_id: str,
+        match_data: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Run extractors on a match's telemetry.
+
+        Columnar extractors share MatchColumns built once from the dispatched
+        events; the others get their event types from the dispatcher.
 
-            return {"success": False, "error": str(e)}
+        Args:
+            dispatcher: Telemetry events grouped by type
+            extractors: Extractors to run, in run order
+            match_id: Match ID
+            match_data: Match metadata
+
+        Returns:
+            Extractor results keyed by the extractors' declared outputs
+        """
+        results = {}
+        columns = None
+        for extractor in extractors:
+            if extractor.columnar:
+                if columns is None:
+                    columns = MatchColumns(dispatcher.select(MatchColumns.EVENT_TYPES))
+                source = columns
+            else:
+                source = dispatcher.select(extractor.event_types)
+
+            extract = getattr(self, extractor.method)
+            values = extract(source, match_id, match_data)
+            if len(extractor.outputs) == 1:
+                values = (values,)
+            results.update(zip(extractor.outputs, values))
+        return results
 
     def extract_landings(
         self, events: List[Dict], match_id: str, match_data: Dict[str, Any]
@@ -613,7 +836,10 @@ class TelemetryProcessingWorker:
         return weapon_kills
 
     def extract_damage_events(
-        self, events: List[Dict], match_id: str, match_data: Dict[str, Any]
+        self,
+        events: Union[MatchColumns, List[Dict]],
+        match_id: str,
+        match_data: Dict[str, Any],
     ) -> List[Dict[str, Any]]:
         """
         Extract damage events from telemetry.
@@ -622,81 +848,85 @@ class TelemetryProcessingWorker:
         (exists in the players table) to reduce storage and improve performance.
 
         Args:
-            events: List of telemetry events
+            events: List of telemetry events or the match's MatchColumns
             match_id: Match ID
             match_data: Match metadata
 
         Returns:
             List of damage event records (filtered to tracked players only)
         """
-        damage_events = []
-
-        # Get tracked players set for filtering
-        tracked_players = self._get_tracked_players_set()
-
-        for event in events:
-            event_type = get_event_type(event)
-
-            if event_type != "LogPlayerTakeDamage":
-                continue
-
-            # Extract attacker info
-            attacker = event.get("attacker") or {}
-            attacker_name = attacker.get("name") if attacker else None
-            attacker_team_id = attacker.get("teamId") if attacker else None
-            attacker_location = attacker.get("location") or {} if attacker else {}
-            attacker_health = attacker.get("health") if attacker else None
-
-            # Extract victim info
-            victim = event.get("victim") or {}
-            victim_name = victim.get("name") if victim else None
-            victim_team_id = victim.get("teamId") if victim else None
-            victim_location = victim.get("location") or {} if victim else {}
-            victim_health = victim.get("health") if victim else None
+        columns = MatchColumns.of(events)
+        damage = columns.damage
 
-            # Extract damage info
-            damage = event.get("damage")
-            damage_type = event.get("damageTypeCategory")
-            damage_reason = event.get("damageReason")
-            damage_causer = event.get("damageCauserName")
-
-            # Extract timestamp
-            timestamp = event.get("_D")
-
-            # Try both possible keys for is_game
-            is_game = get_nested(event, "common.isGame") or get_nested(event, "common.is_game")
-
-            # Validate
-            if not victim_name:
-                continue
-
-            if is_game is None or is_game < 1:
-                continue
+        # Get tracked players for filtering (indexable by player id)
+        tracked = columns.players.mask(self._get_tracked_players_set())
 
+        attacker = damage["attacker"]
+        victim = damage["victim"]
+        selected = np.flatnonzero(
+            (victim != MISSING)
+            & (damage["is_game"] >= 1)
             # FILTER: Only include events where attacker OR victim is a tracked player
-            if not (attacker_name in tracked_players or victim_name in tracked_players):
-                continue
+            & (tracked[attacker] | tracked[victim])
+        )
 
+        rows = zip(
+            selected.tolist(),
+            columns.players.decode(attacker[selected]),
+            missing_to_none(damage["attacker_team"][selected]),
+            nan_to_none(damage["attacker_health"][selected]),
+            nan_to_none(damage["attacker_x"][selected]),
+            nan_to_none(damage["attacker_y"][selected]),
+            nan_to_none(damage["attacker_z"][selected]),
+            columns.players.decode(victim[selected]),
+            missing_to_none(damage["victim_team"][selected]),
+            nan_to_none(damage["victim_health"][selected]),
+            nan_to_none(damage["victim_x"][selected]),
+            nan_to_none(damage["victim_y"][selected]),
+            nan_to_none(damage["victim_z"][selected]),
+            columns.damage_types.decode(damage["damage_type"][selected]),
+            columns.weapons.decode(damage["weapon"][selected]),
+        )
+
+        damage_events = []
+        for (
+            index,
+            attacker_name,
+            attacker_team_id,
+            attacker_health,
+            attacker_x,
+            attacker_y,
+            attacker_z,
+            victim_name,
+            victim_team_id,
+            victim_health,
+            victim_x,
+            victim_y,
+            victim_z,
+            damage_type,
+            damage_causer,
+        ) in rows:
+            event = damage.events[index]
             damage_events.append(
                 {
                     "match_id": match_id,
                     "attacker_name": attacker_name,
                     "attacker_team_id": attacker_team_id,
                     "attacker_health": attacker_health,
-                    "attacker_location_x": attacker_location.get("x"),
-                    "attacker_location_y": attacker_location.get("y"),
-                    "attacker_location_z": attacker_location.get("z"),
+                    "attacker_location_x": attacker_x,
+                    "attacker_location_y": attacker_y,
+                    "attacker_location_z": attacker_z,
                     "victim_name": victim_name,
                     "victim_team_id": victim_team_id,
                     "victim_health": victim_health,
-                    "victim_location_x": victim_location.get("x"),
-                    "victim_location_y": victim_location.get("y"),
-                    "victim_location_z": victim_location.get("z"),
+                    "victim_location_x": victim_x,
+                    "victim_location_y": victim_y,
+                    "victim_location_z": victim_z,
                     "damage_type_category": damage_type,
-                    "damage_reason": damage_reason,
-                    "damage": damage,
+                    "damage_reason": event.get("damageReason"),
+                    "damage": event.get("damage"),
                     "weapon_id": damage_causer,
-                    "event_timestamp": timestamp,
+                    "event_timestamp": event.get("_D"),
                 }
             )
 
@@ -716,24 +946,11 @@ class TelemetryProcessingWorker:
         Returns:
             Tuple of (knock_events, finishing_summaries)
         """
-        # Build position timeline
-        position_map = self._build_position_timeline(events)
+        # Index player positions by time
+        position_index = PositionIndex(events)
 
-        # Build knock map
-        knock_map = {}
-        for event in events:
-            if get_event_type(event) == "LogPlayerMakeGroggy":
-                dbno_id = event.get("dBNOId")
-                if dbno_id:
-                    knock_map[dbno_id] = event
-
-        # Track revivals
-        revival_map = {}
-        for event in events:
-            if get_event_type(event) == "LogPlayerRevive":
-                dbno_id = event.get("dBNOId")
-                if dbno_id:
-                    revival_map[dbno_id] = event
+        # Index knocks, kills and revivals by dBNOId once per match
+        knock_index = KnockIndex(events)
 
         # Process knock events
         knock_events = []
@@ -760,13 +977,14 @@ class TelemetryProcessingWorker:
             }
         )
 
-        for dbno_id, knock_event in knock_map.items():
+        for dbno_id, knock_event in knock_index.knocks.items():
             attacker = knock_event.get("attacker") or {}
             victim = knock_event.get("victim") or {}
             knocker_name = attacker.get("name")
             knocker_team = attacker.get("teamId")
             knocker_loc = attacker.get("location")
             timestamp = knock_event.get("_D")
+            knock_ms = event_time_ms(knock_event)
 
             if not knocker_name:
                 continue
@@ -789,38 +1007,29 @@ class TelemetryProcessingWorker:
             time_to_finish = None
 
             # Check for kill
-            kill_found = False
-            for event in events:
-                if get_event_type(event) == "LogPlayerKillV2" and event.get("dBNOId") == dbno_id:
-                    outcome = "killed"
-                    finisher = event.get("finisher") or {}
-                    finisher_name = finisher.get("name")
-                    finisher_team = finisher.get("teamId")
-
-                    finisher_is_self = finisher_name == knocker_name
-                    finisher_is_teammate = (
-                        finisher_team == knocker_team and finisher_name != knocker_name
-                    )
-
-                    # Calculate time to finish
-                    try:
-                        knock_time = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                        kill_time = datetime.fromisoformat(event.get("_D").replace("Z", "+00:00"))
-                        time_to_finish = (kill_time - knock_time).total_seconds()
-                    except (ValueError, AttributeError, TypeError):
-                        pass
+            kill_event = knock_index.kill_for(dbno_id)
+            if kill_event is not None:
+                outcome = "killed"
+                finisher = kill_event.get("finisher") or {}
+                finisher_name = finisher.get("name")
+                finisher_team = finisher.get("teamId")
+
+                finisher_is_self = finisher_name == knocker_name
+                finisher_is_teammate = (
+                    finisher_team == knocker_team and finisher_name != knocker_name
+                )
 
-                    kill_found = True
-                    break
+                # Calculate time to finish
+                kill_ms = event_time_ms(kill_event)
+                if knock_ms is not None and kill_ms is not None:
+                    time_to_finish = (kill_ms - knock_ms) / 1000
 
             # Check for revival
-            if not kill_found and dbno_id in revival_map:
+            elif knock_index.revive_for(dbno_id) is not None:
                 outcome = "revived"
 
             # Find teammate positions at knock time
-            nearby_positions = self._find_positions_near_time(
-                timestamp, position_map, window_seconds=5
-            )
+            nearby_positions = position_index.positions_near(knock_ms, window_seconds=5)
 
             # Calculate ATTACKER teammate metrics
             teammates = []
@@ -975,21 +1184,16 @@ class TelemetryProcessingWorker:
                 player_stats[knocker_name]["knocks_revived_by_enemy"] += 1
 
         # Track instant kills (no knock phase)
-        for event in events:
-            if get_event_type(event) == "LogPlayerKillV2":
-                dbno_id = event.get("dBNOId")
-                if not dbno_id or dbno_id == -1 or dbno_id not in knock_map:
-                    finisher = event.get("finisher") or {}
-                    finisher_name = finisher.get("name")
-                    if finisher_name:
-                        finisher_team = finisher.get("teamId")
-                        if (
-                            player_stats[finisher_name]["team_id"] is None
-                            and finisher_team is not None
-                        ):
-                            player_stats[finisher_name]["team_id"] = finisher_team
-                            player_stats[finisher_name]["account_id"] = finisher.get("accountId")
-                        player_stats[finisher_name]["instant_kills"] += 1
+        for event in knock_index.kill_events:
+            if knock_index.is_instant_kill(event):
+                finisher = event.get("finisher") or {}
+                finisher_name = finisher.get("name")
+                if finisher_name:
+                    finisher_team = finisher.get("teamId")
+                    if player_stats[finisher_name]["team_id"] is None and finisher_team is not None:
+                        player_stats[finisher_name]["team_id"] = finisher_team
+                        player_stats[finisher_name]["account_id"] = finisher.get("accountId")
+                    player_stats[finisher_name]["instant_kills"] += 1
 
         # Build finishing summaries
         finishing_summaries = []
@@ -1083,6 +1287,22 @@ class TelemetryProcessingWorker:
 
         return knock_events, finishing_summaries
 
+    def extract_fights(
+        self, events: List[Dict], match_id: str, match_data: Dict
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract team fights with FightTrackingProcessor.
+
+        Args:
+            events: Telemetry events (FightTrackingProcessor.EVENT_TYPES)
+            match_id: Match ID
+            match_data: Match metadata
+
+        Returns:
+            List of fight records, each including its participants
+        """
+        return self.fight_processor.process_match_fights(events, match_id, match_data)
+
     def extract_item_usage(
         self, events: List[Dict], match_id: str, match_data: Dict[str, Any]
     ) -> Dict[str, Dict[str, int]]:
@@ -1159,86 +1379,112 @@ class TelemetryProcessingWorker:
         return dict(player_stats)
 
     def extract_advanced_stats(
-        self, events: List[Dict], match_id: str, match_data: Dict[str, Any]
+        self,
+        events: Union[MatchColumns, List[Dict]],
+        match_id: str,
+        match_data: Dict[str, Any],
     ) -> Dict[str, Dict[str, float]]:
         """
         Extract advanced combat stats (killsteals, throwable damage, damage received).
 
-        Returns aggregated stats per player for match_summaries update.
+        Returns aggregated stats per player for match_summaries update, in the
+        order players first contribute to a stat.
 
         Args:
-            events: List of telemetry events
+            events: List of telemetry events or the match's MatchColumns
             match_id: Match ID
             match_data: Match metadata
 
         Returns:
             Dict[player_name, stats_dict] with advanced stats
         """
-        player_stats = defaultdict(
-            lambda: {"killsteals": 0, "throwable_damage": 0.0, "damage_received": 0.0}
+        columns = MatchColumns.of(events)
+        damage, knocks, kills = columns.damage, columns.knocks, columns.kills
+        player_count = len(columns.players)
+        amounts = fill_nan(damage["damage"])
+
+        # Damage received by named victims, throwable damage dealt by named attackers
+        throwable = np.array(
+            [category == "Throwable" for category in columns.weapons.map(get_weapon_category)]
+            + [False]
+        )
+        received = damage["victim"] != MISSING
+        dealt = (damage["attacker"] != MISSING) & throwable[damage["weapon"]]
+
+        damage_received = np.zeros(player_count)
+        np.add.at(damage_received, damage["victim"][received], amounts[received])
+        throwable_damage = np.zeros(player_count)
+        np.add.at(throwable_damage, damage["attacker"][dealt], amounts[dealt])
+
+        # Killsteal = player knocked by Team A, but killed/finished by Team B (where A != B).
+        # Knocks and kills are replayed in telemetry order, so each kill is compared
+        # with the latest earlier knock of its dBNO id.
+        knocked = (
+            knocks["has_dbno"]
+            & (knocks["attacker"] != MISSING)
+            & (knocks["attacker_team"] != MISSING)
+        )
+        finished = (
+            kills["has_dbno"]
+            & (kills["killer"] != MISSING)
+            & (kills["killer_team"] != MISSING)
+        )
+        sequence = np.concatenate([knocks["seq"][knocked], kills["seq"][finished]])
+        order = np.argsort(sequence, kind="stable")
+        replay = zip(
+            sequence[order].tolist(),
+            (order >= np.count_nonzero(knocked)).tolist(),
+            np.concatenate([knocks["dbno"][knocked], kills["dbno"][finished]])[order].tolist(),
+            np.concatenate([knocks["attacker_team"][knocked], kills["killer_team"][finished]])[
+                order
+            ].tolist(),
+            np.concatenate([knocks["attacker"][knocked], kills["killer"][finished]])[
+                order
+            ].tolist(),
         )
 
-        # Track knock and kill events for killsteal detection
-        # Killsteal = player knocked by Team A, but killed/finished by Team B (where A != B)
-        knock_events = {}  # dbno_id -> (knocker_name, knocker_team_id)
-
-        # Pass 1: Collect all events
-        for event in events:
-            event_type = get_event_type(event)
-
-            if event_type == "LogPlayerTakeDamage":
-                attacker = event.get("attacker") or {}
-                victim = event.get("victim") or {}
-                attacker_name = attacker.get("name")
-                victim_name = victim.get("name")
-                damage = event.get("damage", 0)
-                weapon = event.get("damageCauserName")
-
-                # Track damage received
-                if victim_name:
-                    player_stats[victim_name]["damage_received"] += damage
-
-                # Track throwable damage (by weapon category)
-                if attacker_name and weapon:
-                    weapon_cat = get_weapon_category(weapon)
-                    if weapon_cat == "Throwable":
-                        player_stats[attacker_name]["throwable_damage"] += damage
-
-            elif event_type == "LogPlayerMakeGroggy":
-                # Player was knocked down
-                attacker = event.get("attacker") or {}
-                victim = event.get("victim") or {}
-                dbno_id = event.get("dBNOId")
-
-                knocker_name = attacker.get("name")
-                knocker_team_id = attacker.get("teamId")
-
-                if dbno_id and knocker_name and knocker_team_id is not None:
-                    knock_events[dbno_id] = (knocker_name, knocker_team_id)
-
-            elif event_type == "LogPlayerKillV2":
-                # Player was killed/finished
-                killer = event.get("killer") or {}
-                dbno_id = event.get("dBNOId")
-
-                killer_name = killer.get("name")
-                killer_team_id = killer.get("teamId")
-
-                if not (dbno_id and killer_name and killer_team_id is not None):
-                    continue
-
-                # Check if this was a killsteal
-                if dbno_id in knock_events:
-                    knocker_name, knocker_team_id = knock_events[dbno_id]
-
-                    # Killsteal if killer's team != knocker's team
-                    if killer_team_id != knocker_team_id:
-                        player_stats[killer_name]["killsteals"] += 1
+        knock_teams = {}  # dbno_id -> knocker_team_id
+        killsteal_seqs: List[int] = []
+        killsteal_players: List[int] = []
+        for seq, is_kill, dbno_id, team_id, player in replay:
+            if not is_kill:
+                knock_teams[dbno_id] = team_id
+            elif dbno_id in knock_teams and knock_teams[dbno_id] != team_id:
+                killsteal_seqs.append(seq)
+                killsteal_players.append(player)
+
+        killsteal_players = np.array(killsteal_players, dtype=np.int64)
+        killsteals = np.bincount(killsteal_players, minlength=player_count)
+
+        # Players in the order they first contribute; a damage event's victim
+        # is counted before its attacker
+        touches = np.concatenate(
+            [
+                damage["seq"][received] * 2,
+                damage["seq"][dealt] * 2 + 1,
+                np.array(killsteal_seqs, dtype=np.int64) * 2,
+            ]
+        )
+        touched = np.concatenate(
+            [damage["victim"][received], damage["attacker"][dealt], killsteal_players]
+        )
+        players, _ = first_seen_order(touched[np.argsort(touches, kind="stable")])
 
-        return dict(player_stats)
+        names = columns.players.values
+        return {
+            names[player]: {
+                "killsteals": int(killsteals[player]),
+                "throwable_damage": float(throwable_damage[player]),
+                "damage_received": float(damage_received[player]),
+            }
+            for player in players.tolist()
+        }
 
     def extract_circle_tracking(
-        self, events: List[Dict], match_id: str, match_data: Dict[str, Any]
+        self,
+        events: Union[MatchColumns, List[Dict]],
+        match_id: str,
+        match_data: Dict[str, Any],
     ) -> Tuple[Dict[str, Dict[str, float]], List[Dict[str, Any]]]:
         """
         Extract circle positioning data with filtered storage.
@@ -1254,7 +1500,7 @@ class TelemetryProcessingWorker:
         combine it with LogPlayerPosition events.
 
         Args:
-            events: List of telemetry events
+            events: List of telemetry events or the match's MatchColumns
             match_id: Match ID
             match_data: Match metadata
 
@@ -1263,285 +1509,198 @@ class TelemetryProcessingWorker:
             - aggregate_stats: Dict[player_name, stats] for match_summaries
             - detailed_positions: List[position_records] for player_circle_positions table (tracked only)
         """
-        # Step 1: Build timeline of circle states from LogGameStatePeriodic
-        circle_states = []
-        for event in events:
-            event_type = get_event_type(event)
-            if event_type != "LogGameStatePeriodic":
-                continue
-
-            game_state = event.get("gameState") or {}
-            safety_zone_position = game_state.get("safetyZonePosition") or {}
-
-            circle_states.append(
-                {
-                    "elapsed_time": game_state.get("elapsedTime", 0),
-                    "center_x": safety_zone_position.get("x", 0),
-                    "center_y": safety_zone_position.get("y", 0),
-                    "radius": game_state.get("safetyZoneRadius", 0),
-                }
-            )
+        columns = MatchColumns.of(events)
+        players = columns.players
 
-        # Sort by elapsed time for efficient lookup
-        circle_states.sort(key=lambda x: x["elapsed_time"])
+        # Step 1: Build timeline of circle states from LogGameStatePeriodic
+        circle_timeline = CircleTimeline(columns)
 
-        if not circle_states:
+        if not circle_timeline:
             # No circle data available
             return {}, []
 
         # Step 2: Count blue zone damage ticks for accurate time_outside_zone calculation
-        # Blue zone damage occurs at ~1.03 second intervals (empirically verified)
-        bluezone_tick_counts = defaultdict(int)
-        for event in events:
-            event_type = get_event_type(event)
-            if event_type == "LogPlayerTakeDamage":
-                damage_type = event.get("damageTypeCategory", "")
-                # Only count actual blue zone damage (not blue zone grenades)
-                if damage_type == "Damage_BlueZone":
-                    victim = event.get("victim") or {}
-                    victim_name = victim.get("name")
-                    if victim_name:
-                        bluezone_tick_counts[victim_name] += 1
-
-        # Step 3: Process LogPlayerPosition events and match to circle states
-        player_samples = defaultdict(
-            lambda: {
-                "distances_center": [],
-                "distances_edge": [],
-                "total_samples": 0,
-                "positions": [],  # Detailed data (will be filtered)
-            }
-        )
+        # Blue zone damage occurs at ~1.03 second intervals (empirically verified).
+        # Only count actual blue zone damage (not blue zone grenades)
+        damage = columns.damage
+        blue_zone = columns.damage_types.mask(["Damage_BlueZone"])[damage["damage_type"]]
+        blue_zone &= damage["victim"] != MISSING
+        bluezone_tick_counts = np.bincount(damage["victim"][blue_zone], minlength=len(players))
+
+        # Step 3: Match LogPlayerPosition samples to circle states in NumPy batches;
+        # aggregates are kept as running per-player accumulators.
+        positions = columns.positions
+        named = np.flatnonzero(positions["character"] != MISSING)
+        sample_players = positions["character"][named]
+        xs = fill_nan(positions["character_x"][named])
+        ys = fill_nan(positions["character_y"][named])
+        elapsed_times = fill_nan(positions["elapsed"][named])
+
+        # Accumulator index of each sample, players in the order first seen
+        distance_stats = CircleDistanceStats()
+        first_seen, stats_indices = first_seen_order(sample_players)
+        for player in first_seen.tolist():
+            distance_stats.index_for(players.values[player])
 
         # Get tracked players for filtering detailed storage
         tracked_players = self._get_tracked_players_set()
+        sample_tracked = players.mask(tracked_players)[sample_players]
+        tracked_positions = defaultdict(list)  # Detailed data (tracked players only)
 
-        # Helper function to find nearest circle state
-        def find_circle_state(elapsed_time):
-            # Binary search or simple iteration (linear is fine for ~100 states)
-            for i, state in enumerate(circle_states):
-                if state["elapsed_time"] >= elapsed_time:
-                    return state
-            # Return last state if time is after all states
-            return circle_states[-1]
-
-        for event in events:
-            event_type = get_event_type(event)
-            if event_type != "LogPlayerPosition":
-                continue
-
-            character = event.get("character") or {}
-            player_name = character.get("name")
-            if not player_name:
-                continue
-
-            location = character.get("location") or {}
-            player_x = location.get("x", 0)
-            player_y = location.get("y", 0)
-            elapsed_time = event.get("elapsedTime", 0)
-
-            # Find corresponding circle state
-            circle = find_circle_state(elapsed_time)
-            center_x = circle["center_x"]
-            center_y = circle["center_y"]
-            radius = circle["radius"]
-
-            # Calculate distance from center (2D distance, convert to meters)
-            distance_from_center = (
-                math.sqrt((player_x - center_x) ** 2 + (player_y - center_y) ** 2) / 100
+        for start in range(0, len(named), self.CIRCLE_BATCH_SIZE):
+            batch = slice(start, start + self.CIRCLE_BATCH_SIZE)
+            states, distances_center, distances_edge = circle_timeline.distances(
+                xs[batch], ys[batch], elapsed_times[batch]
             )
 
-            # Calculate distance from edge (convert to meters)
-            distance_from_edge = (radius - distance_from_center * 100) / 100
-            is_in_safe_zone = distance_from_edge >= 0
-
             # Store aggregate data (for ALL players)
-            player_samples[player_name]["distances_center"].append(distance_from_center)
-            player_samples[player_name]["distances_edge"].append(distance_from_edge)
-            player_samples[player_name]["total_samples"] += 1
+            distance_stats.add(stats_indices[batch], distances_center, distances_edge)
 
             # Store detailed position ONLY for tracked players
-            if player_name in tracked_players:
-                player_samples[player_name]["positions"].append(
+            rows = np.flatnonzero(sample_tracked[batch])
+            if not len(rows):
+                continue
+
+            row_states = states[rows]
+            detail_columns = zip(
+                players.decode(sample_players[batch][rows]),
+                elapsed_times[batch][rows].tolist(),
+                (xs[batch][rows] / 100).tolist(),  # Convert to meters
+                (ys[batch][rows] / 100).tolist(),
+                (circle_timeline.center_x[row_states] / 100).tolist(),
+                (circle_timeline.center_y[row_states] / 100).tolist(),
+                (circle_timeline.radius[row_states] / 100).tolist(),
+                distances_center[rows].tolist(),
+                distances_edge[rows].tolist(),
+            )
+            for (
+                player_name,
+                elapsed_time,
+                x,
+                y,
+                center_x,
+                center_y,
+                radius,
+                from_center,
+                from_edge,
+            ) in detail_columns:
+                tracked_positions[player_name].append(
                     {
                         "match_id": match_id,
                         "player_name": player_name,
                         "elapsed_time": int(elapsed_time),
-                        "player_x": player_x / 100,  # Convert to meters
-                        "player_y": player_y / 100,
-                        "safe_zone_center_x": center_x / 100,
-                        "safe_zone_center_y": center_y / 100,
-                        "safe_zone_radius": radius / 100,
-                        "distance_from_center": distance_from_center,
-                        "distance_from_edge": distance_from_edge,
-                        "is_in_safe_zone": is_in_safe_zone,
+                        "player_x": x,
+                        "player_y": y,
+                        "safe_zone_center_x": center_x,
+                        "safe_zone_center_y": center_y,
+                        "safe_zone_radius": radius,
+                        "distance_from_center": from_center,
+                        "distance_from_edge": from_edge,
+                        "is_in_safe_zone": from_edge >= 0,
                     }
                 )
 
         # Calculate aggregate stats for ALL players
-        aggregate_stats = {}
-        for player_name, samples in player_samples.items():
-            if samples["total_samples"] == 0:
-                continue
-
+        aggregate_stats = distance_stats.summary()
+        for player_name, stats in aggregate_stats.items():
             # Calculate time outside zone from blue zone damage ticks
             # Blue zone damage ticks occur every ~1.03 seconds (empirically verified)
-            bluezone_ticks = bluezone_tick_counts.get(player_name, 0)
-            time_outside_zone = round(bluezone_ticks * 1.03)
-
-            aggregate_stats[player_name] = {
-                "avg_distance_from_center": sum(samples["distances_center"])
-                / len(samples["distances_center"]),
-                "avg_distance_from_edge": sum(samples["distances_edge"])
-                / len(samples["distances_edge"]),
-                "max_distance_from_center": max(samples["distances_center"])
-                if samples["distances_center"]
-                else None,
-                "min_distance_from_edge": min(samples["distances_edge"])
-                if samples["distances_edge"]
-                else None,
-                "time_outside_zone_seconds": time_outside_zone,
-            }
+            bluezone_ticks = int(bluezone_tick_counts[players.ids[player_name]])
+            stats["time_outside_zone_seconds"] = round(bluezone_ticks * 1.03)
 
         # Collect detailed positions (tracked players only)
         detailed_positions = []
         for player_name in tracked_players:
-            if player_name in player_samples:
-                detailed_positions.extend(player_samples[player_name]["positions"])
+            if player_name in tracked_positions:
+                detailed_positions.extend(tracked_positions[player_name])
 
         return aggregate_stats, detailed_positions
 
     def extract_weapon_distribution(
-        self, events: List[Dict], match_id: str, match_data: Dict[str, Any]
+        self,
+        events: Union[MatchColumns, List[Dict]],
+        match_id: str,
+        match_data: Dict[str, Any],
     ) -> Dict[str, Dict[str, Dict[str, float]]]:
         """
         Extract weapon distribution by category using weapon_categories module.
 
-        Aggregates damage/kills by weapon category per player.
+        Aggregates damage/kills by weapon category per player. Players and their
+        categories are ordered by first contribution.
 
         Args:
-            events: List of telemetry events
+            events: List of telemetry events or the match's MatchColumns
             match_id: Match ID
             match_data: Match data
 
         Returns:
             Dict[player_name, Dict[category, stats]] with damage/kills per category
         """
-        player_weapon_stats = defaultdict(
-            lambda: defaultdict(lambda: {"total_damage": 0.0, "total_kills": 0, "knock_downs": 0})
+        columns = MatchColumns.of(events)
+        damage, kills, knocks = columns.damage, columns.kills, columns.knocks
+
+        # Resolve each distinct weapon's category once
+        category_ids: Dict[str, int] = {}
+        weapon_categories = np.array(
+            [
+                category_ids.setdefault(category, len(category_ids))
+                for category in columns.weapons.map(get_weapon_category)
+            ]
+            + [MISSING],
+            dtype=np.int64,
         )
+        category_names = list(category_ids)
+
+        # Damage, kills and knock downs credited to named players with a weapon
+        by_damage = (damage["attacker"] != MISSING) & (damage["weapon"] != MISSING)
+        by_kill = (kills["killer"] != MISSING) & (kills["weapon"] != MISSING)
+        by_knock = (knocks["attacker"] != MISSING) & (knocks["weapon"] != MISSING)
+        counts = [
+            np.count_nonzero(by_damage),
+            np.count_nonzero(by_kill),
+            np.count_nonzero(by_knock),
+        ]
+
+        order = np.argsort(
+            np.concatenate(
+                [damage["seq"][by_damage], kills["seq"][by_kill], knocks["seq"][by_knock]]
+            ),
+            kind="stable",
+        )
+        credited_players = np.concatenate(
+            [damage["attacker"][by_damage], kills["killer"][by_kill], knocks["attacker"][by_knock]]
+        )[order]
+        credited_weapons = np.concatenate(
+            [damage["weapon"][by_damage], kills["weapon"][by_kill], knocks["weapon"][by_knock]]
+        )[order]
+        kinds = np.repeat(np.arange(3), counts)[order]
+        amounts = np.concatenate(
+            [fill_nan(damage["damage"])[by_damage], np.zeros(counts[1] + counts[2])]
+        )[order]
+
+        # Group by (player, category) in order of first contribution
+        pairs, groups = first_seen_order(
+            credited_players * len(category_names) + weapon_categories[credited_weapons]
+        )
+        total_damage = np.zeros(len(pairs))
+        np.add.at(total_damage, groups[kinds == 0], amounts[kinds == 0])
+        total_kills = np.bincount(groups[kinds == 1], minlength=len(pairs))
+        knock_downs = np.bincount(groups[kinds == 2], minlength=len(pairs))
 
-        # Pass 1: Collect damage by weapon category
-        for event in events:
-            event_type = get_event_type(event)
-
-            if event_type == "LogPlayerTakeDamage":
-                attacker = event.get("attacker") or {}
-                attacker_name = attacker.get("name")
-                damage = event.get("damage", 0)
-                weapon_id = event.get("damageCauserName")
-
-                if attacker_name and weapon_id:
-                    category = get_weapon_category(weapon_id)
-                    player_weapon_stats[attacker_name][category]["total_damage"] += damage
-
-            elif event_type == "LogPlayerKillV2":
-                killer = event.get("killer") or {}
-                killer_name = killer.get("name")
-                damage_causer = event.get("damageCauserName")
-
-                if killer_name and damage_causer:
-                    category = get_weapon_category(damage_causer)
-                    player_weapon_stats[killer_name][category]["total_kills"] += 1
-
-            elif event_type == "LogPlayerMakeGroggy":
-                attacker = event.get("attacker") or {}
-                attacker_name = attacker.get("name")
-                weapon_id = event.get("damageCauserName")
-
-                if attacker_name and weapon_id:
-                    category = get_weapon_category(weapon_id)
-                    player_weapon_stats[attacker_name][category]["knock_downs"] += 1
-
-        # Convert to regular dict
         result = {}
-        for player_name, categories in player_weapon_stats.items():
-            result[player_name] = dict(categories)
+        names = columns.players.values
+        for pair, damage_total, kill_total, knock_total in zip(
+            pairs.tolist(), total_damage.tolist(), total_kills.tolist(), knock_downs.tolist()
+        ):
+            player, category = divmod(pair, len(category_names))
+            result.setdefault(names[player], {})[category_names[category]] = {
+                "total_damage": damage_total,
+                "total_kills": kill_total,
+                "knock_downs": knock_total,
+            }
 
         return result
 
-    def _build_position_timeline(self, events: List[Dict]) -> Dict[str, Dict[str, Dict]]:
-        """Build position timeline from all events with position data."""
-        position_map = defaultdict(dict)
-
-        for event in events:
-            event_type = get_event_type(event)
-            timestamp = event.get("_D")
-
-            if not timestamp:
-                continue
-
-            # Extract positions from different event types
-            positions_to_add = []
-
-            if event_type == "LogPlayerPosition":
-                char = event.get("character") or {}
-                positions_to_add.append(char)
-
-            elif event_type == "LogPlayerTakeDamage":
-                attacker = event.get("attacker") or {}
-                victim = event.get("victim") or {}
-                positions_to_add.extend([attacker, victim])
-
-            elif event_type in ["LogPlayerMakeGroggy", "LogPlayerKillV2"]:
-                attacker = event.get("attacker") or {}
-                finisher = event.get("finisher") or {}
-                victim = event.get("victim") or {}
-                positions_to_add.extend([attacker, finisher, victim])
-
-            # Add positions to map
-            for pos_data in positions_to_add:
-                name = pos_data.get("name")
-                team_id = pos_data.get("teamId")
-                location = pos_data.get("location")
-
-                if name and location and team_id is not None:
-                    position_map[timestamp][name] = {"location": location, "teamId": team_id}
-
-        return position_map
-
-    def _find_positions_near_time(
-        self, target_time: str, position_map: Dict, window_seconds: int = 5
-    ) -> Dict[str, Dict]:
-        """Find player positions closest to target timestamp within a time window."""
-        try:
-            target_dt = datetime.fromisoformat(target_time.replace("Z", "+00:00"))
-        except (ValueError, AttributeError, TypeError):
-            return {}
-
-        nearby_positions = {}
-
-        for ts, players in position_map.items():
-            try:
-                ts_dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                time_diff = abs((ts_dt - target_dt).total_seconds())
-
-                if time_diff <= window_seconds:
-                    for player_name, data in players.items():
-                        if (
-                            player_name not in nearby_positions
-                            or time_diff < nearby_positions[player_name]["time_diff"]
-                        ):
-                            nearby_positions[player_name] = {
-                                **data,
-                                "time_diff": time_diff,
-                                "timestamp": ts,
-                            }
-            except (ValueError, AttributeError, TypeError):
-                continue
-
-        return nearby_positions
-
     def _calculate_distance_3d(self, loc1: Optional[Dict], loc2: Optional[Dict]) -> Optional[float]:
         """Calculate 3D distance between two locations in meters."""
         if not loc1 or not loc2:
@@ -1580,37 +1739,39 @@ class TelemetryProcessingWorker:
             "last_check": datetime.now(timezone.utc).isoformat(),
         }
 
-    def _read_telemetry_file(self, file_path: str) -> List[Dict[str, Any]]:
+    def _read_telemetry_file(
+        self, file_path: str, event_types: Optional[frozenset] = None
+    ) -> List[Dict[str, Any]]:
         """
         Read and parse telemetry JSON file.
 
-        Handles both single and double gzip compression.
+        Handles both single and double gzip compression. Events are decoded
+        incrementally, so event types outside event_types are never retained.
+        When only extractor event types are requested, events are loaded from
+        the match's extracted-event artifact if it is up to date.
 
         Args:
             file_path: Path to raw.json.gz file
+            event_types: Event types to keep (default: None keeps all events)
 
         Returns:
-            List of event dictionaries
+            List of events; types with a schema in telemetry_records are records
         """
         try:
-            # First decompression
-            with gzip.open(file_path, "rb") as f:
-                first_bytes = f.read(2)
-                f.seek(0)
-
-                # Check if double-gzipped (starts with 0x1f 0x8b)
-                if first_bytes == b"\x1f\x8b":
-                    # Double gzipped - decompress twice
-                    with gzip.open(f, "rt", encoding="utf-8") as f2:
-                        events = json.load(f2)
-                else:
-                    # Single gzipped - read as text
-                    f.seek(0)
-                    content = f.read().decode("utf-8")
-                    events = json.loads(content)
-
-            if not isinstance(events, list):
-                raise ValueError(f"Expected list of events, got {type(events)}")
+            if (
+                self.artifact_cache is not None
+                and event_types is not None
+                and event_types <= self.artifact_cache.event_types
+            ):
+                return self.artifact_cache.read(file_path, event_types)
+
+            reader = TelemetryReader(file_path, event_types=event_types, typed=True)
+            events = reader.read()
+
+            self.logger.debug(
+                f"[{self.worker_id}] Read {reader.events_read} events from {file_path}, "
+                f"kept {reader.events_kept}"
+            )
 
             return events
 
@@ -1621,22 +1782,26 @@ class TelemetryProcessingWorker:
     def _store_events(
         self,
         match_id: str,
-        landings: List[Dict],
-        kill_positions: List[Dict],
-        weapon_kills: List[Dict],
-        damage_events: List[Dict],
-        knock_events: List[Dict],
-        finishing_summaries: List[Dict],
-        fights: List[Dict],
+        landings: List[Dict] = None,
+        kill_positions: List[Dict] = None,
+        weapon_kills: List[Dict] = None,
+        damage_events: List[Dict] = None,
+        knock_events: List[Dict] = None,
+        finishing_summaries: List[Dict] = None,
+        fights: List[Dict] = None,
         item_usage_stats: Dict[str, Dict[str, int]] = None,
         advanced_stats: Dict[str, Dict[str, float]] = None,
         circle_aggregate_stats: Dict[str, Dict[str, float]] = None,
         circle_detailed_positions: List[Dict[str, Any]] = None,
         weapon_distribution: Dict[str, Dict[str, Dict[str, float]]] = None,
+        processed_flags: Optional[Dict[str, bool]] = None,
     ) -> None:
         """
         Store extracted events in database.
 
+        store_match runs this inside DatabaseManager.transaction(), so the events,
+        enhanced stats and processing flags of a match are committed together.
+
         Args:
             match_id: Match ID
             landings: Landing events to store
@@ -1651,8 +1816,17 @@ class TelemetryProcessingWorker:
             circle_aggregate_stats: Circle positioning aggregates for match_summaries
             circle_detailed_positions: Detailed circle positions (tracked players only)
             weapon_distribution: Weapon distribution by category per player
+            processed_flags: matches processed flags to set (default: derived from
+                the stored events for every flagged extractor)
         """
         # Default to empty if not provided
+        landings = landings or []
+        kill_positions = kill_positions or []
+        weapon_kills = weapon_kills or []
+        damage_events = damage_events or []
+        knock_events = knock_events or []
+        finishing_summaries = finishing_summaries or []
+        fights = fights or []
         item_usage_stats = item_usage_stats or {}
         advanced_stats = advanced_stats or {}
         circle_aggregate_stats = circle_aggregate_stats or {}
@@ -1702,24 +1876,12 @@ class TelemetryProcessingWorker:
 
         # Insert fights and participants
         if fights:
-            # Insert fights one by one to get fight_id for participants
-            total_participants = 0
-            for fight in fights:
-                # Extract participants before inserting fight
-                participants = fight.pop("participants", [])
-
-                # Insert fight and get ID
-                fight_id = self.database_manager.insert_fight_and_get_id(fight)
-
-                # Add fight_id to each participant and insert
-                if participants:
-                    for participant in participants:
-                        participant["fight_id"] = fight_id
-                    inserted = self.database_manager.insert_fight_participants(participants)
-                    total_participants += inserted
-
+            # One statement for all fights, one for all participants linked to their IDs
+            inserted, total_participants = self.database_manager.insert_fights_with_participants(
+                fights
+            )
             self.logger.debug(
-                f"[{self.worker_id}] Inserted {len(fights)} fights with {total_participants} participants for match {match_id}"
+                f"[{self.worker_id}] Inserted {inserted}/{len(fights)} fights with {total_participants} participants for match {match_id}"
             )
 
         # Update match_summaries with enhanced stats
@@ -1784,15 +1946,43 @@ class TelemetryProcessingWorker:
                 )
 
         # Update processing flags
-        self.database_manager.update_match_processing_flags(
-            match_id,
-            landings_processed=bool(landings),
-            kills_processed=bool(kill_positions),
-            weapons_processed=bool(weapon_kills),
-            damage_processed=bool(damage_events),
-            finishing_processed=bool(knock_events or finishing_summaries),
-            fights_processed=bool(fights),
-        )
+        if processed_flags is None:
+            processed_flags = self._processed_flags(
+                self.EXTRACTORS,
+                {
+                    "landings": landings,
+                    "kill_positions": kill_positions,
+                    "weapon_kills": weapon_kills,
+                    "damage_events": damage_events,
+                    "knock_events": knock_events,
+                    "finishing_summaries": finishing_summaries,
+                    "fights": fights,
+                },
+            )
+        if processed_flags:
+            self.database_manager.update_match_processing_flags(match_id, **processed_flags)
+
+    @staticmethod
+    def _processed_flags(
+        extractors: Iterable[TelemetryExtractor], results: Dict[str, Any]
+    ) -> Dict[str, bool]:
+        """
+        Get the processed flags of extractors that ran.
+
+        An extractor counts as processed when any of its outputs is non-empty.
+
+        Args:
+            extractors: Extractors that ran
+            results: Extractor results keyed by output
+
+        Returns:
+            Dict[flag_column, processed]
+        """
+        return {
+            extractor.flag_column: any(results.get(output) for output in extractor.outputs)
+            for extractor in extractors
+            if extractor.flag_column
+        }
 
     def _get_tracked_players_set(self) -> set:
         """
@@ -1847,6 +2037,7 @@ class TelemetryProcessingWorker:
                     cur.execute(
                         "SELECT game_type FROM matches WHERE match_id = %s",
                         (match_id,),
+                        prepare=self.database_manager.prepare,
                     )
                     row = cur.fetchone()
 
@@ -1886,6 +2077,7 @@ class TelemetryProcessingWorker:
                         WHERE match_id = %s
                         """,
                         (match_id,),
+                        prepare=self.database_manager.prepare,
                     )
                     row = cur.fetchone()
 
@@ -1957,25 +2149,12 @@ class TelemetryProcessingWorker:
 # Helper functions
 
 
-def get_event_type(event: Dict[str, Any]) -> Optional[str]:
-    """
-    Get event type from multiple possible keys.
-
-    Args:
-        event: Event dictionary
-
-    Returns:
-        Event type string or None
-    """
-    return event.get("_T") or event.get("type") or event.get("event_type")
-
-
 def get_nested(obj: Dict[str, Any], path: str, default=None) -> Any:
     """
-    Safely get nested dictionary value.
+    Safely get nested dictionary or telemetry record value.
 
     Args:
-        obj: Dictionary to extract from
+        obj: Dictionary or record to extract from
         path: Dot-separated path (e.g., "character.location.x")
         default: Default value if not found
 
@@ -1986,7 +2165,7 @@ def get_nested(obj: Dict[str, Any], path: str, default=None) -> Any:
     current = obj
 
     for key in keys:
-        if isinstance(current, dict):
+        if isinstance(current, (dict, TelemetryRecord)):
             current = current.get(key)
         else:
             return default
@@ -2015,14 +2194,30 @@ if __name__ == "__main__":
         dbname=os.getenv("POSTGRES_DB"),
         user=os.getenv("POSTGRES_USER"),
         password=os.getenv("POSTGRES_PASSWORD"),
+        # DB_BULK_LOAD=copy loads high-volume event tables with binary COPY
+        use_copy=os.getenv("DB_BULK_LOAD", "executemany") == "copy",
+        # DB_PIPELINE=on pipelines independent statements and prepares hot ones
+        use_pipeline=os.getenv("DB_PIPELINE", "off") == "on",
     )
 
     # Initialize worker
     worker = TelemetryProcessingWorker(
         database_manager=db_manager,
         worker_id=os.getenv("WORKER_ID", "telemetry-processing-worker-1"),
+        # TELEMETRY_ARTIFACTS=on caches extracted events next to the raw files
+        use_artifacts=os.getenv("TELEMETRY_ARTIFACTS", "off") == "on",
     )
 
+    # Pipelined mode overlaps reading, extracting and storing consecutive matches
+    # (PIPELINE_QUEUE_SIZE > 0); by default CONSUMER_THREADS matches run at once
+    pipeline_queue_size = int(os.getenv("PIPELINE_QUEUE_SIZE", "0"))
+    consumer_threads = int(os.getenv("CONSUMER_THREADS", "1"))
+    pipeline = None
+    if pipeline_queue_size > 0:
+        from pewstats_collectors.workers.telemetry_pipeline import TelemetryPipeline
+
+        pipeline = TelemetryPipeline(worker, queue_size=pipeline_queue_size)
+
     # Initialize consumer
     consumer = RabbitMQConsumer(
         host=os.getenv("RABBITMQ_HOST"),
@@ -2031,8 +2226,22 @@ if __name__ == "__main__":
         password=os.getenv("RABBITMQ_PASSWORD", "guest"),
         vhost=os.getenv("RABBITMQ_VHOST", "/"),
         environment=os.getenv("ENVIRONMENT", "development"),
+        prefetch_count=pipeline.capacity if pipeline else consumer_threads,
     )
 
     # Start consuming
     print(f"Starting telemetry processing worker: {worker.worker_id}")
-    consumer.consume_messages("match", "processing", worker.process_message)
+    if pipeline:
+        # Messages are acked once the store stage has committed them
+        print(f"Pipelined processing: {pipeline.capacity} matches in flight")
+        pipeline.start()
+        try:
+            consumer.consume_messages_deferred("match", "processing", pipeline.submit)
+        finally:
+            pipeline.stop(wait=False)
+            consumer.close()
+    else:
+        # Long matches must not block heartbeats on the connection's thread
+        consumer.consume_messages_threaded(
+            "match", "processing", worker.process_message, workers=consumer_threads
+        )
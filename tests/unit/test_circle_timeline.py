@@ -0,0 +1,104 @@
+"""
+Unit tests for Circle Timeline
+"""
+
+import numpy as np
+import pytest
+
+from pewstats_collectors.processors.circle_timeline import CircleDistanceStats, CircleTimeline
+
+
+def _state(elapsed_time, x, y, radius):
+    return {
+        "_T": "LogGameStatePeriodic",
+        "gameState": {
+            "elapsedTime": elapsed_time,
+            "safetyZonePosition": {"x": x, "y": y, "z": 0},
+            "safetyZoneRadius": radius,
+        },
+    }
+
+
+class TestCircleTimeline:
+    """Test CircleTimeline class"""
+
+    @pytest.fixture
+    def timeline(self):
+        """Three circle states, out of order"""
+        return CircleTimeline(
+            [
+                _state(120, 1000, 1000, 50000),
+                {"_T": "LogPlayerPosition", "elapsedTime": 10},
+                _state(60, 0, 0, 100000),
+                _state(180, 2000, 2000, 20000),
+            ]
+        )
+
+    def test_sorts_states(self, timeline):
+        """Should keep only game states, sorted by elapsed time"""
+        assert len(timeline) == 3
+        assert timeline.elapsed_times == [60, 120, 180]
+
+    @pytest.mark.parametrize(
+        "elapsed_time,expected_radius",
+        [(0, 100000), (60, 100000), (61, 50000), (120, 50000), (150, 20000), (999, 20000)],
+    )
+    def test_state_at(self, timeline, elapsed_time, expected_radius):
+        """Should use the first state at or after the elapsed time, else the last"""
+        assert timeline.state_at(elapsed_time)["radius"] == expected_radius
+
+    def test_state_indices_match_state_index(self, timeline):
+        """Vectorized lookups should match scalar lookups"""
+        elapsed_times = [0, 59.5, 60, 60.5, 120, 179, 180, 181]
+
+        indices = timeline.state_indices(np.array(elapsed_times, dtype=np.float64))
+
+        assert indices.tolist() == [timeline.state_index(t) for t in elapsed_times]
+
+    def test_distances(self, timeline):
+        """Should calculate distances from center and edge in meters"""
+        _, from_center, from_edge = timeline.distances(
+            np.array([3000.0, 0.0]), np.array([4000.0, 120000.0]), np.array([30.0, 60.0])
+        )
+
+        assert from_center.tolist() == [50.0, 1200.0]
+        assert from_edge.tolist() == [950.0, -200.0]
+
+    def test_empty_timeline(self):
+        """Should be empty without game state events"""
+        assert not CircleTimeline([{"_T": "LogPlayerPosition"}])
+
+
+class TestCircleDistanceStats:
+    """Test CircleDistanceStats class"""
+
+    def test_running_aggregates(self):
+        """Should aggregate batches per player in first-seen order"""
+        stats = CircleDistanceStats()
+        a, b = stats.index_for("A"), stats.index_for("B")
+
+        stats.add(np.array([a, b, a]), np.array([10.0, 5.0, 30.0]), np.array([-1.0, 2.0, 4.0]))
+        c = stats.index_for("C")
+        stats.add(np.array([c, a]), np.array([7.0, 20.0]), np.array([0.5, -3.0]))
+
+        summary = stats.summary()
+
+        assert list(summary) == ["A", "B", "C"]
+        assert summary["A"] == {
+            "avg_distance_from_center": 20.0,
+            "avg_distance_from_edge": 0.0,
+            "max_distance_from_center": 30.0,
+            "min_distance_from_edge": -3.0,
+        }
+        assert summary["C"]["avg_distance_from_center"] == 7.0
+
+    def test_sums_in_sample_order(self):
+        """Should accumulate in sample order like a sequential sum"""
+        values = [0.1, 0.2, 0.3, 1e16, -1e16, 0.7] * 50
+        stats = CircleDistanceStats()
+        index = stats.index_for("A")
+
+        stats.add(np.full(len(values), index), np.array(values), np.array(values))
+
+        expected = sum(values) / len(values)
+        assert stats.summary()["A"]["avg_distance_from_center"] == expected
@@ -5,10 +5,20 @@ Ensures R DatabaseClient parity.
 """
 
 import pytest
-from datetime import datetime
+from contextlib import nullcontext
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
 from unittest.mock import Mock, patch
 
-from pewstats_collectors.core.database_manager import DatabaseManager, DatabaseError
+from pewstats_collectors.core.database_manager import (
+    ENHANCED_STATS_COLUMNS,
+    FIGHT_COLUMNS,
+    FIGHT_PARTICIPANT_COLUMNS,
+    LANDING_COLUMNS,
+    DatabaseManager,
+    DatabaseError,
+    _copy_converter,
+)
 
 
 @pytest.fixture
@@ -459,6 +469,384 @@ class TestMatchSummaryManagement:
         assert "match_id VARCHAR(255)" in execute_sql
         assert "UNIQUE(match_id, participant_id)" in execute_sql
 
+    def test_update_enhanced_stats_single_statement(self, db_manager):
+        """Test updating all players' enhanced stats with one UPDATE ... FROM VALUES."""
+        db, cursor = db_manager
+        cursor.rowcount = 2
+
+        result = db.update_match_summaries_enhanced_stats(
+            "match123",
+            {"PlayerOne": {"heals_used": 3, "damage_received": 41.5}, "PlayerTwo": {}},
+        )
+
+        assert result == 2
+        cursor.execute.assert_called_once()
+        query, params = cursor.execute.call_args[0]
+        query = query.as_string(None)
+        assert "FROM (VALUES" in query
+        # Missing stats keep the current value
+        assert '"heals_used" = COALESCE(v."heals_used", ms."heals_used")' in query
+        assert '%s::integer' in query
+
+        width = len(ENHANCED_STATS_COLUMNS) + 1
+        assert params[-1] == "match123"
+        first, second = params[:width], params[width : 2 * width]
+        assert first[0] == "PlayerOne"
+        assert first[1] == 3
+        assert first[7] == 41.5
+        assert second == ["PlayerTwo"] + [None] * len(ENHANCED_STATS_COLUMNS)
+
+    def test_update_enhanced_stats_empty(self, db_manager):
+        """Test updating enhanced stats without players."""
+        db, cursor = db_manager
+
+        assert db.update_match_summaries_enhanced_stats("match123", {}) == 0
+        assert not cursor.execute.called
+
+
+class TestCopyBulkLoad:
+    """Test binary COPY bulk loading."""
+
+    CATALOG = [
+        {"attname": "match_id", "atttypid": 1043, "typname": "varchar"},
+        {"attname": "damage", "atttypid": 1700, "typname": "numeric"},
+        {"attname": "event_timestamp", "atttypid": 1114, "typname": "timestamp"},
+        {"attname": "positions", "atttypid": 3802, "typname": "jsonb"},
+    ]
+    COLUMNS = ("match_id", "damage", "event_timestamp", "positions")
+
+    def _copy(self, cursor):
+        copy = Mock()
+        copy.__enter__ = Mock(return_value=copy)
+        copy.__exit__ = Mock(return_value=False)
+        cursor.copy = Mock(return_value=copy)
+        cursor.fetchall.return_value = self.CATALOG
+        cursor.rowcount = 1
+        return copy
+
+    def test_copy_rows_converts_values(self, db_manager):
+        """Should copy rows in binary format, converting values for their column types"""
+        db, cursor = db_manager
+        copy = self._copy(cursor)
+
+        count = db.copy_rows(
+            "player_damage_events",
+            self.COLUMNS,
+            [("m1", 12.5, "2024-01-15T14:30:45.123Z", '[{"x": 1}]')],
+        )
+
+        assert count == 1
+        statement = cursor.copy.call_args[0][0].as_string(None)
+        assert statement == (
+            'COPY "player_damage_events" ("match_id", "damage", "event_timestamp", "positions") '
+            "FROM STDIN (FORMAT BINARY)"
+        )
+        copy.set_types.assert_called_once_with([1043, 1700, 1114, 3802])
+        match_id, damage, timestamp, positions = copy.write_row.call_args[0][0]
+        assert match_id == "m1"
+        assert damage == Decimal("12.5")
+        assert timestamp == datetime(2024, 1, 15, 14, 30, 45, 123000)
+        assert positions.obj == '[{"x": 1}]' and positions.dumps(positions.obj) == '[{"x": 1}]'
+
+    def test_copy_rows_converts_offset_timestamps_to_utc(self, db_manager):
+        """Should store timestamps with a non-UTC offset as UTC in timestamp columns"""
+        db, cursor = db_manager
+        copy = self._copy(cursor)
+
+        db.copy_rows(
+            "player_damage_events",
+            self.COLUMNS,
+            [("m1", 12.5, "2024-01-15T16:30:45+02:00", "[]")],
+        )
+
+        assert copy.write_row.call_args[0][0][2] == datetime(2024, 1, 15, 14, 30, 45)
+
+    def test_copy_rows_caches_column_types(self, db_manager):
+        """Should look up a table's column types once"""
+        db, cursor = db_manager
+        self._copy(cursor)
+
+        db.copy_rows("player_damage_events", self.COLUMNS[:1], [("m1",)])
+        db.copy_rows("player_damage_events", self.COLUMNS[:1], [("m2",)])
+
+        assert cursor.execute.call_count == 1
+
+    def test_copy_rows_merges_through_staging_table(self, db_manager):
+        """Should copy into a staging table and merge with the conflict clause"""
+        db, cursor = db_manager
+        copy = self._copy(cursor)
+
+        db.copy_rows(
+            "player_damage_events",
+            self.COLUMNS[:1],
+            [("m1",)],
+            on_conflict="ON CONFLICT DO NOTHING",
+        )
+
+        statements = [call[0][0] for call in cursor.execute.call_args_list[1:]]
+        statements = [s.as_string(None) for s in statements]
+        assert statements[0].startswith('CREATE TEMP TABLE "_staging_player_damage_events"')
+        assert statements[1] == (
+            'INSERT INTO "player_damage_events" ("match_id") SELECT "match_id" '
+            'FROM "_staging_player_damage_events" ON CONFLICT DO NOTHING'
+        )
+        assert statements[2] == 'DROP TABLE "_staging_player_damage_events"'
+        assert '"_staging_player_damage_events"' in cursor.copy.call_args[0][0].as_string(None)
+        copy.write_row.assert_called_once_with(["m1"])
+
+    def test_insert_uses_copy_when_enabled(self, db_manager):
+        """Should route bulk inserts through COPY only when enabled"""
+        db, cursor = db_manager
+        landing = {column: None for column in LANDING_COLUMNS}
+
+        with patch.object(db, "copy_rows", return_value=1) as copy_rows:
+            db.insert_landings([landing])
+            copy_rows.assert_not_called()
+
+            db.use_copy = True
+            assert db.insert_landings([landing]) == 1
+
+        table, columns, rows = copy_rows.call_args[0]
+        assert table == "landings"
+        assert columns == LANDING_COLUMNS
+        assert rows == [(None,) * len(LANDING_COLUMNS)]
+
+
+class TestCopyConverters:
+    """Test that COPY converters store what the server's cast of executemany stores."""
+
+    @pytest.mark.parametrize(
+        "type_name, value, expected",
+        [
+            # '2024-01-15T14:30:45.123Z'::timestamp
+            ("timestamp", "2024-01-15T14:30:45.123Z", datetime(2024, 1, 15, 14, 30, 45, 123000)),
+            # '2024-01-15T16:30:45+02:00'::timestamptz
+            (
+                "timestamptz",
+                "2024-01-15T16:30:45+02:00",
+                datetime(2024, 1, 15, 14, 30, 45, tzinfo=timezone.utc),
+            ),
+            # '2024-01-15'::date
+            ("date", "2024-01-15", date(2024, 1, 15)),
+            # 0.1::float8::numeric, 12.5::float8::numeric
+            ("numeric", 0.1, Decimal("0.1")),
+            ("numeric", 12.5, Decimal("12.5")),
+            # 87.6::float8::int4, 86.5::float8::int4, 87.5::float8::int4 (half to even)
+            ("int4", 87.6, 88),
+            ("int2", 86.5, 86),
+            ("int8", 87.5, 88),
+            ("int4", -2.5, -2),
+            ("int4", 7, 7),
+            # 1::int::bool, 0::int::bool
+            ("bool", 1, True),
+            ("bool", 0, False),
+            # true::text, 12::text, 1.5::float8::text
+            ("text", True, "true"),
+            ("varchar", False, "false"),
+            ("text", 12, "12"),
+            ("bpchar", 1.5, "1.5"),
+            ("text", "as is", "as is"),
+        ],
+    )
+    def test_matches_server_cast(self, type_name, value, expected):
+        """Should convert values as the server casts them"""
+        converted = _copy_converter(type_name)(value)
+
+        assert converted == expected
+        assert type(converted) is type(expected)
+        if isinstance(expected, datetime) and expected.tzinfo is not None:
+            assert converted.utcoffset() == timedelta(hours=2)
+
+    def test_json_converters(self):
+        """Should pass JSON text through and serialize other values"""
+        text = _copy_converter("jsonb")('{"a": 1}')
+        value = _copy_converter("json")({"a": 1})
+
+        assert text.dumps(text.obj) == '{"a": 1}'
+        assert value.obj == {"a": 1}
+
+    def test_other_types_pass_through(self):
+        """Should not convert values of other column types"""
+        assert _copy_converter("float8") is None
+
+
+# Session time zone of a server not running in UTC
+CET = timezone(timedelta(hours=1))
+
+
+class TestFightInsertion:
+    """Test set-based fight and participant insertion."""
+
+    def _fight(self, minute, participants):
+        fight = {column: None for column in FIGHT_COLUMNS}
+        fight.update(
+            match_id="m1",
+            fight_start_time=datetime(2024, 1, 1, 12, minute, tzinfo=timezone.utc),
+            fight_end_time=datetime(2024, 1, 1, 12, minute, 30, tzinfo=timezone.utc),
+            participants=[
+                {**{column: None for column in FIGHT_PARTICIPANT_COLUMNS}, "player_name": name}
+                for name in participants
+            ],
+        )
+        return fight
+
+    def _returned(self, fight_id, minute):
+        return {
+            "id": fight_id,
+            "match_id": "m1",
+            # Read back as timestamptz in the session time zone
+            "fight_start_time": datetime(2024, 1, 1, 13, minute, tzinfo=CET),
+            "fight_end_time": datetime(2024, 1, 1, 13, minute, 30, tzinfo=CET),
+        }
+
+    def test_one_statement_per_table(self, db_manager):
+        """Should insert all fights and all participants with one statement each"""
+        db, cursor = db_manager
+        cursor.rowcount = 2
+        cursor.fetchall.return_value = [self._returned(11, 1), self._returned(12, 2)]
+        fights = [self._fight(1, ["a", "b"]), self._fight(2, ["c"])]
+
+        assert db.insert_fights_with_participants(fights) == (2, 2)
+
+        assert cursor.execute.call_count == 2
+        fight_query, fight_params = cursor.execute.call_args_list[0][0]
+        assert "fight_start_time::timestamptz" in fight_query.as_string(None)
+        assert len(fight_params) == 2 * len(FIGHT_COLUMNS)
+        # Times are sent time zone aware for the server to convert
+        assert fight_params[1] == datetime(2024, 1, 1, 12, 1, tzinfo=timezone.utc)
+        assert fight_params[1].tzinfo is not None
+
+        participant_query, participant_params = cursor.execute.call_args_list[1][0]
+        assert '"fight_participants"' in participant_query.as_string(None)
+        width = len(FIGHT_PARTICIPANT_COLUMNS)
+        rows = [participant_params[i : i + width] for i in range(0, len(participant_params), width)]
+        assert [(row[0], row[2]) for row in rows] == [(11, "a"), (11, "b"), (12, "c")]
+        # Input fights keep their participants
+        assert len(fights[0]["participants"]) == 2
+
+    def test_links_existing_fights(self, db_manager):
+        """Should look up existing fights once and still link their participants"""
+        db, cursor = db_manager
+        cursor.rowcount = 1
+        cursor.fetchall.side_effect = [
+            [self._returned(12, 2)],
+            [self._returned(5, 1), self._returned(12, 2)],
+        ]
+        fights = [self._fight(1, ["a"]), self._fight(2, ["c"])]
+
+        db.insert_fights_with_participants(fights)
+
+        assert cursor.execute.call_count == 3
+        lookup = cursor.execute.call_args_list[1][0][0]
+        assert "fight_end_time::timestamptz AS fight_end_time" in lookup
+        participant_params = cursor.execute.call_args_list[2][0][1]
+        width = len(FIGHT_PARTICIPANT_COLUMNS)
+        assert [participant_params[0], participant_params[width]] == [5, 12]
+
+    def test_missing_fight_id(self, db_manager):
+        """Should fail if a fight's ID cannot be found"""
+        db, cursor = db_manager
+        cursor.rowcount = 0
+        cursor.fetchall.return_value = []
+
+        with pytest.raises(DatabaseError):
+            db.insert_fights_with_participants([self._fight(1, ["a"])])
+
+
+class TestExecutePipeline:
+    """Test running independent statements together."""
+
+    STATEMENTS = [("UPDATE a SET x = 1 WHERE id = %s", (1,)), ("DELETE FROM b", None)]
+
+    def test_sequential_by_default(self, db_manager):
+        """Should run the statements on one connection with one commit"""
+        db, cursor = db_manager
+        conn = db._pool.getconn.return_value
+        cursor.rowcount = 3
+
+        assert db.execute_pipeline(self.STATEMENTS) == [3, 3]
+
+        conn.pipeline.assert_not_called()
+        assert cursor.execute.call_args_list[0][0] == self.STATEMENTS[0]
+        assert cursor.execute.call_args_list[0][1] == {"prepare": None}
+        conn.commit.assert_called_once()
+        db._pool.getconn.assert_called_once()
+
+    def test_pipeline_mode(self, db_manager):
+        """Should pipeline and prepare the statements when enabled"""
+        db, cursor = db_manager
+        conn = db._pool.getconn.return_value
+        conn.pipeline = Mock(return_value=nullcontext())
+        db.use_pipeline = True
+        db.prepare = True
+
+        with patch("psycopg.Pipeline.is_supported", return_value=True):
+            db.execute_pipeline(self.STATEMENTS)
+
+        conn.pipeline.assert_called_once()
+        assert all(call[1] == {"prepare": True} for call in cursor.execute.call_args_list)
+        assert cursor.close.call_count == 2
+        conn.commit.assert_called_once()
+
+    def test_prepare_follows_pipeline_option(self):
+        """Should prepare hot statements on first use only in pipeline mode"""
+        with patch("pewstats_collectors.core.database_manager.ConnectionPool"):
+            default = DatabaseManager(host="h", dbname="d", user="u", password="p")
+            pipelined = DatabaseManager(
+                host="h", dbname="d", user="u", password="p", use_pipeline=True
+            )
+
+        assert default.prepare is None
+        assert pipelined.prepare is True
+
+
+class TestTransaction:
+    """Test running several operations in one transaction."""
+
+    def test_single_connection_and_commit(self, db_manager):
+        """Should run every operation on one connection and commit once"""
+        db, cursor = db_manager
+        conn = db._pool.getconn.return_value
+        cursor.rowcount = 1
+
+        with db.transaction():
+            db.insert_landings([{"match_id": "m1"}])
+            db.update_match_processing_flags("m1", landings_processed=True)
+
+        db._pool.getconn.assert_called_once()
+        db._pool.putconn.assert_called_once_with(conn)
+        conn.commit.assert_called_once()
+
+    def test_rolls_back_on_error(self, db_manager):
+        """Should roll back everything and not commit if an operation fails"""
+        db, cursor = db_manager
+        conn = db._pool.getconn.return_value
+        cursor.rowcount = 1
+
+        with pytest.raises(DatabaseError):
+            with db.transaction():
+                db.insert_landings([{"match_id": "m1"}])
+                raise DatabaseError("Failed to insert fights")
+
+        conn.commit.assert_not_called()
+        conn.rollback.assert_called()
+
+        # Operations after the block commit on their own again
+        db.insert_landings([{"match_id": "m2"}])
+        conn.commit.assert_called_once()
+
+    def test_nested_transaction_joins_outer(self, db_manager):
+        """Should commit nested blocks with the outer transaction"""
+        db, cursor = db_manager
+        conn = db._pool.getconn.return_value
+
+        with db.transaction():
+            with db.transaction():
+                db.execute_query("UPDATE matches SET status = 'x'", fetch=False)
+            conn.commit.assert_not_called()
+
+        conn.commit.assert_called_once()
+
 
 # ============================================================================
 # Health Check Tests
@@ -0,0 +1,89 @@
+"""
+Unit tests for Telemetry Event Dispatcher
+"""
+
+import pytest
+
+from pewstats_collectors.processors.event_dispatcher import TelemetryEventDispatcher
+
+
+class TestTelemetryEventDispatcher:
+    """Test TelemetryEventDispatcher class"""
+
+    @pytest.fixture
+    def events(self):
+        """Interleaved telemetry events of several types"""
+        return [
+            {"_T": "LogPlayerPosition", "id": 0},
+            {"_T": "LogPlayerTakeDamage", "id": 1},
+            {"_T": "LogPlayerKillV2", "id": 2},
+            {"type": "LogPlayerTakeDamage", "id": 3},
+            {"_T": "LogPlayerPosition", "id": 4},
+            {"_T": "LogItemPickup", "id": 5},
+            {"data": "untyped", "id": 6},
+            {"_T": "LogPlayerKillV2", "id": 7},
+        ]
+
+    def test_groups_events_by_type(self, events):
+        """Should group events by type in a single pass"""
+        dispatcher = TelemetryEventDispatcher(events)
+
+        assert len(dispatcher) == 8
+        assert dispatcher.count("LogPlayerPosition") == 2
+        assert dispatcher.count("LogPlayerTakeDamage") == 2
+        assert dispatcher.count("LogVehicleRide") == 0
+
+    def test_select_single_type(self, events):
+        """Should return only events of the requested type"""
+        dispatcher = TelemetryEventDispatcher(events)
+
+        selected = dispatcher.select(("LogPlayerKillV2",))
+
+        assert [e["id"] for e in selected] == [2, 7]
+
+    def test_select_multiple_types_preserves_order(self, events):
+        """Should merge several types back into original telemetry order"""
+        dispatcher = TelemetryEventDispatcher(events)
+
+        selected = dispatcher.select(
+            ("LogPlayerKillV2", "LogPlayerPosition", "LogPlayerTakeDamage")
+        )
+
+        assert [e["id"] for e in selected] == [0, 1, 2, 3, 4, 7]
+
+    def test_select_matches_full_scan(self, events):
+        """Selection should equal filtering the full list by type"""
+        dispatcher = TelemetryEventDispatcher(events)
+        wanted = {"LogPlayerPosition", "LogItemPickup"}
+
+        expected = [e for e in events if (e.get("_T") or e.get("type")) in wanted]
+
+        assert dispatcher.select(wanted) == expected
+
+    def test_select_unknown_type(self, events):
+        """Should return an empty list for types not in the telemetry"""
+        dispatcher = TelemetryEventDispatcher(events)
+
+        assert dispatcher.select(("LogVehicleRide",)) == []
+
+    def test_select_is_cached(self, events):
+        """Should reuse the same selection for the same set of types"""
+        dispatcher = TelemetryEventDispatcher(events)
+
+        first = dispatcher.select(("LogPlayerKillV2", "LogPlayerPosition"))
+        second = dispatcher.select(["LogPlayerPosition", "LogPlayerKillV2"])
+
+        assert first is second
+
+    def test_attaches_epoch_ms(self):
+        """Should attach epoch milliseconds parsed from _D to every event"""
+        events = [
+            {"_T": "LogPlayerPosition", "_D": "1970-01-01T00:00:01.500Z"},
+            {"_T": "LogPlayerPosition", "_D": "1970-01-01T00:00:01.500Z"},
+            {"_T": "LogPlayerKillV2", "_D": "invalid"},
+            {"_T": "LogMatchEnd"},
+        ]
+
+        TelemetryEventDispatcher(events)
+
+        assert [e["_ms"] for e in events] == [1500, 1500, None, None]
@@ -0,0 +1,107 @@
+"""
+Unit tests for Extractor Registry
+"""
+
+import pytest
+
+from pewstats_collectors.processors.extractor_registry import (
+    ExtractorRegistry,
+    TelemetryExtractor,
+)
+
+
+class TestExtractorRegistry:
+    """Test ExtractorRegistry class"""
+
+    @pytest.fixture
+    def registry(self):
+        """Registry with flagged and unflagged extractors"""
+        return ExtractorRegistry(
+            [
+                TelemetryExtractor(
+                    "landings",
+                    ("LogParachuteLanding",),
+                    "extract_landings",
+                    outputs=("landings",),
+                    flag_column="landings_processed",
+                ),
+                TelemetryExtractor(
+                    "kills",
+                    ("LogPlayerKillV2",),
+                    "extract_kill_positions",
+                    outputs=("kill_positions",),
+                    flag_column="kills_processed",
+                ),
+                TelemetryExtractor(
+                    "circle_tracking",
+                    ("LogGameStatePeriodic", "LogPlayerPosition"),
+                    "extract_circle_tracking",
+                    outputs=("circle_aggregate_stats", "circle_detailed_positions"),
+                ),
+            ]
+        )
+
+    def test_registration_order(self, registry):
+        """Should keep extractors in registration order"""
+        assert registry.names == ["landings", "kills", "circle_tracking"]
+        assert len(registry) == 3
+        assert "kills" in registry
+
+    def test_duplicate_name(self, registry):
+        """Should reject extractors registered twice"""
+        with pytest.raises(ValueError, match="already registered"):
+            registry.register(TelemetryExtractor("kills", (), "extract_other", outputs=("other",)))
+
+    def test_duplicate_output(self, registry):
+        """Should reject extractors writing another extractor's output"""
+        with pytest.raises(ValueError, match="outputs already registered"):
+            registry.register(
+                TelemetryExtractor("other", (), "extract_other", outputs=("landings",))
+            )
+
+    def test_requires_outputs(self):
+        """Should reject extractors without outputs"""
+        with pytest.raises(ValueError):
+            TelemetryExtractor("other", (), "extract_other", outputs=())
+
+    def test_select_keeps_run_order(self, registry):
+        """Should select by name in registry order"""
+        selected = registry.select(["circle_tracking", "landings"])
+
+        assert [extractor.name for extractor in selected] == ["landings", "circle_tracking"]
+
+    def test_select_unknown(self, registry):
+        """Should reject unknown extractor names"""
+        with pytest.raises(ValueError, match="Unknown extractors: fights"):
+            registry.select(["landings", "fights"])
+
+    def test_event_types(self, registry):
+        """Should union the selected extractors' event types"""
+        assert registry.event_types(registry.select(["landings", "kills"])) == {
+            "LogParachuteLanding",
+            "LogPlayerKillV2",
+        }
+        assert len(registry.event_types()) == 4
+
+    def test_pending_nothing_processed(self, registry):
+        """Should run every extractor for a new match"""
+        assert registry.pending({}) == registry.select()
+
+    def test_pending_skips_processed(self, registry):
+        """Should skip flagged extractors that are processed"""
+        pending = registry.pending({"landings_processed": True})
+
+        assert [extractor.name for extractor in pending] == ["kills", "circle_tracking"]
+
+    def test_pending_fully_processed(self, registry):
+        """Should run nothing once every flagged extractor is processed"""
+        status = {"landings_processed": True, "kills_processed": True}
+
+        assert registry.pending(status) == []
+
+    def test_pending_unflagged_selection(self, registry):
+        """Should run explicitly selected extractors without flags"""
+        status = {"landings_processed": True, "kills_processed": True}
+        selected = registry.select(["circle_tracking"])
+
+        assert registry.pending(status, selected) == selected
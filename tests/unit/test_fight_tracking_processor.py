@@ -0,0 +1,156 @@
+"""
+Unit tests for Fight Tracking Processor
+"""
+
+import pytest
+
+from pewstats_collectors.processors.fight_tracking_processor import FightTrackingProcessor
+
+
+def _player(name, team_id, x=0):
+    return {
+        "name": name,
+        "teamId": team_id,
+        "accountId": f"account.{name}",
+        "location": {"x": x, "y": 0, "z": 0},
+    }
+
+
+def _ts(seconds):
+    return f"2024-01-01T00:{seconds // 60:02d}:{seconds % 60:02d}.000Z"
+
+
+def _damage(seconds, attacker, victim, damage=30):
+    return {
+        "_T": "LogPlayerTakeDamage",
+        "_D": _ts(seconds),
+        "attacker": attacker,
+        "victim": victim,
+        "damage": damage,
+    }
+
+
+def _knock(seconds, attacker, victim):
+    return {"_T": "LogPlayerMakeGroggy", "_D": _ts(seconds), "attacker": attacker, "victim": victim}
+
+
+def _kill(seconds, finisher, victim):
+    return {"_T": "LogPlayerKillV2", "_D": _ts(seconds), "finisher": finisher, "victim": victim}
+
+
+class TestFightTrackingProcessor:
+    """Test FightTrackingProcessor class"""
+
+    @pytest.fixture
+    def processor(self):
+        """Create processor instance"""
+        return FightTrackingProcessor()
+
+    @pytest.fixture
+    def events(self):
+        """Two separate team fights more than ENGAGEMENT_WINDOW apart"""
+        a1, a2 = _player("A1", 1), _player("A2", 1, 200)
+        b1, b2 = _player("B1", 2, 1000), _player("B2", 2, 1200)
+        c1 = _player("C1", 3, 50000)
+        d1 = _player("D1", 4, 51000)
+
+        return [
+            {"_T": "LogMatchStart", "_D": _ts(0)},
+            _damage(10, a1, b1),
+            _damage(12, b1, a1),
+            _knock(15, a1, b1),
+            {"_T": "LogPlayerPosition", "_D": _ts(16), "character": a1},
+            _damage(18, b2, a2),
+            _kill(20, a2, b1),
+            _knock(25, a2, b2),
+            _kill(28, a1, b2),
+            _damage(300, c1, d1, damage=100),
+            _damage(302, d1, c1, damage=100),
+        ]
+
+    def test_process_match_fights(self, processor, events):
+        """Should detect a decisive fight and skip insufficient engagements"""
+        fights = processor.process_match_fights(events, "match-123", {"map_name": "Baltic_Main"})
+
+        assert len(fights) == 2
+
+        fight = fights[0]
+        assert fight["team_ids"] == [1, 2]
+        assert fight["total_knocks"] == 2
+        assert fight["total_kills"] == 2
+        assert fight["duration_seconds"] == 18.0
+        assert fight["winning_team_id"] == 1
+        assert fight["loser_team_id"] == 2
+        assert fight["fight_start_time"].isoformat() == "2024-01-01T00:00:10+00:00"
+        assert {p["player_name"] for p in fight["participants"]} == {"A1", "A2", "B1", "B2"}
+
+        assert fights[1]["fight_reason"] == "Sustained reciprocal damage (200 total)"
+
+    def test_combat_timeline_slices_window(self, processor, events):
+        """Should return combat events inside the window in telemetry order"""
+        timeline = processor._build_combat_timeline(events)
+
+        start_ms = timeline["times"][0] + 5000  # 00:15
+        end_ms = start_ms + 10000  # 00:25
+        window = processor._slice_combat_timeline(timeline, start_ms, end_ms)
+
+        assert timeline["in_order"] is True
+        assert [e["_D"] for e in window] == [_ts(15), _ts(18), _ts(20), _ts(25)]
+
+    def test_combat_timeline_out_of_order(self, processor, events):
+        """Should sort out-of-order telemetry but keep original order in slices"""
+        events[1], events[3] = events[3], events[1]
+
+        timeline = processor._build_combat_timeline(events)
+        window = processor._slice_combat_timeline(
+            timeline, timeline["times"][0], timeline["times"][2]
+        )
+
+        assert timeline["in_order"] is False
+        assert timeline["times"] == sorted(timeline["times"])
+        assert [e["_T"] for e in window] == [
+            "LogPlayerMakeGroggy",
+            "LogPlayerTakeDamage",
+            "LogPlayerTakeDamage",
+        ]
+
+    def test_third_party_within_distance_joins_engagement(self, processor):
+        """Should add a new team within MAX_ENGAGEMENT_DISTANCE of the fight center"""
+        a, b = _player("A1", 1, 0), _player("B1", 2, 1000)
+        near, far = _player("C1", 3, 5000), _player("D1", 4, 900000)
+
+        engagements = processor._detect_combat_engagements(
+            [
+                _damage(10, a, b),
+                _damage(12, near, b),
+                _damage(14, far, a),
+                _damage(16, b, near),
+            ],
+            "match-123",
+        )
+
+        assert len(engagements) == 2
+        assert sorted(engagements[0]["teams"]) == [1, 2, 3]
+        assert len(engagements[0]["events"]) == 3
+        assert sorted(engagements[1]["teams"]) == [1, 4]
+
+    def test_engagement_window_splits_clusters(self, processor):
+        """Should start a new engagement after ENGAGEMENT_WINDOW without events"""
+        a, b = _player("A1", 1), _player("B1", 2)
+
+        engagements = processor._detect_combat_engagements(
+            [_damage(0, a, b), _damage(40, b, a), _damage(90, a, b)], "match-123"
+        )
+
+        assert [len(e["events"]) for e in engagements] == [2, 1]
+        assert engagements[0]["duration"] == 40.0
+
+    def test_max_fight_duration_splits_clusters(self, processor):
+        """Should close an engagement after MAX_FIGHT_DURATION"""
+        a, b = _player("A1", 1), _player("B1", 2)
+
+        engagements = processor._detect_combat_engagements(
+            [_damage(seconds, a, b) for seconds in range(0, 300, 30)], "match-123"
+        )
+
+        assert [len(e["events"]) for e in engagements] == [9, 1]
@@ -0,0 +1,53 @@
+"""
+Unit tests for Knock Index
+"""
+
+import pytest
+
+from pewstats_collectors.processors.knock_index import KnockIndex
+
+
+class TestKnockIndex:
+    """Test KnockIndex class"""
+
+    @pytest.fixture
+    def events(self):
+        """Knocks with kill, revive and no outcome plus an instant kill"""
+        return [
+            {"_T": "LogPlayerMakeGroggy", "dBNOId": 1, "victim": {"name": "A"}},
+            {"_T": "LogPlayerMakeGroggy", "dBNOId": 2, "victim": {"name": "B"}},
+            {"_T": "LogPlayerMakeGroggy", "dBNOId": 3, "victim": {"name": "C"}},
+            {"_T": "LogPlayerPosition", "character": {"name": "A"}},
+            {"_T": "LogPlayerKillV2", "dBNOId": 1, "victim": {"name": "A"}, "id": "first"},
+            {"_T": "LogPlayerKillV2", "dBNOId": 1, "victim": {"name": "A"}, "id": "second"},
+            {"_T": "LogPlayerRevive", "dBNOId": 2, "victim": {"name": "B"}},
+            {"_T": "LogPlayerKillV2", "dBNOId": -1, "victim": {"name": "D"}},
+        ]
+
+    def test_indexes_by_dbno_id(self, events):
+        """Should key knocks, kills and revives by dBNOId"""
+        index = KnockIndex(events)
+
+        assert list(index.knocks) == [1, 2, 3]
+        assert index.kill_for(1)["id"] == "first"
+        assert index.kill_for(2) is None
+        assert index.revive_for(2) is not None
+        assert index.revive_for(3) is None
+
+    def test_indexes_by_victim(self, events):
+        """Should expose events by victim name"""
+        index = KnockIndex(events)
+
+        assert len(index.knocks_by_victim["A"]) == 1
+        assert len(index.kills_by_victim["A"]) == 2
+        assert len(index.revives_by_victim["B"]) == 1
+        assert "D" in index.kills_by_victim
+
+    def test_instant_kills(self, events):
+        """Should flag kills without a knock phase"""
+        index = KnockIndex(events)
+
+        instant = [e for e in index.kill_events if index.is_instant_kill(e)]
+
+        assert len(index.kill_events) == 3
+        assert [e["victim"]["name"] for e in instant] == ["D"]
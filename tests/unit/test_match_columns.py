@@ -0,0 +1,238 @@
+"""
+Unit tests for Match Columns
+"""
+
+import numpy as np
+import pytest
+
+from pewstats_collectors.core.telemetry_records import record_from_dict
+from pewstats_collectors.processors.match_columns import (
+    MISSING,
+    InternTable,
+    MatchColumns,
+    fill_nan,
+    first_seen_order,
+    missing_to_none,
+    nan_to_none,
+)
+
+
+def _character(name, team_id, x=100.0, y=200.0, z=0.0, health=100.0):
+    return {
+        "name": name,
+        "teamId": team_id,
+        "health": health,
+        "location": {"x": x, "y": y, "z": z},
+    }
+
+
+@pytest.fixture
+def events():
+    """Mixed telemetry with every columnar stream"""
+    return [
+        {"_T": "LogMatchStart", "_D": "2024-01-01T12:00:00.000Z"},
+        {
+            "_T": "LogPlayerTakeDamage",
+            "_D": "2024-01-01T12:00:01.000Z",
+            "attacker": _character("Alice", 1),
+            "victim": _character("Bob", 2, health=80.0),
+            "damage": 20,
+            "damageTypeCategory": "Damage_Gun",
+            "damageCauserName": "WeapAK47_C",
+            "common": {"isGame": 1.0},
+        },
+        {
+            "_T": "LogPlayerTakeDamage",
+            "_D": "2024-01-01T12:00:02.000Z",
+            "attacker": None,
+            "victim": _character("Alice", 1),
+            "damage": 1.5,
+            "damageTypeCategory": "Damage_BlueZone",
+        },
+        {
+            "_T": "LogPlayerMakeGroggy",
+            "_D": "2024-01-01T12:00:03.000Z",
+            "attacker": _character("Alice", 1),
+            "victim": _character("Bob", 2),
+            "damageCauserName": "WeapAK47_C",
+            "dBNOId": 7,
+        },
+        {
+            "_T": "LogPlayerKillV2",
+            "_D": "2024-01-01T12:00:04.000Z",
+            "killer": _character("Carol", 3),
+            "finisher": _character("Carol", 3),
+            "victim": _character("Bob", 2),
+            "damageCauserName": "WeapM416_C",
+            "dBNOId": 0,
+        },
+        {
+            "_T": "LogPlayerPosition",
+            "_D": "2024-01-01T12:00:05.000Z",
+            "character": _character("Dave", 4, x=1.0, y=2.0),
+            "elapsedTime": 30,
+        },
+        {
+            "_T": "LogGameStatePeriodic",
+            "_D": "2024-01-01T12:00:06.000Z",
+            "gameState": {
+                "elapsedTime": 60,
+                "safetyZonePosition": {"x": 500.0, "y": 600.0, "z": 0},
+                "safetyZoneRadius": 1000.0,
+            },
+        },
+    ]
+
+
+class TestInternTable:
+    """Test InternTable class"""
+
+    def test_intern_first_seen_order(self):
+        """Should assign dense ids in first-seen order and skip empty values"""
+        table = InternTable()
+
+        assert [table.intern(v) for v in ["b", "a", "b", "", None]] == [0, 1, 0, MISSING, MISSING]
+        assert table.values == ["b", "a"]
+        assert len(table) == 2
+
+    def test_decode(self):
+        """Should map MISSING back to None"""
+        table = InternTable()
+        table.intern("a")
+
+        assert table.decode(np.array([0, MISSING])) == ["a", None]
+
+    def test_mask_maps_missing_to_false(self):
+        """Mask should be indexable by id arrays containing MISSING"""
+        table = InternTable()
+        table.intern("a")
+        table.intern("b")
+
+        mask = table.mask(["b", "unknown"])
+
+        assert mask[np.array([0, 1, MISSING])].tolist() == [False, True, False]
+
+    def test_map(self):
+        """Should apply a function once per distinct value"""
+        table = InternTable()
+        for value in ["a", "bb", "a"]:
+            table.intern(value)
+
+        assert table.map(len) == [1, 2]
+
+
+class TestMatchColumns:
+    """Test MatchColumns class"""
+
+    def test_damage_stream(self, events):
+        """Should store damage events as interned ids, teams and numbers"""
+        columns = MatchColumns(events)
+        damage = columns.damage
+
+        assert len(damage) == 2
+        assert damage["seq"].tolist() == [1, 2]
+        assert columns.players.decode(damage["attacker"]) == ["Alice", None]
+        assert columns.players.decode(damage["victim"]) == ["Bob", "Alice"]
+        assert damage["attacker_team"].tolist() == [1, MISSING]
+        assert damage["victim_health"].tolist() == [80.0, 100.0]
+        assert damage["damage"].tolist() == [20.0, 1.5]
+        assert columns.damage_types.decode(damage["damage_type"]) == [
+            "Damage_Gun",
+            "Damage_BlueZone",
+        ]
+        assert columns.weapons.decode(damage["weapon"]) == ["WeapAK47_C", None]
+        assert nan_to_none(damage["is_game"]) == [1.0, None]
+        assert np.isnan(damage["attacker_x"][1])
+
+    def test_knock_and_kill_streams(self, events):
+        """Should store dBNO ids with zero meaning no knock"""
+        columns = MatchColumns(events)
+
+        assert columns.knocks["dbno"].tolist() == [7]
+        assert columns.knocks["has_dbno"].tolist() == [True]
+        assert columns.kills["has_dbno"].tolist() == [False]
+        assert columns.players.decode(columns.kills["finisher"]) == ["Carol"]
+        assert columns.weapons.decode(columns.kills["weapon"]) == ["WeapM416_C"]
+
+    def test_negative_dbno_id_is_a_knock(self):
+        """Should only treat zero and missing dBNO ids as no knock"""
+        columns = MatchColumns(
+            [
+                {"_T": "LogPlayerMakeGroggy", "dBNOId": -1},
+                {"_T": "LogPlayerMakeGroggy", "dBNOId": None},
+                {"_T": "LogPlayerMakeGroggy"},
+            ]
+        )
+
+        assert columns.knocks["dbno"].tolist() == [-1, 0, 0]
+        assert columns.knocks["has_dbno"].tolist() == [True, False, False]
+
+    def test_event_times(self, events):
+        """Should store event times as epoch milliseconds"""
+        columns = MatchColumns(events)
+
+        assert columns.knocks["time"][0] - columns.damage["time"][0] == 2000
+
+    def test_position_and_game_state_streams(self, events):
+        """Should store positions and circle states"""
+        columns = MatchColumns(events)
+
+        assert columns.players.decode(columns.positions["character"]) == ["Dave"]
+        assert columns.positions["character_x"].tolist() == [1.0]
+        assert columns.positions["elapsed"].tolist() == [30.0]
+        assert columns.game_states["radius"].tolist() == [1000.0]
+        assert columns.game_states["center_y"].tolist() == [600.0]
+
+    def test_event_count(self, events):
+        """Should count all events, including types without a stream"""
+        assert MatchColumns(events).event_count == len(events)
+
+    def test_records_match_dicts(self, events):
+        """Typed records should give the same columns as dicts"""
+        from_dicts = MatchColumns(events)
+        from_records = MatchColumns([record_from_dict(event) for event in events])
+
+        assert from_records.players.values == from_dicts.players.values
+        for name in from_dicts.damage.columns:
+            np.testing.assert_array_equal(from_records.damage[name], from_dicts.damage[name])
+
+    def test_empty(self):
+        """Should build empty streams without events"""
+        columns = MatchColumns([])
+
+        assert len(columns.damage) == 0
+        assert columns.damage["attacker"].dtype == np.int64
+        assert "dbno" in columns.kills
+
+    def test_of_reuses_columns(self, events):
+        """Should return existing columns unchanged"""
+        columns = MatchColumns(events)
+
+        assert MatchColumns.of(columns) is columns
+        assert isinstance(MatchColumns.of(events), MatchColumns)
+
+
+class TestHelpers:
+    """Test column helper functions"""
+
+    def test_first_seen_order(self):
+        """Should group keys in order of first occurrence"""
+        unique, groups = first_seen_order(np.array([5, 3, 5, 1, 3]))
+
+        assert unique.tolist() == [5, 3, 1]
+        assert groups.tolist() == [0, 1, 0, 2, 1]
+
+    def test_first_seen_order_empty(self):
+        """Should handle no rows"""
+        unique, groups = first_seen_order(np.array([], dtype=np.int64))
+
+        assert len(unique) == 0
+        assert len(groups) == 0
+
+    def test_fill_nan_keeps_infinity(self):
+        """Should only replace NaN"""
+        assert fill_nan(np.array([np.nan, np.inf, 2.0])).tolist() == [0.0, np.inf, 2.0]
+
+    def test_missing_to_none(self):
+        """Should convert MISSING to None"""
+        assert missing_to_none(np.array([3, MISSING])) == [3, None]
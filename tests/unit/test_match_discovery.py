@@ -0,0 +1,66 @@
+"""
+Unit tests for Match Discovery Service
+"""
+
+import pytest
+from unittest.mock import Mock
+from pewstats_collectors.services.match_discovery import MatchDiscoveryService
+
+
+class TestMatchDiscoveryService:
+    """Test MatchDiscoveryService class"""
+
+    @pytest.fixture
+    def calls(self):
+        """Records database inserts and publishes in the order they happen"""
+        return Mock()
+
+    @pytest.fixture
+    def service(self, calls):
+        """Create service with mocked dependencies"""
+        pubg_client = Mock()
+        pubg_client.get_match.side_effect = lambda match_id: {"id": match_id}
+        pubg_client.extract_match_metadata.side_effect = lambda data: {
+            "match_id": data["id"],
+            "map_name": "Baltic_Main",
+            "game_mode": "squad-fpp",
+            "game_type": "official",
+        }
+        calls.insert_match.return_value = True
+        calls.publish_many.side_effect = lambda type, step, messages: [True] * len(messages)
+
+        return MatchDiscoveryService(
+            database=Mock(insert_match=calls.insert_match),
+            pubg_client=pubg_client,
+            rabbitmq_publisher=Mock(publish_many=calls.publish_many),
+            start_metrics=False,
+            queue_batch_size=2,
+        )
+
+    def test_process_matches_queues_in_batches(self, service, calls):
+        """Should publish stored matches in batches while the loop runs"""
+        summary = service._process_matches([f"match-{i}" for i in range(5)])
+
+        assert summary["processed"] == 5
+        assert summary["queued"] == 5
+        batches = [
+            [message["match_id"] for message in call.kwargs["messages"]]
+            for call in calls.publish_many.call_args_list
+        ]
+        assert batches == [["match-0", "match-1"], ["match-2", "match-3"], ["match-4"]]
+        # The first batch is queued before the third match is stored
+        assert [call[0] for call in calls.mock_calls[:4]] == [
+            "insert_match",
+            "insert_match",
+            "publish_many",
+            "insert_match",
+        ]
+
+    def test_process_matches_counts_failed_publishes(self, service, calls):
+        """Should count only confirmed matches as queued"""
+        calls.publish_many.side_effect = lambda type, step, messages: [False] * len(messages)
+
+        summary = service._process_matches(["match-0", "match-1", "match-2"])
+
+        assert summary["processed"] == 3
+        assert summary["queued"] == 0
@@ -516,3 +516,99 @@ class TestMatchSummaryWorker:
         assert result["success"] is False
         assert "API error" in result["error"]
         assert worker.error_count == 1
+
+    def _match_data(self, match_id):
+        """Match with one participant and a telemetry asset"""
+        return {
+            "data": {
+                "id": match_id,
+                "attributes": {"mapName": "Baltic_Main", "createdAt": "2024-01-15T14:30:45Z"},
+                "relationships": {"assets": {"data": [{"id": "asset-1"}]}},
+            },
+            "included": [
+                {
+                    "type": "asset",
+                    "id": "asset-1",
+                    "attributes": {"URL": f"https://telemetry.pubg.com/{match_id}.json"},
+                },
+                {
+                    "type": "participant",
+                    "id": "p1",
+                    "attributes": {"stats": {"playerId": "a1", "name": "P1"}},
+                },
+                {
+                    "type": "roster",
+                    "attributes": {"stats": {"teamId": 1, "rank": 1}, "won": "true"},
+                    "relationships": {"participants": {"data": [{"id": "p1"}]}},
+                },
+            ],
+        }
+
+    def test_process_batch_inserts_once(
+        self, worker, mock_pubg_client, mock_database_manager, mock_rabbitmq_publisher
+    ):
+        """Should insert the summaries of all matches in one call"""
+        mock_database_manager.execute_query.return_value = [{"count": 0}]
+        mock_database_manager.insert_match_summaries.return_value = 2
+        mock_pubg_client.get_match.side_effect = self._match_data
+        mock_rabbitmq_publisher.publish_message.return_value = True
+
+        results = worker.process_batch([{"match_id": "match-1"}, {"match_id": "match-2"}])
+
+        assert results == [{"success": True}, {"success": True}]
+        mock_database_manager.insert_match_summaries.assert_called_once()
+        summaries = mock_database_manager.insert_match_summaries.call_args[0][0]
+        assert [summary["match_id"] for summary in summaries] == ["match-1", "match-2"]
+        assert mock_rabbitmq_publisher.publish_message.call_count == 2
+        assert worker.processed_count == 2
+
+    def test_process_batch_isolates_failed_matches(
+        self, worker, mock_pubg_client, mock_database_manager, mock_rabbitmq_publisher
+    ):
+        """Should fail only the matches that could not be fetched"""
+        mock_database_manager.execute_query.return_value = [{"count": 0}]
+        mock_database_manager.insert_match_summaries.return_value = 1
+        mock_pubg_client.get_match.side_effect = [Exception("API error"), self._match_data("m2")]
+        mock_rabbitmq_publisher.publish_message.return_value = True
+
+        results = worker.process_batch([{"match_id": "m1"}, {}, {"match_id": "m2"}])
+
+        assert [result["success"] for result in results] == [False, False, True]
+        assert "API error" in results[0]["error"]
+        assert len(mock_database_manager.insert_match_summaries.call_args[0][0]) == 1
+
+    def test_process_batch_insert_failure(
+        self, worker, mock_pubg_client, mock_database_manager, mock_rabbitmq_publisher
+    ):
+        """Should fail matches whose insert still fails alone without publishing them"""
+        mock_database_manager.execute_query.return_value = [{"count": 0}]
+        mock_database_manager.insert_match_summaries.side_effect = Exception("DB error")
+        mock_pubg_client.get_match.side_effect = self._match_data
+
+        results = worker.process_batch([{"match_id": "match-1"}, {"match_id": "match-2"}])
+
+        assert results == [{"success": False, "error": "DB error"}] * 2
+        mock_rabbitmq_publisher.publish_message.assert_not_called()
+        assert worker.error_count == 2
+        # One batch insert, then one retry per match
+        assert mock_database_manager.insert_match_summaries.call_count == 3
+
+    def test_process_batch_retries_matches_alone(
+        self, worker, mock_pubg_client, mock_database_manager, mock_rabbitmq_publisher
+    ):
+        """Should store the good matches of a batch whose insert fails on one bad match"""
+        mock_database_manager.execute_query.return_value = [{"count": 0}]
+        mock_database_manager.insert_match_summaries.side_effect = [
+            Exception("bad row"),
+            1,
+            Exception("bad row"),
+        ]
+        mock_pubg_client.get_match.side_effect = self._match_data
+        mock_rabbitmq_publisher.publish_message.return_value = True
+
+        results = worker.process_batch([{"match_id": "good"}, {"match_id": "bad"}])
+
+        assert results == [{"success": True}, {"success": False, "error": "bad row"}]
+        retried = mock_database_manager.insert_match_summaries.call_args_list[1:]
+        assert [call[0][0][0]["match_id"] for call in retried] == ["good", "bad"]
+        mock_rabbitmq_publisher.publish_message.assert_called_once()
@@ -0,0 +1,81 @@
+"""
+Unit tests for Prometheus metrics
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+# Records metrics in the main process and a child process, then prints the
+# aggregated exposition the metrics server would serve
+MULTIPROCESS_SCRIPT = textwrap.dedent(
+    """
+    import multiprocessing
+
+    from prometheus_client import CollectorRegistry, generate_latest, multiprocess
+
+    from pewstats_collectors import metrics
+
+
+    def record():
+        metrics.TELEMETRY_PROCESSED.labels(status="success").inc()
+        metrics.TELEMETRY_PEAK_RSS.set(2)
+
+
+    if __name__ == "__main__":
+        metrics.reset_multiprocess_dir()
+        record()
+        child = multiprocessing.get_context("fork").Process(target=record)
+        child.start()
+        child.join()
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        print(generate_latest(registry).decode())
+
+        metrics.mark_process_dead(child.pid)
+        print("LIVE", generate_latest(registry).decode().count("telemetry_process_peak_rss_bytes{"))
+    """
+)
+
+
+class TestMultiprocessMetrics:
+    """Test metrics aggregation across processes"""
+
+    def test_aggregates_child_processes(self, tmp_path):
+        """Should sum counters over processes and keep per-process gauges"""
+        metrics_dir = tmp_path / "metrics"
+        metrics_dir.mkdir()
+        (metrics_dir / "counter_stale.db").write_bytes(b"")
+        script = tmp_path / "record.py"
+        script.write_text(MULTIPROCESS_SCRIPT)
+
+        output = subprocess.run(
+            [sys.executable, str(script)],
+            env={**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(metrics_dir)},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+        exposition, live_gauges = output.split("LIVE")
+        assert 'telemetry_processed_total{status="success"} 2.0' in exposition
+        assert exposition.count("telemetry_process_peak_rss_bytes{pid=") == 2
+        # Dead processes drop out of live gauges; stale files of earlier runs are removed
+        assert live_gauges.strip() == "1"
+        assert not (metrics_dir / "counter_stale.db").exists()
+
+    def test_import_keeps_sample_files(self, tmp_path):
+        """Should only remove sample files of earlier runs when reset explicitly"""
+        metrics_dir = tmp_path / "metrics"
+        metrics_dir.mkdir()
+        (metrics_dir / "counter_stale.db").write_bytes(b"")
+
+        subprocess.run(
+            [sys.executable, "-c", "import pewstats_collectors.metrics"],
+            env={**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(metrics_dir)},
+            check=True,
+        )
+
+        assert (metrics_dir / "counter_stale.db").exists()
@@ -0,0 +1,189 @@
+"""
+Unit tests for Parallel Telemetry Processing Worker
+"""
+
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pewstats_collectors.workers import parallel_telemetry_processing_worker as parallel
+from pewstats_collectors.workers.parallel_telemetry_processing_worker import (
+    ParallelTelemetryProcessingWorker,
+)
+
+DB_CONFIG = {"host": "localhost", "port": 5432, "dbname": "db", "user": "u", "password": "p"}
+
+
+class TestWorkerProcess:
+    """Test the functions run inside pool processes"""
+
+    @pytest.fixture(autouse=True)
+    def reset_process_worker(self, monkeypatch):
+        monkeypatch.setattr(parallel, "_process_worker", None)
+
+    def test_initializer_creates_worker_once(self):
+        """Should build the database manager and worker once and reuse them"""
+        with patch.object(parallel, "DatabaseManager") as db_class, patch.object(
+            parallel, "TelemetryProcessingWorker"
+        ) as worker_class:
+            worker_class.return_value.process_message.return_value = {"success": True}
+
+            parallel._init_worker_process("w1", DB_CONFIG)
+            first = parallel._process_message_worker({"match_id": "m1"})
+            second = parallel._process_message_worker({"match_id": "m2"})
+
+        db_class.assert_called_once()
+        worker_class.assert_called_once()
+        assert worker_class.call_args.kwargs["metrics_port"] is None
+        assert worker_class.return_value.process_message.call_count == 2
+        assert first["success"] is True
+        assert second["match_id"] == "m2"
+        assert second["rss_bytes"] > 0
+
+    @pytest.mark.parametrize("setting, enabled", [(None, False), ("off", False), ("on", True)])
+    def test_initializer_artifact_setting(self, monkeypatch, setting, enabled):
+        """Should only cache telemetry artifacts when TELEMETRY_ARTIFACTS=on"""
+        if setting is None:
+            monkeypatch.delenv("TELEMETRY_ARTIFACTS", raising=False)
+        else:
+            monkeypatch.setenv("TELEMETRY_ARTIFACTS", setting)
+
+        with patch.object(parallel, "DatabaseManager"), patch.object(
+            parallel, "TelemetryProcessingWorker"
+        ) as worker_class:
+            parallel._init_worker_process("w1", DB_CONFIG)
+
+        assert worker_class.call_args.kwargs["use_artifacts"] is enabled
+
+    def test_uninitialized_process(self):
+        """Should fail messages if the initializer did not run"""
+        result = parallel._process_message_worker({"match_id": "m1"})
+
+        assert result["success"] is False
+        assert result["match_id"] == "m1"
+
+
+class TestParallelTelemetryProcessingWorker:
+    """Test ParallelTelemetryProcessingWorker class"""
+
+    @pytest.fixture
+    def worker(self):
+        with patch.object(parallel, "start_metrics_server"):
+            worker = ParallelTelemetryProcessingWorker(
+                worker_id="test-worker",
+                pool_size=1,
+                db_config=DB_CONFIG,
+                max_child_rss_bytes=1_000_000,
+            )
+        worker.executor = Mock()
+        yield worker
+
+    def _complete(self, worker, result=None, error=None):
+        future = Mock()
+        if error is not None:
+            future.result.side_effect = error
+        else:
+            future.result.return_value = result
+        worker.executor.submit.return_value = future
+
+    def test_executor_uses_initializer(self):
+        """Should initialize each pool process and spawn when recycling by task count"""
+        with patch.object(parallel, "start_metrics_server"), patch.object(
+            parallel, "ProcessPoolExecutor"
+        ) as executor_class:
+            ParallelTelemetryProcessingWorker(
+                worker_id="test-worker", db_config=DB_CONFIG, max_tasks_per_child=10
+            )
+
+        kwargs = executor_class.call_args.kwargs
+        assert kwargs["initializer"] is parallel._init_worker_process
+        assert kwargs["initargs"] == ("test-worker", DB_CONFIG)
+        assert kwargs["max_tasks_per_child"] == 10
+        assert kwargs["mp_context"].get_start_method() == "spawn"
+
+    def test_keeps_pool_below_rss_limit(self, worker):
+        """Should keep the pool while worker processes stay small"""
+        executor = worker.executor
+        self._complete(worker, {"success": True, "rss_bytes": 500_000})
+
+        with patch.object(worker, "_create_executor") as create:
+            result = worker.process_message({"match_id": "m1"})
+
+        assert result["success"] is True
+        create.assert_not_called()
+        assert worker.executor is executor
+
+    def test_recycles_pool_above_rss_limit(self, worker):
+        """Should replace the pool once a worker process exceeds the RSS limit"""
+        executor = worker.executor
+        self._complete(worker, {"success": True, "rss_bytes": 2_000_000})
+
+        with patch.object(worker, "_create_executor") as create:
+            worker.process_message({"match_id": "m1"})
+
+        executor.shutdown.assert_called_once_with(wait=False)
+        assert worker.executor is create.return_value
+
+    def test_replaces_broken_pool(self, worker):
+        """Should replace the pool if a worker process died"""
+        executor = worker.executor
+        self._complete(worker, error=BrokenProcessPool("died"))
+
+        with patch.object(worker, "_create_executor") as create:
+            result = worker.process_message({"match_id": "m1"})
+
+        assert result["success"] is False
+        assert worker.error_count == 1
+        executor.shutdown.assert_called_once_with(wait=False)
+        assert worker.executor is create.return_value
+
+    def test_submit_reports_result_when_done(self, worker):
+        """Should return immediately and report the result once the future finishes"""
+        future = Future()
+        worker.executor.submit.return_value = future
+        done = Mock()
+
+        worker.submit({"match_id": "m1"}, done)
+
+        done.assert_not_called()
+        assert worker.in_flight_count == 1
+
+        future.set_result({"success": True, "match_id": "m1", "rss_bytes": 500_000})
+
+        done.assert_called_once_with({"success": True, "match_id": "m1", "rss_bytes": 500_000})
+        assert worker.in_flight_count == 0
+        assert worker.processed_count == 1
+
+    def test_submit_replaces_broken_pool_once(self, worker):
+        """Should replace a broken pool once even if several messages fail with it"""
+        executor = worker.executor
+        futures = [Future(), Future()]
+        executor.submit.side_effect = futures
+        done = Mock()
+
+        with patch.object(worker, "_create_executor") as create:
+            worker.submit({"match_id": "m1"}, done)
+            worker.submit({"match_id": "m2"}, done)
+            for future in futures:
+                future.set_exception(BrokenProcessPool("died"))
+
+        assert done.call_count == 2
+        assert all(not call.args[0]["success"] for call in done.call_args_list)
+        create.assert_called_once()
+        assert worker.error_count == 2
+
+    def test_submit_failure(self, worker):
+        """Should report messages the pool refuses as failed"""
+        worker.executor.submit.side_effect = RuntimeError("shut down")
+        done = Mock()
+
+        worker.submit({"match_id": "m1"}, done)
+
+        assert done.call_args.args[0]["success"] is False
+        assert worker.in_flight_count == 0
+
+    def test_max_in_flight(self, worker):
+        """Should keep two messages per worker process in flight by default"""
+        assert worker.max_in_flight == 2
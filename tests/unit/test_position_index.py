@@ -0,0 +1,127 @@
+"""
+Unit tests for Position Index
+"""
+
+import pytest
+
+from pewstats_collectors.processors.position_index import PositionIndex
+from pewstats_collectors.utils.timestamps import (
+    event_time_ms,
+    ms_to_datetime,
+    parse_timestamp_ms,
+)
+
+
+def _char(name, team_id, x):
+    return {"name": name, "teamId": team_id, "location": {"x": x, "y": 0, "z": 0}}
+
+
+class TestParseTimestampMs:
+    """Test parse_timestamp_ms helper"""
+
+    def test_parses_utc_timestamp(self):
+        """Should convert ISO timestamps to epoch milliseconds"""
+        assert parse_timestamp_ms("1970-01-01T00:00:01.500Z") == 1500
+        assert parse_timestamp_ms("1970-01-01T00:00:01.500+00:00") == 1500
+
+    def test_naive_timestamp_is_utc(self):
+        """Should treat timestamps without timezone as UTC"""
+        assert parse_timestamp_ms("1970-01-01T00:00:02") == 2000
+
+    @pytest.mark.parametrize("value", [None, "", "not-a-date", 12345])
+    def test_invalid_timestamp(self, value):
+        """Should return None for invalid timestamps"""
+        assert parse_timestamp_ms(value) is None
+
+    def test_event_time_ms_prefers_normalized_time(self):
+        """Should use the attached epoch time and fall back to parsing _D"""
+        assert event_time_ms({"_D": "1970-01-01T00:00:01.000Z", "_ms": 42}) == 42
+        assert event_time_ms({"_D": "1970-01-01T00:00:01.000Z"}) == 1000
+        assert event_time_ms({}) is None
+
+    def test_ms_to_datetime_round_trip(self):
+        """Should convert epoch milliseconds back to a UTC datetime"""
+        dt = ms_to_datetime(parse_timestamp_ms("2024-01-01T12:30:00.250Z"))
+
+        assert dt.isoformat() == "2024-01-01T12:30:00.250000+00:00"
+
+
+class TestPositionIndex:
+    """Test PositionIndex class"""
+
+    @pytest.fixture
+    def events(self):
+        """Position samples for two teams"""
+        return [
+            {
+                "_T": "LogPlayerPosition",
+                "_D": "2024-01-01T00:00:00.000Z",
+                "character": _char("A", 1, 0),
+            },
+            {
+                "_T": "LogPlayerPosition",
+                "_D": "2024-01-01T00:00:00.000Z",
+                "character": _char("B", 1, 10),
+            },
+            {
+                "_T": "LogPlayerPosition",
+                "_D": "2024-01-01T00:00:04.000Z",
+                "character": _char("A", 1, 40),
+            },
+            {
+                "_T": "LogPlayerTakeDamage",
+                "_D": "2024-01-01T00:00:06.000Z",
+                "attacker": _char("C", 2, 60),
+                "victim": _char("B", 1, 61),
+            },
+            {
+                "_T": "LogItemPickup",
+                "_D": "2024-01-01T00:00:05.000Z",
+                "character": _char("D", 3, 0),
+            },
+            {
+                "_T": "LogPlayerPosition",
+                "_D": "2024-01-01T00:00:30.000Z",
+                "character": _char("A", 1, 300),
+            },
+        ]
+
+    def test_collects_samples_per_player(self, events):
+        """Should index positions from position-carrying events only"""
+        index = PositionIndex(events)
+
+        assert sorted(index.players) == ["A", "B", "C"]
+        assert len(index) == 6
+
+    def test_positions_near_picks_closest_sample(self, events):
+        """Should return each player's closest sample within the window"""
+        index = PositionIndex(events)
+
+        nearby = index.positions_near(parse_timestamp_ms("2024-01-01T00:00:05.000Z"))
+
+        assert list(nearby) == ["A", "B", "C"]
+        assert nearby["A"]["location"]["x"] == 40
+        assert nearby["A"]["time_diff"] == 1.0
+        assert nearby["B"]["location"]["x"] == 61
+        assert nearby["C"]["timestamp"] == "2024-01-01T00:00:06.000Z"
+
+    def test_positions_near_respects_window(self, events):
+        """Should exclude samples outside the window"""
+        index = PositionIndex(events)
+
+        nearby = index.positions_near(parse_timestamp_ms("2024-01-01T00:00:30.000Z"))
+
+        assert list(nearby) == ["A"]
+
+    def test_positions_near_missing_time(self, events):
+        """Should return no positions without a target time"""
+        assert PositionIndex(events).positions_near(None) == {}
+
+    def test_nearest(self, events):
+        """Should find a single player's nearest sample by epoch milliseconds"""
+        index = PositionIndex(events)
+        target_ms = parse_timestamp_ms("2024-01-01T00:00:03.000Z")
+
+        assert index.nearest("A", target_ms)["location"]["x"] == 40
+        assert index.nearest("A", target_ms, window_ms=500) is None
+        assert index.nearest("Z", target_ms) is None
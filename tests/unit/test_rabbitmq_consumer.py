@@ -5,6 +5,7 @@ Ensures R BaseWorker parity.
 """
 
 import json
+import threading
 import pytest
 from unittest.mock import Mock, patch
 
@@ -264,6 +265,253 @@ class TestBatchConsumption:
         assert result == 5
 
 
+# ============================================================================
+# Deferred Consumption Tests
+# ============================================================================
+
+
+class TestDeferredConsumption:
+    """Test consumption with acks sent after off-thread processing."""
+
+    def _deliver(self, cons, channel, submit, body):
+        """Start deferred consumption and deliver one message."""
+        cons._ensure_connection()
+        cons.consume_messages_deferred("match", "processing", submit)
+        on_message = channel.basic_consume.call_args.kwargs["on_message_callback"]
+        on_message(channel, Mock(delivery_tag=7), Mock(), body)
+
+    def test_ack_after_done(self, consumer):
+        """Should ack only once done reports success, through the I/O thread"""
+        cons, channel = consumer
+        submitted = []
+
+        self._deliver(
+            cons,
+            channel,
+            lambda data, done: submitted.append((data, done)),
+            json.dumps({"match_id": "m1"}).encode(),
+        )
+
+        data, done = submitted[0]
+        assert data == {"match_id": "m1"}
+        channel.basic_ack.assert_not_called()
+
+        done({"success": True})
+        threadsafe_callback = cons._connection.add_callback_threadsafe.call_args[0][0]
+        channel.basic_ack.assert_not_called()
+
+        threadsafe_callback()
+        channel.basic_ack.assert_called_once_with(7)
+        assert cons.get_processed_count() == 1
+
+    def test_nack_after_failure(self, consumer):
+        """Should nack when done reports failure"""
+        cons, channel = consumer
+
+        self._deliver(
+            cons,
+            channel,
+            lambda data, done: done({"success": False, "error": "Failed"}),
+            json.dumps({"match_id": "m1"}).encode(),
+        )
+        cons._connection.add_callback_threadsafe.call_args[0][0]()
+
+        channel.basic_nack.assert_called_once_with(7, requeue=False)
+        channel.basic_ack.assert_not_called()
+
+    def test_nack_invalid_json(self, consumer):
+        """Should nack unparseable messages without submitting them"""
+        cons, channel = consumer
+        submit = Mock()
+
+        self._deliver(cons, channel, submit, b"not json")
+
+        submit.assert_not_called()
+        channel.basic_nack.assert_called_once_with(7, requeue=False)
+
+    def test_nack_when_submit_fails(self, consumer):
+        """Should nack messages that cannot be handed off"""
+        cons, channel = consumer
+
+        self._deliver(
+            cons, channel, Mock(side_effect=RuntimeError("full")), json.dumps({}).encode()
+        )
+
+        channel.basic_nack.assert_called_once_with(7, requeue=False)
+
+
+class TestThreadedConsumption:
+    """Test consumption with callbacks run on worker threads."""
+
+    def _deliver(self, cons, channel, callback, bodies, workers=2):
+        """Start threaded consumption, deliver messages and settle their results."""
+        cons._ensure_connection()
+        settled = threading.Semaphore(0)
+
+        def add_callback_threadsafe(settle):
+            settle()
+            settled.release()
+
+        cons._connection.add_callback_threadsafe.side_effect = add_callback_threadsafe
+
+        def start_consuming():
+            on_message = channel.basic_consume.call_args.kwargs["on_message_callback"]
+            for tag, body in enumerate(bodies):
+                on_message(channel, Mock(delivery_tag=tag), Mock(), body)
+            for _ in bodies:
+                assert settled.acquire(timeout=5)
+
+        channel.start_consuming.side_effect = start_consuming
+        cons.consume_messages_threaded("match", "processing", callback, workers=workers)
+
+    def test_runs_callbacks_off_consumer_thread(self, consumer):
+        """Should run callbacks on worker threads and ack through the I/O thread"""
+        cons, channel = consumer
+        threads = []
+
+        def callback(data):
+            threads.append(threading.current_thread())
+            return {"success": True}
+
+        self._deliver(cons, channel, callback, [json.dumps({"match_id": "m1"}).encode()])
+
+        assert threads and threads[0] is not threading.current_thread()
+        channel.basic_ack.assert_called_once_with(0)
+        assert cons.get_processed_count() == 1
+
+    def test_prefetch_matches_workers(self, consumer):
+        """Should prefetch one message per worker thread"""
+        cons, channel = consumer
+
+        self._deliver(cons, channel, lambda data: {"success": True}, [], workers=4)
+
+        assert cons.prefetch_count == 4
+        channel.basic_qos.assert_called_with(prefetch_count=4)
+
+    def test_nack_when_callback_raises(self, consumer):
+        """Should nack messages whose callback raises"""
+        cons, channel = consumer
+
+        self._deliver(
+            cons,
+            channel,
+            Mock(side_effect=ValueError("boom")),
+            [json.dumps({"match_id": "m1"}).encode()],
+        )
+
+        channel.basic_nack.assert_called_once_with(0, requeue=False)
+
+    def test_invalid_workers(self, consumer):
+        """Should reject pools without worker threads"""
+        cons, channel = consumer
+
+        with pytest.raises(ValueError):
+            cons.consume_messages_threaded("match", "processing", Mock(), workers=0)
+
+
+class TestBatchedConsumption:
+    """Test consumption of messages in batches."""
+
+    def _consume(
+        self, cons, channel, callback, bodies, batch_size=2, timeout=False, batches=1
+    ):
+        """Start batched consumption, deliver messages and wait for the batches to settle."""
+        cons._ensure_connection()
+        settled = threading.Semaphore(0)
+
+        def add_callback_threadsafe(settle):
+            settle()
+            settled.release()
+
+        cons._connection.add_callback_threadsafe.side_effect = add_callback_threadsafe
+
+        def start_consuming():
+            on_message = channel.basic_consume.call_args.kwargs["on_message_callback"]
+            for tag, body in enumerate(bodies):
+                on_message(channel, Mock(delivery_tag=tag), Mock(), body)
+            if timeout:
+                cons._connection.call_later.call_args[0][1]()
+            for _ in range(batches):
+                assert settled.acquire(timeout=5)
+
+        channel.start_consuming.side_effect = start_consuming
+        cons.consume_messages_batched(
+            "match", "discovered", callback, batch_size=batch_size, max_wait=1.0
+        )
+
+    def test_full_batch(self, consumer):
+        """Should pass a full batch to the callback and settle each message"""
+        cons, channel = consumer
+        callback = Mock(return_value=[{"success": True}, {"success": False, "error": "x"}])
+        bodies = [json.dumps({"match_id": f"m{i}"}).encode() for i in range(2)]
+
+        self._consume(cons, channel, callback, bodies)
+
+        callback.assert_called_once_with([{"match_id": "m0"}, {"match_id": "m1"}])
+        channel.basic_ack.assert_called_once_with(0)
+        channel.basic_nack.assert_called_once_with(1, requeue=False)
+        channel.basic_qos.assert_called_with(prefetch_count=2)
+        cons._connection.remove_timeout.assert_called_once()
+
+    def test_runs_callback_off_consumer_thread(self, consumer):
+        """Should run the batch callback on a worker thread and settle on the I/O thread"""
+        cons, channel = consumer
+        threads = []
+
+        def callback(messages):
+            threads.append(threading.current_thread())
+            return [{"success": True} for _ in messages]
+
+        bodies = [json.dumps({"match_id": f"m{i}"}).encode() for i in range(2)]
+        self._consume(cons, channel, callback, bodies)
+
+        assert threads and threads[0] is not threading.current_thread()
+        assert channel.basic_ack.call_count == 2
+
+    def test_partial_batch_after_timeout(self, consumer):
+        """Should pass a partial batch once max_wait has passed"""
+        cons, channel = consumer
+        callback = Mock(return_value=[{"success": True}])
+
+        self._consume(
+            cons, channel, callback, [json.dumps({"match_id": "m0"}).encode()], timeout=True
+        )
+
+        assert cons._connection.call_later.call_args[0][0] == 1.0
+        callback.assert_called_once_with([{"match_id": "m0"}])
+        channel.basic_ack.assert_called_once_with(0)
+
+    def test_nack_batch_when_callback_raises(self, consumer):
+        """Should nack every message of a batch whose callback raises"""
+        cons, channel = consumer
+        bodies = [json.dumps({"match_id": f"m{i}"}).encode() for i in range(2)]
+
+        self._consume(cons, channel, Mock(side_effect=RuntimeError("boom")), bodies)
+
+        assert channel.basic_nack.call_count == 2
+        channel.basic_ack.assert_not_called()
+
+    def test_nack_missing_results(self, consumer):
+        """Should nack messages the callback returned no result for"""
+        cons, channel = consumer
+        bodies = [json.dumps({"match_id": f"m{i}"}).encode() for i in range(2)]
+
+        self._consume(cons, channel, Mock(return_value=[{"success": True}]), bodies)
+
+        channel.basic_ack.assert_called_once_with(0)
+        channel.basic_nack.assert_called_once_with(1, requeue=False)
+
+    def test_nack_invalid_json(self, consumer):
+        """Should nack unparseable messages without batching them"""
+        cons, channel = consumer
+        callback = Mock()
+
+        self._consume(cons, channel, callback, [b"not json"], batches=0)
+
+        callback.assert_not_called()
+        channel.basic_nack.assert_called_once_with(0, requeue=False)
+
+
 # ============================================================================
 # Connection Management Tests
 # ============================================================================
@@ -5,6 +5,7 @@ Ensures R business logic parity.
 """
 
 import json
+import pika
 import pytest
 from unittest.mock import Mock, patch
 
@@ -344,6 +345,179 @@ class TestMessagePublishing:
             assert result is True
 
 
+class FakeSelectConnection:
+    """Non-blocking connection, ioloop and channel answering publisher confirms.
+
+    respond(ack_nack, tags) is called with the delivery tags of each window sent.
+    """
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.published = []
+        self.windows = []
+        self.declared = []
+        self.is_open = False
+        self.is_closed = False
+        self.ioloop = self
+        self._unconfirmed = []
+        self._timeout = None
+        self._started = False
+        self._stopped = False
+
+    def __call__(self, parameters, on_open_callback, on_open_error_callback, on_close_callback):
+        self._on_open = on_open_callback
+        self._on_close = on_close_callback
+        return self
+
+    # Connection
+    def channel(self, on_open_callback):
+        on_open_callback(self)
+
+    def close(self):
+        self.is_open, self.is_closed = False, True
+        self._on_close(self, Exception("closed"))
+
+    # IOLoop
+    def start(self):
+        self._stopped = False
+        if not self._started:
+            self._started = self.is_open = True
+            self._on_open(self)
+        while not self._stopped:
+            tags, self._unconfirmed = self._unconfirmed, []
+            if tags:
+                self.windows.append(len(tags))
+                self.respond(self._ack_nack, tags)
+            elif self._timeout is not None:
+                callback, self._timeout = self._timeout, None
+                callback()
+            else:
+                break
+
+    def stop(self):
+        self._stopped = True
+
+    def call_later(self, delay, callback):
+        self._timeout = callback
+        return callback
+
+    def remove_timeout(self, timeout):
+        self._timeout = None
+
+    # Channel
+    def add_on_close_callback(self, callback):
+        pass
+
+    def queue_declare(self, queue, durable, callback):
+        self.declared.append(queue)
+        callback(Mock())
+
+    def confirm_delivery(self, ack_nack_callback, callback):
+        self._ack_nack = ack_nack_callback
+        callback(Mock())
+
+    def basic_publish(self, **kwargs):
+        self.published.append(kwargs)
+        self._unconfirmed.append(len(self.published))
+
+
+class TestPublishMany:
+    """Test batch publishing under publisher confirms."""
+
+    def _frame(self, method_class, delivery_tag, multiple=False):
+        return Mock(method=method_class(delivery_tag=delivery_tag, multiple=multiple))
+
+    def _publish_many(self, pub, respond, messages, **kwargs):
+        connection = FakeSelectConnection(respond)
+        with patch("pewstats_collectors.core.rabbitmq_publisher.pika.SelectConnection", connection):
+            return pub.publish_many("match", "discovered", messages, **kwargs), connection
+
+    def test_publish_many_confirmed(self, publisher):
+        """Should send windows of messages and collect their confirms in between"""
+        pub, channel = publisher
+
+        def ack_window(ack_nack, tags):
+            ack_nack(self._frame(pika.spec.Basic.Ack, tags[-1], multiple=True))
+
+        results, connection = self._publish_many(
+            pub, ack_window, [{"match_id": str(i)} for i in range(5)], confirm_window=2
+        )
+
+        assert results == [True] * 5
+        assert connection.windows == [2, 2, 1]  # Confirms collected per window
+        assert connection.declared == ["match.discovered.dev"]
+        body = json.loads(connection.published[-1]["body"])
+        assert body["queue_target"] == "match.discovered.dev"
+        assert connection.is_closed
+        channel.basic_publish.assert_not_called()
+
+    def test_publish_many_nacked(self, publisher):
+        """Should report nacked messages as failed and keep sending"""
+        pub, channel = publisher
+
+        def nack_second(ack_nack, tags):
+            for tag in tags:
+                method = pika.spec.Basic.Nack if tag == 2 else pika.spec.Basic.Ack
+                ack_nack(self._frame(method, tag))
+
+        results, _ = self._publish_many(pub, nack_second, [{"n": 1}, {"n": 2}, {"n": 3}])
+
+        assert results == [True, False, True]
+
+    def test_publish_many_unconfirmed(self, publisher):
+        """Should report messages not confirmed in time as failed and stop"""
+        pub, channel = publisher
+
+        results, connection = self._publish_many(
+            pub, lambda ack_nack, tags: None, [{"n": 1}, {"n": 2}, {"n": 3}], confirm_window=2
+        )
+
+        assert results == [False, False, False]
+        assert len(connection.published) == 2
+        assert connection.is_closed
+
+    def test_publish_many_error(self, publisher):
+        """Should report failure instead of raising and close the connection"""
+        pub, channel = publisher
+        connection = FakeSelectConnection(lambda ack_nack, tags: None)
+        connection.basic_publish = Mock(side_effect=Exception("Channel closed"))
+
+        with patch("pewstats_collectors.core.rabbitmq_publisher.pika.SelectConnection", connection):
+            results = pub.publish_many("match", "discovered", [{"n": 1}, {"n": 2}])
+
+        assert results == [False, False]
+        assert connection.is_closed
+
+    def test_publish_many_invalid_window(self, publisher):
+        """Should reject windows that hold no messages"""
+        pub, channel = publisher
+
+        with pytest.raises(ValueError):
+            pub.publish_many("match", "discovered", [{"n": 1}], confirm_window=0)
+
+    def test_publish_many_empty(self, publisher):
+        """Should not connect for an empty batch"""
+        pub, channel = publisher
+
+        assert pub.publish_many("match", "discovered", []) == []
+        assert pub._connection is None
+
+    def test_queue_declared_once_per_connection(self, publisher):
+        """Should declare each queue once until the connection is reopened"""
+        pub, channel = publisher
+
+        pub.publish_message("match", "discovered", {"n": 1})
+        pub.publish_message("match", "discovered", {"n": 2})
+        pub.publish_message("match", "telemetry", {"n": 3})
+
+        assert channel.queue_declare.call_count == 2
+
+        pub._connection.is_closed = True
+        pub.publish_message("match", "discovered", {"n": 4})
+
+        assert channel.queue_declare.call_count == 3
+
+
 # ============================================================================
 # Connection Management Tests
 # ============================================================================
@@ -0,0 +1,153 @@
+"""
+Unit tests for Telemetry Artifact Cache
+"""
+
+import gzip
+import json
+import os
+from unittest.mock import patch
+
+import msgspec
+import pytest
+
+from pewstats_collectors.core.telemetry_artifact import (
+    TelemetryArtifactCache,
+    artifact_path_for,
+)
+from pewstats_collectors.core.telemetry_records import TelemetryRecord
+
+CACHED_TYPES = ("LogPlayerKillV2", "LogPlayerPosition")
+
+
+def as_dicts(events):
+    """Convert records back to plain dicts for comparison"""
+    return [event.to_dict() if isinstance(event, TelemetryRecord) else event for event in events]
+
+
+class TestTelemetryArtifactCache:
+    """Test TelemetryArtifactCache class"""
+
+    @pytest.fixture
+    def events(self):
+        """Telemetry events of several types"""
+        return [
+            {"_T": "LogMatchStart", "_D": "2024-01-01T00:00:00Z"},
+            {"_T": "LogPlayerPosition", "character": {"name": "Player1"}},
+            {"_T": "LogPlayerKillV2", "victim": {"name": "Player2"}},
+            {"_T": "LogPlayerPosition", "character": {"name": "Player3"}},
+        ]
+
+    @pytest.fixture
+    def raw_path(self, events, tmp_path):
+        """Gzipped raw telemetry file"""
+        path = tmp_path / "raw.json.gz"
+        path.write_bytes(gzip.compress(json.dumps(events).encode("utf-8")))
+        return str(path)
+
+    @pytest.fixture
+    def cache(self):
+        return TelemetryArtifactCache(CACHED_TYPES)
+
+    def test_artifact_path_for(self):
+        """Should place the artifact next to the raw file"""
+        assert artifact_path_for("/data/m1/raw.json.gz") == "/data/m1/raw.events.msgpack.zz"
+        assert artifact_path_for("/data/m1/other.json") == "/data/m1/other.events.msgpack.zz"
+
+    def test_first_read_writes_artifact(self, cache, raw_path, events):
+        """Should parse the raw file and store the cached event types"""
+        result = cache.read(raw_path)
+
+        assert all(isinstance(event, TelemetryRecord) for event in result)
+        assert as_dicts(result) == events[1:]
+        assert os.path.exists(artifact_path_for(raw_path))
+
+    def test_second_read_uses_artifact(self, cache, raw_path, events):
+        """Should not parse the raw file when a valid artifact exists"""
+        cache.read(raw_path)
+
+        with patch("pewstats_collectors.core.telemetry_artifact.TelemetryReader") as reader:
+            result = cache.read(raw_path)
+
+        reader.assert_not_called()
+        assert as_dicts(result) == events[1:]
+
+    def test_filters_requested_types(self, cache, raw_path, events):
+        """Should only return the requested subset of cached types"""
+        cache.read(raw_path)
+
+        assert as_dicts(cache.read(raw_path, ["LogPlayerKillV2"])) == [events[2]]
+
+    def test_rebuilds_for_uncached_types(self, cache, raw_path, events):
+        """Should fall back to the raw file for types missing from the artifact"""
+        cache.read(raw_path)
+
+        assert as_dicts(cache.read(raw_path, ["LogMatchStart"])) == [events[0]]
+
+    def test_rebuilds_on_schema_change(self, cache, raw_path):
+        """Should ignore artifacts written with another schema version"""
+        cache.read(raw_path)
+
+        newer = TelemetryArtifactCache(CACHED_TYPES, schema_version=cache.schema_version + 1)
+
+        assert newer.load(raw_path) is None
+
+    def test_rebuilds_when_raw_file_changes(self, cache, raw_path, events):
+        """Should ignore artifacts of an older version of the raw file"""
+        cache.read(raw_path)
+
+        changed = events + [{"_T": "LogPlayerKillV2", "victim": {"name": "Player4"}}]
+        with open(raw_path, "wb") as f:
+            f.write(gzip.compress(json.dumps(changed).encode("utf-8")))
+
+        assert cache.load(raw_path) is None
+        assert as_dicts(cache.read(raw_path)) == changed[1:]
+
+    def test_ignores_unreadable_artifact(self, cache, raw_path, events):
+        """Should rebuild instead of failing on a corrupt artifact"""
+        with open(artifact_path_for(raw_path), "wb") as f:
+            f.write(b"not an artifact")
+
+        assert cache.load(raw_path) is None
+        assert as_dicts(cache.read(raw_path)) == events[1:]
+
+    def test_artifact_header_is_msgpack(self, cache, raw_path):
+        """Should write a length-prefixed msgpack header, not a pickle"""
+        cache.read(raw_path)
+
+        with open(artifact_path_for(raw_path), "rb") as f:
+            length = int.from_bytes(f.read(4), "big")
+            header = msgspec.msgpack.decode(f.read(length))
+
+        assert header["schema_version"] == cache.schema_version
+        assert header["event_types"] == sorted(CACHED_TYPES)
+        assert header["event_count"] == 3
+
+    def test_save_failure_is_not_fatal(self, cache, raw_path, events):
+        """Should still return events when the artifact cannot be written"""
+        with patch(
+            "pewstats_collectors.core.telemetry_artifact.tempfile.mkstemp",
+            side_effect=PermissionError("read-only"),
+        ):
+            assert as_dicts(cache.read(raw_path)) == events[1:]
+
+        assert not os.path.exists(artifact_path_for(raw_path))
+
+    def test_skips_events_not_fitting_schema(self, cache, tmp_path, events):
+        """Should return but not cache events that could not be typed"""
+        malformed = events + [{"_T": "LogPlayerKillV2", "victim": ["Player4"]}]
+        path = tmp_path / "raw.json.gz"
+        path.write_bytes(gzip.compress(json.dumps(malformed).encode("utf-8")))
+
+        assert as_dicts(cache.read(str(path))) == malformed[1:]
+        assert not os.path.exists(artifact_path_for(str(path)))
+
+    def test_encode_failure_is_not_fatal(self, cache, tmp_path, events):
+        """Should return events and leave no files behind when they cannot be encoded"""
+        oversized = events + [
+            {"_T": "LogPlayerKillV2", "attackId": 2**70, "victim": {"name": "Player4"}}
+        ]
+        path = tmp_path / "raw.json.gz"
+        path.write_bytes(gzip.compress(json.dumps(oversized).encode("utf-8")))
+
+        assert as_dicts(cache.read(str(path))) == oversized[1:]
+        assert os.listdir(tmp_path) == ["raw.json.gz"]
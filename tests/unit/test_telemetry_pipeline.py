@@ -0,0 +1,147 @@
+"""
+Unit tests for Telemetry Pipeline
+"""
+
+import gzip
+import json
+import threading
+from contextlib import nullcontext
+from unittest.mock import Mock
+
+import pytest
+
+from pewstats_collectors.workers.telemetry_pipeline import TelemetryPipeline
+from pewstats_collectors.workers.telemetry_processing_worker import TelemetryProcessingWorker
+
+
+class TestTelemetryPipeline:
+    """Test TelemetryPipeline class"""
+
+    @pytest.fixture
+    def mock_database_manager(self):
+        """Mock database manager"""
+        database_manager = Mock()
+        database_manager.transaction.side_effect = nullcontext
+        return database_manager
+
+    @pytest.fixture
+    def worker(self, mock_database_manager, monkeypatch):
+        """Worker treating every match as competitive"""
+        worker = TelemetryProcessingWorker(
+            database_manager=mock_database_manager,
+            worker_id="test-worker-001",
+            metrics_port=None,
+            use_artifacts=False,
+        )
+        monkeypatch.setattr(worker, "_get_match_game_type", lambda match_id: "competitive")
+        return worker
+
+    @pytest.fixture
+    def telemetry_file(self, tmp_path):
+        """Telemetry file with one landing"""
+        events = [
+            {
+                "_T": "LogParachuteLanding",
+                "character": {
+                    "accountId": "account.abc123",
+                    "name": "TestPlayer1",
+                    "teamId": 1,
+                    "location": {"x": 100.5, "y": 200.5, "z": 300.5},
+                },
+                "common": {"isGame": 1.0},
+            },
+        ]
+        file_path = tmp_path / "raw.json.gz"
+        with gzip.open(file_path, "wt", encoding="utf-8") as f:
+            json.dump(events, f)
+        return str(file_path)
+
+    def _run(self, pipeline, messages):
+        results = {}
+        finished = threading.Event()
+
+        def on_done(match_id):
+            def done(result):
+                results[match_id] = result
+                if len(results) == len(messages):
+                    finished.set()
+
+            return done
+
+        pipeline.start()
+        for message in messages:
+            pipeline.submit(message, on_done(message.get("match_id")))
+        assert finished.wait(timeout=10)
+        pipeline.stop()
+        return results
+
+    def test_capacity(self, worker):
+        """Should hold the queued matches plus one per stage"""
+        assert TelemetryPipeline(worker, queue_size=2).capacity == 9
+
+    def test_invalid_queue_size(self, worker):
+        """Should reject queues that hold no matches"""
+        with pytest.raises(ValueError):
+            TelemetryPipeline(worker, queue_size=0)
+
+    def test_submit_before_start(self, worker):
+        """Should refuse messages while not running"""
+        with pytest.raises(RuntimeError):
+            TelemetryPipeline(worker).submit({}, lambda result: None)
+
+    def test_processes_matches(self, worker, mock_database_manager, telemetry_file):
+        """Should store every match and report success after storing it"""
+        stored = []
+        mock_database_manager.update_match_status.side_effect = (
+            lambda match_id, status, error: stored.append(match_id)
+        )
+        messages = [{"match_id": f"match-{i}", "file_path": telemetry_file} for i in range(5)]
+
+        results = self._run(TelemetryPipeline(worker, queue_size=1), messages)
+
+        assert results == {f"match-{i}": {"success": True} for i in range(5)}
+        assert sorted(stored) == sorted(results)
+        assert mock_database_manager.insert_landings.call_count == 5
+        assert worker.processed_count == 5
+
+    def test_finishes_early_outcomes(self, worker, mock_database_manager, telemetry_file):
+        """Should report invalid messages and failed stores without stopping"""
+        mock_database_manager.insert_landings.side_effect = [Exception("DB error"), 1]
+        messages = [
+            {"match_id": "match-1"},
+            {"match_id": "match-2", "file_path": telemetry_file},
+            {"match_id": "match-3", "file_path": telemetry_file},
+        ]
+
+        results = self._run(TelemetryPipeline(worker), messages)
+
+        assert "file_path" in results["match-1"]["error"]
+        assert results["match-2"] == {"success": False, "error": "DB error"}
+        assert results["match-3"] == {"success": True}
+        assert worker.error_count == 2
+
+    def test_stage_exception(self, worker, telemetry_file, monkeypatch):
+        """Should fail the match if a stage raises"""
+        monkeypatch.setattr(worker, "extract_match", Mock(side_effect=RuntimeError("boom")))
+
+        results = self._run(
+            TelemetryPipeline(worker), [{"match_id": "match-1", "file_path": telemetry_file}]
+        )
+
+        assert results["match-1"]["success"] is False
+        assert "boom" in results["match-1"]["error"]
+
+    @pytest.mark.parametrize("stage", ["extract_match", "store_match"])
+    def test_stage_without_result(self, worker, telemetry_file, monkeypatch, stage):
+        """Should fail the match if a stage returns neither a job nor an outcome"""
+        returned = None if stage == "extract_match" else Mock(outcome=None)
+        monkeypatch.setattr(worker, stage, Mock(return_value=returned))
+
+        results = self._run(
+            TelemetryPipeline(worker), [{"match_id": "match-1", "file_path": telemetry_file}]
+        )
+
+        assert results["match-1"] == {
+            "success": False,
+            "error": f"Pipeline {stage.split('_')[0]} stage returned no result",
+        }
@@ -5,8 +5,11 @@ Unit tests for Telemetry Processing Worker
 import gzip
 import json
 import pytest
+from contextlib import nullcontext
 from unittest.mock import Mock
 
+from pewstats_collectors.processors.event_dispatcher import TelemetryEventDispatcher
+from pewstats_collectors.processors.match_columns import MatchColumns
 from pewstats_collectors.workers.telemetry_processing_worker import (
     TelemetryProcessingWorker,
     get_event_type,
@@ -74,7 +77,9 @@ class TestTelemetryProcessingWorker:
     @pytest.fixture
     def mock_database_manager(self):
         """Mock database manager"""
-        return Mock()
+        database_manager = Mock()
+        database_manager.transaction.side_effect = nullcontext
+        return database_manager
 
     @pytest.fixture
     def worker(self, mock_database_manager):
@@ -306,6 +311,9 @@ class TestTelemetryProcessingWorker:
             "match-123", "completed", None
         )
 
+        # Events and processing flags are written in one transaction
+        mock_database_manager.transaction.assert_called_once()
+
     def test_process_message_empty_events(self, worker, mock_database_manager, tmp_path):
         """Should fail if no events in file"""
         # Create empty file
@@ -367,3 +375,139 @@ class TestTelemetryProcessingWorker:
         mock_database_manager.update_match_status.assert_called_with(
             "match-123", "failed", "Telemetry processing failed: DB error"
         )
+
+    def test_process_message_runs_only_pending_extractors(
+        self, worker, mock_database_manager, tmp_path, sample_telemetry_events, monkeypatch
+    ):
+        """Should skip processed extractors and only set flags of those that ran"""
+        file_path = tmp_path / "raw.json.gz"
+        with gzip.open(file_path, "wt", encoding="utf-8") as f:
+            json.dump(sample_telemetry_events, f)
+
+        monkeypatch.setattr(worker, "_get_match_game_type", lambda match_id: "competitive")
+        monkeypatch.setattr(
+            worker,
+            "_get_processing_status",
+            lambda match_id: {
+                "kills_processed": True,
+                "weapons_processed": True,
+                "damage_processed": True,
+                "finishing_processed": True,
+                "fights_processed": True,
+            },
+        )
+        mock_database_manager.insert_landings.return_value = 2
+
+        result = worker.process_message(
+            {"match_id": "match-123", "file_path": str(file_path), "map_name": "Erangel"}
+        )
+
+        assert result["success"] is True
+        mock_database_manager.insert_landings.assert_called_once()
+        mock_database_manager.insert_kill_positions.assert_not_called()
+        mock_database_manager.update_match_processing_flags.assert_called_once_with(
+            "match-123", landings_processed=True
+        )
+
+    def test_process_message_selected_extractors(
+        self, worker, mock_database_manager, tmp_path, sample_telemetry_events, monkeypatch
+    ):
+        """Should only run the extractors named in the message"""
+        file_path = tmp_path / "raw.json.gz"
+        with gzip.open(file_path, "wt", encoding="utf-8") as f:
+            json.dump(sample_telemetry_events, f)
+
+        monkeypatch.setattr(worker, "_get_match_game_type", lambda match_id: "competitive")
+        monkeypatch.setattr(worker, "_get_processing_status", lambda match_id: {})
+
+        result = worker.process_message(
+            {
+                "match_id": "match-123",
+                "file_path": str(file_path),
+                "map_name": "Erangel",
+                "extractors": ["landings"],
+            }
+        )
+
+        assert result["success"] is True
+        mock_database_manager.insert_landings.assert_called_once()
+        mock_database_manager.insert_kill_positions.assert_not_called()
+        mock_database_manager.update_match_summaries_enhanced_stats.assert_not_called()
+
+    def test_process_message_unknown_extractor(self, worker, mock_database_manager):
+        """Should reject messages naming unknown extractors"""
+        result = worker.process_message(
+            {"match_id": "match-123", "file_path": "/tmp/raw.json.gz", "extractors": ["nope"]}
+        )
+
+        assert result["success"] is False
+        assert "nope" in result["error"]
+        mock_database_manager.update_match_status.assert_not_called()
+
+    def test_store_events_inserts_fights_in_one_call(self, worker, mock_database_manager):
+        """Should hand all fights with their participants to one bulk insert"""
+        mock_database_manager.insert_fights_with_participants.return_value = (2, 3)
+        fights = [
+            {"match_id": "match-123", "participants": [{"player_name": "a"}]},
+            {"match_id": "match-123", "participants": [{"player_name": "b"}, {}]},
+        ]
+
+        worker._store_events("match-123", fights=fights)
+
+        mock_database_manager.insert_fights_with_participants.assert_called_once_with(fights)
+        mock_database_manager.insert_fight_and_get_id.assert_not_called()
+        flags = mock_database_manager.update_match_processing_flags.call_args.kwargs
+        assert flags["fights_processed"] is True
+
+    def test_extractor_registry_matches_worker(self, worker):
+        """Every registered extractor should name a worker method and a store argument"""
+        store_arguments = worker._store_events.__code__.co_varnames
+
+        for extractor in worker.EXTRACTORS:
+            assert callable(getattr(worker, extractor.method))
+            assert set(extractor.outputs) <= set(store_arguments)
+
+    def test_extract_advanced_stats_killsteal_with_negative_dbno_id(self, worker):
+        """A dBNO id of -1 is a real knock and can be killstolen"""
+
+        def character(name, team_id):
+            return {"name": name, "teamId": team_id}
+
+        events = [
+            {
+                "_T": "LogPlayerMakeGroggy",
+                "attacker": character("Alice", 1),
+                "victim": character("Bob", 2),
+                "dBNOId": -1,
+            },
+            {
+                "_T": "LogPlayerKillV2",
+                "killer": character("Carol", 3),
+                "victim": character("Bob", 2),
+                "dBNOId": -1,
+            },
+        ]
+
+        stats = worker.extract_advanced_stats(events, "match-123", {})
+
+        assert stats["Carol"]["killsteals"] == 1
+
+    def test_run_extractors_shares_match_columns(self, worker):
+        """Columnar extractors should get the same MatchColumns, built once"""
+        dispatcher = TelemetryEventDispatcher(
+            [{"_T": "LogPlayerTakeDamage", "_D": "2024-01-01T12:00:00.000Z", "damage": 10}]
+        )
+        worker.extract_advanced_stats = Mock(return_value={})
+        worker.extract_weapon_distribution = Mock(return_value={})
+
+        worker.run_extractors(
+            dispatcher,
+            worker.EXTRACTORS.select(["advanced_stats", "weapon_distribution"]),
+            "match-123",
+            {},
+        )
+
+        columns = worker.extract_advanced_stats.call_args[0][0]
+        assert isinstance(columns, MatchColumns)
+        assert len(columns.damage) == 1
+        assert worker.extract_weapon_distribution.call_args[0][0] is columns
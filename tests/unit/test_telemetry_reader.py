@@ -0,0 +1,175 @@
+"""
+Unit tests for Telemetry Reader
+"""
+
+import gzip
+import json
+
+import pytest
+
+from pewstats_collectors.core.telemetry_reader import TelemetryReader
+from pewstats_collectors.core.telemetry_records import PlayerKillV2, PlayerPosition
+
+
+class TestTelemetryReader:
+    """Test TelemetryReader class"""
+
+    @pytest.fixture
+    def events(self):
+        """Telemetry events of several types"""
+        return [
+            {"_T": "LogMatchStart", "_D": "2024-01-01T00:00:00Z"},
+            {"_T": "LogPlayerPosition", "character": {"name": "Plâyer 1", "location": {"x": 1.5}}},
+            {"_T": "LogPlayerKillV2", "victim": {"name": "Player2"}, "assists": [None, True]},
+            {"type": "LogPlayerPosition", "character": {"name": "Player3"}},
+            {"_T": "LogMatchEnd", "characters": []},
+        ]
+
+    @pytest.fixture
+    def pubg_events(self):
+        """Events laid out like PUBG telemetry, with _T as the last key"""
+        return [
+            {"MatchId": "m1", "_D": "2024-01-01T00:00:00Z", "_T": "LogMatchStart"},
+            {
+                "item": {"itemId": "Item_Ammo_556mm_C"},
+                "_D": "2024-01-01T00:00:01Z",
+                "_T": "LogItemPickup",
+            },
+            {
+                "character": {"name": "Plâyer 1", "location": {"x": 1.5, "y": 2, "z": 3}},
+                "elapsedTime": 12,
+                "_D": "2024-01-01T00:00:02Z",
+                "_T": "LogPlayerPosition",
+            },
+            {"type": "LogPlayerPosition", "character": {"name": "Player3"}},
+            {"vehicle": {"vehicleId": "Uaz"}, "_D": "2024-01-01T00:00:03Z", "_T": "LogVehicleRide"},
+            {
+                "victim": {"name": "Player2", "teamId": 2},
+                "finisher": None,
+                "assists": [None, True],
+                "_D": "2024-01-01T00:00:04Z",
+                "_T": "LogPlayerKillV2",
+            },
+        ]
+
+    def _write(self, path, events, double=False, indent=None):
+        content = json.dumps(events, indent=indent).encode("utf-8")
+        data = gzip.compress(content)
+        if double:
+            data = gzip.compress(data)
+        path.write_bytes(data)
+        return str(path)
+
+    def test_read_single_gzip(self, events, tmp_path):
+        """Should read all events from a gzipped file"""
+        path = self._write(tmp_path / "raw.json.gz", events)
+
+        reader = TelemetryReader(path)
+
+        assert reader.read() == events
+        assert reader.events_read == 5
+        assert reader.events_kept == 5
+
+    def test_read_double_gzip(self, events, tmp_path):
+        """Should detect and read double gzipped files"""
+        path = self._write(tmp_path / "raw.json.gz", events, double=True)
+
+        assert TelemetryReader(path).read() == events
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 64])
+    def test_small_chunks(self, events, tmp_path, chunk_size):
+        """Should decode events spanning several reads"""
+        path = self._write(tmp_path / "raw.json.gz", events, indent=2)
+
+        assert TelemetryReader(path, chunk_size=chunk_size).read() == events
+
+    def test_filters_event_types(self, events, tmp_path):
+        """Should only yield the requested event types"""
+        path = self._write(tmp_path / "raw.json.gz", events)
+
+        reader = TelemetryReader(path, event_types={"LogPlayerPosition"})
+        kept = reader.read()
+
+        assert [e["character"]["name"] for e in kept] == ["Plâyer 1", "Player3"]
+        assert reader.events_read == 5
+        assert reader.events_kept == 2
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1 << 20])
+    def test_skips_unwanted_types_by_type_key(self, pubg_events, tmp_path, chunk_size):
+        """Should skip events by their trailing _T and keep events typed another way"""
+        path = self._write(tmp_path / "raw.json.gz", pubg_events, indent=2)
+
+        reader = TelemetryReader(
+            path, event_types={"LogPlayerPosition", "LogPlayerKillV2"}, chunk_size=chunk_size
+        )
+
+        assert reader.read() == [pubg_events[2], pubg_events[3], pubg_events[5]]
+        assert reader.events_read == 6
+        assert reader.events_kept == 3
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+    def test_typed_records(self, pubg_events, tmp_path, chunk_size):
+        """Should decode event types with a schema into records"""
+        path = self._write(tmp_path / "raw.json.gz", pubg_events)
+
+        events = TelemetryReader(path, chunk_size=chunk_size, typed=True).read()
+
+        assert [type(e) for e in events] == [
+            dict,
+            dict,
+            PlayerPosition,
+            dict,
+            dict,
+            PlayerKillV2,
+        ]
+        assert events[2]["character"]["location"]["x"] == 1.5
+        assert events[2].get("elapsedTime") == 12
+        assert events[5]["victim"].get("name") == "Player2"
+        assert events[5].get("finisher") is None
+        # Fields no extractor reads are not decoded
+        assert "assists" not in events[5]
+
+    def test_typed_records_share_strings(self, tmp_path):
+        """Should share one string object per distinct player name in a file"""
+        events = [
+            {"character": {"name": "Player1"}, "_T": "LogPlayerPosition"},
+            {"character": {"name": "Player1"}, "_T": "LogPlayerPosition"},
+            {"_T": "LogPlayerPosition", "character": {"name": "Player1"}},
+        ]
+        path = self._write(tmp_path / "raw.json.gz", events)
+
+        first, second, third = TelemetryReader(path, typed=True).read()
+
+        assert first["character"]["name"] is second["character"]["name"]
+        assert first["character"]["name"] is third["character"]["name"]
+
+    def test_typed_records_from_other_layouts(self, events, tmp_path):
+        """Should type events whose _T is not the last key"""
+        path = self._write(tmp_path / "raw.json.gz", events)
+
+        kept = TelemetryReader(path, event_types={"LogPlayerKillV2"}, typed=True).read()
+
+        assert len(kept) == 1
+        assert isinstance(kept[0], PlayerKillV2)
+        assert kept[0].to_dict() == {"_T": "LogPlayerKillV2", "victim": {"name": "Player2"}}
+
+    def test_empty_list(self, tmp_path):
+        """Should return no events for an empty array"""
+        path = self._write(tmp_path / "raw.json.gz", [])
+
+        assert TelemetryReader(path).read() == []
+
+    def test_not_a_list(self, tmp_path):
+        """Should reject telemetry that is not an event array"""
+        path = self._write(tmp_path / "raw.json.gz", {"_T": "LogMatchStart"})
+
+        with pytest.raises(ValueError, match="Expected list of events"):
+            TelemetryReader(path).read()
+
+    def test_truncated_file(self, tmp_path):
+        """Should raise on an unterminated event array"""
+        path = tmp_path / "raw.json.gz"
+        path.write_bytes(gzip.compress(b'[{"_T": "LogMatchStart"},'))
+
+        with pytest.raises(ValueError):
+            TelemetryReader(str(path), chunk_size=4).read()
@@ -0,0 +1,120 @@
+"""
+Unit tests for Telemetry Records
+"""
+
+import json
+
+import pytest
+
+from pewstats_collectors.core.telemetry_records import (
+    EVENT_RECORDS,
+    Character,
+    PlayerTakeDamage,
+    decode_event,
+    record_from_dict,
+    share_strings,
+)
+
+
+class TestTelemetryRecords:
+    """Test telemetry record decoding and dict-style access"""
+
+    @pytest.fixture
+    def damage_event(self):
+        """LogPlayerTakeDamage event with fields no extractor reads"""
+        return {
+            "attackId": 7,
+            "attacker": {
+                "name": "Player1",
+                "teamId": 1,
+                "location": {"x": 1.0, "y": 2.0, "z": 3.0},
+            },
+            "victim": {"name": "Player2", "teamId": 2, "vehicle": {"vehicleId": "Uaz"}},
+            "damage": 25.5,
+            "damageTypeCategory": "Damage_Gun",
+            "damageCauserName": "WeapHK416_C",
+            "_D": "2024-01-01T00:00:00Z",
+            "_T": "LogPlayerTakeDamage",
+        }
+
+    def test_event_types(self):
+        """Should map event types to their records"""
+        assert EVENT_RECORDS["LogPlayerTakeDamage"] is PlayerTakeDamage
+        assert "LogItemPickup" not in EVENT_RECORDS
+
+    def test_decode_event(self, damage_event):
+        """Should decode declared fields and drop unknown ones"""
+        event = decode_event("LogPlayerTakeDamage", json.dumps(damage_event))
+
+        assert isinstance(event, PlayerTakeDamage)
+        assert event["_T"] == "LogPlayerTakeDamage"
+        assert event["attacker"]["location"]["y"] == 2.0
+        assert event.to_dict()["victim"] == {"name": "Player2", "teamId": 2}
+
+    def test_decode_unknown_type(self, damage_event):
+        """Should not decode event types without a record"""
+        assert decode_event("LogItemPickup", json.dumps(damage_event)) is None
+
+    def test_decode_schema_mismatch(self, damage_event):
+        """Should not decode events that do not fit the schema"""
+        damage_event["victim"] = "Player2"
+
+        assert decode_event("LogPlayerTakeDamage", json.dumps(damage_event)) is None
+
+    def test_dict_access(self, damage_event):
+        """Should behave like the event dict for reads"""
+        event = record_from_dict(damage_event)
+
+        assert event.get("damage") == 25.5
+        assert event.get("isThroughPenetrableWall") is None
+        assert event.get("isThroughPenetrableWall", False) is False
+        assert "damage" in event
+        assert "isThroughPenetrableWall" not in event
+        with pytest.raises(KeyError):
+            event["isThroughPenetrableWall"]
+
+    def test_set_item(self, damage_event):
+        """Should only allow setting declared fields"""
+        event = record_from_dict(damage_event)
+
+        event["_ms"] = 1704067200000
+        assert event["_ms"] == 1704067200000
+        with pytest.raises(KeyError):
+            event["unknown"] = 1
+
+    def test_empty_record_is_falsy(self):
+        """Should be falsy like an empty dict when no field is set"""
+        assert not Character()
+        assert Character(name="Player1")
+
+    def test_record_from_dict_fallback(self, damage_event):
+        """Should keep dicts of unknown types and mismatching events"""
+        other = {"_T": "LogItemPickup", "item": {}}
+        damage_event["attacker"] = [1, 2]
+
+        assert record_from_dict(other) is other
+        assert record_from_dict(damage_event) is damage_event
+
+    def test_share_strings(self, damage_event):
+        """Should make equal names and weapon ids share one string object"""
+        first = decode_event("LogPlayerTakeDamage", json.dumps(damage_event))
+        second = decode_event("LogPlayerTakeDamage", json.dumps(damage_event))
+        assert first["attacker"]["name"] is not second["attacker"]["name"]
+
+        strings = {}
+        share_strings(first, strings)
+        share_strings(second, strings)
+
+        assert first["attacker"]["name"] is second["attacker"]["name"]
+        assert first["victim"]["name"] is second["victim"]["name"]
+        assert first["damageCauserName"] is second["damageCauserName"]
+        assert first == second
+        assert set(strings) == {"Player1", "Player2", "WeapHK416_C"}
+
+    def test_share_strings_ignores_other_events(self):
+        """Should leave dicts and unset fields alone"""
+        strings = {}
+        share_strings({"_T": "LogItemPickup", "character": {"name": "Player1"}}, strings)
+        share_strings(record_from_dict({"_T": "LogPlayerKillV2", "finisher": None}), strings)
+
+        assert strings == {}